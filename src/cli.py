@@ -0,0 +1,181 @@
+# cli.py
+# Command-line entry point for running graphs without the editor or Qt.
+#
+#     python src/cli.py run graph.md --set "Node Title.param=value" [--output "Node Title"]
+#     python src/cli.py worker --listen 127.0.0.1:7300
+#
+# Outputs of the run are written to stdout as JSON, node output and errors to
+# stderr. The exit status is 1 if any node failed. ``worker`` serves remote
+# nodes for other machines' runs (``run --remote host:port``) until stopped;
+# it refuses to start without a shared token in PYFLOWGRAPH_WORKER_TOKEN (or
+# ``--token``), which the running side needs too.
+
+import time
+
+_start_time = time.perf_counter()
+
+import argparse
+import json
+import os
+import sys
+
+# Seconds from process start of this module until the graph is ready to run.
+# Headless imports must stay Qt-free to keep within it.
+STARTUP_BUDGET = 0.5
+
+src_dir = os.path.dirname(os.path.abspath(__file__))
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from execution.headless_runner import HeadlessRunner
+from execution.pin_liveness import format_bytes
+from execution.remote_worker import TOKEN_ENV_VAR, RemoteWorkerServer, format_address, parse_address
+from execution.single_process_executor import format_import_times
+
+
+def parse_assignment(assignment: str):
+    """Split ``node.param=value`` into (node, param, value).
+
+    The value is read as JSON when possible (numbers, booleans, lists, quoted
+    strings) and taken as a plain string otherwise. The node is a title or
+    UUID and may itself contain dots; the parameter name follows the last one.
+    """
+    target, separator, raw_value = assignment.partition("=")
+    node_key, dot, param = target.rpartition(".")
+    if not separator or not dot or not node_key or not param:
+        raise argparse.ArgumentTypeError(f"expected NODE.PARAM=VALUE, got '{assignment}'")
+    try:
+        value = json.loads(raw_value)
+    except ValueError:
+        value = raw_value
+    return node_key, param, value
+
+
+def parse_worker_address(text: str):
+    try:
+        return parse_address(text)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e)) from None
+
+
+def _to_json(value):
+    """Fallback for values json cannot encode: NumPy/pandas via tolist, anything else via repr."""
+    to_list = getattr(value, "tolist", None)
+    if callable(to_list):
+        return to_list()
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return repr(value)
+
+
+def _print_node_output(node, output):
+    print(f"[{node.title}] {output}", file=sys.stderr)
+
+
+def run_command(args) -> int:
+    runner = HeadlessRunner.from_file(args.graph, venv_path=args.venv,
+                                      on_output=None if args.quiet else _print_node_output, fuse=args.fuse,
+                                      memory_budget=int(args.memory_budget * 1024 ** 2) if args.memory_budget else None,
+                                      remote_workers=args.remote, remote_token=args.token)
+    runner.tracer.enabled = bool(args.trace)
+    overrides = {}
+    for node_key, param, value in args.set:
+        if runner.graph.find_node(node_key) is None:
+            print(f"error: no node titled or with UUID '{node_key}'", file=sys.stderr)
+            return 2
+        overrides.setdefault(node_key, {})[param] = value
+
+    startup_time = time.perf_counter() - _start_time
+    try:
+        run_start = time.perf_counter()
+        results = runner.run(overrides, args.output or None)
+        run_time = time.perf_counter() - run_start
+    finally:
+        runner.shutdown()
+    if args.profile:
+        runner.profiler.export_json(args.profile)
+    if args.trace:
+        runner.tracer.export(args.trace)
+
+    json.dump(results, sys.stdout, indent=2, default=_to_json)
+    sys.stdout.write("\n")
+    for error in runner.errors:
+        print(f"EXECUTION ERROR: {error}", file=sys.stderr)
+    if args.timings:
+        over_budget = " (over budget)" if startup_time > STARTUP_BUDGET else ""
+        print(f"[TIMINGS] startup {startup_time:.3f}s of {STARTUP_BUDGET:.3f}s budget{over_budget}, "
+              f"run {run_time:.3f}s, peak retained pin values {format_bytes(runner.peak_retained_bytes)}",
+              file=sys.stderr)
+        if runner.spill_store is not None:
+            spill = runner.spill_store.stats()
+            print(f"[SPILL] {spill['spills']} values spilled to disk ({format_bytes(spill['spilled_bytes'])}), "
+                  f"{spill['faults']} read back", file=sys.stderr)
+        import_times = runner.single_process_executor.get_import_report()
+        if import_times:
+            print(f"[IMPORTS] {format_import_times(import_times)}", file=sys.stderr)
+    return 1 if runner.errors else 0
+
+
+def worker_command(args) -> int:
+    host, port = args.listen
+    try:
+        server = RemoteWorkerServer(host, port, max_workers=args.workers, venv_dir=args.venv_dir, token=args.token)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    server.start()
+    # The bound address, which differs from --listen for port 0
+    print(f"Listening on {format_address(server.address)}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python src/cli.py", description="Run PyFlowGraph graphs without the editor.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Execute a .md graph and print its outputs as JSON")
+    run_parser.add_argument("graph", help="Path to the .md graph file")
+    run_parser.add_argument("--set", action="append", default=[], type=parse_assignment, metavar="NODE.PARAM=VALUE",
+                            help="Override a node input or GUI value (repeatable)")
+    run_parser.add_argument("--output", action="append", metavar="NODE",
+                            help="Node whose outputs to print (repeatable; default: unconnected outputs)")
+    run_parser.add_argument("--venv", help="Virtual environment whose site-packages nodes may import")
+    run_parser.add_argument("--remote", action="append", type=parse_worker_address, metavar="HOST:PORT",
+                            help="Worker daemon for nodes declared with @node_entry(remote=True) (repeatable)")
+    run_parser.add_argument("--token", help=f"Shared secret of the --remote workers (default: ${TOKEN_ENV_VAR})")
+    run_parser.add_argument("--quiet", action="store_true", help="Do not print node output to stderr")
+    run_parser.add_argument("--fuse", action="store_true",
+                            help="Run linear chains of small nodes as single fused steps")
+    run_parser.add_argument("--memory-budget", type=float, metavar="MB",
+                            help="Spill large pin values (arrays, DataFrames, bytes) to disk beyond this budget")
+    run_parser.add_argument("--timings", action="store_true", help="Print startup and run time to stderr")
+    run_parser.add_argument("--profile", metavar="PATH", help="Write per-node wall/CPU time and output size profiles as JSON")
+    run_parser.add_argument("--trace", metavar="PATH", help="Write a Chrome trace (chrome://tracing, Perfetto) of the run")
+    run_parser.set_defaults(handler=run_command)
+
+    worker_parser = commands.add_parser("worker", help="Serve remote nodes for runs on other machines")
+    worker_parser.add_argument("--listen", type=parse_worker_address, default="127.0.0.1:7300", metavar="HOST:PORT",
+                               help="Address to listen on (default: 127.0.0.1:7300; 0.0.0.0 for all interfaces)")
+    worker_parser.add_argument("--token", help=f"Shared secret clients must prove they hold (required; default: ${TOKEN_ENV_VAR}; "
+                                               "prefer the variable, arguments are visible to other users)")
+    worker_parser.add_argument("--workers", type=int, metavar="N",
+                               help="Worker processes per venv (default: up to 4, by CPU count)")
+    worker_parser.add_argument("--venv-dir", metavar="DIR",
+                               help="Create a venv per graph requirements here (default: run on this interpreter)")
+    worker_parser.set_defaults(handler=worker_command)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,33 @@
 """Core graph engine components."""
-from .node import Node
-from .pin import Pin
-from .connection import Connection
-from .reroute_node import RerouteNode
-from .node_graph import NodeGraph
-from .event_system import EventType, GraphEvent, EventManager, LiveGraphExecutor
-
-__all__ = [
-    'Node', 'Pin', 'Connection', 'RerouteNode', 
-    'NodeGraph', 'EventType', 'GraphEvent', 'EventManager', 'LiveGraphExecutor'
-]
\ No newline at end of file
+import importlib
+import os
+import sys
+
+# Modules import sibling packages as top-level ones (``from core.pin import Pin``)
+src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+# Exports are imported on first access, so Qt-free modules such as
+# node_signature and headless_graph can be used without loading Qt.
+_EXPORTS = {
+    'Node': '.node',
+    'Pin': '.pin',
+    'Connection': '.connection',
+    'RerouteNode': '.reroute_node',
+    'NodeGraph': '.node_graph',
+    'EventType': '.event_system',
+    'GraphEvent': '.event_system',
+    'EventManager': '.event_system',
+    'LiveGraphExecutor': '.event_system',
+    'HeadlessGraph': '.headless_graph',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -3,11 +3,17 @@ Event-driven execution system for interactive PyFlowGraph applications.
 Enables live, event-based execution with state persistence.
 """
 
+import math
+import time
 from enum import Enum
-from typing import Dict, Any, Optional, Callable
-from PySide6.QtCore import QObject, Signal, QTimer
+from typing import Dict, Any, Optional, Callable, Tuple
+from PySide6.QtCore import QObject, Qt, Signal, QTimer
 from collections import defaultdict
 
+# GraphExecutor is resolved through the package's lazy exports on first use,
+# so importing this module does not load the execution backends
+import execution
+
 
 class EventType(Enum):
     """Types of events that can trigger node execution."""
@@ -20,14 +26,40 @@ class EventType(Enum):
     NODE_TRIGGER = "node_trigger"
 
 
+# Dispatch order when several queued events are ready at once; lower goes first
+EVENT_PRIORITIES = {
+    EventType.GRAPH_RESET: 0,
+    EventType.BUTTON_CLICK: 1,
+    EventType.USER_INPUT: 1,
+    EventType.NODE_TRIGGER: 1,
+    EventType.VALUE_CHANGED: 2,
+    EventType.TIMER_TICK: 3,
+}
+
+# Distinct sources with a pending event before the lowest-priority ones are dropped
+DEFAULT_MAX_PENDING = 256
+
+# Slider drags and typing re-run a flow at most this often (seconds)
+DEFAULT_VALUE_THROTTLE = 1 / 30
+
+
 class GraphEvent:
     """Represents an event that occurred in the graph."""
 
-    def __init__(self, event_type: EventType, source_node=None, data: Dict[str, Any] = None):
+    def __init__(self, event_type: EventType, source_node=None, data: Dict[str, Any] = None,
+                 priority: Optional[int] = None):
         self.event_type = event_type
         self.source_node = source_node
         self.data = data or {}
-        self.timestamp = None
+        self.priority = EVENT_PRIORITIES.get(event_type, 1) if priority is None else priority
+        self.timestamp = time.monotonic()
+        # Earlier events from the same source this one replaced while queued
+        self.merged = 0
+
+    @property
+    def source_key(self) -> Tuple[Optional[str], EventType]:
+        """Events with the same key coalesce in a LiveEventQueue."""
+        return getattr(self.source_node, "uuid", None), self.event_type
 
 
 class EventManager(QObject):
@@ -69,6 +101,171 @@ class EventManager(QObject):
         self.node_events.pop(node_uuid, None)
 
 
+# Widget signals that post VALUE_CHANGED for nodes declared with @node_entry(live_on_change=True)
+VALUE_SIGNALS = ("valueChanged", "textChanged", "currentIndexChanged", "stateChanged")
+
+
+class LiveEventQueue(QObject):
+    """Live-mode event loop: queued GraphEvents dispatched one at a time from the Qt event loop.
+
+    Events never run their flow inside the signal handler that posted them.
+    Each source (node and event type) has at most one pending event: a newer
+    one replaces it, so the flow sees the latest value ("latest value wins")
+    and a burst of clicks or a slider drag costs one run, not one per event.
+    Ready events are dispatched in ``EVENT_PRIORITIES`` order, oldest first
+    within a priority.
+
+    Per event type, or per node and event type, a debounce window holds an
+    event until its source has been quiet that long, and a throttle window
+    spaces dispatches from one source at least that far apart while still
+    delivering the last value. Beyond ``max_pending`` sources the lowest
+    priority, oldest event is dropped.
+    """
+
+    def __init__(self, handler: Callable[[GraphEvent], None], max_pending: int = DEFAULT_MAX_PENDING,
+                 parent=None):
+        super().__init__(parent)
+        self.handler = handler
+        self.max_pending = max_pending
+        self._pending: Dict[Tuple, GraphEvent] = {}
+        self._sequence: Dict[Tuple, int] = {}
+        self._next_sequence = 0
+        self._last_dispatch: Dict[Tuple, float] = {}
+        self._debounce: Dict[Any, float] = {}
+        self._throttle: Dict[Any, float] = {EventType.VALUE_CHANGED: DEFAULT_VALUE_THROTTLE}
+        self._dispatching = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._dispatch_next)
+        self.posted = self.dispatched = self.merged = self.dropped = 0
+
+    def set_debounce(self, event_type: EventType, seconds: float, node_uuid: Optional[str] = None):
+        """Hold events until their source has been quiet for ``seconds`` (0 disables)."""
+        self._debounce[event_type if node_uuid is None else (node_uuid, event_type)] = seconds
+
+    def set_throttle(self, event_type: EventType, seconds: float, node_uuid: Optional[str] = None):
+        """Dispatch events from one source at most once per ``seconds`` (0 disables)."""
+        self._throttle[event_type if node_uuid is None else (node_uuid, event_type)] = seconds
+
+    def post(self, event: GraphEvent):
+        """Queue ``event``, replacing a pending event from the same source."""
+        self.posted += 1
+        key = event.source_key
+        previous = self._pending.get(key)
+        if previous is not None:
+            event.merged = previous.merged + 1
+            self.merged += 1
+        else:
+            self._sequence[key] = self._next_sequence
+            self._next_sequence += 1
+        self._pending[key] = event
+        if len(self._pending) > self.max_pending:
+            victim = max(self._pending, key=lambda k: (self._pending[k].priority, -self._sequence[k]))
+            del self._pending[victim], self._sequence[victim]
+            self.dropped += 1
+        self._schedule()
+
+    def clear(self):
+        """Discard pending events (counters are kept)."""
+        self._timer.stop()
+        self._pending.clear()
+        self._sequence.clear()
+        self._last_dispatch.clear()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> Dict[str, int]:
+        return {'posted': self.posted, 'dispatched': self.dispatched, 'merged': self.merged,
+                'dropped': self.dropped, 'pending': len(self._pending)}
+
+    def format_stats(self) -> str:
+        return (f"[EVENTS] {self.posted} posted, {self.dispatched} dispatched, "
+                f"{self.merged} merged, {self.dropped} dropped")
+
+    def _window(self, table: Dict[Any, float], key: Tuple) -> float:
+        window = table.get(key)
+        return table.get(key[1], 0) if window is None else window
+
+    def _ready_at(self, key: Tuple, event: GraphEvent) -> float:
+        ready_at = event.timestamp + self._window(self._debounce, key)
+        throttle = self._window(self._throttle, key)
+        if throttle and key in self._last_dispatch:
+            ready_at = max(ready_at, self._last_dispatch[key] + throttle)
+        return ready_at
+
+    def _schedule(self):
+        if not self._pending or self._dispatching:
+            return
+        now = time.monotonic()
+        delay = max(0.0, min(self._ready_at(key, event) for key, event in self._pending.items()) - now)
+        milliseconds = math.ceil(delay * 1000)
+        # A burst of posts restarts the timer only when it brings the next dispatch forward
+        if not self._timer.isActive() or milliseconds < self._timer.remainingTime():
+            self._timer.start(milliseconds)
+
+    def _dispatch_next(self):
+        now = time.monotonic()
+        ready = [key for key, event in self._pending.items() if self._ready_at(key, event) <= now]
+        if ready:
+            key = min(ready, key=lambda k: (self._pending[k].priority, self._sequence[k]))
+            event = self._pending.pop(key)
+            del self._sequence[key]
+            self._last_dispatch[key] = now
+            self.dispatched += 1
+            # A flow that pumps the Qt event loop must not start another one inside it
+            self._dispatching = True
+            try:
+                self.handler(event)
+            finally:
+                self._dispatching = False
+        self._schedule()
+
+
+class TimerSource(QObject):
+    """Posts TIMER_TICK events for a node at ``rate`` Hz while started.
+
+    Ticks missed because the GUI thread was busy (Qt does not queue them)
+    are counted in ``missed`` and reported as dropped by the queue.
+    """
+
+    def __init__(self, node, rate: float, queue: LiveEventQueue, parent=None):
+        super().__init__(parent)
+        self.node = node
+        self.rate = rate
+        self.queue = queue
+        self.ticks = 0
+        self.missed = 0
+        self._interval = 1.0 / rate
+        self._last_tick = None
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.setInterval(max(1, round(self._interval * 1000)))
+        self._timer.timeout.connect(self._tick)
+
+    @property
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+
+    def start(self):
+        self._last_tick = time.monotonic()
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def _tick(self):
+        now = time.monotonic()
+        missed = max(0, round((now - self._last_tick) / self._interval) - 1)
+        self._last_tick = now
+        self.ticks += 1
+        self.missed += missed
+        self.queue.dropped += missed
+        self.queue.post(GraphEvent(EventType.TIMER_TICK, self.node, {"tick": self.ticks}))
+
+
 class LiveGraphExecutor:
     """Enhanced graph executor with event-driven capabilities and state persistence."""
 
@@ -86,8 +283,21 @@ class LiveGraphExecutor:
         # Event setup optimization
         self.events_setup = False  # Track if events are already configured
 
+        # Execution timeline shared with the batch executor, so live runs land in the same trace
+        self.tracer = None
+
+        # Warm GraphExecutor reused by every interaction, so node code stays compiled
+        # and the namespace keeps its imports; built on first use unless shared
+        self.executor = None
+        self._shared_executor = None
+
+        # Events are queued, coalesced and dispatched from the Qt event loop
+        self.event_queue = LiveEventQueue(self.handle_event, parent=self.event_manager)
+        # node uuid -> periodic source for nodes declared with @node_entry(live_rate=hz)
+        self.timer_sources: Dict[str, TimerSource] = {}
+
         # Connect event manager
-        self.event_manager.event_triggered.connect(self.handle_event)
+        self.event_manager.event_triggered.connect(self.event_queue.post)
 
     def set_live_mode(self, enabled: bool):
         """Toggle between live mode and batch mode."""
@@ -99,7 +309,14 @@ class LiveGraphExecutor:
                 self.events_setup = True
             else:
                 self.log.append("LIVE MODE ACTIVATED - Graph is ready for interaction!")
+            for source in self.timer_sources.values():
+                source.start()
         else:
+            for source in self.timer_sources.values():
+                source.stop()
+            self.event_queue.clear()
+            if self.event_queue.posted:
+                self.log.append(self.event_queue.format_stats())
             self.log.append("BATCH MODE ACTIVATED - Traditional execution mode")
             # Don't cleanup events - keep them for fast reactivation
             self.reset_graph_state()
@@ -109,6 +326,20 @@ class LiveGraphExecutor:
         for node in self.graph.nodes:
             if hasattr(node, "gui_widgets") and node.gui_widgets:
                 self._setup_node_event_handlers(node)
+            if getattr(node, "live_rate", None):
+                self.add_timer_source(node, node.live_rate)
+
+    def add_timer_source(self, node, rate: float) -> TimerSource:
+        """Run ``node``'s flow ``rate`` times a second while live mode is on."""
+        previous = self.timer_sources.pop(node.uuid, None)
+        if previous is not None:
+            previous.stop()
+            previous.deleteLater()
+        source = self.timer_sources[node.uuid] = TimerSource(node, rate, self.event_queue, self.event_manager)
+        if self.live_mode:
+            source.start()
+        self.log.append(f"Timer source on '{node.title}' at {rate:g} Hz")
+        return source
 
     def _setup_node_event_handlers(self, node):
         """Set up event handlers for a specific node's widgets."""
@@ -123,13 +354,25 @@ class LiveGraphExecutor:
             if hasattr(widget, "clicked"):  # It's a button
                 try:
                     # Use lambda with default parameter to capture node properly
-                    widget.clicked.connect(lambda checked=False, n=node: self.trigger_node_execution(n))
+                    widget.clicked.connect(
+                        lambda checked=False, n=node: self.event_queue.post(GraphEvent(EventType.BUTTON_CLICK, n)))
                     connected_count += 1
                 except Exception as e:
                     self.log.append(f"WARNING: Failed to connect button '{widget_name}': {e}")
+            elif getattr(node, "live_on_change", False):
+                signal_name = next((name for name in VALUE_SIGNALS if hasattr(widget, name)), None)
+                if signal_name is None:
+                    continue
+                try:
+                    getattr(widget, signal_name).connect(
+                        lambda *args, n=node, w=widget_name: self.event_queue.post(
+                            GraphEvent(EventType.VALUE_CHANGED, n, {"widget": w})))
+                    connected_count += 1
+                except Exception as e:
+                    self.log.append(f"WARNING: Failed to connect widget '{widget_name}': {e}")
 
         if connected_count > 0:
-            self.log.append(f"Connected {connected_count} interactive button(s) in '{node.title}'")
+            self.log.append(f"Connected {connected_count} interactive widget(s) in '{node.title}'")
 
     def _cleanup_node_events(self):
         """Clean up all node event handlers."""
@@ -154,31 +397,55 @@ class LiveGraphExecutor:
             self.log.append(f"ERROR: Execution error: {e}")
             self.log.append("TIP: Try resetting the graph")
 
+    def set_executor(self, executor):
+        """Run interactions on ``executor`` (e.g. the batch executor) instead of a private one."""
+        self.executor = self._shared_executor = executor
+        self.tracer = executor.tracer
+
+    def get_executor(self):
+        """The warm executor, created on first use and refreshed when the environment changes."""
+        venv_path = self.get_venv_path() if self.get_venv_path else None
+        if self.executor is None:
+            self.executor = execution.GraphExecutor(self.graph, self.log, self.get_venv_path, tracer=self.tracer)
+        elif venv_path != self.executor.single_process_executor.venv_path:
+            self.executor.refresh_executor_environment()
+        return self.executor
+
+    def shutdown(self):
+        """Stop timer sources and release the private executor (a shared executor is left to its owner)."""
+        for source in self.timer_sources.values():
+            source.stop()
+        if self.executor is not None and self.executor is not self._shared_executor:
+            self.executor.shutdown()
+        self.executor = None
+
     def _execute_node_flow_live(self, node):
         """Execute a node in live mode with state persistence."""
-        # Add project root to path for cross-package imports
-        import sys
-        import os
-        project_root = os.path.dirname(os.path.dirname(__file__))
-        if project_root not in sys.path:
-            sys.path.insert(0, project_root)
-        
-        from execution.graph_executor import GraphExecutor
-
-        # Create a temporary executor for this execution
-        temp_executor = GraphExecutor(self.graph, self.log, self.get_venv_path)
+        executor = self.get_executor()
+        spill_store = executor.spill_store
+        if getattr(self.pin_values, "_store", None) is not spill_store:
+            # Live pin values follow the executor's memory budget
+            self.pin_values = (spill_store.new_pin_values(self.pin_values) if spill_store is not None
+                               else {pin: self.pin_values[pin] for pin in self.pin_values})
 
         # Execute just this node and its downstream flow
-        execution_count = temp_executor._execute_node_flow(node, self.pin_values, 0, 100)
+        execution_count = executor._execute_node_flow(node, self.pin_values, 0, 100)
 
         self.log.append(f"Live execution completed ({execution_count} nodes)")
 
     def handle_event(self, event: GraphEvent):
-        """Handle an event emitted by the event manager."""
+        """Handle an event dispatched by the live event queue."""
         # Removed GRAPH_RESET handling to prevent recursion
-        if event.event_type == EventType.NODE_TRIGGER:
-            if event.source_node:
-                self.trigger_node_execution(event.source_node)
+        if not event.source_node:
+            return
+        if event.event_type in (EventType.NODE_TRIGGER, EventType.BUTTON_CLICK, EventType.USER_INPUT):
+            self.trigger_node_execution(event.source_node)
+        elif event.event_type in (EventType.VALUE_CHANGED, EventType.TIMER_TICK) and self.live_mode:
+            # Frequent sources run quietly; the flow's own node log is enough
+            try:
+                self._execute_node_flow_live(event.source_node)
+            except Exception as e:
+                self.log.append(f"ERROR: Execution error: {e}")
 
     def reset_graph_state(self):
         """Reset the graph to initial state."""
@@ -38,6 +38,9 @@ class Group(QGraphicsRectItem):
         
         # Groups no longer have interface pins - they keep original connections
         
+        # Function groups execute as one compiled call (see execution/group_function.py)
+        self.is_function = False
+        
         # Visual state
         self.is_expanded = True
         self.is_selected = False
@@ -569,6 +572,7 @@ class Group(QGraphicsRectItem):
             "description": self.description,
             "member_node_uuids": self.member_node_uuids,
             "is_expanded": self.is_expanded,
+            "is_function": self.is_function,
             "position": {"x": self.pos().x(), "y": self.pos().y()},
             "size": {"width": self.width, "height": self.height},
             "padding": self.padding,
@@ -618,6 +622,7 @@ class Group(QGraphicsRectItem):
         group.uuid = data.get("uuid", str(uuid.uuid4()))
         group.description = data.get("description", "")
         group.is_expanded = data.get("is_expanded", True)
+        group.is_function = data.get("is_function", False)
         
         # Restore position and size
         position = data.get("position", {"x": 0, "y": 0})
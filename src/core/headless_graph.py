@@ -0,0 +1,179 @@
+# headless_graph.py
+# Lightweight, Qt-free graph model built from serialized graph data.
+# Mirrors the parts of Node, RerouteNode, Pin and Connection that execution
+# plans read, so graphs can run on machines without a display or PySide6.
+
+from typing import Any, Dict, List, Optional
+
+from .node_signature import parse_node_signature
+
+
+class HeadlessPin:
+    """A pin with just the fields execution reads."""
+
+    __slots__ = ("node", "name", "direction", "pin_type", "pin_category", "connections")
+
+    def __init__(self, node, name: str, direction: str, pin_type: str, pin_category: str = "data"):
+        self.node = node
+        self.name = name
+        self.direction = direction
+        self.pin_type = pin_type
+        self.pin_category = pin_category
+        self.connections: List["HeadlessConnection"] = []
+
+
+class HeadlessConnection:
+    """A connection from an output pin to an input pin."""
+
+    __slots__ = ("start_pin", "end_pin")
+
+    def __init__(self, start_pin: HeadlessPin, end_pin: HeadlessPin):
+        self.start_pin = start_pin
+        self.end_pin = end_pin
+        start_pin.connections.append(self)
+        end_pin.connections.append(self)
+
+
+class HeadlessNode:
+    """A code node whose pins are parsed from its code exactly as ``Node`` does.
+
+    GUI widgets do not exist headless; the values saved in the graph's
+    ``gui_state`` stand in for them.
+    """
+
+    is_reroute = False
+
+    def __init__(self, node_data: Dict[str, Any]):
+        self.uuid = node_data["uuid"]
+        self.title = node_data.get("title", "")
+        self.description = node_data.get("description", "")
+        self.code = node_data.get("code", "")
+        self.gui_state = dict(node_data.get("gui_state") or {})
+        self.function_name = None
+        self.run_in_process = False
+        self.run_isolated = False
+        self.run_remote = False
+        self.persist_result = False
+        self.vectorized = False
+        self.retain_outputs = False
+        self.live_rate = None
+        self.live_on_change = False
+        self.is_async = False
+        self.is_streaming = False
+        self.pins: List[HeadlessPin] = []
+        self._build_pins()
+
+    @property
+    def input_pins(self) -> List[HeadlessPin]:
+        return [pin for pin in self.pins if pin.direction == "input"]
+
+    @property
+    def output_pins(self) -> List[HeadlessPin]:
+        return [pin for pin in self.pins if pin.direction == "output"]
+
+    def _build_pins(self):
+        try:
+            signature = parse_node_signature(self.code)
+        except (SyntaxError, AttributeError):
+            return
+        if signature is None:
+            return
+        self.function_name = signature.function_name
+        self.run_in_process = signature.run_in_process
+        self.run_isolated = signature.run_isolated
+        self.run_remote = signature.run_remote
+        self.persist_result = signature.persist_result
+        self.vectorized = signature.vectorized
+        self.retain_outputs = signature.retain_outputs
+        self.live_rate = signature.live_rate
+        self.live_on_change = signature.live_on_change
+        self.is_async = signature.is_async
+        self.is_streaming = signature.is_streaming
+
+        # Same pin order as Node.update_pins_from_code: data pins, then execution pins
+        for name, pin_type in signature.inputs.items():
+            self.pins.append(HeadlessPin(self, name, "input", pin_type))
+        for name, pin_type in signature.outputs.items():
+            self.pins.append(HeadlessPin(self, name, "output", pin_type))
+        if signature.inputs:
+            self.pins.append(HeadlessPin(self, "exec_in", "input", "exec", "execution"))
+        self.pins.append(HeadlessPin(self, "exec_out", "output", "exec", "execution"))
+
+    def get_gui_values(self) -> Dict[str, Any]:
+        return dict(self.gui_state)
+
+    def get_pin_by_name_and_direction(self, name: str, direction: str) -> Optional[HeadlessPin]:
+        for pin in self.pins:
+            if pin.name == name and pin.direction == direction:
+                return pin
+        return None
+
+
+class HeadlessRerouteNode:
+    """A reroute node: one input passed through to one output."""
+
+    is_reroute = True
+
+    def __init__(self, node_data: Dict[str, Any]):
+        self.uuid = node_data["uuid"]
+        self.title = "Reroute"
+        self.code = ""
+        self.function_name = None
+        self.input_pin = HeadlessPin(self, "input", "input", "any")
+        self.output_pin = HeadlessPin(self, "output", "output", "any")
+        self.pins = [self.input_pin, self.output_pin]
+
+    def get_pin_by_name_and_direction(self, name: str, direction: str) -> Optional[HeadlessPin]:
+        for pin in self.pins:
+            if pin.name == name and pin.direction == direction:
+                return pin
+        return None
+
+
+class HeadlessGroup:
+    """A group's membership and whether it executes as one function."""
+
+    def __init__(self, group_data: Dict[str, Any]):
+        self.uuid = group_data.get("uuid", "")
+        self.name = group_data.get("name", "Group")
+        self.member_node_uuids = list(group_data.get("member_node_uuids", []))
+        self.is_function = bool(group_data.get("is_function", False))
+
+
+class HeadlessGraph:
+    """Graph of headless nodes, built from the dict ``FlowFormatHandler.markdown_to_data`` returns.
+
+    The structure never changes after loading, so execution plans built from
+    it can be reused.
+    """
+
+    structure_revision = 0
+
+    def __init__(self, data: Dict[str, Any]):
+        self.graph_title = data.get("graph_title", "Untitled Graph")
+        self.requirements = data.get("requirements", [])
+        self.nodes: List[Any] = []
+        self.groups = [HeadlessGroup(group_data) for group_data in data.get("groups", [])]
+        self._nodes_by_uuid: Dict[str, Any] = {}
+
+        for node_data in data.get("nodes", []):
+            node = (HeadlessRerouteNode(node_data) if node_data.get("is_reroute", False)
+                    else HeadlessNode(node_data))
+            self.nodes.append(node)
+            self._nodes_by_uuid[node.uuid] = node
+
+        for conn_data in data.get("connections", []):
+            start_node = self._nodes_by_uuid.get(conn_data["start_node_uuid"])
+            end_node = self._nodes_by_uuid.get(conn_data["end_node_uuid"])
+            if start_node and end_node:
+                start_pin = start_node.get_pin_by_name_and_direction(conn_data["start_pin_name"], "output")
+                end_pin = end_node.get_pin_by_name_and_direction(conn_data["end_pin_name"], "input")
+                if start_pin and end_pin:
+                    HeadlessConnection(start_pin, end_pin)
+
+    def find_node(self, key: str):
+        """Find a node by UUID or, failing that, by title."""
+        node = self._nodes_by_uuid.get(key)
+        if node is not None:
+            return node
+        return next((node for node in self.nodes if node.title == key), None)
@@ -3,7 +3,6 @@
 # for visuals, logic, and interaction.
 
 import uuid
-import ast
 import sys
 import os
 from PySide6.QtWidgets import QGraphicsItem, QGraphicsTextItem, QGraphicsProxyWidget, QPushButton, QVBoxLayout, QWidget, QStyle, QApplication
@@ -16,6 +15,7 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 from .pin import Pin
+from .node_signature import parse_node_signature
 
 # Debug configuration  
 # Set to True to enable detailed GUI widget update debugging
@@ -61,6 +61,26 @@ class Node(QGraphicsItem):
         # --- Code Storage ---
         self.code, self.gui_code, self.gui_get_values_code = "", "", ""
         self.function_name = None
+        # Set by @node_entry(process=True): run in a worker process instead of in-process
+        self.run_in_process = False
+        # Set by @node_entry(isolate=True): run in a worker started from the graph's venv interpreter
+        self.run_isolated = False
+        # Set by @node_entry(remote=True): run on a remote worker daemon when one is configured
+        self.run_remote = False
+        # Set by @node_entry(persist=True): keep results in the on-disk result store
+        self.persist_result = False
+        # True when the entry function is declared with async def
+        self.is_async = False
+        # True when the entry function yields or is annotated Iterator[T]/Generator[...]
+        self.is_streaming = False
+        # Set by @node_entry(vectorize=True): batch runs pass whole columns of inputs
+        self.vectorized = False
+        # Set by @node_entry(retain=True): outputs stay in memory for the whole run
+        self.retain_outputs = False
+        # Set by @node_entry(live_rate=hz): live mode runs the node's flow periodically
+        self.live_rate = None
+        # Set by @node_entry(live_on_change=True): live mode runs the flow when a widget value changes
+        self.live_on_change = False
         self.gui_widgets = {}
 
         # --- Interaction State ---
@@ -457,6 +477,10 @@ class Node(QGraphicsItem):
         dialog.exec()
 
     def set_code(self, code_text):
+        if code_text != self.code:
+            # Drop the compiled form of the old code from executor caches
+            from execution.code_cache import invalidate_code
+            invalidate_code(self.code)
         self.code = code_text
         self.update_pins_from_code()
 
@@ -556,54 +580,6 @@ class Node(QGraphicsItem):
         if hasattr(pin, 'update_label_text'):
             pin.update_label_text()
 
-    def _parse_type_hint(self, hint_node):
-        if hint_node is None:
-            return "any"
-        if isinstance(hint_node, ast.Name):
-            return hint_node.id
-        if isinstance(hint_node, ast.Subscript):
-            base_type = self._parse_type_hint(hint_node.value)
-            # Handle different slice types
-            if isinstance(hint_node.slice, ast.Name):
-                # Simple generic like List[Dict]
-                slice_type = hint_node.slice.id
-                return f"{base_type}[{slice_type}]"
-            elif isinstance(hint_node.slice, ast.Tuple):
-                # Multiple generic parameters like Dict[str, int]
-                slice_types = [self._parse_type_hint(elt) for elt in hint_node.slice.elts]
-                return f"{base_type}[{', '.join(slice_types)}]"
-            elif hasattr(hint_node.slice, 'value'):
-                # Handle other slice structures
-                return f"{base_type}[{self._parse_type_hint(hint_node.slice)}]"
-            else:
-                # Fallback for unknown slice types
-                return base_type
-        return "any"
-    
-    def _parse_named_output(self, type_str):
-        """Parse named output like 'name:type' or just 'type'."""
-        if ':' in type_str:
-            name, type_part = type_str.split(':', 1)
-            return name.strip(), type_part.strip().lower()
-        else:
-            return None, type_str.lower()
-    
-    def _parse_output_names_from_docstring(self, func_def):
-        """Parse output names from function docstring using @outputs annotation."""
-        docstring = ast.get_docstring(func_def)
-        if not docstring:
-            return []
-        
-        lines = docstring.split('\n')
-        for line in lines:
-            line = line.strip()
-            if line.startswith('@outputs:'):
-                # Format: @outputs: name1, name2, name3
-                outputs_str = line.replace('@outputs:', '').strip()
-                return [name.strip() for name in outputs_str.split(',') if name.strip()]
-        
-        return []
-    
     def _update_data_pins(self, new_pins_dict, direction):
         """Update data pins intelligently, preserving connections when renaming"""
         # Get current pins of this direction and category
@@ -641,71 +617,44 @@ class Node(QGraphicsItem):
             self.remove_pin(current_pins[i])
 
     def update_pins_from_code(self):
-        new_data_inputs, new_data_outputs = {}, {}
-        self.function_name, main_func_def = None, None
+        self.function_name = None
+        self.run_in_process = False
+        self.run_isolated = False
+        self.run_remote = False
+        self.persist_result = False
+        self.is_async = False
+        self.is_streaming = False
+        self.vectorized = False
+        self.retain_outputs = False
+        self.live_rate = None
+        self.live_on_change = False
         
         try:
-            tree = ast.parse(self.code)
-            for node in tree.body:
-                if isinstance(node, ast.FunctionDef):
-                    for decorator in node.decorator_list:
-                        if isinstance(decorator, ast.Name) and decorator.id == "node_entry":
-                            main_func_def = node
-                            break
-                    if main_func_def:
-                        break
-            if not main_func_def:
-                # Remove all pins if no valid function
-                for pin in list(self.pins):
-                    self.remove_pin(pin)
-                self.fit_size_to_content()
-                return
-                
-            self.function_name = main_func_def.name
-            
-            # Parse data input pins from function parameters
-            for arg in main_func_def.args.args:
-                new_data_inputs[arg.arg] = self._parse_type_hint(arg.annotation).lower()
-            
-            # Parse data output pins from return annotation
-            if main_func_def.returns:
-                return_annotation = main_func_def.returns
-                if isinstance(return_annotation, ast.Subscript) and isinstance(return_annotation.value, ast.Name) and return_annotation.value.id.lower() == "tuple":
-                    # Handle Tuple[str, int, bool] - multiple outputs
-                    if hasattr(return_annotation.slice, 'elts'):
-                        # Check for named outputs in docstring first
-                        named_outputs = self._parse_output_names_from_docstring(main_func_def)
-                        
-                        for i, elt in enumerate(return_annotation.slice.elts):
-                            type_name = self._parse_type_hint(elt).lower()
-                            
-                            # Use named output if available, otherwise use generic name
-                            if i < len(named_outputs):
-                                output_name = named_outputs[i]
-                            else:
-                                output_name = f"output_{i+1}"
-                            
-                            new_data_outputs[output_name] = type_name
-                    else:
-                        # Single tuple element like Tuple[str]
-                        named_outputs = self._parse_output_names_from_docstring(main_func_def)
-                        type_name = self._parse_type_hint(return_annotation.slice).lower()
-                        
-                        if named_outputs:
-                            new_data_outputs[named_outputs[0]] = type_name
-                        else:
-                            new_data_outputs["output_1"] = type_name
-                else:
-                    # Handle single return types (including List[Dict], Dict[str, int], etc.)
-                    named_outputs = self._parse_output_names_from_docstring(main_func_def)
-                    type_name = self._parse_type_hint(return_annotation).lower()
-                    
-                    if named_outputs:
-                        new_data_outputs[named_outputs[0]] = type_name
-                    else:
-                        new_data_outputs["output_1"] = type_name
+            signature = parse_node_signature(self.code)
         except (SyntaxError, AttributeError):
             return
+        if signature is None:
+            # Remove all pins if no valid function
+            for pin in list(self.pins):
+                self.remove_pin(pin)
+            self.fit_size_to_content()
+            return
+
+        self.function_name = signature.function_name
+        self.run_in_process = signature.run_in_process
+        self.run_isolated = signature.run_isolated
+        self.run_remote = signature.run_remote
+        self.persist_result = signature.persist_result
+        self.vectorized = signature.vectorized
+        self.retain_outputs = signature.retain_outputs
+        self.live_rate = signature.live_rate
+        self.live_on_change = signature.live_on_change
+        self.is_async = signature.is_async
+        self.is_streaming = signature.is_streaming
+        new_data_inputs, new_data_outputs = signature.inputs, signature.outputs
+
+        # Function name or pin names may have changed even if no pin was added
+        self._mark_graph_changed()
 
         # Manage data pins intelligently
         self._update_data_pins(new_data_inputs, "input")
@@ -734,6 +683,7 @@ class Node(QGraphicsItem):
     def add_pin(self, name, direction, pin_type_str, pin_category="data"):
         pin = Pin(self, name, direction, pin_type_str, pin_category)
         self.pins.append(pin)
+        self._mark_graph_changed()
         
         if direction == "input":
             self.input_pins.append(pin)
@@ -762,6 +712,8 @@ class Node(QGraphicsItem):
                 if self.scene():
                     self.scene().remove_connection(conn, use_command=False)
         
+        self._mark_graph_changed()
+
         # Destroy the pin (this handles scene removal safely)
         pin_to_remove.destroy()
         
@@ -776,3 +728,9 @@ class Node(QGraphicsItem):
             self.execution_pins.remove(pin_to_remove)
         if pin_to_remove in self.data_pins:
             self.data_pins.remove(pin_to_remove)
+
+    def _mark_graph_changed(self):
+        """Tell the owning graph that its execution structure changed."""
+        scene = self.scene()
+        if scene is not None and hasattr(scene, "mark_structure_changed"):
+            scene.mark_structure_changed()
@@ -43,10 +43,18 @@ class NodeGraph(QGraphicsScene):
         self.graph_description = ""
         self._is_pasting = False  # Flag to prevent Group.itemChange during paste operations
         
+        # Bumped whenever pins, connections or node code change so cached
+        # execution plans know when they have to be rebuilt
+        self.structure_revision = 0
+        
         # Command system integration
         self.command_history = CommandHistory()
         self._tracking_moves = {}  # Track node movements for command batching  # Track node movements for command batching  # Track node movements for command batching
     
+    def mark_structure_changed(self):
+        """Record a change in pins, connections or code that affects execution."""
+        self.structure_revision += 1
+
     def get_node_by_id(self, node_id):
         """Find node by UUID - helper for command restoration."""
         for node in self.nodes:
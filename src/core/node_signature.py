@@ -0,0 +1,197 @@
+# node_signature.py
+# Parses a node's source code into its entry function signature: data pins,
+# @node_entry options and function kind. Free of Qt so the editor's Node and
+# the headless runner derive identical pins from the same code.
+
+import ast
+from typing import Dict, List, Optional
+
+
+class NodeSignature:
+    """What a node's ``@node_entry`` function declares.
+
+    ``inputs`` and ``outputs`` map data pin names to lower-cased type strings,
+    in declaration order.
+    """
+
+    def __init__(self, function_name: str):
+        self.function_name = function_name
+        self.inputs: Dict[str, str] = {}
+        self.outputs: Dict[str, str] = {}
+        self.run_in_process = False
+        self.run_isolated = False
+        self.run_remote = False
+        self.persist_result = False
+        self.vectorized = False
+        self.retain_outputs = False
+        self.live_rate: Optional[float] = None
+        self.live_on_change = False
+        self.is_async = False
+        self.is_streaming = False
+
+
+def parse_type_hint(hint_node) -> str:
+    if hint_node is None:
+        return "any"
+    if isinstance(hint_node, ast.Name):
+        return hint_node.id
+    if isinstance(hint_node, ast.Subscript):
+        base_type = parse_type_hint(hint_node.value)
+        # Handle different slice types
+        if isinstance(hint_node.slice, ast.Name):
+            # Simple generic like List[Dict]
+            slice_type = hint_node.slice.id
+            return f"{base_type}[{slice_type}]"
+        elif isinstance(hint_node.slice, ast.Tuple):
+            # Multiple generic parameters like Dict[str, int]
+            slice_types = [parse_type_hint(elt) for elt in hint_node.slice.elts]
+            return f"{base_type}[{', '.join(slice_types)}]"
+        elif hasattr(hint_node.slice, 'value'):
+            # Handle other slice structures
+            return f"{base_type}[{parse_type_hint(hint_node.slice)}]"
+        else:
+            # Fallback for unknown slice types
+            return base_type
+    return "any"
+
+
+def parse_named_output(type_str):
+    """Parse named output like 'name:type' or just 'type'."""
+    if ':' in type_str:
+        name, type_part = type_str.split(':', 1)
+        return name.strip(), type_part.strip().lower()
+    else:
+        return None, type_str.lower()
+
+
+def parse_output_names_from_docstring(func_def) -> List[str]:
+    """Parse output names from function docstring using @outputs annotation."""
+    docstring = ast.get_docstring(func_def)
+    if not docstring:
+        return []
+
+    lines = docstring.split('\n')
+    for line in lines:
+        line = line.strip()
+        if line.startswith('@outputs:'):
+            # Format: @outputs: name1, name2, name3
+            outputs_str = line.replace('@outputs:', '').strip()
+            return [name.strip() for name in outputs_str.split(',') if name.strip()]
+
+    return []
+
+
+def is_generator_function(func_def) -> bool:
+    """Check whether a function body yields (ignoring nested functions and classes)."""
+    pending = list(func_def.body)
+    while pending:
+        item = pending.pop()
+        if isinstance(item, (ast.Yield, ast.YieldFrom)):
+            return True
+        if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            continue
+        pending.extend(ast.iter_child_nodes(item))
+    return False
+
+
+def is_stream_annotation(annotation) -> bool:
+    """Check for an ``Iterator[T]`` or ``Generator[...]`` return annotation."""
+    if isinstance(annotation, ast.Subscript):
+        annotation = annotation.value
+    if isinstance(annotation, ast.Attribute):
+        return annotation.attr in ("Iterator", "Generator")
+    return isinstance(annotation, ast.Name) and annotation.id in ("Iterator", "Generator")
+
+
+def parse_entry_option(decorator_call, name) -> bool:
+    """Read a literal keyword option from an ``@node_entry(...)`` decorator."""
+    for keyword in decorator_call.keywords:
+        if keyword.arg == name and isinstance(keyword.value, ast.Constant):
+            return bool(keyword.value.value)
+    return False
+
+
+def parse_entry_number(decorator_call, name) -> Optional[float]:
+    """Read a literal positive number option from an ``@node_entry(...)`` decorator."""
+    for keyword in decorator_call.keywords:
+        if (keyword.arg == name and isinstance(keyword.value, ast.Constant)
+                and isinstance(keyword.value.value, (int, float)) and not isinstance(keyword.value.value, bool)
+                and keyword.value.value > 0):
+            return float(keyword.value.value)
+    return None
+
+
+def _parse_outputs(func_def, is_streaming: bool) -> Dict[str, str]:
+    outputs = {}
+    return_annotation = func_def.returns
+    named_outputs = parse_output_names_from_docstring(func_def)
+    if return_annotation:
+        if (isinstance(return_annotation, ast.Subscript) and isinstance(return_annotation.value, ast.Name)
+                and return_annotation.value.id.lower() == "tuple"):
+            if hasattr(return_annotation.slice, 'elts'):
+                # Handle Tuple[str, int, bool] - multiple outputs
+                for i, elt in enumerate(return_annotation.slice.elts):
+                    # Use named output if available, otherwise use generic name
+                    output_name = named_outputs[i] if i < len(named_outputs) else f"output_{i+1}"
+                    outputs[output_name] = parse_type_hint(elt).lower()
+            else:
+                # Single tuple element like Tuple[str]
+                type_name = parse_type_hint(return_annotation.slice).lower()
+                outputs[named_outputs[0] if named_outputs else "output_1"] = type_name
+        else:
+            # Handle single return types (including List[Dict], Dict[str, int], etc.)
+            type_name = parse_type_hint(return_annotation).lower()
+            outputs[named_outputs[0] if named_outputs else "output_1"] = type_name
+    elif is_streaming:
+        # An unannotated generator still streams its items to one output
+        outputs[named_outputs[0] if named_outputs else "output_1"] = "iterator"
+    return outputs
+
+
+def parse_node_signature(code: str) -> Optional[NodeSignature]:
+    """Parse the ``@node_entry`` function out of ``code``.
+
+    Returns:
+        The signature, or None if the code defines no ``@node_entry`` function
+
+    Raises:
+        SyntaxError: If the code does not parse
+    """
+    tree = ast.parse(code)
+    main_func_def, decorator_call = None, None
+    for node in tree.body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in node.decorator_list:
+                if isinstance(decorator, ast.Name) and decorator.id == "node_entry":
+                    main_func_def = node
+                    break
+                if (isinstance(decorator, ast.Call) and isinstance(decorator.func, ast.Name)
+                        and decorator.func.id == "node_entry"):
+                    main_func_def, decorator_call = node, decorator
+                    break
+            if main_func_def:
+                break
+    if not main_func_def:
+        return None
+
+    signature = NodeSignature(main_func_def.name)
+    if decorator_call is not None:
+        signature.run_in_process = parse_entry_option(decorator_call, "process")
+        signature.run_isolated = parse_entry_option(decorator_call, "isolate")
+        signature.run_remote = parse_entry_option(decorator_call, "remote")
+        signature.persist_result = parse_entry_option(decorator_call, "persist")
+        signature.vectorized = parse_entry_option(decorator_call, "vectorize")
+        signature.retain_outputs = parse_entry_option(decorator_call, "retain")
+        signature.live_rate = parse_entry_number(decorator_call, "live_rate")
+        signature.live_on_change = parse_entry_option(decorator_call, "live_on_change")
+    signature.is_async = isinstance(main_func_def, ast.AsyncFunctionDef)
+    signature.is_streaming = (not signature.is_async and
+                              (is_generator_function(main_func_def) or
+                               is_stream_annotation(main_func_def.returns)))
+
+    # Parse data input pins from function parameters
+    for arg in main_func_def.args.args:
+        signature.inputs[arg.arg] = parse_type_hint(arg.annotation).lower()
+    # Parse data output pins from return annotation
+    signature.outputs = _parse_outputs(main_func_def, signature.is_streaming)
+    return signature
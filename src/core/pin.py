@@ -130,10 +130,18 @@ class Pin(QGraphicsItem):
 
     def add_connection(self, connection):
         self.connections.append(connection)
+        self._mark_graph_changed()
 
     def remove_connection(self, connection):
         if connection in self.connections:
             self.connections.remove(connection)
+            self._mark_graph_changed()
+
+    def _mark_graph_changed(self):
+        """Tell the owning graph that its execution structure changed."""
+        scene = self.scene()
+        if scene is not None and hasattr(scene, "mark_structure_changed"):
+            scene.mark_structure_changed()
 
     def update_connections(self):
         for conn in self.connections:
@@ -1,5 +1,25 @@
 """Data persistence and format handling."""
-from .file_operations import FileOperationsManager
-from .flow_format import FlowFormatHandler
+import importlib
+import os
+import sys
 
-__all__ = ['FileOperationsManager', 'FlowFormatHandler']
\ No newline at end of file
+# Modules import sibling packages as top-level ones (``from core.pin import Pin``)
+src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+# Exports are imported on first access, so the Qt-free flow format parser can
+# be used without loading the Qt file dialogs.
+_EXPORTS = {
+    'FileOperationsManager': '.file_operations',
+    'FlowFormatHandler': '.flow_format',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -4,14 +4,21 @@
 import json
 import re
 from typing import Dict, List, Any, Optional, Tuple
-from markdown_it import MarkdownIt
 
 
 class FlowFormatHandler:
     """Handles conversion between JSON graph format and .md markdown format."""
     
     def __init__(self):
-        self.md = MarkdownIt()
+        self._md = None
+    
+    @property
+    def md(self):
+        """Markdown parser, imported on first use: markdown_it is slow to import."""
+        if self._md is None:
+            from markdown_it import MarkdownIt
+            self._md = MarkdownIt()
+        return self._md
     
     def data_to_markdown(self, graph_data: Dict[str, Any], title: str = "Untitled Graph", 
                     description: str = "") -> str:
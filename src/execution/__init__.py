@@ -1,11 +1,33 @@
 """Code execution and environment management."""
-from .graph_executor import GraphExecutor
-from .single_process_executor import SingleProcessExecutor
-from .execution_controller import ExecutionController
-from .environment_manager import EnvironmentManagerDialog, EnvironmentWorker
-from .default_environment_manager import DefaultEnvironmentManager
-
-__all__ = [
-    'GraphExecutor', 'SingleProcessExecutor', 'ExecutionController', 
-    'EnvironmentManagerDialog', 'EnvironmentWorker', 'DefaultEnvironmentManager'
-]
\ No newline at end of file
+import importlib
+import os
+import sys
+
+# Modules import sibling packages as top-level ones (``from core.pin import Pin``)
+src_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+# Exports are imported on first access, so Qt-free modules such as the
+# headless runner can be used without loading the Qt-based ones.
+_EXPORTS = {
+    'GraphExecutor': '.graph_executor',
+    'ExecutionPlan': '.execution_plan',
+    'ParallelScheduler': '.parallel_scheduler',
+    'SingleProcessExecutor': '.single_process_executor',
+    'ProcessPoolNodeExecutor': '.process_pool_executor',
+    'HeadlessRunner': '.headless_runner',
+    'ExecutionController': '.execution_controller',
+    'EnvironmentManagerDialog': '.environment_manager',
+    'EnvironmentWorker': '.environment_manager',
+    'DefaultEnvironmentManager': '.default_environment_manager',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
@@ -0,0 +1,73 @@
+# async_runner.py
+# Dedicated asyncio event loop for `async def` node functions.
+# The loop runs on its own daemon thread so awaiting network- or disk-bound
+# nodes never blocks the Qt event loop, and independent async nodes submitted
+# together are awaited concurrently.
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Optional
+
+from .node_watchdog import wait_interruptibly
+
+
+class AsyncNodeRunner:
+    """Owns an event loop on a background thread, started on first use."""
+
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run_loop():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run_loop, name="PyFlowGraphAsyncNodes", daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coroutine: Awaitable) -> Future:
+        """Schedule ``coroutine`` on the loop and return a thread-safe future for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_loop())
+
+    def run(self, coroutine: Awaitable) -> Any:
+        """Run ``coroutine`` on the loop and block the calling thread until it finishes."""
+        if self._thread is not None and threading.current_thread() is self._thread:
+            raise RuntimeError("AsyncNodeRunner.run() cannot be called from the event loop thread")
+        return wait_interruptibly(self.submit(coroutine))
+
+    def shutdown(self):
+        """Stop the loop and its thread. A later submit starts a new one."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None:
+            return
+
+        async def cancel_pending():
+            # Let abandoned nodes (e.g. ones that timed out) unwind on their own loop
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            loop.stop()
+
+        asyncio.run_coroutine_threadsafe(cancel_pending(), loop)
+        thread.join(timeout=5)
+        if not loop.is_running():
+            loop.close()
@@ -0,0 +1,233 @@
+# batch_runner.py
+# Runs one compiled execution plan over many input records.
+# The plan is walked step by step across a whole chunk of records, so planning,
+# GUI value reads and logging happen once per chunk rather than once per record,
+# and vectorized nodes are called once per chunk with all records' inputs.
+
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .pin_liveness import PinLiveness
+
+# Records processed together per step
+DEFAULT_BATCH_SIZE = 1024
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float, complex)) and not isinstance(value, bool)
+
+
+def to_batch_column(values: List[Any]) -> Any:
+    """Collect one input across records: a NumPy array for numeric scalars, else a list."""
+    if values and all(_is_number(value) for value in values):
+        try:
+            import numpy
+        except ImportError:
+            return values
+        return numpy.asarray(values)
+    return values
+
+
+class BatchRunner:
+    """Executes a plan for every record of an iterable of parameter sets.
+
+    A record maps node titles (or UUIDs) to ``{input name: value}`` dicts that
+    override that node's GUI values and wired inputs. Node output is captured
+    and only passed to ``on_output`` if one is given; failures are collected
+    per record and skip only that record's downstream flow.
+    """
+
+    def __init__(self, graph_executor, batch_size: int = DEFAULT_BATCH_SIZE,
+                 on_output: Optional[Callable[[Any, str], None]] = None):
+        self.graph_executor = graph_executor
+        self.batch_size = batch_size
+        self.on_output = on_output
+        self.errors: List[Tuple[int, str]] = []
+        # Largest estimated size of pin values held at once by any chunk
+        self.peak_retained_bytes = 0
+        self.released_values = 0
+
+    def run(self, plan, records: Iterable[Dict[str, Dict[str, Any]]],
+            outputs: Optional[Sequence[str]] = None) -> List[Dict[str, Dict[str, Any]]]:
+        """Run ``plan`` once per record.
+
+        Args:
+            plan: Compiled ExecutionPlan
+            records: Iterable of ``{node title or uuid: {input name: value}}`` parameter sets
+            outputs: Titles of nodes whose outputs are returned (default: nodes
+                with at least one unconnected data output)
+
+        Returns:
+            One ``{node title: {output name: value}}`` dict per record
+        """
+        collected = self._collected_steps(plan, outputs)
+        gui_values = self._read_gui_values(plan)
+        results: List[Dict[str, Dict[str, Any]]] = []
+        chunk: List[Dict[str, Dict[str, Any]]] = []
+
+        for record in records:
+            chunk.append(record)
+            if len(chunk) >= self.batch_size:
+                results.extend(self._run_chunk(plan, chunk, len(results), gui_values, collected))
+                chunk = []
+        if chunk:
+            results.extend(self._run_chunk(plan, chunk, len(results), gui_values, collected))
+        return results
+
+    def _collected_steps(self, plan, outputs) -> Dict[int, List[Any]]:
+        """Per step index, the nodes whose outputs are returned (members, for a function group)."""
+        wanted = set(outputs) if outputs is not None else None
+        collected = {}
+        for index, step in enumerate(plan.steps):
+            if step.is_reroute or not step.outputs:
+                continue
+            nodes = step.node.members if getattr(step.node, "is_group", False) else [step.node]
+            nodes = [node for node in nodes if self._is_collected(node, wanted)]
+            if nodes:
+                collected[index] = nodes
+        return collected
+
+    @staticmethod
+    def _is_collected(node, wanted) -> bool:
+        if wanted is not None:
+            return node.title in wanted or getattr(node, "uuid", None) in wanted
+        return any(not pin.connections for pin in node.output_pins if pin.pin_category == "data")
+
+    def _read_gui_values(self, plan) -> Dict[int, Dict[str, Any]]:
+        """Read every node's GUI values once for the whole batch."""
+        gui_values = {}
+        for step in plan.steps:
+            node = step.node
+            if not step.is_reroute and id(node) not in gui_values and hasattr(node, "get_gui_values"):
+                gui_values[id(node)] = node.get_gui_values()
+        return gui_values
+
+    def _run_chunk(self, plan, records, offset, gui_values, collected):
+        count = len(records)
+        spill_store = getattr(self.graph_executor, "spill_store", None)
+        slot_values = [plan.new_slot_values(spill_store) for _ in range(count)]
+        liveness = PinLiveness(plan, slot_values)
+        # Per record, the first step index it may run again after a failure
+        skip_until = [0] * count
+        outputs = [dict() for _ in range(count)]
+
+        for index, step in enumerate(plan.steps):
+            if not step.is_reroute and step.node.function_name:
+                self._run_step(index, step, records, offset, slot_values, gui_values,
+                               skip_until, outputs, collected.get(index))
+            # Skipped records have no later reader of this step's inputs either
+            liveness.step_done(index)
+
+        self.peak_retained_bytes = max(self.peak_retained_bytes, liveness.peak_bytes)
+        self.released_values += liveness.released
+        return outputs
+
+    def _run_step(self, index, step, records, offset, slot_values, gui_values, skip_until, outputs, collect):
+        node = step.node
+        active = [r for r in range(len(records)) if skip_until[r] <= index]
+        if not active:
+            return
+
+        overrides = [self._record_overrides(records[r], node) for r in active]
+        inputs = [self._record_inputs(step, slot_values[r], gui_values, override)
+                  for r, override in zip(active, overrides)]
+
+        if getattr(node, "vectorized", False):
+            results = self._run_vectorized(node, active, inputs, offset, skip_until, step)
+        else:
+            results = self._run_per_record(node, active, inputs, offset, skip_until, step)
+
+        for r, result in results:
+            self._store(step, slot_values[r], result)
+            if not collect:
+                continue
+            values = {name: slot_values[r][slot] for name, slot in step.outputs}
+            if getattr(node, "is_group", False):
+                for member, member_values in node.split_outputs(values):
+                    if member in collect:
+                        outputs[r][member.title] = member_values
+            else:
+                outputs[r][node.title] = values
+
+    def _record_overrides(self, record, node) -> Dict[str, Any]:
+        if getattr(node, "is_group", False):
+            # Members' overrides travel in their GUI value parameters
+            overrides = {}
+            for member, name in node.gui_parameters:
+                override = self._record_overrides(record, member)
+                if override:
+                    overrides[name] = override
+            return overrides
+        override = record.get(node.title)
+        uuid = getattr(node, "uuid", None)
+        if uuid is not None and uuid in record:
+            override = {**(override or {}), **record[uuid]}
+        return override or {}
+
+    def _record_inputs(self, step, slot_values, gui_values, override) -> Dict[str, Any]:
+        inputs = {name: slot_values[slot] for name, slot in step.inputs}
+        inputs.update(gui_values.get(id(step.node), {}))
+        if getattr(step.node, "is_group", False):
+            for name, member_override in override.items():
+                inputs[name] = {**(inputs.get(name) or {}), **member_override}
+        else:
+            inputs.update(override)
+        return inputs
+
+    def _run_per_record(self, node, active, inputs, offset, skip_until, step):
+        executor = self.graph_executor.get_node_executor(node)
+        results = []
+        for r, record_inputs in zip(active, inputs):
+            try:
+                result, output = executor.execute_node(node, record_inputs)
+            except Exception as e:
+                self._fail(offset + r, str(e), r, skip_until, step)
+                continue
+            self._emit_output(node, output)
+            results.append((r, result))
+        return results
+
+    def _run_vectorized(self, node, active, inputs, offset, skip_until, step):
+        """Call a vectorized node once with every active record's inputs as columns."""
+        names = inputs[0].keys() if inputs else ()
+        columns = {name: to_batch_column([record_inputs.get(name) for record_inputs in inputs])
+                   for name in names}
+        executor = self.graph_executor.get_node_executor(node)
+        try:
+            result, output = executor.execute_node(node, columns)
+            self._emit_output(node, output)
+            per_record = self._split_vectorized(node, step, result, len(active))
+        except Exception as e:
+            for r in active:
+                self._fail(offset + r, str(e), r, skip_until, step)
+            return []
+        return list(zip(active, per_record))
+
+    def _split_vectorized(self, node, step, result, count) -> List[Any]:
+        """Turn a vectorized result (one column per output) into one result per record."""
+        if not step.outputs:
+            return [None] * count
+        if len(step.outputs) > 1:
+            columns = list(result)
+            if len(columns) != len(step.outputs) or any(len(column) != count for column in columns):
+                raise RuntimeError(f"ERROR in node '{node.title}': vectorized node must return "
+                                   f"{len(step.outputs)} columns of {count} values")
+            return [tuple(column[i] for column in columns) for i in range(count)]
+        if len(result) != count:
+            raise RuntimeError(f"ERROR in node '{node.title}': vectorized node returned "
+                               f"{len(result)} values for {count} records")
+        return list(result)
+
+    def _emit_output(self, node, output):
+        if output and self.on_output is not None:
+            self.on_output(node, output)
+
+    def _store(self, step, slot_values, result):
+        if len(step.outputs) == 1:
+            slot_values[step.outputs[0][1]] = result
+        elif len(step.outputs) > 1 and isinstance(result, (list, tuple)):
+            for (_, slot), value in zip(step.outputs, result):
+                slot_values[slot] = value
+
+    def _fail(self, record_index, message, r, skip_until, step):
+        self.errors.append((record_index, message))
+        skip_until[r] = step.skip_to
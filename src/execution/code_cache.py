@@ -0,0 +1,136 @@
+# code_cache.py
+# Caches compiled node code and the resolved @node_entry function so repeated
+# executions skip parsing, compiling and re-running module-level code.
+
+import hashlib
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+# Every live cache, so code edits can evict stale entries from all executors
+_live_caches = weakref.WeakSet()
+
+
+@lru_cache(maxsize=1024)
+def code_hash(code: str) -> str:
+    """Return the cache key for a piece of node source code.
+
+    Memoized so the same source string is only hashed once.
+    """
+    return hashlib.sha1(code.encode("utf-8")).hexdigest()
+
+
+def invalidate_code(code: str):
+    """Evict ``code`` from every live code cache (called when a node's code changes)."""
+    if not code or not _live_caches:
+        return
+    key = code_hash(code)
+    for cache in list(_live_caches):
+        cache.invalidate_key(key)
+
+
+class CompiledNode:
+    """Compiled code object plus the globals dict it was executed in.
+
+    Each distinct source runs in its own copy of the shared namespace, so its
+    functions keep resolving the helpers it defined itself even after another
+    node defines the same names.
+    """
+
+    __slots__ = ("code_object", "namespace", "bound_names", "namespace_version", "functions")
+
+    def __init__(self, code_object, namespace: Dict[str, Any], bound_names=frozenset(),
+                 namespace_version: int = 0):
+        self.code_object = code_object
+        self.namespace = namespace
+        # Names the code bound itself; these never come from the shared namespace
+        self.bound_names = frozenset(bound_names)
+        # Version of the shared namespace this entry last copied names from
+        self.namespace_version = namespace_version
+        # Resolved entry functions by name
+        self.functions: Dict[str, Callable] = {}
+
+    def refresh(self, shared_namespace: Dict[str, Any], namespace_version: int):
+        """Copy names this code did not bind itself from ``shared_namespace``.
+
+        Other nodes' definitions become visible to this code, as they were
+        when every call re-executed the source against the shared namespace.
+        """
+        for name, value in shared_namespace.items():
+            if name not in self.bound_names:
+                self.namespace[name] = value
+        self.namespace_version = namespace_version
+
+    def get_function(self, function_name: str) -> Optional[Callable]:
+        """Resolve (and remember) the callable named ``function_name``."""
+        function = self.functions.get(function_name)
+        if function is None:
+            function = self.namespace.get(function_name)
+            if callable(function):
+                self.functions[function_name] = function
+            else:
+                function = None
+        return function
+
+
+class CodeCache:
+    """LRU cache of compiled node code keyed by a hash of the source.
+
+    Nodes with identical code share one entry, so the module-level code runs
+    once per distinct source rather than once per execution.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CompiledNode]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        _live_caches.add(self)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, code: str) -> Optional[CompiledNode]:
+        """Look up the compiled entry for ``code``, marking it most recently used."""
+        key = code_hash(code)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            # Invalidated by an edit on the GUI thread while a background run looked it up
+            pass
+        self.hits += 1
+        return entry
+
+    def put(self, code: str, entry: CompiledNode):
+        """Store a compiled entry, evicting the least recently used beyond the bound."""
+        key = code_hash(code)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, code: str):
+        """Drop the entry for ``code`` if present."""
+        self.invalidate_key(code_hash(code))
+
+    def invalidate_key(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop every entry and reset the hit/miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
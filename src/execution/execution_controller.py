@@ -9,30 +9,83 @@ project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
+from PySide6.QtCore import QThread, Signal, Slot
 from PySide6.QtWidgets import QPushButton, QLabel
 from .graph_executor import GraphExecutor
 from core.event_system import LiveGraphExecutor
+
+
+class BatchExecutionThread(QThread):
+    """Runs one batch execution off the GUI thread.
+
+    The thread object lives on the GUI thread, so node output values and the
+    end of the run are delivered there through queued signals, in order.
+    """
+
+    _gui_values = Signal(object, object)
+
+    def __init__(self, executor: GraphExecutor, on_done, parent=None):
+        super().__init__(parent)
+        self.executor = executor
+        self.on_done = on_done
+        self.error = None
+        self._gui_values.connect(self._apply_gui_values)
+        self.finished.connect(self._on_finished)
+
+    def run(self):
+        try:
+            self.executor.execute()
+        except BaseException as e:
+            # Including a NodeTimeout that escaped the run, so the run always ends normally
+            self.error = e
+
+    def dispatch_gui_values(self, node, values):
+        """Called on the worker thread with a node's output values."""
+        self._gui_values.emit(node, values)
+
+    @Slot(object, object)
+    def _apply_gui_values(self, node, values):
+        try:
+            node.set_gui_values(values)
+        except RuntimeError:
+            # The node was deleted while the graph ran
+            pass
+
+    @Slot()
+    def _on_finished(self):
+        self.on_done(self)
+
+
 class ExecutionController:
-    """Manages execution modes and controls for the node graph."""
+    """Manages execution modes and controls for the node graph.
+
+    Batch runs execute on a BatchExecutionThread so the editor stays
+    responsive; ``output_log`` must therefore accept appends from any thread
+    (the editor passes a LogSink).
+    """
     
     def __init__(self, graph, output_log, get_venv_path_callback, 
                  main_exec_button: QPushButton, status_label: QLabel, 
-                 button_style_callback=None, file_ops=None):
+                 button_style_callback=None, file_ops=None, stop_button: QPushButton = None):
         self.graph = graph
         self.output_log = output_log
         self.get_venv_path_callback = get_venv_path_callback
         self.main_exec_button = main_exec_button
         self.status_label = status_label
+        self.stop_button = stop_button
         self.file_ops = file_ops
         self.button_style_callback = button_style_callback
         
         # Execution systems
         self.executor = GraphExecutor(graph, output_log, get_venv_path_callback)
         self.live_executor = LiveGraphExecutor(graph, output_log, get_venv_path_callback)
+        # Live interactions reuse the warm batch executor and its caches
+        self.live_executor.set_executor(self.executor)
         
         # Execution state
         self.live_mode = False
         self.live_active = False
+        self.batch_thread = None
         
         # Environment state tracking
         self.venv_is_valid = False
@@ -47,6 +100,7 @@ class ExecutionController:
     
     def on_mode_changed(self, mode_id):
         """Handle radio button change between Batch (0) and Live (1) modes."""
+        self.stop_execution(wait=True)
         self.live_mode = mode_id == 1
         self.output_log.clear()
 
@@ -58,8 +112,11 @@ class ExecutionController:
     def on_main_button_clicked(self):
         """Handle the main execution button based on current mode and state."""
         if not self.live_mode:
-            # Batch mode execution
-            self._execute_batch_mode()
+            # Batch mode execution; the button stops a run in progress
+            if self.is_batch_running:
+                self.stop_execution()
+            else:
+                self._execute_batch_mode()
         else:
             # Live mode - toggle between start/pause
             if not self.live_active:
@@ -117,18 +174,70 @@ class ExecutionController:
         self.status_label.setText("Executing")
         self.status_label.setStyleSheet("color: #607D8B; font-weight: bold;")
 
+        self.batch_thread = BatchExecutionThread(self.executor, self._on_batch_finished)
         try:
-            self.executor.execute()
-            self.output_log.append("[OK] === BATCH EXECUTION FINISHED ===")
+            self.executor.begin_background_run(self.batch_thread.dispatch_gui_values)
         except Exception as e:
-            self.output_log.append(f"[ERROR] === EXECUTION FAILED: {e} ===")
-        finally:
-            # Restore button state
-            self.main_exec_button.setText("Execute Graph")
-            if self.button_style_callback:
-                self.main_exec_button.setStyleSheet(self.button_style_callback("batch", "ready"))
-            self.status_label.setText("Ready")
-            self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
+            self.batch_thread.error = e
+            self._on_batch_finished(self.batch_thread)
+            return
+        if self.stop_button is not None:
+            self.stop_button.setEnabled(True)
+            self.stop_button.setVisible(True)
+        self.batch_thread.start()
+
+    @property
+    def is_batch_running(self):
+        return self.batch_thread is not None
+
+    def stop_execution(self, wait=False):
+        """Stop a running batch execution before its next node.
+
+        Args:
+            wait: Block until the node in progress has finished and the run has ended
+        """
+        thread = self.batch_thread
+        if thread is None:
+            return
+        if not self.executor.cancel_requested:
+            self.executor.cancel()
+            self.output_log.append("[STOP] Stopping after the current node...")
+            self.status_label.setText("Stopping")
+            if self.stop_button is not None:
+                self.stop_button.setEnabled(False)
+        if wait:
+            thread.wait()
+            # Finish now instead of on the next event loop pass
+            self._on_batch_finished(thread)
+
+    def set_node_timeout(self, seconds):
+        """Abort nodes that run longer than ``seconds`` (0 or None for no limit)."""
+        self.executor.set_node_timeout(seconds)
+
+    def _on_batch_finished(self, thread):
+        """Restore the controls once the batch thread has ended (on the GUI thread)."""
+        if thread is not self.batch_thread:
+            # Already finished by stop_execution(wait=True)
+            return
+        self.batch_thread = None
+        thread.deleteLater()
+        self.executor.end_background_run()
+
+        if thread.error is not None:
+            self.output_log.append(f"[ERROR] === EXECUTION FAILED: {thread.error} ===")
+        elif self.executor.cancel_requested:
+            self.output_log.append("[STOP] === BATCH EXECUTION STOPPED ===")
+        else:
+            self.output_log.append("[OK] === BATCH EXECUTION FINISHED ===")
+
+        if self.stop_button is not None:
+            self.stop_button.setVisible(False)
+        # Restore button state
+        self.main_exec_button.setText("Execute Graph")
+        if self.button_style_callback:
+            self.main_exec_button.setStyleSheet(self.button_style_callback("batch", "ready"))
+        self.status_label.setText("Ready")
+        self.status_label.setStyleSheet("color: #4CAF50; font-weight: bold;")
 
     def _start_live_mode(self):
         """Start live interactive mode."""
@@ -239,4 +348,12 @@ class ExecutionController:
         
         # Refresh the GraphExecutor's SingleProcessExecutor with new venv path
         if self.executor:
-            self.executor.refresh_executor_environment()
\ No newline at end of file
+            self.stop_execution(wait=True)
+            self.executor.refresh_executor_environment()
+
+    def shutdown(self):
+        """Release execution resources such as worker processes (called on application close)."""
+        if self.executor:
+            self.stop_execution(wait=True)
+            self.live_executor.shutdown()
+            self.executor.shutdown()
\ No newline at end of file
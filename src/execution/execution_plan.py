@@ -0,0 +1,240 @@
+# execution_plan.py
+# Compiles a NodeGraph into a flat, reusable list of execution steps.
+# Built once per graph structure so repeated runs skip graph traversal entirely.
+# Nodes are told apart by their ``is_reroute`` flag rather than their class, so
+# plans compile from the editor's Qt items and the headless graph model alike.
+# Function groups are compiled first, and each runs as a single step; with
+# fusion on, linear chains of small nodes are then fused into single steps too.
+
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+from .group_function import CompiledSubgraph, GroupFunction, compile_function_groups, function_group_signature
+from .node_fusion import FusedChain, fuse_chains
+
+
+def _is_reroute(node) -> bool:
+    return getattr(node, "is_reroute", False)
+
+
+class PlanStep:
+    """A single node visit in an execution plan.
+
+    Input and output pins are pre-resolved to integer slots so running the
+    step never has to filter pin lists or follow connections.
+    """
+
+    __slots__ = ("node", "is_reroute", "parent", "inputs", "outputs", "skip_to")
+
+    def __init__(self, node, is_reroute: bool, parent: int = -1):
+        self.node = node
+        self.is_reroute = is_reroute
+        # Index of the step whose execution output triggered this one (-1 for entries)
+        self.parent = parent
+        # (parameter name, slot) for every connected data input
+        self.inputs: Tuple[Tuple[str, int], ...] = ()
+        # (pin name, slot) for every data output, in pin order
+        self.outputs: Tuple[Tuple[str, int], ...] = ()
+        # Index of the first step after this step's downstream flow, used to
+        # skip the subtree when the node fails
+        self.skip_to = 0
+
+
+def graph_signature(graph) -> Optional[Tuple[Any, ...]]:
+    """Return a cheap signature that changes whenever the graph structure does.
+
+    Graphs without a ``structure_revision`` counter cannot report changes, so
+    they get ``None`` and plans built from them are never reused.
+    """
+    revision = getattr(graph, "structure_revision", None)
+    if revision is None:
+        return None
+    return revision, tuple(map(id, graph.nodes)), function_group_signature(graph)
+
+
+class ExecutionPlan:
+    """Flat, depth-first ordered list of steps compiled from a graph.
+
+    The step order is identical to the recursive flow-following the executor
+    used before: entry nodes in graph order, each followed by its execution
+    outputs depth-first. Nodes reachable through several execution paths
+    appear once per path, exactly as they would run.
+    """
+
+    def __init__(self, graph, execution_limit: Optional[int] = None, fuse: bool = False):
+        self.signature = graph_signature(graph)
+        # Whether linear chains of small nodes run as single fused steps
+        self.fuse = fuse
+        self.steps: List[PlanStep] = []
+        self.entry_nodes: List[Any] = []
+        # Function groups compiled into single steps, and why others were not
+        self.group_functions: List[GroupFunction] = []
+        self.group_notes: List[str] = []
+        # Chains of nodes fused into single steps (empty unless ``fuse``)
+        self.fused_chains: List[FusedChain] = []
+        # Compiled step standing in for each member node
+        self._group_of: Dict[int, CompiledSubgraph] = {}
+        # Distinct sources of nodes declared with @node_entry(process=True)
+        self.process_codes: Tuple[str, ...] = ()
+        # Distinct sources of nodes declared with @node_entry(isolate=True)
+        self.isolated_codes: Tuple[str, ...] = ()
+        # Number of steps whose entry function is declared with async def
+        self.async_step_count = 0
+        self.pin_slots: Dict[Any, int] = {}
+        self.slot_count = 0
+        # Per slot, how many step inputs read it over the whole plan
+        self.slot_reads: List[int] = []
+        # Slots written by nodes declared with @node_entry(retain=True), never released early
+        self.retained_slots: FrozenSet[int] = frozenset()
+        self.execution_limit = (execution_limit if execution_limit is not None
+                                else len(graph.nodes) * 10)
+
+        self._build(graph)
+
+    def is_valid_for(self, graph) -> bool:
+        """Check whether this plan still matches the graph's structure."""
+        return self.signature is not None and self.signature == graph_signature(graph)
+
+    @property
+    def limit_reached(self) -> bool:
+        """True if the plan was cut short by the execution limit."""
+        return len(self.steps) >= self.execution_limit
+
+    def new_slot_values(self, spill_store=None) -> List[Any]:
+        """Create an empty value array sized for this plan's slots, under ``spill_store``'s budget if given."""
+        if spill_store is not None:
+            return spill_store.new_slot_values(self.slot_count)
+        return [None] * self.slot_count
+
+    def pin_values(self, slot_values: List[Any]) -> Dict[Any, Any]:
+        """Map a slot value array back to a ``{pin: value}`` dictionary."""
+        return {pin: slot_values[slot] for pin, slot in self.pin_slots.items()
+                if slot_values[slot] is not None}
+
+    # --- Building ---
+
+    def _build(self, graph):
+        self.group_functions, self.group_notes = compile_function_groups(graph)
+        self._group_of = {id(member): function for function in self.group_functions
+                          for member in function.members}
+        if self.fuse:
+            self.fused_chains = fuse_chains(graph, set(self._group_of))
+            self._group_of.update((id(member), chain) for chain in self.fused_chains
+                                  for member in chain.members)
+        self.entry_nodes = self._find_entry_nodes(graph)
+
+        for entry_node in self.entry_nodes:
+            if self.limit_reached:
+                break
+            self._append_flow(entry_node)
+
+        self.process_codes = tuple(dict.fromkeys(
+            step.node.code for step in self.steps
+            if getattr(step.node, "run_in_process", False) and step.node.code
+        ))
+        self.isolated_codes = tuple(dict.fromkeys(
+            step.node.code for step in self.steps
+            if getattr(step.node, "run_isolated", False) and step.node.code
+        ))
+        self.async_step_count = sum(1 for step in self.steps if getattr(step.node, "is_async", False))
+
+        self.slot_reads = [0] * self.slot_count
+        for step in self.steps:
+            for _, slot in step.inputs:
+                self.slot_reads[slot] += 1
+        self.retained_slots = frozenset(
+            slot for step in self.steps if getattr(step.node, "retain_outputs", False)
+            for _, slot in step.outputs
+        )
+
+    def _find_entry_nodes(self, graph) -> List[Any]:
+        """Find nodes with no execution inputs (reroutes with no input at all)."""
+        entry_nodes = []
+        for node in graph.nodes:
+            group = self._group_of.get(id(node))
+            if group is not None:
+                # A function group or fused chain enters once, in place of its first member
+                if group.is_entry and group.members[0] is node:
+                    entry_nodes.append(group)
+            elif _is_reroute(node):
+                if not node.input_pin.connections:
+                    entry_nodes.append(node)
+            else:
+                has_exec_input = any(pin.connections for pin in node.input_pins
+                                     if pin.pin_category == "execution")
+                if not has_exec_input:
+                    entry_nodes.append(node)
+        return entry_nodes
+
+    def _append_flow(self, root):
+        """Append ``root`` and its downstream execution flow using an explicit stack."""
+        stack = [(self._add_step(root), iter(self._downstream_nodes(root)))]
+        while stack:
+            step_index, children = stack[-1]
+            child = next(children, None)
+            if child is None or self.limit_reached:
+                stack.pop()
+                self.steps[step_index].skip_to = len(self.steps)
+                continue
+            stack.append((self._add_step(child, step_index), iter(self._downstream_nodes(child))))
+
+    def _downstream_nodes(self, node) -> List[Any]:
+        if isinstance(node, CompiledSubgraph):
+            targets = node.downstream
+        elif _is_reroute(node):
+            targets = [conn.end_pin.node for conn in node.output_pin.connections]
+        else:
+            targets = [conn.end_pin.node
+                       for pin in node.output_pins if pin.pin_category == "execution"
+                       for conn in pin.connections]
+        # Flow into a function group or fused chain runs all of it
+        return [self._group_of.get(id(target), target) for target in targets]
+
+    def _add_step(self, node, parent: int = -1) -> int:
+        is_reroute = _is_reroute(node)
+        step = PlanStep(node, is_reroute, parent)
+
+        if is_reroute:
+            # A reroute shares the slot of whatever ultimately feeds it
+            self._slot_for(node.output_pin)
+        elif isinstance(node, CompiledSubgraph):
+            step.inputs = tuple((name, self._slot_for(pin)) for name, pin in node.interface_inputs)
+            step.outputs = tuple((name, self._slot_for(pin)) for name, pin in node.interface_outputs)
+        else:
+            step.inputs = tuple(
+                (pin.name, self._slot_for(pin.connections[0].start_pin))
+                for pin in node.input_pins
+                if pin.pin_category == "data" and pin.connections
+            )
+            step.outputs = tuple(
+                (pin.name, self._slot_for(pin))
+                for pin in node.output_pins if pin.pin_category == "data"
+            )
+
+        self.steps.append(step)
+        return len(self.steps) - 1
+
+    def _slot_for(self, pin) -> int:
+        """Get the value slot for an output pin, looking through reroute chains."""
+        slot = self.pin_slots.get(pin)
+        if slot is not None:
+            return slot
+
+        source = self._resolve_source_pin(pin)
+        slot = self.pin_slots.get(source)
+        if slot is None:
+            slot = self.slot_count
+            self.slot_count += 1
+            self.pin_slots[source] = slot
+        self.pin_slots[pin] = slot
+        return slot
+
+    def _resolve_source_pin(self, pin):
+        """Follow reroute nodes upstream to the pin that actually produces the value."""
+        seen = set()
+        while _is_reroute(pin.node) and pin is pin.node.output_pin:
+            reroute = pin.node
+            if reroute in seen or not reroute.input_pin.connections:
+                break
+            seen.add(reroute)
+            pin = reroute.input_pin.connections[0].start_pin
+        return pin
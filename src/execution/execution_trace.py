@@ -0,0 +1,152 @@
+# execution_trace.py
+# Timeline of graph executions in Chrome Trace Event format, viewable in
+# chrome://tracing or https://ui.perfetto.dev. Node executions, result cache
+# lookups and GUI updates become spans on the thread that ran them.
+# Disabled tracers hand out a shared no-op span, so tracing costs one
+# attribute check per hook when it is off.
+
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from .node_profiler import object_size
+
+# Events kept per tracer; later events are dropped (and counted) beyond this
+DEFAULT_MAX_EVENTS = 1_000_000
+
+
+def node_span_args(node, inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Arguments recorded for a node execution span."""
+    return {
+        "uuid": getattr(node, "uuid", None),
+        "input_size": sum(object_size(value) for value in inputs.values()),
+    }
+
+
+class _NullSpan:
+    """Context manager used while tracing is off; yields None."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, exc_type, exc, traceback):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class TraceSpan:
+    """One open span. Callers add to ``args`` before it closes."""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer: "ExecutionTracer", name: str, category: str, args: Optional[Dict[str, Any]]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args if args is not None else {}
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        end = time.perf_counter()
+        if exc_type is not None:
+            self.args["error"] = f"{exc_type.__name__}: {exc}"
+        self.tracer._add_complete(self.name, self.category, self.start, end, self.args)
+        return False
+
+
+class ExecutionTracer:
+    """Collects trace events from any thread and exports them as Chrome trace JSON.
+
+    Timestamps are microseconds since the tracer was created. Worker-process
+    nodes are recorded on the thread that waited for them, with the worker
+    marked in their arguments.
+    """
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS):
+        self.enabled = False
+        self.max_events = max_events
+        self.dropped_events = 0
+        self._events: List[Dict[str, Any]] = []
+        self._thread_names: Dict[int, str] = {}
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def span(self, name: str, category: str, args: Optional[Dict[str, Any]] = None):
+        """Context manager timing a block; yields the span, or None when tracing is off."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return TraceSpan(self, name, category, args)
+
+    def instant(self, name: str, category: str, args: Optional[Dict[str, Any]] = None):
+        """Record a zero-length event, e.g. a result cache hit."""
+        if not self.enabled:
+            return
+        self._append({
+            "name": name, "cat": category, "ph": "i", "s": "t",
+            "ts": self._timestamp(time.perf_counter()),
+            "pid": self._pid, "tid": self._current_tid(), "args": args or {},
+        })
+
+    def _add_complete(self, name: str, category: str, start: float, end: float, args: Dict[str, Any]):
+        self._append({
+            "name": name, "cat": category, "ph": "X",
+            "ts": self._timestamp(start), "dur": (end - start) * 1e6,
+            "pid": self._pid, "tid": self._current_tid(), "args": args,
+        })
+
+    def _timestamp(self, counter: float) -> float:
+        return (counter - self._origin) * 1e6
+
+    def _current_tid(self) -> int:
+        tid = threading.get_ident()
+        if tid not in self._thread_names:
+            self._thread_names[tid] = threading.current_thread().name
+        return tid
+
+    def _append(self, event: Dict[str, Any]):
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                self.dropped_events += 1
+                return
+            self._events.append(event)
+
+    @property
+    def event_count(self) -> int:
+        return len(self._events)
+
+    def clear(self):
+        """Drop every recorded event."""
+        with self._lock:
+            self._events.clear()
+            self.dropped_events = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The trace as a Chrome Trace Event Format object."""
+        with self._lock:
+            events = list(self._events)
+            thread_names = dict(self._thread_names)
+        metadata = [{"name": "process_name", "ph": "M", "pid": self._pid, "tid": 0,
+                     "args": {"name": "PyFlowGraph"}}]
+        metadata.extend({"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid,
+                         "args": {"name": thread_name}} for tid, thread_name in thread_names.items())
+        return {
+            "traceEvents": metadata + events,
+            "displayTimeUnit": "ms",
+            "otherData": {"dropped_events": self.dropped_events},
+        }
+
+    def export(self, path: str):
+        """Write the trace to ``path``; open it in chrome://tracing or Perfetto."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, default=repr)
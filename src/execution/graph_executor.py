@@ -4,6 +4,10 @@
 
 import os
 import sys
+import time
+import threading
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, QThread
 
 # Add project root to path for cross-package imports
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -12,7 +16,27 @@ if project_root not in sys.path:
 
 from core.node import Node
 from core.reroute_node import RerouteNode
-from .single_process_executor import SingleProcessExecutor
+from .single_process_executor import SingleProcessExecutor, format_import_times
+from .process_pool_executor import ProcessPoolNodeExecutor
+from .venv_worker_pool import VenvWorkerPool, venv_python_executable
+from .remote_worker_pool import RemoteWorkerPool
+from .execution_plan import ExecutionPlan
+from .parallel_scheduler import ParallelScheduler
+from .result_memo import ResultMemo, MemoEntry
+from .result_store import ResultStore, DEFAULT_MAX_BYTES
+from .node_stream import NodeStream
+from .batch_runner import BatchRunner, DEFAULT_BATCH_SIZE
+from .node_profiler import NodeProfiler, object_size
+from .pin_liveness import PinLiveness, format_bytes
+from .pin_spill import PinSpillStore, DEFAULT_MIN_SPILL_BYTES
+from .node_watchdog import NodeWatchdog
+from .execution_trace import ExecutionTracer
+
+# Batch runs log at most this many individual record errors
+MAX_LOGGED_BATCH_ERRORS = 10
+
+# Directory name of the on-disk result store inside the graph's venv (or project root)
+RESULT_STORE_DIRNAME = ".pyflowgraph_results"
 
 # Debug configuration
 # Set to True to enable detailed execution flow debugging
@@ -20,7 +44,7 @@ DEBUG_EXECUTION = False
 
 
 class GraphExecutor:
-    def __init__(self, graph, log_widget, venv_path_callback):
+    def __init__(self, graph, log_widget, venv_path_callback, tracer=None):
         self.graph = graph
         self.log = log_widget
         self.get_venv_path = venv_path_callback
@@ -28,8 +52,64 @@ class GraphExecutor:
         # Get venv path for package loading
         venv_path = self.get_venv_path() if self.get_venv_path else None
         
+        # Per-node wall/CPU time, allocation and output size profiles, kept across runs
+        self.profiler = NodeProfiler()
+
+        # Chrome trace timeline of runs, off unless enabled; may be shared with the live executor
+        self.tracer = tracer if tracer is not None else ExecutionTracer()
+
+        # Opt-in run statistics, such as peak pin memory, in the log after every run
+        self.log_timings = False
+
         # Initialize single process executor with venv path
-        self.single_process_executor = SingleProcessExecutor(log_widget, venv_path)
+        self.single_process_executor = SingleProcessExecutor(log_widget, venv_path, profiler=self.profiler,
+                                                             tracer=self.tracer)
+
+        # Worker processes for nodes declared with @node_entry(process=True), started on first use
+        self.process_executor = ProcessPoolNodeExecutor(venv_path, profiler=self.profiler, tracer=self.tracer)
+
+        # Workers started from the venv's own interpreter for nodes declared with
+        # @node_entry(isolate=True), or for every node in isolated mode
+        self.venv_worker_pool = VenvWorkerPool(venv_python_executable(venv_path), profiler=self.profiler,
+                                               tracer=self.tracer)
+        self.isolated_mode = False
+
+        # Connections to worker daemons on other machines, for @node_entry(remote=True)
+        # nodes or, in remote mode, every node; None runs those nodes locally
+        self.remote_pool = None
+        self.remote_mode = False
+
+        # Opt-in fusion of linear chains of small nodes into single steps
+        self.fusion = False
+
+        # Compiled execution plan, rebuilt only when the graph structure changes
+        self._plan = None
+
+        # Opt-in parallel execution of independent branches
+        self.parallel = False
+        self.max_workers = None
+        self.last_run_stats = {}
+
+        # Opt-in incremental mode: unchanged nodes reuse their result from the last run
+        self.incremental = False
+        self.result_memo = ResultMemo()
+
+        # Optional on-disk store for nodes declared with @node_entry(persist=True)
+        self.result_store = None
+        self._result_store_dir = None
+
+        # Optional byte budget for pin values; beyond it large values spill to disk
+        self.spill_store = None
+
+        # Stop requests, checked between nodes
+        self._cancel_event = threading.Event()
+        # Optional wall-clock limit per node, in seconds
+        self.node_timeout = None
+
+        # Set while a run executes off the GUI thread (see begin_background_run)
+        self._background_plan = None
+        self._gui_snapshot = None
+        self._gui_dispatcher = None
 
     def refresh_executor_environment(self):
         """Recreate the SingleProcessExecutor with updated venv path when environment changes."""
@@ -37,20 +117,266 @@ class GraphExecutor:
         venv_path = self.get_venv_path() if self.get_venv_path else None
         
         # Recreate the SingleProcessExecutor with new venv path
-        self.single_process_executor = SingleProcessExecutor(self.log, venv_path)
+        self.single_process_executor.shutdown()
+        self.single_process_executor = SingleProcessExecutor(self.log, venv_path, profiler=self.profiler,
+                                                             tracer=self.tracer)
+        if self.spill_store is not None:
+            self.single_process_executor.object_store = self.spill_store.new_pin_values()
+
+        # Worker processes have the old site-packages on their path, so replace them too
+        max_workers = self.process_executor.max_workers
+        self.process_executor.shutdown(wait=False)
+        self.process_executor = ProcessPoolNodeExecutor(venv_path, max_workers, profiler=self.profiler,
+                                                        tracer=self.tracer)
+        self.venv_worker_pool.shutdown()
+        self.venv_worker_pool = VenvWorkerPool(venv_python_executable(venv_path), self.venv_worker_pool.max_workers,
+                                               profiler=self.profiler, tracer=self.tracer)
+
+        # A store in the default location follows the graph's venv
+        if self.result_store is not None and self._result_store_dir is None:
+            self.enable_result_store(True, self.result_store.max_bytes)
         
         if DEBUG_EXECUTION:
             self.log.append(f"DEBUG: Recreated SingleProcessExecutor with venv_path: {venv_path}")
 
     def get_python_executable(self):
         """Get the Python executable path for the virtual environment."""
-        venv_path = self.get_venv_path() if self.get_venv_path else None
-        if venv_path and os.path.exists(venv_path):
-            if sys.platform == "win32":
-                return os.path.join(venv_path, "Scripts", "python.exe")
-            else:
-                return os.path.join(venv_path, "bin", "python")
-        return sys.executable
+        return venv_python_executable(self.get_venv_path() if self.get_venv_path else None)
+
+    def get_execution_plan(self):
+        """Return the compiled execution plan, rebuilding it only if the graph changed."""
+        if self._plan is None or not self._plan.is_valid_for(self.graph):
+            # Fused chains run in this interpreter, so isolated and remote mode turn fusion off
+            self._plan = ExecutionPlan(self.graph, fuse=self.fusion and not self.isolated_mode
+                                       and not self.remote_mode)
+            for note in self._plan.group_notes:
+                self.log.append(f"[GROUP] {note}")
+            chains = self._plan.fused_chains
+            if chains:
+                self.log.append(f"[FUSION] {sum(len(chain.members) for chain in chains)} nodes "
+                                f"fused into {len(chains)} {'step' if len(chains) == 1 else 'steps'}")
+            if DEBUG_EXECUTION:
+                self.log.append(f"DEBUG: Built execution plan with {len(self._plan.steps)} steps")
+        return self._plan
+
+    def invalidate_plan(self):
+        """Force the execution plan to be rebuilt on the next run."""
+        self._plan = None
+
+    def set_parallel_mode(self, enabled, max_workers=None):
+        """Run independent branches on a thread pool instead of one after another.
+        
+        Args:
+            enabled: Whether batch runs should use the parallel scheduler
+            max_workers: Thread pool size (None uses the ThreadPoolExecutor default)
+        """
+        self.parallel = enabled
+        self.max_workers = max_workers
+
+    def set_isolated_mode(self, enabled, max_workers=None):
+        """Run every node in the venv's worker processes instead of in this interpreter.
+
+        Isolated nodes import the venv's own packages and cannot crash the
+        editor, but their inputs and results must be picklable and they do not
+        share the in-process node namespace.
+
+        Args:
+            enabled: Whether all nodes should run isolated (nodes declared with isolate=True always do)
+            max_workers: Worker processes per venv (None keeps the current count)
+        """
+        if enabled != self.isolated_mode and self.fusion:
+            self.invalidate_plan()
+        self.isolated_mode = enabled
+        if max_workers and max_workers != self.venv_worker_pool.max_workers:
+            self.venv_worker_pool.shutdown()
+            self.venv_worker_pool = VenvWorkerPool(self.venv_worker_pool.python_executable, max_workers,
+                                                   profiler=self.profiler, tracer=self.tracer)
+
+    def set_remote_workers(self, addresses, all_nodes=False, requirements=None, **pool_options):
+        """Run nodes on worker daemons (``python src/cli.py worker --listen host:port``) on other machines.
+
+        Nodes declared with ``@node_entry(remote=True)`` run there, or every
+        non-streaming node with ``all_nodes``. Like isolated nodes, their
+        inputs and results must be picklable. Calls from parallel mode are
+        pipelined over a few pooled connections per daemon.
+
+        Args:
+            addresses: ``"host:port"`` strings or ``(host, port)`` tuples (empty or None disables)
+            all_nodes: Send every node, not only those declared remote
+            requirements: Pip requirements each daemon installs into a venv (default: the graph's)
+            **pool_options: ``connections_per_worker``, ``max_in_flight`` and ``token`` for RemoteWorkerPool
+        """
+        if self.remote_pool is not None:
+            self.remote_pool.shutdown()
+        remote_mode = bool(addresses) and all_nodes
+        if remote_mode != self.remote_mode and self.fusion:
+            self.invalidate_plan()
+        self.remote_mode = remote_mode
+        if not addresses:
+            self.remote_pool = None
+            return
+        if requirements is None:
+            requirements = getattr(self.graph, "requirements", None) or ()
+        self.remote_pool = RemoteWorkerPool(addresses, requirements, profiler=self.profiler, tracer=self.tracer,
+                                            **pool_options)
+
+    def set_fusion_mode(self, enabled):
+        """Run linear chains of small nodes as single fused steps (see ``node_fusion``).
+
+        Saves the per-node overhead of long chains of tiny nodes. Nodes with
+        GUI output, and nodes that run in worker processes, are never fused;
+        profiles and errors still name the individual nodes, but the log
+        shows one header per fused chain.
+        """
+        if enabled != self.fusion:
+            self.fusion = enabled
+            self.invalidate_plan()
+
+    def set_incremental_mode(self, enabled):
+        """Only re-execute nodes whose code, GUI values or upstream results changed.
+
+        Memoized results are dropped when the mode is switched off.
+        """
+        self.incremental = enabled
+        if not enabled:
+            self.result_memo.invalidate()
+
+    def invalidate_results(self, node=None):
+        """Force ``node`` (or every node if None) to re-execute on the next incremental run."""
+        self.result_memo.invalidate(node)
+
+    def set_profiling(self, enabled=True, track_allocations=False):
+        """Record per-node profiles in ``self.profiler`` (on by default).
+
+        Args:
+            enabled: Whether node invocations are profiled
+            track_allocations: Also record peak tracemalloc allocation, which slows execution
+        """
+        self.profiler.enabled = enabled
+        self.profiler.set_track_allocations(enabled and track_allocations)
+
+    def set_tracing(self, enabled=True):
+        """Record node executions, cache lookups and GUI updates on a timeline (see ``export_trace``)."""
+        self.tracer.enabled = enabled
+
+    def set_timings(self, enabled=True):
+        """Log run statistics, such as peak retained pin memory, after every execution."""
+        self.log_timings = enabled
+
+    def export_trace(self, path):
+        """Write the recorded timeline as Chrome Trace Event JSON for chrome://tracing or Perfetto."""
+        self.tracer.export(path)
+
+    def enable_result_store(self, enabled=True, max_bytes=DEFAULT_MAX_BYTES, cache_dir=None):
+        """Keep results of persist nodes on disk so they survive restarts.
+
+        Args:
+            enabled: Whether persist nodes should use the result store
+            max_bytes: Byte budget; least recently used results are evicted beyond it
+            cache_dir: Store directory (default: a folder inside the graph's venv, or the project root)
+        """
+        if not enabled:
+            self.result_store = None
+            return
+        self._result_store_dir = cache_dir
+        if cache_dir is None:
+            venv_path = self.get_venv_path() if self.get_venv_path else None
+            base_dir = venv_path if venv_path and os.path.isdir(venv_path) else project_root
+            cache_dir = os.path.join(base_dir, RESULT_STORE_DIRNAME)
+        self.result_store = ResultStore(cache_dir, max_bytes)
+
+    def set_memory_budget(self, max_bytes, spill_dir=None, min_spill_bytes=DEFAULT_MIN_SPILL_BYTES):
+        """Keep large pin values within ``max_bytes`` by spilling them to disk (None disables).
+
+        Least recently used NumPy arrays, DataFrames and bytes-like values of
+        at least ``min_spill_bytes`` are written out as memory-mapped .npy,
+        Parquet or pickle files and read back when a node needs them. Spill
+        and fault counts are added to ``last_run_stats``.
+
+        Args:
+            max_bytes: Budget for large values held in pin slots, live pin values and the object store
+            spill_dir: Directory for spill files (default: a temporary directory)
+            min_spill_bytes: Smaller values are never spilled
+        """
+        # The old store's files go with it once nothing holds its values any more
+        object_store = self.single_process_executor.object_store
+        if not max_bytes:
+            self.spill_store = None
+            self.single_process_executor.object_store = {key: object_store[key] for key in object_store}
+            return
+        self.spill_store = PinSpillStore(max_bytes, spill_dir, min_spill_bytes)
+        self.single_process_executor.object_store = self.spill_store.new_pin_values(object_store)
+
+    def set_node_timeout(self, seconds):
+        """Abort any node that runs longer than ``seconds`` (None or 0 disables the limit).
+
+        The node fails with a TIMEOUT error naming it, and its downstream flow
+        is skipped like for any other failure.
+        """
+        self.node_timeout = seconds or None
+
+    def cancel(self):
+        """Ask the current run to stop before its next node; the running node finishes first."""
+        self._cancel_event.set()
+
+    @property
+    def cancel_requested(self):
+        return self._cancel_event.is_set()
+
+    def begin_background_run(self, gui_dispatcher):
+        """Prepare for ``execute()`` on a worker thread. Call on the GUI thread.
+
+        Compiles the plan and reads every node's GUI values now, since widgets
+        may only be touched from the GUI thread. During the run, output values
+        are handed to ``gui_dispatcher(node, values)``, which must deliver them
+        to the GUI thread.
+        """
+        plan = self._background_plan = self.get_execution_plan()
+        self._gui_snapshot = {id(step.node): step.node.get_gui_values() for step in plan.steps
+                              if not step.is_reroute and hasattr(step.node, "get_gui_values")}
+        self._gui_dispatcher = gui_dispatcher
+        self._cancel_event.clear()
+
+    def end_background_run(self):
+        """Return to running on the GUI thread after a background run."""
+        self._background_plan = None
+        self._gui_snapshot = None
+        self._gui_dispatcher = None
+
+    def set_process_workers(self, max_workers):
+        """Set the number of worker processes used for process nodes (None uses the CPU count)."""
+        if max_workers != self.process_executor.max_workers:
+            self.process_executor.shutdown(wait=False)
+            self.process_executor = ProcessPoolNodeExecutor(self.process_executor.venv_path, max_workers,
+                                                            profiler=self.profiler, tracer=self.tracer)
+
+    def get_node_executor(self, node):
+        """Return the backend that runs ``node``: a worker process or this interpreter."""
+        # Streams are generators living in this interpreter, so they stay here in isolated and remote mode
+        if self.remote_pool is not None and not getattr(node, "is_streaming", False) and (
+                self.remote_mode or getattr(node, "run_remote", False) is True):
+            return self.remote_pool
+        if getattr(node, "run_isolated", False) or (self.isolated_mode and not getattr(node, "is_streaming", False)):
+            return self.venv_worker_pool
+        if getattr(node, "run_in_process", False):
+            return self.process_executor
+        return self.single_process_executor
+
+    def shutdown(self):
+        """Stop any worker processes and the event loop used by async nodes."""
+        self.process_executor.shutdown()
+        self.venv_worker_pool.shutdown()
+        if self.remote_pool is not None:
+            self.remote_pool.shutdown()
+        self.single_process_executor.shutdown()
+        if self.spill_store is not None:
+            self.spill_store.close()
+
+    def _process_pending_events(self):
+        """Let Qt repaint while nodes are in flight, without accepting user input mid-run."""
+        app = QCoreApplication.instance()
+        if app is not None and QThread.currentThread() == app.thread():
+            app.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
 
     def execute(self):
         """Execute the graph using single process execution with direct object references."""
@@ -58,36 +384,83 @@ class GraphExecutor:
         if DEBUG_EXECUTION:
             self.log.append("DEBUG: Starting single process execution")
 
-        # Pin values now store direct Python object references (no JSON serialization)
-        pin_values = {}
-        
-        # Find entry point nodes (nodes with no execution input connections)
-        entry_nodes = []
-        for node in self.graph.nodes:
-            if isinstance(node, Node):
-                exec_input_pins = [p for p in node.input_pins if p.pin_category == "execution"]
-                has_exec_input = any(pin.connections for pin in exec_input_pins)
-                if not has_exec_input:
-                    entry_nodes.append(node)
-            elif isinstance(node, RerouteNode):
-                # RerouteNodes don't have execution pins, handle separately
-                if not node.input_pin.connections:
-                    entry_nodes.append(node)
-
-        if not entry_nodes:
+        if self._gui_snapshot is None:
+            self._cancel_event.clear()
+            plan = self.get_execution_plan()
+        else:
+            # Compiled on the GUI thread by begin_background_run
+            plan = self._background_plan
+
+        if not plan.entry_nodes:
             self.log.append("EXECUTION ERROR: No entry point nodes found. Add nodes without execution inputs to start execution.")
             return
 
-        execution_count = 0
-        execution_limit = len(self.graph.nodes) * 10  # Higher limit for flow control
+        if plan.process_codes:
+            # Start the workers with every process node's code precompiled
+            self.process_executor.start(plan.process_codes)
+        if plan.isolated_codes:
+            self.venv_worker_pool.start(plan.isolated_codes)
+
+        imports_before = len(self.single_process_executor.import_times)
+
+        # Slot values store direct Python object references (no JSON serialization)
+        slot_values = plan.new_slot_values(self.spill_store)
+        spill_before = self._begin_spill_stats()
+        fingerprinting = self.incremental or self.result_store is not None
+        if fingerprinting:
+            self.result_memo.begin_run(plan)
+        if self.result_store is not None:
+            store_hits, store_misses = self.result_store.hits, self.result_store.misses
+        # Values are dropped from their slots once their last consumer has run
+        liveness = PinLiveness(plan, [slot_values])
+        if self.parallel:
+            with self.tracer.span("graph run", "run", {"mode": "parallel"}):
+                execution_count, stats = ParallelScheduler(self, self.max_workers).run(plan, slot_values, liveness)
+            summary = (f"[PARALLEL] {execution_count} steps in {stats['wall_time']:.3f}s "
+                       f"(critical path {stats['critical_path_time']:.3f}s, "
+                       f"serial node time {stats['serial_node_time']:.3f}s, "
+                       f"{stats['speedup']:.2f}x speedup)")
+        elif plan.async_step_count > 1:
+            # Sync nodes stay on this thread in plan order; independent async nodes overlap
+            with self.tracer.span("graph run", "run", {"mode": "async"}):
+                execution_count, stats = ParallelScheduler(self, inline=True).run(plan, slot_values, liveness)
+            summary = (f"[ASYNC] {plan.async_step_count} async nodes, {execution_count} steps "
+                       f"in {stats['wall_time']:.3f}s (serial node time {stats['serial_node_time']:.3f}s)")
+        else:
+            with self.tracer.span("graph run", "run", {"mode": "serial"}):
+                execution_count = self._run_plan(plan, slot_values, liveness)
+            stats, summary = {}, None
+        self.last_run_stats = {**stats, **liveness.stats(), **self._spill_stats(spill_before)}
+        new_imports = dict(list(self.single_process_executor.import_times.items())[imports_before:])
+        if new_imports:
+            self.log.append(f"[IMPORTS] First use of optional libraries: {format_import_times(new_imports)}")
+        if self.log_timings or self.profiler.tracking_allocations:
+            self.log.append(f"[MEMORY] Peak retained pin values {format_bytes(liveness.peak_bytes)}, "
+                            f"{liveness.released} released after their last consumer")
+        if summary:
+            self.log.append(summary)
+
+        # Release producers of streams that were never read to the end
+        for value in slot_values:
+            if isinstance(value, NodeStream):
+                value.close()
 
-        # Execute starting from entry nodes
-        for entry_node in entry_nodes:
-            if execution_count >= execution_limit:
-                break
-            execution_count = self._execute_node_flow(entry_node, pin_values, execution_count, execution_limit)
+        if fingerprinting:
+            self.result_memo.end_run()
+        if self.result_store is not None:
+            store = self.result_store
+            hits, misses = store.hits - store_hits, store.misses - store_misses
+            if hits or misses:
+                self.log.append(f"[RESULT CACHE] {hits} hits, {misses} misses, "
+                                f"{store.total_bytes / 1024 ** 2:.1f} of {store.max_bytes / 1024 ** 2:.1f} MB used")
+        if self.incremental:
+            memo = self.result_memo
+            self.log.append(f"[INCREMENTAL] {memo.misses} of {memo.hits + memo.misses} nodes re-executed, "
+                            f"{memo.hits} reused from the previous run")
 
-        if execution_count >= execution_limit:
+        if self.cancel_requested:
+            self.log.append(f"[STOPPED] Execution stopped after {execution_count} of {len(plan.steps)} steps.")
+        elif execution_count >= plan.execution_limit:
             self.log.append("EXECUTION ERROR: Execution limit reached. Check for infinite loops in execution flow.")
         
         # Log performance statistics
@@ -96,25 +469,266 @@ class GraphExecutor:
             self.log.append(f"DEBUG: Execution completed. Total time: {stats.get('total_time', 0):.4f}s, "
                           f"Average per node: {stats.get('average_time', 0):.4f}s")
 
-    def _execute_node_flow(self, node, pin_values, execution_count, execution_limit):
-        """Execute a node using direct function calls and follow its execution outputs."""
-        if execution_count >= execution_limit:
-            return execution_count
-            
-        execution_count += 1
+    def run_batch(self, records, outputs=None, batch_size=DEFAULT_BATCH_SIZE):
+        """Run the graph once per record and return each record's outputs.
+
+        The plan is compiled once and walked step by step across chunks of
+        ``batch_size`` records. GUI values are read once, node output is not
+        logged, and nodes declared with ``@node_entry(vectorize=True)`` are
+        called once per chunk with every record's inputs as lists (NumPy
+        arrays for numeric values) and return one value per record.
+
+        Args:
+            records: Iterable of ``{node title or uuid: {input name: value}}`` parameter sets
+            outputs: Titles of nodes to collect (default: nodes with unconnected data outputs)
+            batch_size: Records processed together per step
+
+        Returns:
+            List with one ``{node title: {output name: value}}`` dict per record
+        """
+        plan = self.get_execution_plan()
+        if not plan.entry_nodes:
+            self.log.append("EXECUTION ERROR: No entry point nodes found. Add nodes without execution inputs to start execution.")
+            return []
+        if plan.process_codes:
+            self.process_executor.start(plan.process_codes)
+        if plan.isolated_codes:
+            self.venv_worker_pool.start(plan.isolated_codes)
+
+        runner = BatchRunner(self, batch_size)
+        spill_before = self._begin_spill_stats()
+        start_time = time.perf_counter()
+        with self.tracer.span("batch run", "run", {"batch_size": batch_size}) as span:
+            results = runner.run(plan, records, outputs)
+            if span is not None:
+                span.args["records"] = len(results)
+        wall_time = time.perf_counter() - start_time
+
+        failed_records = sorted({record for record, _ in runner.errors})
+        self.last_run_stats = {
+            'records': len(results),
+            'failed_records': len(failed_records),
+            'wall_time': wall_time,
+            'errors': runner.errors,
+            'peak_retained_bytes': runner.peak_retained_bytes,
+            'released_values': runner.released_values,
+            **self._spill_stats(spill_before),
+        }
+        self.log.append(f"[BATCH] {len(results)} records in {wall_time:.3f}s, {len(failed_records)} failed, "
+                        f"peak retained pin values {format_bytes(runner.peak_retained_bytes)}")
+        for record, message in runner.errors[:MAX_LOGGED_BATCH_ERRORS]:
+            self.log.append(f"Record {record}: {message}")
+        if len(runner.errors) > MAX_LOGGED_BATCH_ERRORS:
+            self.log.append(f"... {len(runner.errors) - MAX_LOGGED_BATCH_ERRORS} more errors")
+        return results
+
+    def _begin_spill_stats(self):
+        if self.spill_store is None:
+            return None
+        self.spill_store.reset_peak()
+        return self.spill_store.stats()
+
+    def _spill_stats(self, before):
+        """Spills and faults since ``before``, logged as [SPILL] if there were any."""
+        if before is None:
+            return {}
+        after = self.spill_store.stats()
+        stats = {key: after[key] - before[key] for key in ('spills', 'faults', 'spilled_bytes')}
+        stats['peak_resident_bytes'] = after['peak_resident_bytes']
+        if stats['spills'] or stats['faults']:
+            self.log.append(f"[SPILL] {stats['spills']} values spilled to disk ({format_bytes(stats['spilled_bytes'])}), "
+                            f"{stats['faults']} read back; peak {format_bytes(stats['peak_resident_bytes'])} "
+                            f"in memory of a {format_bytes(self.spill_store.max_bytes)} budget")
+        return stats
+
+    def _run_plan(self, plan, slot_values, liveness=None):
+        """Run every step of a compiled plan, skipping the downstream flow of failed nodes."""
+        execution_count = 0
+        steps = plan.steps
+        index = 0
+        while index < len(steps) and not self._cancel_event.is_set():
+            step = steps[index]
+            execution_count += 1
+            next_index = index + 1 if step.is_reroute or self._execute_step(step, slot_values) else step.skip_to
+            if liveness is not None:
+                # Skipped steps will not read their inputs either
+                for done in range(index, next_index):
+                    liveness.step_done(done)
+            index = next_index
+        return execution_count
+
+    def _execute_step(self, step, slot_values):
+        """Execute a single node step. Returns False if its downstream flow must be skipped."""
+        inputs_for_function = self._prepare_step(step, slot_values, self.log)
+        if inputs_for_function is None:
+            # Still follow execution flow even if no function
+            return True
 
-        if isinstance(node, RerouteNode):
-            # Handle reroute nodes - direct object reference passing
-            if node.input_pin.connections:
-                source_pin = node.input_pin.connections[0].start_pin
-                pin_values[node.output_pin] = pin_values.get(source_pin)
+        fingerprint, entry = self._lookup_result(step, slot_values, inputs_for_function, self.log)
+        if entry is not None:
+            self._finish_step(step, slot_values, entry.result, fingerprint)
+            return True
+
+        # Execute the node using SingleProcessExecutor (direct function call)
+        try:
+            result, output_message = self.call_node(step.node, inputs_for_function)
             
-            # Follow connections from reroute node
-            for conn in node.output_pin.connections:
-                downstream_node = conn.end_pin.node
-                execution_count = self._execute_node_flow(downstream_node, pin_values, execution_count, execution_limit)
-            return execution_count
+            if output_message:
+                self.log.append(output_message)
+                
+        except Exception as e:
+            self.log.append(str(e))
+            return False
+
+        self._remember_result(step, fingerprint, result, output_message, self.log)
+        self._finish_step(step, slot_values, result, fingerprint)
+        return True
+
+    def _prepare_step(self, step, slot_values, log):
+        """Log the node header and gather its inputs. Returns None if the node has no function."""
+        node = step.node
+        log.append(f"--- Executing Node: {node.title} ---")
+
+        # Gather input data from pre-resolved slots - direct object references
+        inputs_for_function = {name: slot_values[slot] for name, slot in step.inputs}
+        
+        if self._gui_snapshot is not None:
+            inputs_for_function.update(self._gui_snapshot.get(id(node), {}))
+        elif hasattr(node, "get_gui_values"):
+            inputs_for_function.update(node.get_gui_values())
+
+        if not node.function_name:
+            log.append(f"SKIP: Node '{node.title}' has no valid function defined.")
+            return None
+        return inputs_for_function
+
+    def _lookup_result(self, step, slot_values, inputs, log):
+        """Fingerprint a step and look up its result in the memo, then the result store.
+
+        Returns:
+            Tuple of (fingerprint, memo entry); both None when no result caching is
+            enabled, and the fingerprint None when an input cannot be fingerprinted
+        """
+        if not self.incremental and self.result_store is None:
+            return None, None
+        node = step.node
+        fingerprint = self.result_memo.fingerprint(step, inputs, slot_values)
+        if self.incremental:
+            entry = self.result_memo.lookup(step, fingerprint)
+            if entry is not None:
+                log.append(f"CACHED: Node '{node.title}' is unchanged, reusing its previous result.")
+                self.tracer.instant(node.title, "cache", {"uuid": getattr(node, "uuid", None), "source": "memo"})
+                return fingerprint, entry
 
+        if fingerprint is not None and self.result_store is not None and getattr(node, "persist_result", False):
+            with self.tracer.span(node.title, "cache", {"uuid": getattr(node, "uuid", None),
+                                                         "source": "result store"}) as span:
+                found, value = self.result_store.get(fingerprint)
+                if span is not None:
+                    span.args["hit"] = found
+                    if found:
+                        span.args["output_size"] = object_size(value)
+            if not found:
+                log.append(f"CACHE MISS: Node '{node.title}' not in the result store.")
+                return fingerprint, None
+            log.append(f"CACHE HIT: Node '{node.title}' loaded from the result store.")
+            entry = MemoEntry(value, "")
+            if self.incremental:
+                self.result_memo.store(step, fingerprint, value, "")
+            return fingerprint, entry
+        return fingerprint, None
+
+    def _remember_result(self, step, fingerprint, result, output_message, log):
+        """Keep a freshly computed result in the memo and, for persist nodes, the result store."""
+        if fingerprint is None or isinstance(result, NodeStream):
+            # A stream can only be read once, so it is never reused
+            return
+        if self.incremental:
+            self.result_memo.store(step, fingerprint, result, output_message)
+        if self.result_store is not None and getattr(step.node, "persist_result", False):
+            if self.result_store.put(fingerprint, result) is None:
+                log.append(f"CACHE SKIP: Result of '{step.node.title}' could not be written to the result store.")
+
+    def _finish_step(self, step, slot_values, result, fingerprint=None):
+        """Store a node's result in its output slots and push it to the node's GUI."""
+        node = step.node
+        if fingerprint is not None:
+            self.result_memo.tag_outputs(step, fingerprint)
+
+        # Store results in output slots using direct object references
+        output_values = {}
+        if len(step.outputs) == 1:
+            # Single output - store result directly (no JSON conversion)
+            name, slot = step.outputs[0]
+            slot_values[slot] = result
+            output_values[name] = result
+        elif len(step.outputs) > 1 and isinstance(result, (list, tuple)):
+            # Multiple outputs - distribute tuple/list items
+            for (name, slot), value in zip(step.outputs, result):
+                slot_values[slot] = value
+                output_values[name] = value
+
+        # Update GUI with output values
+        if hasattr(node, "set_gui_values"):
+            if DEBUG_EXECUTION:
+                print(f"DEBUG: Execution completed for '{node.title}', calling set_gui_values with: {output_values}")
+            if self._gui_dispatcher is not None:
+                self._gui_dispatcher(node, output_values)
+            else:
+                with self.tracer.span(node.title, "gui", {"uuid": getattr(node, "uuid", None)}):
+                    node.set_gui_values(output_values)
+        else:
+            if DEBUG_EXECUTION:
+                print(f"DEBUG: Node '{node.title}' does not have set_gui_values method")
+
+    def call_node(self, node, inputs):
+        """Run one node on its backend, enforcing ``node_timeout`` if set.
+
+        Returns:
+            Tuple of (result, captured_output)
+        """
+        executor = self.get_node_executor(node)
+        if not self.node_timeout:
+            return executor.execute_node(node, inputs)
+        with NodeWatchdog(node.title, self.node_timeout):
+            return executor.execute_node(node, inputs)
+
+    def _execute_node_flow(self, node, pin_values, execution_count, execution_limit):
+        """Execute a node using direct function calls and follow its execution outputs.
+
+        Flow is followed with an explicit work stack rather than recursion, so
+        long chains are bounded only by ``execution_limit``. Nodes run in the
+        same depth-first order as the compiled plan, and a failing node skips
+        its downstream flow.
+        """
+        with self.tracer.span("live flow", "run", {"from": node.title}):
+            return self._follow_live_flow(node, pin_values, execution_count, execution_limit)
+
+    def _follow_live_flow(self, node, pin_values, execution_count, execution_limit):
+        stack = [node]
+        while stack and execution_count < execution_limit:
+            node = stack.pop()
+            execution_count += 1
+
+            if isinstance(node, RerouteNode):
+                # Handle reroute nodes - direct object reference passing
+                if node.input_pin.connections:
+                    source_pin = node.input_pin.connections[0].start_pin
+                    pin_values[node.output_pin] = pin_values.get(source_pin)
+                downstream = [conn.end_pin.node for conn in node.output_pin.connections]
+            elif self._execute_live_node(node, pin_values):
+                downstream = [conn.end_pin.node
+                              for pin in node.output_pins if pin.pin_category == "execution"
+                              for conn in pin.connections]
+            else:
+                continue
+
+            # Reversed so the first execution output is the next one popped
+            stack.extend(reversed(downstream))
+        return execution_count
+
+    def _execute_live_node(self, node, pin_values):
+        """Execute one node against a ``{pin: value}`` dict. Returns False if it failed."""
         self.log.append(f"--- Executing Node: {node.title} ---")
 
         # Gather input data from data pins - now using direct object references
@@ -132,19 +746,18 @@ class GraphExecutor:
         if not node.function_name:
             self.log.append(f"SKIP: Node '{node.title}' has no valid function defined.")
             # Still follow execution flow even if no function
-            self._follow_execution_outputs(node, pin_values, execution_count, execution_limit)
-            return execution_count
+            return True
 
         # Execute the node using SingleProcessExecutor (direct function call)
         try:
-            result, output_message = self.single_process_executor.execute_node(node, inputs_for_function)
+            result, output_message = self.call_node(node, inputs_for_function)
             
             if output_message:
                 self.log.append(output_message)
                 
         except Exception as e:
             self.log.append(str(e))
-            return execution_count
+            return False
 
         # Store results in data output pins using direct object references
         data_output_pins = [p for p in node.output_pins if p.pin_category == "data"]
@@ -152,33 +765,31 @@ class GraphExecutor:
         
         if len(data_output_pins) == 1:
             # Single output - store result directly (no JSON conversion)
-            pin_values[data_output_pins[0]] = result
             output_values[data_output_pins[0].name] = result
         elif len(data_output_pins) > 1 and isinstance(result, (list, tuple)):
             # Multiple outputs - distribute tuple/list items
             for i, pin in enumerate(data_output_pins):
                 if i < len(result):
-                    pin_values[pin] = result[i]
                     output_values[pin.name] = result[i]
 
+        # Live flows can be re-triggered at any time, so only outputs without a
+        # consumer are known to be dead; those just go to the GUI
+        retain = getattr(node, "retain_outputs", False)
+        for pin in data_output_pins:
+            if pin.name not in output_values:
+                continue
+            if pin.connections or retain:
+                pin_values[pin] = output_values[pin.name]
+            else:
+                pin_values.pop(pin, None)
+
         # Update GUI with output values
         if hasattr(node, "set_gui_values"):
             if DEBUG_EXECUTION:
                 print(f"DEBUG: Execution completed for '{node.title}', calling set_gui_values with: {output_values}")
-            node.set_gui_values(output_values)
+            with self.tracer.span(node.title, "gui", {"uuid": getattr(node, "uuid", None)}):
+                node.set_gui_values(output_values)
         else:
             if DEBUG_EXECUTION:
                 print(f"DEBUG: Node '{node.title}' does not have set_gui_values method")
-
-        # Follow execution flow to next nodes
-        execution_count = self._follow_execution_outputs(node, pin_values, execution_count, execution_limit)
-        return execution_count
-
-    def _follow_execution_outputs(self, node, pin_values, execution_count, execution_limit):
-        """Follow execution output connections to continue the flow."""
-        exec_output_pins = [p for p in node.output_pins if p.pin_category == "execution"]
-        for pin in exec_output_pins:
-            for conn in pin.connections:
-                downstream_node = conn.end_pin.node
-                execution_count = self._execute_node_flow(downstream_node, pin_values, execution_count, execution_limit)
-        return execution_count
+        return True
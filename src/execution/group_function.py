@@ -0,0 +1,333 @@
+# group_function.py
+# Compiles a function group (a Group with ``is_function`` set) into a single
+# node-like callable. Data wired into the group from outside becomes its
+# parameters and every member output one of its results, so an execution
+# plan runs the whole group as one step: one backend call, one memo entry
+# keyed on the group's inputs, and one unit to send to a worker process.
+#
+# Groups whose execution flow cannot be expressed as one call (flow entering
+# midway, streaming or async members, ...) keep running node by node.
+# The compiler itself, CompiledSubgraph, is shared with node_fusion.py.
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Tuple
+
+# Name of the entry function in a group's generated code
+GROUP_FUNCTION_NAME = "run_group"
+
+
+def _is_reroute(node) -> bool:
+    return getattr(node, "is_reroute", False)
+
+
+def is_function_group(group) -> bool:
+    return bool(getattr(group, "is_function", False))
+
+
+def function_groups(graph) -> List[Any]:
+    """The graph's function groups; none for graphs without a list of groups."""
+    groups = getattr(graph, "groups", None)
+    if not isinstance(groups, (list, tuple)):
+        return []
+    return [group for group in groups if is_function_group(group)]
+
+
+def function_group_signature(graph) -> Tuple[Any, ...]:
+    """Membership of the graph's function groups, for plan signatures."""
+    return tuple((group.uuid, tuple(group.member_node_uuids)) for group in function_groups(graph))
+
+
+def _resolve_source_pin(pin):
+    """Follow reroute nodes upstream to the pin that actually produces the value."""
+    seen = set()
+    while _is_reroute(pin.node) and pin is pin.node.output_pin:
+        reroute = pin.node
+        if reroute in seen or not reroute.input_pin.connections:
+            break
+        seen.add(reroute)
+        pin = reroute.input_pin.connections[0].start_pin
+    return pin
+
+
+def _exec_sources(node) -> List[Any]:
+    return [conn.start_pin.node for pin in node.input_pins if pin.pin_category == "execution"
+            for conn in pin.connections]
+
+
+def _exec_targets(node) -> List[Any]:
+    return [conn.end_pin.node for pin in node.output_pins if pin.pin_category == "execution"
+            for conn in pin.connections]
+
+
+class GroupCompileError(Exception):
+    """A function group that cannot run as one call; its members run node by node."""
+
+
+class CompiledSubgraph(ABC):
+    """Several code nodes compiled into one node for execution plans.
+
+    Quacks like a code node: ``code`` holds generated source whose entry
+    function calls every member in ``call_order``, passing member outputs
+    along in local variables. Each member's GUI values arrive as one
+    dictionary parameter. Subclasses decide the call order and how member
+    calls are wrapped.
+    """
+
+    is_reroute = False
+    is_group = True
+    persist_result = False
+    vectorized = False
+    is_async = False
+    is_streaming = False
+
+    # Name of the entry function in the generated code
+    entry_name = GROUP_FUNCTION_NAME
+
+    def __init__(self, uuid: str, title: str, members: List[Any]):
+        """Compile ``members`` (in graph or chain order) into one callable.
+
+        Raises:
+            GroupCompileError: If the members cannot run as a single call
+        """
+        self.uuid = uuid
+        self.title = title
+        self.members = members
+        self.function_name = self.entry_name
+        # The step runs as one unit, so one member needing a worker sends all of it there
+        self.run_in_process = any(getattr(member, "run_in_process", False) for member in members)
+        self.run_isolated = any(getattr(member, "run_isolated", False) for member in members)
+        self.run_remote = any(getattr(member, "run_remote", False) for member in members)
+        self.retain_outputs = any(getattr(member, "retain_outputs", False) for member in members)
+        self.member_codes = tuple(member.code for member in members if member.function_name)
+
+        # (parameter name, connected pin outside the subgraph) per distinct external data source
+        self.interface_inputs: List[Tuple[str, Any]] = []
+        # (result name, member output pin) for every member data output
+        self.interface_outputs: List[Tuple[str, Any]] = []
+        # (member, parameter name) for members with GUI values
+        self.gui_parameters: List[Tuple[Any, str]] = []
+        # Whether the subgraph starts a flow, rather than being triggered from outside
+        self.is_entry = True
+        # Nodes outside the subgraph that members' execution outputs lead to, run after it
+        self.downstream: List[Any] = []
+
+        self.call_order = self._flow_order()
+        self.code = self._generate_code()
+
+    # --- Compiling ---
+
+    @abstractmethod
+    def _flow_order(self) -> List[int]:
+        """Member indices in call order; also sets ``is_entry`` and ``downstream``."""
+
+    def _add_downstream(self, member, index_of: Dict[int, int], seen: set) -> List[int]:
+        """Record ``member``'s execution targets outside the subgraph; return the member ones."""
+        children = []
+        for target in _exec_targets(member):
+            if id(target) in index_of:
+                children.append(index_of[id(target)])
+            elif id(target) not in seen:
+                seen.add(id(target))
+                self.downstream.append(target)
+        return children
+
+    def _generate_code(self) -> str:
+        index_of = {id(member): index for index, member in enumerate(self.members)}
+        variables: Dict[int, str] = {}
+        for index, member in enumerate(self.members):
+            for pin in member.output_pins:
+                if pin.pin_category == "data":
+                    variables[id(pin)] = f"v{len(variables)}"
+                    self.interface_outputs.append((f"{index}:{pin.name}", pin))
+
+        parameters: Dict[int, str] = {}
+        calls = []
+        for index in self.call_order:
+            member = self.members[index]
+            if not member.function_name:
+                continue
+            arguments = []
+            for pin in member.input_pins:
+                if pin.pin_category != "data" or not pin.connections:
+                    continue
+                start = pin.connections[0].start_pin
+                source = _resolve_source_pin(start)
+                if id(source.node) in index_of:
+                    value = variables[id(source)]
+                else:
+                    value = parameters.get(id(source))
+                    if value is None:
+                        value = parameters[id(source)] = f"_in{len(self.interface_inputs)}"
+                        self.interface_inputs.append((value, start))
+                arguments.append(f"{pin.name!r}: {value}")
+            if hasattr(member, "get_gui_values"):
+                arguments.append(f"**(_gui{index} or {{}})")
+            outputs = [variables[id(pin)] for pin in member.output_pins if pin.pin_category == "data"]
+            call = f"_call({index}, {{{', '.join(arguments)}}})"
+            if len(outputs) == 1:
+                calls.append(f"    {outputs[0]} = {call}")
+            elif outputs:
+                # Like a plan step: items beyond the result's length keep their previous value
+                calls.append(f"    _result = {call}")
+                calls.append("    if isinstance(_result, (list, tuple)):")
+                calls.append(f"        {', '.join(outputs)}, = tuple(_result[:{len(outputs)}]) + "
+                             f"({', '.join(outputs)},)[len(_result):]")
+            else:
+                calls.append(f"    {call}")
+
+        for index, member in enumerate(self.members):
+            if hasattr(member, "get_gui_values") and member.function_name:
+                self.gui_parameters.append((member, f"_gui{index}"))
+
+        signature = ", ".join([f"{name}=None" for name, _ in self.interface_inputs] +
+                              [f"{name}=None" for _, name in self.gui_parameters])
+        results = [variables[id(pin)] for _, pin in self.interface_outputs]
+        lines = [
+            f"# {self.title!r}, compiled from {len(self.members)} member nodes",
+            "",
+            "def _load_member(source, function_name):",
+            "    namespace = dict(globals())",
+            "    exec(compile(source, '<group member>', 'exec'), namespace)",
+            "    return namespace.get(function_name)",
+            "",
+            "_members = (",
+            *[f"    _load_member({member.code!r}, {member.function_name!r}),"
+              if member.function_name else "    None,"
+              for member in self.members],
+            ")",
+            f"_titles = {tuple(member.title for member in self.members)!r}",
+            "",
+            *self._call_helper(),
+            "",
+            "@node_entry",
+            f"def {self.entry_name}({signature}):",
+            *self._entry_prologue(),
+        ]
+        if results:
+            lines.append(f"    {' = '.join(results)} = None")
+        lines.extend(calls)
+        if len(results) > 1:
+            lines.append(f"    return {self._returned(', '.join(results))}")
+        else:
+            lines.append(f"    return {self._returned(results[0] if results else 'None')}")
+        return "\n".join(lines) + "\n"
+
+    def _call_helper(self) -> List[str]:
+        """Source lines defining ``_call(index, inputs)``, which runs one member."""
+        return [
+            "def _call(index, inputs):",
+            "    function = _members[index]",
+            "    if not callable(function):",
+            "        raise RuntimeError(f\"Function of {_titles[index]!r} not found after code execution\")",
+            "    try:",
+            "        return function(**inputs)",
+            "    except Exception as e:",
+            "        raise RuntimeError(f\"{_titles[index]!r} failed: {type(e).__name__}: {e}\") from e",
+        ]
+
+    def _entry_prologue(self) -> List[str]:
+        """Source lines run first in the entry function."""
+        return []
+
+    def _returned(self, results: str) -> str:
+        """Expression the entry function returns, given its results expression."""
+        return results
+
+    # --- Node interface ---
+
+    def get_gui_values(self) -> Dict[str, Any]:
+        return {name: member.get_gui_values() for member, name in self.gui_parameters}
+
+    def split_outputs(self, values: Dict[str, Any]) -> List[Tuple[Any, Dict[str, Any]]]:
+        """Regroup ``{result name: value}`` into ``(member, {output name: value})`` pairs."""
+        per_member: Dict[int, Dict[str, Any]] = {}
+        for name, pin in self.interface_outputs:
+            if name in values:
+                per_member.setdefault(id(pin.node), {})[pin.name] = values[name]
+        return [(member, per_member.get(id(member), {})) for member in self.members]
+
+
+class GroupFunction(CompiledSubgraph):
+    """A function group compiled into one node for execution plans.
+
+    Members run in flow order, depth first from the group's first nodes, and
+    their outputs are handed back to their widgets by ``set_gui_values``.
+    """
+
+    def __init__(self, group, members: List[Any]):
+        """Compile ``group`` from its code nodes ``members`` (in graph order).
+
+        Raises:
+            GroupCompileError: If the members cannot run as a single call
+        """
+        self.group = group
+        super().__init__(group.uuid, group.name, members)
+
+    def _flow_order(self) -> List[int]:
+        """Member indices in the order a plan would run them, depth first from the first nodes."""
+        index_of = {id(member): index for index, member in enumerate(self.members)}
+        roots, triggered = [], False
+        for index, member in enumerate(self.members):
+            if member.is_streaming or member.is_async or member.vectorized:
+                kind = "streaming" if member.is_streaming else "async" if member.is_async else "vectorized"
+                raise GroupCompileError(f"'{member.title}' is a {kind} node")
+            sources = _exec_sources(member)
+            outside = [source for source in sources if id(source) not in index_of]
+            if len(outside) < len(sources):
+                if outside:
+                    raise GroupCompileError(f"execution enters the group at '{member.title}', "
+                                            "which is not one of its first nodes")
+                continue
+            roots.append(index)
+            triggered = triggered or bool(outside)
+        if triggered and len(roots) > 1:
+            raise GroupCompileError("execution enters the group at more than one node")
+        self.is_entry = not triggered
+
+        order: List[int] = []
+        limit = len(self.members) * 10
+        seen_downstream = set()
+        stack = list(reversed(roots))
+        while stack:
+            index = stack.pop()
+            order.append(index)
+            if len(order) > limit:
+                raise GroupCompileError("its execution flow loops")
+            children = self._add_downstream(self.members[index], index_of, seen_downstream)
+            stack.extend(reversed(children))
+        return order
+
+    def set_gui_values(self, values: Dict[str, Any]):
+        for member, member_values in self.split_outputs(values):
+            if hasattr(member, "set_gui_values"):
+                member.set_gui_values(member_values)
+
+
+def compile_function_groups(graph) -> Tuple[List[GroupFunction], List[str]]:
+    """Compile the graph's function groups.
+
+    Returns:
+        Tuple of (compiled groups, notes on groups that run node by node)
+    """
+    position = {id(node): index for index, node in enumerate(graph.nodes)}
+    nodes_by_uuid = {getattr(node, "uuid", None): node for node in graph.nodes}
+    functions: List[GroupFunction] = []
+    notes: List[str] = []
+    claimed = set()
+    for group in function_groups(graph):
+        # Reroutes only forward values, so they stay outside the compiled call
+        members = [nodes_by_uuid[uuid] for uuid in group.member_node_uuids
+                   if uuid in nodes_by_uuid and not _is_reroute(nodes_by_uuid[uuid])
+                   and id(nodes_by_uuid[uuid]) not in claimed]
+        if not members:
+            continue
+        members.sort(key=lambda node: position[id(node)])
+        try:
+            function = GroupFunction(group, members)
+        except GroupCompileError as e:
+            notes.append(f"'{group.name}' runs node by node: {e}")
+            continue
+        claimed.update(id(member) for member in members)
+        functions.append(function)
+    return functions, notes
+
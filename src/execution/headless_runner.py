@@ -0,0 +1,114 @@
+# headless_runner.py
+# Runs a saved graph without Qt: the .md file is parsed into the lightweight
+# HeadlessGraph model, compiled into an ExecutionPlan and executed in-process
+# (or in the worker pools for process, isolated and remote nodes). Used by
+# the command-line runner.
+
+import os
+import sys
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Add project root to path for cross-package imports
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from core.headless_graph import HeadlessGraph
+from data.flow_format import load_flow_file
+from .execution_plan import ExecutionPlan
+from .batch_runner import BatchRunner
+from .single_process_executor import SingleProcessExecutor
+from .process_pool_executor import ProcessPoolNodeExecutor
+from .venv_worker_pool import VenvWorkerPool, venv_python_executable
+from .remote_worker_pool import RemoteWorkerPool
+from .node_profiler import NodeProfiler
+from .pin_spill import PinSpillStore
+from .execution_trace import ExecutionTracer
+
+
+class HeadlessRunner:
+    """Executes a HeadlessGraph and returns the outputs of its nodes.
+
+    Runs go through the same plan and batch machinery as
+    ``GraphExecutor.run_batch``, with a single record holding the overrides.
+    """
+
+    def __init__(self, graph: HeadlessGraph, venv_path: Optional[str] = None,
+                 on_output: Optional[Callable[[Any, str], None]] = None, fuse: bool = False,
+                 memory_budget: Optional[int] = None, remote_workers: Optional[Sequence[str]] = None,
+                 remote_token: Optional[str] = None):
+        self.graph = graph
+        self.on_output = on_output
+        # Run linear chains of small nodes as single fused steps
+        self.fuse = fuse
+        self.log: List[str] = []
+        self.profiler = NodeProfiler()
+        self.tracer = ExecutionTracer()
+        self.single_process_executor = SingleProcessExecutor(self.log, venv_path, profiler=self.profiler,
+                                                             tracer=self.tracer)
+        self.process_executor = ProcessPoolNodeExecutor(venv_path, profiler=self.profiler, tracer=self.tracer)
+        self.venv_worker_pool = VenvWorkerPool(venv_python_executable(venv_path), profiler=self.profiler,
+                                               tracer=self.tracer)
+        # Worker daemons for nodes declared with @node_entry(remote=True); they run locally without any
+        self.remote_pool = (RemoteWorkerPool(remote_workers, graph.requirements, profiler=self.profiler,
+                                             tracer=self.tracer, token=remote_token) if remote_workers else None)
+        self.errors: List[str] = []
+        # Largest estimated size of pin values held at once during the last run
+        self.peak_retained_bytes = 0
+        # Byte budget for large pin values, beyond which they spill to disk
+        self.spill_store = PinSpillStore(memory_budget) if memory_budget else None
+        self._plan: Optional[ExecutionPlan] = None
+
+    @classmethod
+    def from_file(cls, file_path: str, **kwargs) -> "HeadlessRunner":
+        """Load a .md graph file into a runner."""
+        return cls(HeadlessGraph(load_flow_file(file_path)), **kwargs)
+
+    def get_node_executor(self, node):
+        if (self.remote_pool is not None and getattr(node, "run_remote", False)
+                and not getattr(node, "is_streaming", False)):
+            return self.remote_pool
+        if getattr(node, "run_isolated", False):
+            return self.venv_worker_pool
+        if getattr(node, "run_in_process", False):
+            return self.process_executor
+        return self.single_process_executor
+
+    def run(self, overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+            outputs: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Run the graph once.
+
+        Args:
+            overrides: ``{node title or uuid: {input name: value}}`` replacing GUI state and wired inputs
+            outputs: Titles of nodes to collect (default: nodes with unconnected data outputs)
+
+        Returns:
+            ``{node title: {output name: value}}``; node errors are left in ``errors``
+        """
+        if self._plan is None:
+            self._plan = ExecutionPlan(self.graph, fuse=self.fuse)
+        if not self._plan.entry_nodes:
+            self.errors = ["No entry point nodes found. Add nodes without execution inputs to start execution."]
+            return {}
+        if self._plan.process_codes:
+            self.process_executor.start(self._plan.process_codes)
+        if self._plan.isolated_codes:
+            self.venv_worker_pool.start(self._plan.isolated_codes)
+
+        runner = BatchRunner(self, batch_size=1, on_output=self.on_output)
+        with self.tracer.span("graph run", "run", {"mode": "headless"}):
+            results = runner.run(self._plan, [overrides or {}], outputs)
+        self.errors = [message for _, message in runner.errors]
+        self.peak_retained_bytes = runner.peak_retained_bytes
+        if self._plan.limit_reached:
+            self.errors.append("Execution limit reached. Check for infinite loops in execution flow.")
+        return results[0]
+
+    def shutdown(self):
+        self.single_process_executor.shutdown()
+        self.process_executor.shutdown()
+        self.venv_worker_pool.shutdown()
+        if self.remote_pool is not None:
+            self.remote_pool.shutdown()
+        if self.spill_store is not None:
+            self.spill_store.close()
@@ -0,0 +1,140 @@
+# node_fusion.py
+# Optimization pass that inlines linear chains of small nodes into one
+# compiled function (``GraphExecutor.set_fusion_mode``). Graphs of many tiny
+# nodes (add, format, strip, cast) spend more time on per-node overhead -
+# output capture, namespace lookups, GUI value sync, log lines - than on the
+# work itself; a fused chain pays that overhead once.
+#
+# A chain is a maximal run of nodes where each one's only execution output
+# leads to the next, which has no other execution input, and each one's data
+# outputs feed nothing but the next. Members must run in this interpreter and
+# have no GUI output. The fused function still times every member, and an
+# error is reported against the member that raised it.
+
+from typing import Any, Dict, List, Set
+
+from .group_function import CompiledSubgraph, _exec_sources, _exec_targets
+
+# Name of the entry function in a fused chain's generated code
+FUSED_FUNCTION_NAME = "run_fused"
+
+# Shortest run of nodes worth fusing
+MIN_CHAIN_LENGTH = 2
+
+
+def has_gui_output(node) -> bool:
+    """Whether ``node`` shows its outputs in widgets (headless nodes never do)."""
+    return bool(getattr(node, "gui_get_values_code", "") and getattr(node, "gui_widgets", None))
+
+
+def is_fusable(node) -> bool:
+    """Whether ``node`` can be inlined into a fused chain."""
+    return (not getattr(node, "is_reroute", False) and bool(node.function_name)
+            and not has_gui_output(node)
+            and not any(getattr(node, flag, False) for flag in (
+                "is_streaming", "is_async", "vectorized", "persist_result",
+                "run_in_process", "run_isolated", "run_remote", "retain_outputs")))
+
+
+def _next_in_chain(node):
+    """The node ``node`` hands over to in a chain, or None where a chain must end."""
+    targets = _exec_targets(node)
+    if len(targets) != 1:
+        return None
+    target = targets[0]
+    if target is node or len(_exec_sources(target)) != 1:
+        return None
+    # Every data output is consumed by the next node alone (unconnected ones are fine)
+    for pin in node.output_pins:
+        if pin.pin_category == "data" and any(conn.end_pin.node is not target for conn in pin.connections):
+            return None
+    return target
+
+
+class FusedChain(CompiledSubgraph):
+    """A linear chain of nodes compiled into one node for execution plans.
+
+    The entry function returns ``(results, timings)``, where ``timings``
+    holds ``(member index, wall time, CPU time)`` per member call; a member
+    that raises is reported as a ``FusedNodeError`` carrying its index and
+    the timings so far. ``SingleProcessExecutor`` unpacks both, so profiles
+    and error messages name the members, never the chain.
+    """
+
+    entry_name = FUSED_FUNCTION_NAME
+    is_fused = True
+
+    def __init__(self, members: List[Any]):
+        """Compile ``members``, in chain order."""
+        titles = [member.title for member in members]
+        super().__init__(f"fused:{members[0].uuid}", " > ".join(titles), members)
+
+    def _flow_order(self) -> List[int]:
+        self.is_entry = not _exec_sources(self.members[0])
+        self._add_downstream(self.members[-1], {}, set())
+        return list(range(len(self.members)))
+
+    def _call_helper(self) -> List[str]:
+        return [
+            "from time import perf_counter as _perf_counter, thread_time as _thread_time",
+            "",
+            "class FusedNodeError(Exception):",
+            "    def __init__(self, member_index, timings):",
+            "        super().__init__(_titles[member_index])",
+            "        self.member_index = member_index",
+            "        self.timings = timings",
+            "",
+            "def _timer():",
+            "    timings = []",
+            "    def _call(index, inputs):",
+            "        start, cpu_start = _perf_counter(), _thread_time()",
+            "        try:",
+            "            return _members[index](**inputs)",
+            "        except Exception as e:",
+            "            raise FusedNodeError(index, timings) from e",
+            "        finally:",
+            "            timings.append((index, _perf_counter() - start, _thread_time() - cpu_start))",
+            "    return timings, _call",
+        ]
+
+    def _entry_prologue(self) -> List[str]:
+        return ["    _timings, _call = _timer()"]
+
+    def _returned(self, results: str) -> str:
+        return f"({results}), _timings"
+
+
+def fuse_chains(graph, excluded: Set[int] = frozenset()) -> List[FusedChain]:
+    """Find the graph's maximal fusable chains and compile each one.
+
+    Args:
+        graph: Graph whose nodes to scan
+        excluded: ``id()`` of nodes already compiled into another step (function group members)
+    """
+    def candidate(node) -> bool:
+        return id(node) not in excluded and is_fusable(node)
+
+    successor: Dict[int, Any] = {}
+    has_predecessor: Set[int] = set()
+    for node in graph.nodes:
+        if not candidate(node):
+            continue
+        target = _next_in_chain(node)
+        if target is not None and candidate(target):
+            successor[id(node)] = target
+            has_predecessor.add(id(target))
+
+    chains: List[FusedChain] = []
+    for node in graph.nodes:
+        if id(node) not in successor or id(node) in has_predecessor:
+            continue
+        members, seen = [node], {id(node)}
+        while id(members[-1]) in successor:
+            target = successor[id(members[-1])]
+            if id(target) in seen:
+                break
+            seen.add(id(target))
+            members.append(target)
+        if len(members) >= MIN_CHAIN_LENGTH:
+            chains.append(FusedChain(members))
+    return chains
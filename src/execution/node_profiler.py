@@ -0,0 +1,238 @@
+# node_profiler.py
+# Per-node profiling across runs, keyed by node UUID so nodes with the same
+# title are kept apart. Every invocation records wall time, CPU time, output
+# size and (optionally) peak traced allocation into rolling windows that
+# report p50/p95/p99, queryable from Python and exportable as JSON.
+
+import json
+import math
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+# Samples kept per metric and node; older samples roll out of the window
+DEFAULT_WINDOW = 1000
+
+METRICS = ("wall_time", "cpu_time", "peak_alloc", "output_size")
+
+
+def object_size(value: Any) -> int:
+    """Cheap estimate of a result's size in bytes.
+
+    Buffers (NumPy arrays, bytes) report their payload size; containers add
+    the shallow size of their items one level down. Deep traversal is
+    deliberately avoided so profiling never dominates the node's own cost.
+    """
+    nbytes = getattr(value, "nbytes", None)
+    if isinstance(nbytes, int):
+        return nbytes
+    size = sys.getsizeof(value, 0)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(sys.getsizeof(item, 0) for item in value)
+    elif isinstance(value, dict):
+        size += sum(sys.getsizeof(key, 0) + sys.getsizeof(item, 0) for key, item in value.items())
+    return size
+
+
+def _nearest_rank(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile ``q`` (0-100) of an already sorted list."""
+    rank = math.ceil(q / 100 * len(ordered)) - 1
+    return ordered[max(0, min(len(ordered) - 1, rank))]
+
+
+class RollingHistogram:
+    """The most recent ``window`` samples of one metric, with percentile queries."""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self._samples = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value: float):
+        self._samples.append(value)
+        self.count += 1
+        self.total += value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Nearest-rank percentile (0-100) over the current window."""
+        if not self._samples:
+            return None
+        return _nearest_rank(sorted(self._samples), q)
+
+    def summary(self) -> Dict[str, Any]:
+        if not self._samples:
+            return {'count': 0}
+        ordered = sorted(self._samples)
+        return {
+            'count': self.count,
+            'mean': self.total / self.count,
+            'min': ordered[0],
+            'p50': _nearest_rank(ordered, 50),
+            'p95': _nearest_rank(ordered, 95),
+            'p99': _nearest_rank(ordered, 99),
+            'max': ordered[-1],
+        }
+
+
+class NodeProfile:
+    """Everything recorded for one node."""
+
+    def __init__(self, uuid: str, title: str, window: int = DEFAULT_WINDOW):
+        self.uuid = uuid
+        self.title = title
+        self.calls = 0
+        self.errors = 0
+        self.metrics = {metric: RollingHistogram(window) for metric in METRICS}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'uuid': self.uuid,
+            'title': self.title,
+            'calls': self.calls,
+            'errors': self.errors,
+            **{metric: histogram.summary() for metric, histogram in self.metrics.items()},
+        }
+
+
+class _Sample:
+    """Handed to the measured block so it can report the node's result."""
+
+    __slots__ = ("result", "has_result")
+
+    def __init__(self):
+        self.result = None
+        self.has_result = False
+
+    def set_result(self, result: Any):
+        self.result = result
+        self.has_result = True
+
+
+class NodeProfiler:
+    """Thread-safe per-node profile store shared by the node executors.
+
+    CPU time is the executing thread's CPU time, so it stays meaningful when
+    the parallel scheduler runs nodes on several threads. Allocation tracking
+    uses tracemalloc, which slows execution noticeably, and is therefore
+    opt-in; its peak is process-wide and only exact for nodes run serially.
+    """
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        self.enabled = True
+        self._profiles: Dict[str, NodeProfile] = {}
+        self._lock = threading.Lock()
+        self._tracking_allocations = False
+        self._started_tracemalloc = False
+
+    # --- Configuration ---
+
+    @property
+    def tracking_allocations(self) -> bool:
+        return self._tracking_allocations
+
+    def set_track_allocations(self, enabled: bool):
+        """Record peak tracemalloc allocation per node (slows execution)."""
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        elif not enabled and self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self._tracking_allocations = enabled
+
+    # --- Recording ---
+
+    @contextmanager
+    def measure(self, node, cpu: bool = True) -> Iterator[_Sample]:
+        """Measure one invocation of ``node``.
+
+        Args:
+            node: The node being executed
+            cpu: Whether the calling thread's CPU time belongs to this node
+                (False for coroutines interleaved with other tasks)
+        """
+        sample = _Sample()
+        if not self.enabled:
+            yield sample
+            return
+
+        track_allocations = self._tracking_allocations and tracemalloc.is_tracing()
+        if track_allocations:
+            tracemalloc.reset_peak()
+            alloc_start = tracemalloc.get_traced_memory()[0]
+        cpu_start = time.thread_time() if cpu else None
+        wall_start = time.perf_counter()
+        failed = True
+        try:
+            yield sample
+            failed = False
+        finally:
+            wall_time = time.perf_counter() - wall_start
+            cpu_time = time.thread_time() - cpu_start if cpu else None
+            peak_alloc = (max(0, tracemalloc.get_traced_memory()[1] - alloc_start)
+                          if track_allocations else None)
+            output_size = object_size(sample.result) if sample.has_result else None
+            self.record(node, wall_time, cpu_time, peak_alloc, output_size, failed)
+
+    def record(self, node, wall_time: float, cpu_time: Optional[float] = None,
+               peak_alloc: Optional[int] = None, output_size: Optional[int] = None, failed: bool = False):
+        """Add one invocation's measurements; metrics passed as None are not recorded."""
+        if not self.enabled:
+            return
+        uuid = getattr(node, "uuid", None)
+        if not isinstance(uuid, str):
+            uuid = str(node.title)
+        with self._lock:
+            profile = self._profiles.get(uuid)
+            if profile is None:
+                profile = self._profiles[uuid] = NodeProfile(uuid, node.title, self.window)
+            profile.title = node.title
+            profile.calls += 1
+            if failed:
+                profile.errors += 1
+            for metric, value in (("wall_time", wall_time), ("cpu_time", cpu_time),
+                                  ("peak_alloc", peak_alloc), ("output_size", output_size)):
+                if value is not None:
+                    profile.metrics[metric].add(value)
+
+    # --- Queries ---
+
+    def get_profile(self, uuid: str) -> Optional[Dict[str, Any]]:
+        """Summary of one node, or None if it never ran."""
+        with self._lock:
+            profile = self._profiles.get(uuid)
+            return profile.to_dict() if profile is not None else None
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Summaries of every profiled node, keyed by UUID."""
+        with self._lock:
+            return {uuid: profile.to_dict() for uuid, profile in self._profiles.items()}
+
+    def slowest(self, count: int = 10, metric: str = "wall_time", statistic: str = "p95") -> List[Dict[str, Any]]:
+        """The ``count`` nodes with the highest ``statistic`` of ``metric``."""
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}', expected one of {', '.join(METRICS)}")
+        ranked = [stats for stats in self.get_stats().values() if stats[metric].get('count')]
+        ranked.sort(key=lambda stats: stats[metric][statistic], reverse=True)
+        return ranked[:count]
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps({'window': self.window, 'nodes': self.get_stats()}, indent=indent)
+
+    def export_json(self, path: str):
+        """Write every node's summary to ``path`` as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_json())
+
+    def reset(self, uuid: Optional[str] = None):
+        """Forget ``uuid``'s profile, or every profile if None."""
+        with self._lock:
+            if uuid is None:
+                self._profiles.clear()
+            else:
+                self._profiles.pop(uuid, None)
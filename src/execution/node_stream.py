@@ -0,0 +1,127 @@
+# node_stream.py
+# Streaming pin values: the iterator returned by a generator node is drained
+# on a producer thread into a bounded buffer, so downstream nodes see the
+# first chunk while the producer is still working and peak memory is bounded
+# by buffer size times chunk size instead of by dataset size.
+
+import io
+import queue
+import threading
+from typing import Any, Iterator, Optional
+
+from .output_capture import capture_output
+
+# Chunks a producer may run ahead of its consumer
+DEFAULT_BUFFER_SIZE = 8
+
+# Seconds a blocked producer waits before re-checking whether the stream was closed
+_PUT_TIMEOUT = 0.1
+
+_END = object()
+
+
+class _StreamError:
+    """Buffer entry carrying an exception raised by the producer."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+class NodeStream:
+    """Single-consumer iterator over the items a streaming node yields.
+
+    The producer starts on first iteration. End of stream and producer
+    errors travel through the buffer, so the consumer stops (or fails with
+    the producer's error) exactly where a plain generator would. Reroute
+    nodes pass the stream object through unchanged.
+    """
+
+    def __init__(self, iterator: Iterator, title: str, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.title = title
+        self.buffer_size = buffer_size
+        self._iterator = iterator
+        self._buffer: "queue.Queue[Any]" = queue.Queue(maxsize=buffer_size)
+        self._thread: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self._finished = False
+        self._output = io.StringIO()
+        self._errors = io.StringIO()
+        self._output_read = 0
+        self._errors_read = 0
+        self.items_produced = 0
+
+    def __repr__(self):
+        return f"<NodeStream from '{self.title}'>"
+
+    def __iter__(self):
+        if self._thread is not None or self._closed.is_set():
+            raise RuntimeError(f"Stream from '{self.title}' was already consumed; "
+                               f"a streaming output can feed only one consumer per run")
+        self._thread = threading.Thread(target=self._produce, name=f"PyFlowGraphStream-{self.title}",
+                                        daemon=True)
+        self._thread.start()
+        return self._consume()
+
+    def _consume(self):
+        try:
+            while True:
+                item = self._buffer.get()
+                if item is _END:
+                    self._finished = True
+                    return
+                if isinstance(item, _StreamError):
+                    self._finished = True
+                    raise RuntimeError(f"ERROR in node '{self.title}' (stream): {item.error}") from item.error
+                yield item
+        finally:
+            # Consumer stopped early (break, error or generator close): release the producer
+            self.close()
+
+    def _produce(self):
+        with capture_output(self._output, self._errors):
+            try:
+                for item in self._iterator:
+                    if not self._put(item):
+                        return
+                    self.items_produced += 1
+                self._put(_END)
+            except BaseException as e:
+                self._put(_StreamError(e))
+            finally:
+                close = getattr(self._iterator, "close", None)
+                if close is not None and self._closed.is_set():
+                    try:
+                        close()
+                    except Exception:
+                        pass
+
+    def _put(self, item) -> bool:
+        while not self._closed.is_set():
+            try:
+                self._buffer.put(item, timeout=_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    @property
+    def finished(self) -> bool:
+        """True once the consumer has seen end of stream or a producer error."""
+        return self._finished
+
+    def close(self):
+        """Stop the producer; buffered items are discarded."""
+        self._closed.set()
+
+    def take_output(self) -> str:
+        """Return what the producer printed since the last call."""
+        output = self._output.getvalue()
+        errors = self._errors.getvalue()
+        self._output_read, output = len(output), output[self._output_read:].strip()
+        self._errors_read, errors = len(errors), errors[self._errors_read:].strip()
+        message = output
+        if errors:
+            message += f"\nSTDERR: {errors}"
+        return message
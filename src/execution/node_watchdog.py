@@ -0,0 +1,91 @@
+# node_watchdog.py
+# Per-node wall-clock limit. Python threads cannot be killed, so when a node
+# overruns, the watchdog raises NodeTimeout asynchronously in the thread that
+# runs it; pure-Python loops stop at their next bytecode. A node blocked inside
+# a C call stops once the call returns, and a process node's worker keeps
+# running while its caller moves on.
+
+import ctypes
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Optional
+
+# Seconds between checks for an asynchronous exception while waiting on a future
+WAIT_POLL_INTERVAL = 0.05
+
+
+class NodeTimeout(BaseException):
+    """Raised inside a node that ran past its time limit.
+
+    Derived from BaseException so ``except Exception`` in node code does not
+    swallow it.
+    """
+
+
+def _set_async_exc(thread_id: int, exception: Optional[type]) -> int:
+    return ctypes.pythonapi.PyThreadState_SetAsyncExc(
+        ctypes.c_ulong(thread_id), ctypes.py_object(exception) if exception is not None else None)
+
+
+def wait_interruptibly(future: Future) -> Any:
+    """Wait for ``future``'s result in short slices so a NodeTimeout can reach the waiting thread.
+
+    A plain ``future.result()`` blocks in C, where asynchronous exceptions
+    are not delivered. The future is cancelled if the wait is interrupted.
+    """
+    try:
+        while True:
+            try:
+                return future.result(timeout=WAIT_POLL_INTERVAL)
+            except FutureTimeout:
+                continue
+    except BaseException:
+        future.cancel()
+        raise
+
+
+class NodeWatchdog:
+    """Context manager aborting the block with a RuntimeError after ``timeout`` seconds."""
+
+    def __init__(self, title: str, timeout: float):
+        self.title = title
+        self.timeout = timeout
+        self.fired = False
+        self._running = False
+        self._thread_id = 0
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._thread_id = threading.get_ident()
+        self._running = True
+        self._timer = threading.Timer(self.timeout, self._fire)
+        self._timer.daemon = True
+        self._timer.start()
+        return self
+
+    def _fire(self):
+        with self._lock:
+            if self._running:
+                self.fired = True
+                _set_async_exc(self._thread_id, NodeTimeout)
+
+    def __exit__(self, exc_type, exc, traceback):
+        try:
+            self._stop()
+        except NodeTimeout as late:
+            # Delivered after the block returned but before _stop could withdraw it
+            exc = exc or late
+            self._stop()
+        if self.fired:
+            raise RuntimeError(f"TIMEOUT: Node '{self.title}' exceeded its time limit of "
+                               f"{self.timeout:g}s and was aborted") from exc
+        return False
+
+    def _stop(self):
+        with self._lock:
+            self._running = False
+            self._timer.cancel()
+            if self.fired:
+                # Withdraw the exception if the node finished before it was delivered
+                _set_async_exc(self._thread_id, None)
@@ -0,0 +1,91 @@
+# output_capture.py
+# Thread-safe stdout/stderr capture for node execution.
+# contextlib.redirect_stdout swaps a process-wide stream, which breaks as soon as
+# two nodes run on different threads; this routes writes per thread instead.
+# Targets are context variables, so async nodes awaited concurrently on one
+# event loop thread are captured separately as well.
+
+import io
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Tuple
+
+_targets = {
+    "stdout": ContextVar("pyflowgraph_stdout_capture", default=None),
+    "stderr": ContextVar("pyflowgraph_stderr_capture", default=None),
+}
+_install_lock = threading.Lock()
+_install_count = 0
+_original_streams = None
+
+
+class _ThreadRoutingStream:
+    """Stream proxy that writes to the current thread's (or task's) capture buffer, if any."""
+
+    def __init__(self, fallback, attribute: str):
+        self._fallback = fallback
+        self._target_var = _targets[attribute]
+
+    def _target(self):
+        return self._target_var.get() or self._fallback
+
+    def write(self, text):
+        return self._target().write(text)
+
+    def writelines(self, lines):
+        self._target().writelines(lines)
+
+    def flush(self):
+        self._target().flush()
+
+    def __getattr__(self, name):
+        return getattr(self._fallback, name)
+
+
+def _install():
+    global _install_count, _original_streams
+    with _install_lock:
+        if _install_count == 0:
+            _original_streams = (sys.stdout, sys.stderr)
+            sys.stdout = _ThreadRoutingStream(sys.stdout, "stdout")
+            sys.stderr = _ThreadRoutingStream(sys.stderr, "stderr")
+        _install_count += 1
+
+
+def _uninstall():
+    global _install_count, _original_streams
+    with _install_lock:
+        _install_count -= 1
+        if _install_count == 0:
+            # Only restore if nobody replaced our proxies in the meantime
+            if isinstance(sys.stdout, _ThreadRoutingStream):
+                sys.stdout = _original_streams[0]
+            if isinstance(sys.stderr, _ThreadRoutingStream):
+                sys.stderr = _original_streams[1]
+            _original_streams = None
+
+
+@contextmanager
+def capture_output(stdout_capture=None, stderr_capture=None) -> Iterator[Tuple[io.StringIO, io.StringIO]]:
+    """Capture everything the current thread or asyncio task prints to stdout and stderr.
+
+    Args:
+        stdout_capture: Buffer receiving stdout (a new StringIO if omitted)
+        stderr_capture: Buffer receiving stderr (a new StringIO if omitted)
+
+    Yields:
+        Tuple of (stdout buffer, stderr buffer)
+    """
+    stdout_capture = stdout_capture if stdout_capture is not None else io.StringIO()
+    stderr_capture = stderr_capture if stderr_capture is not None else io.StringIO()
+    _install()
+    stdout_token = _targets["stdout"].set(stdout_capture)
+    stderr_token = _targets["stderr"].set(stderr_capture)
+    try:
+        yield stdout_capture, stderr_capture
+    finally:
+        _targets["stdout"].reset(stdout_token)
+        _targets["stderr"].reset(stderr_token)
+        _uninstall()
@@ -0,0 +1,251 @@
+# parallel_scheduler.py
+# Runs the steps of an ExecutionPlan on a thread pool, dispatching every step
+# whose execution and data dependencies are satisfied.
+
+import asyncio
+import heapq
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Seconds between UI event pumps while waiting for running nodes
+EVENT_PUMP_INTERVAL = 0.05
+
+
+def build_step_dependencies(plan) -> List[Set[int]]:
+    """Compute, for every plan step, the earlier steps it has to wait for.
+
+    A step depends on the step whose execution output triggered it and on
+    every data hazard a serial run would resolve by order: the last writer of
+    each slot it reads, and for each slot it writes, the previous writer and
+    any readers in between. Running steps in any order that respects these
+    dependencies therefore produces the same values as the serial plan.
+    """
+    dependencies: List[Set[int]] = []
+    last_writer: Dict[int, int] = {}
+    readers: Dict[int, List[int]] = {}
+
+    for index, step in enumerate(plan.steps):
+        deps = set()
+        if step.parent >= 0:
+            deps.add(step.parent)
+
+        for _, slot in step.inputs:
+            writer = last_writer.get(slot)
+            if writer is not None:
+                deps.add(writer)
+            readers.setdefault(slot, []).append(index)
+
+        for _, slot in step.outputs:
+            writer = last_writer.get(slot)
+            if writer is not None:
+                deps.add(writer)
+            deps.update(reader for reader in readers.get(slot, ()) if reader != index)
+            last_writer[slot] = index
+            readers[slot] = []
+
+        dependencies.append(deps)
+    return dependencies
+
+
+class ParallelScheduler:
+    """Dispatches ready plan steps to a ThreadPoolExecutor.
+
+    Node functions run on worker threads (process nodes block their thread
+    on a worker process, so wide fan-outs use every core) and ``async def``
+    nodes are awaited together on the executor's event loop. Reading GUI
+    values, storing results, updating node widgets and writing the log all
+    happen on the calling thread. Log lines are flushed in plan order, so
+    the log reads exactly as it would for a serial run regardless of
+    completion order.
+    """
+
+    def __init__(self, graph_executor, max_workers: Optional[int] = None, inline: bool = False):
+        """Create a scheduler for one run.
+
+        Args:
+            graph_executor: GraphExecutor whose plan steps are run
+            max_workers: Thread pool size (None uses the ThreadPoolExecutor default)
+            inline: Run synchronous nodes on the calling thread; only async
+                nodes then overlap, awaited concurrently on the event loop
+        """
+        self.graph_executor = graph_executor
+        self.max_workers = max_workers
+        self.inline = inline
+
+    def run(self, plan, slot_values, liveness=None) -> Tuple[int, Dict[str, Any]]:
+        """Run every step of ``plan``.
+
+        Args:
+            plan: Compiled ExecutionPlan
+            slot_values: The run's slot value array
+            liveness: Optional PinLiveness told about every finished or cancelled step
+
+        Returns:
+            Tuple of (number of executed steps, run statistics)
+        """
+        steps = plan.steps
+        step_count = len(steps)
+        dependencies = build_step_dependencies(plan)
+        dependents: List[List[int]] = [[] for _ in range(step_count)]
+        for index, deps in enumerate(dependencies):
+            for dep in deps:
+                dependents[dep].append(index)
+
+        remaining = [len(deps) for deps in dependencies]
+        durations = [0.0] * step_count
+        logs: List[Optional[List[str]]] = [None] * step_count
+        fingerprints: List[Optional[str]] = [None] * step_count
+        done = [False] * step_count
+        cancelled = [False] * step_count
+        self._next_to_flush = 0
+
+        ready = [index for index in range(step_count) if remaining[index] == 0]
+        heapq.heapify(ready)
+        running = {}
+        start_time = time.perf_counter()
+
+        def complete(index, success):
+            done[index] = True
+            if not success:
+                # Skip the failed node's downstream flow, like the serial run does
+                for skipped in range(index + 1, steps[index].skip_to):
+                    if not done[skipped]:
+                        cancelled[skipped] = True
+                        done[skipped] = True
+                        logs[skipped] = []
+                        release(skipped)
+                        if liveness is not None:
+                            liveness.step_done(skipped)
+            release(index)
+            if liveness is not None:
+                liveness.step_done(index)
+            self._flush_logs(logs, done)
+
+        def release(index):
+            for dependent in dependents[index]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0 and not done[dependent]:
+                    heapq.heappush(ready, dependent)
+
+        def finish(index, outcome):
+            result, output_message, error, duration = outcome
+            durations[index] = duration
+            if error is not None:
+                logs[index].append(error)
+                complete(index, False)
+                return
+            if output_message:
+                logs[index].append(output_message)
+            fingerprint = fingerprints[index]
+            self.graph_executor._remember_result(steps[index], fingerprint, result,
+                                                 output_message, logs[index])
+            self.graph_executor._finish_step(steps[index], slot_values, result, fingerprint)
+            complete(index, True)
+
+        # Inline runs call synchronous nodes on this thread and need no pool
+        with (nullcontext() if self.inline else
+              ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="PyFlowGraphWorker")) as pool:
+            while ready or running:
+                if self.graph_executor.cancel_requested:
+                    # Let running nodes finish, but start no new ones
+                    ready.clear()
+                while ready:
+                    index = heapq.heappop(ready)
+                    if done[index]:
+                        continue
+                    step = steps[index]
+                    logs[index] = []
+                    if step.is_reroute:
+                        complete(index, True)
+                        continue
+                    inputs = self.graph_executor._prepare_step(step, slot_values, logs[index])
+                    if inputs is None:
+                        complete(index, True)
+                        continue
+                    fingerprints[index], entry = self.graph_executor._lookup_result(
+                        step, slot_values, inputs, logs[index])
+                    if entry is not None:
+                        self.graph_executor._finish_step(step, slot_values, entry.result, fingerprints[index])
+                        complete(index, True)
+                        continue
+                    if (getattr(step.node, "is_async", False) and self.graph_executor.get_node_executor(step.node)
+                            is self.graph_executor.single_process_executor):
+                        # Async nodes share one event loop, so any number can be awaited at once
+                        executor = self.graph_executor.single_process_executor
+                        future = executor.async_runner.submit(self._await_node(executor, step.node, inputs))
+                        running[future] = index
+                    elif self.inline:
+                        finish(index, self._run_node(step.node, inputs))
+                    else:
+                        future = pool.submit(self._run_node, step.node, inputs)
+                        running[future] = index
+
+                if not running:
+                    continue
+
+                # Wake up periodically so the UI can repaint while nodes are in flight
+                finished, _ = wait(running, timeout=EVENT_PUMP_INTERVAL, return_when=FIRST_COMPLETED)
+                self.graph_executor._process_pending_events()
+                for future in sorted(finished, key=running.get):
+                    finish(running.pop(future), future.result())
+
+        for index in range(step_count):
+            if not done[index]:
+                # Never started because the run was stopped
+                cancelled[index] = done[index] = True
+                logs[index] = []
+        self._flush_logs(logs, done)
+
+        wall_time = time.perf_counter() - start_time
+        stats = self._summarize(dependencies, durations, cancelled, wall_time)
+        return step_count - sum(cancelled), stats
+
+    def _run_node(self, node, inputs):
+        """Worker-thread body: execute one node and report instead of raising."""
+        start_time = time.perf_counter()
+        try:
+            result, output_message = self.graph_executor.call_node(node, inputs)
+            return result, output_message, None, time.perf_counter() - start_time
+        except Exception as e:
+            return None, "", str(e), time.perf_counter() - start_time
+
+    async def _await_node(self, executor, node, inputs):
+        """Event-loop body: await one async node and report instead of raising."""
+        start_time = time.perf_counter()
+        timeout = self.graph_executor.node_timeout
+        try:
+            result, output_message = await asyncio.wait_for(executor.execute_node_async(node, inputs), timeout)
+            return result, output_message, None, time.perf_counter() - start_time
+        except asyncio.TimeoutError:
+            return None, "", (f"TIMEOUT: Node '{node.title}' exceeded its time limit of "
+                              f"{timeout:g}s and was aborted"), time.perf_counter() - start_time
+        except Exception as e:
+            return None, "", str(e), time.perf_counter() - start_time
+
+    def _flush_logs(self, logs, done):
+        """Write finished steps' log lines in plan order."""
+        log = self.graph_executor.log
+        while self._next_to_flush < len(logs) and done[self._next_to_flush]:
+            for line in logs[self._next_to_flush] or ():
+                log.append(line)
+            logs[self._next_to_flush] = None
+            self._next_to_flush += 1
+
+    def _summarize(self, dependencies, durations, cancelled, wall_time) -> Dict[str, Any]:
+        """Compare the measured wall time against the critical path through the DAG."""
+        finish = [0.0] * len(durations)
+        for index, deps in enumerate(dependencies):
+            if cancelled[index]:
+                continue
+            finish[index] = durations[index] + max((finish[dep] for dep in deps), default=0.0)
+
+        serial_time = sum(durations)
+        return {
+            'wall_time': wall_time,
+            'critical_path_time': max(finish, default=0.0),
+            'serial_node_time': serial_time,
+            'speedup': serial_time / wall_time if wall_time > 0 else 0.0,
+            'max_workers': self.max_workers,
+        }
@@ -0,0 +1,103 @@
+# pin_liveness.py
+# Releases pin values as soon as the last step that reads them has run, so a
+# chain of transforms over a large tensor keeps one or two copies alive
+# instead of one per node. Last consumers come from the plan's topology;
+# outputs of nodes declared with @node_entry(retain=True) and streams are
+# kept until the run ends.
+
+from typing import Any, Dict, List
+
+from .node_profiler import object_size
+from .node_stream import NodeStream
+
+# Reads a slot without faulting a spilled value back in (see pin_spill)
+_peek = list.__getitem__
+
+
+def format_bytes(size: int) -> str:
+    """Human readable byte count for run reports."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class PinLiveness:
+    """Tracks which slots of one plan's slot value arrays are still needed.
+
+    Every step reports completion through ``step_done``, whether it ran,
+    failed or was skipped: the values it wrote are accounted for, and every
+    slot whose readers have all finished is cleared. Readers are counted
+    rather than ordered, so the parallel scheduler may finish them in any
+    order. Batch runs pass one slot array per record.
+
+    Retained bytes are estimated with ``object_size`` and counted once per
+    object, however many slots share it.
+    """
+
+    def __init__(self, plan, slot_arrays: List[List[Any]]):
+        self.plan = plan
+        self.slot_arrays = slot_arrays
+        self.retained_bytes = 0
+        self.peak_bytes = 0
+        self.released = 0
+        self._pending = list(plan.slot_reads)
+        # Mirror of the values accounted for in each slot array
+        self._accounted = [[None] * plan.slot_count for _ in slot_arrays]
+        # id(value) -> [size, number of slots holding it]
+        self._held: Dict[int, List[int]] = {}
+
+    def step_done(self, index: int):
+        """Account for step ``index``'s outputs and release slots it was the last reader of."""
+        step = self.plan.steps[index]
+        for _, slot in step.outputs:
+            self._account(slot)
+        for _, slot in step.inputs:
+            self._pending[slot] -= 1
+            if self._pending[slot] == 0:
+                self._release(slot)
+        for _, slot in step.outputs:
+            # Outputs nobody reads only had to reach the GUI
+            if self._pending[slot] == 0:
+                self._release(slot)
+
+    def stats(self) -> Dict[str, int]:
+        return {'peak_retained_bytes': self.peak_bytes, 'released_values': self.released}
+
+    def _account(self, slot: int):
+        for slot_values, accounted in zip(self.slot_arrays, self._accounted):
+            value = _peek(slot_values, slot)
+            if value is accounted[slot]:
+                continue
+            if accounted[slot] is not None:
+                self._drop(accounted[slot])
+            accounted[slot] = value
+            if value is not None:
+                held = self._held.get(id(value))
+                if held is None:
+                    held = self._held[id(value)] = [object_size(value), 0]
+                    self.retained_bytes += held[0]
+                    self.peak_bytes = max(self.peak_bytes, self.retained_bytes)
+                held[1] += 1
+
+    def _release(self, slot: int):
+        if slot in self.plan.retained_slots:
+            return
+        for slot_values, accounted in zip(self.slot_arrays, self._accounted):
+            value = _peek(slot_values, slot)
+            # Streams are read lazily by downstream generators and closed when the run ends
+            if value is None or isinstance(value, NodeStream):
+                continue
+            slot_values[slot] = None
+            self.released += 1
+            if accounted[slot] is not None:
+                self._drop(accounted[slot])
+                accounted[slot] = None
+
+    def _drop(self, value: Any):
+        held = self._held[id(value)]
+        held[1] -= 1
+        if held[1] == 0:
+            del self._held[id(value)]
+            self.retained_bytes -= held[0]
@@ -0,0 +1,374 @@
+# pin_spill.py
+# Keeps large pin values within a byte budget (``GraphExecutor.set_memory_budget``).
+# Slot arrays and pin value dicts created by a PinSpillStore report every
+# write to it; once the large values they hold exceed the budget, the least
+# recently used ones are written to disk - NumPy arrays as memory-mapped
+# .npy files, DataFrames as Parquet, other buffers as pickles - and their
+# slots hold a small SpilledValue instead. Reading such a slot faults the
+# value back in, so nodes never see the difference.
+#
+# Only ndarrays, DataFrames/Series and bytes-like values of at least
+# ``min_bytes`` are tracked; everything else stays in memory untouched.
+
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .node_profiler import object_size
+
+# Values smaller than this are never spilled: the file round trip costs more than they do
+DEFAULT_MIN_SPILL_BYTES = 1024 * 1024
+
+
+def _spill_format(value: Any) -> Optional[str]:
+    """File format a value would be spilled in, or None if it is never spilled."""
+    if isinstance(value, (bytes, bytearray)):
+        return "pickle"
+    module = type(value).__module__
+    if module == "numpy" and type(value).__name__ in ("ndarray", "memmap"):
+        # Object arrays hold references, not data, so they pickle instead
+        return "pickle" if value.dtype.hasobject else "npy"
+    if module.startswith("pandas."):
+        name = type(value).__name__
+        if name == "DataFrame":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                return "pickle"
+            return "parquet"
+        if name == "Series":
+            return "pickle"
+    return None
+
+
+class SpilledValue:
+    """Stands in for a value written to disk, in every slot that held it."""
+
+    __slots__ = ("path", "format", "size", "locations", "value")
+
+    def __init__(self, path: str, format: str, size: int, locations: List[Tuple[Any, Any]]):
+        self.path = path
+        self.format = format
+        self.size = size
+        # (container, key) pairs holding this placeholder
+        self.locations = locations
+        # Set once faulted back in, for readers that fetched the placeholder just before
+        self.value = None
+
+    def load(self) -> Any:
+        if self.format == "npy":
+            import numpy
+            # Copy-on-write mapping: pages load on access and nodes may still modify the array
+            return numpy.load(self.path, mmap_mode="c", allow_pickle=False)
+        if self.format == "parquet":
+            import pandas
+            return pandas.read_parquet(self.path)
+        with open(self.path, "rb") as f:
+            return pickle.load(f)
+
+    def __repr__(self) -> str:
+        return f"SpilledValue({self.format}, {self.size} bytes)"
+
+
+class _Resident:
+    """A tracked value in memory and the slots holding it."""
+
+    __slots__ = ("value", "size", "format", "locations")
+
+    def __init__(self, value: Any, size: int, format: str):
+        self.value = value
+        self.size = size
+        self.format = format
+        self.locations: List[Tuple[Any, Any]] = []
+
+
+def _raw_set(container, key, value):
+    # Bypass the container's own hooks, which would report the write back to the store
+    if isinstance(container, list):
+        list.__setitem__(container, key, value)
+    else:
+        dict.__setitem__(container, key, value)
+
+
+def _without(locations: List[Tuple[Any, Any]], container, key) -> List[Tuple[Any, Any]]:
+    return [(held_in, held_key) for held_in, held_key in locations
+            if not (held_in is container and held_key == key)]
+
+
+def _remove_directory(path: Optional[str]):
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+class PinSpillStore:
+    """Byte budget shared by the slot arrays and pin value dicts it creates.
+
+    Thread-safe, so the parallel scheduler's workers may read slots while
+    another step's outputs push older values out. Values are counted once
+    however many slots hold them; a value also referenced outside the slots
+    (by a node's namespace, say) is still written out, but its memory is of
+    course only freed once those references go too.
+    """
+
+    def __init__(self, max_bytes: int, spill_dir: Optional[str] = None,
+                 min_bytes: int = DEFAULT_MIN_SPILL_BYTES):
+        """Initialize the store.
+
+        Args:
+            max_bytes: Budget for tracked values held in memory
+            spill_dir: Directory for spill files (default: a temporary directory, removed on ``close``)
+            min_bytes: Smallest value that is tracked and may be spilled
+        """
+        self.max_bytes = max_bytes
+        self.min_bytes = min_bytes
+        self._spill_dir = spill_dir
+        self._owned_dir: Optional[str] = None
+        self._file_count = 0
+        # id(value) -> resident entry, least recently used first
+        self._resident: "OrderedDict[int, _Resident]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.resident_bytes = 0
+        self.peak_resident_bytes = 0
+        self.spills = 0
+        self.faults = 0
+        self.spilled_bytes = 0
+        self.failed_spills = 0
+
+    # --- Containers ---
+
+    def new_slot_values(self, count: int) -> "SpillingSlots":
+        return SpillingSlots(count, self)
+
+    def new_pin_values(self, values: Optional[Dict[Any, Any]] = None) -> "SpillingPinValues":
+        """A pin value dict under this budget, starting with ``values``."""
+        pin_values = SpillingPinValues(self)
+        for key in (values or {}):
+            # Indexing, so values spilled by another store are read back first
+            pin_values[key] = values[key]
+        return pin_values
+
+    # --- Reporting ---
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'spills': self.spills,
+                'faults': self.faults,
+                'spilled_bytes': self.spilled_bytes,
+                'resident_bytes': self.resident_bytes,
+                'peak_resident_bytes': self.peak_resident_bytes,
+            }
+
+    def reset_peak(self):
+        """Start a new peak measurement, e.g. at the start of a run."""
+        with self._lock:
+            self.peak_resident_bytes = self.resident_bytes
+
+    def close(self):
+        """Delete every spill file; placeholders still in slots can no longer be read."""
+        with self._lock:
+            self._resident.clear()
+            self.resident_bytes = 0
+            directory, self._owned_dir = self._owned_dir, None
+        _remove_directory(directory)
+
+    # --- Container hooks ---
+
+    def replaced(self, container, key, old: Any, new: Any):
+        """``container[key]`` changed from ``old`` to ``new``."""
+        with self._lock:
+            if old is not None:
+                self._forget(old, container, key)
+            if new is None:
+                return
+            if type(new) is SpilledValue:
+                # Slot copied from another slot: share the placeholder
+                new.locations.append((container, key))
+                return
+            entry = self._resident.get(id(new))
+            if entry is None:
+                format = _spill_format(new)
+                if format is None:
+                    return
+                size = object_size(new)
+                if size < self.min_bytes:
+                    return
+                entry = self._resident[id(new)] = _Resident(new, size, format)
+                self.resident_bytes += size
+            else:
+                self._resident.move_to_end(id(new))
+            entry.locations.append((container, key))
+            self._enforce(keep=id(new))
+
+    def touch(self, value: Any):
+        """Mark a tracked value as just read."""
+        if id(value) in self._resident:
+            with self._lock:
+                if id(value) in self._resident:
+                    self._resident.move_to_end(id(value))
+
+    def fault_in(self, placeholder: SpilledValue) -> Any:
+        """Load a spilled value back into every slot holding it."""
+        with self._lock:
+            if placeholder.value is not None:
+                return placeholder.value
+            value = placeholder.load()
+            entry = self._resident[id(value)] = _Resident(value, placeholder.size, placeholder.format)
+            entry.locations = placeholder.locations
+            for container, key in entry.locations:
+                _raw_set(container, key, value)
+            placeholder.value = value
+            placeholder.locations = []
+            self.faults += 1
+            self.resident_bytes += placeholder.size
+            self._delete_file(placeholder.path)
+            self._enforce(keep=id(value))
+            return value
+
+    # --- Internals ---
+
+    def _forget(self, old: Any, container, key):
+        if type(old) is SpilledValue:
+            old.locations = _without(old.locations, container, key)
+            if not old.locations and old.value is None:
+                self._delete_file(old.path)
+            return
+        entry = self._resident.get(id(old))
+        if entry is None:
+            return
+        entry.locations = _without(entry.locations, container, key)
+        if not entry.locations:
+            del self._resident[id(old)]
+            self.resident_bytes -= entry.size
+
+    def _enforce(self, keep: int):
+        """Spill least recently used values until the budget holds; ``keep`` is never spilled."""
+        if self.resident_bytes > self.max_bytes:
+            for value_id in list(self._resident):
+                if self.resident_bytes <= self.max_bytes:
+                    break
+                if value_id != keep:
+                    self._spill(self._resident[value_id])
+        self.peak_resident_bytes = max(self.peak_resident_bytes, self.resident_bytes)
+
+    def _spill(self, entry: _Resident):
+        path = self._new_path(entry.format)
+        try:
+            self._write(entry, path)
+        except Exception:
+            # Unpicklable or unwritable: keep it in memory, outside the budget from now on
+            self._delete_file(path)
+            self.failed_spills += 1
+            del self._resident[id(entry.value)]
+            self.resident_bytes -= entry.size
+            return
+        placeholder = SpilledValue(path, entry.format, entry.size, entry.locations)
+        for container, key in entry.locations:
+            _raw_set(container, key, placeholder)
+        del self._resident[id(entry.value)]
+        self.resident_bytes -= entry.size
+        self.spills += 1
+        self.spilled_bytes += entry.size
+
+    @staticmethod
+    def _write(entry: _Resident, path: str):
+        if entry.format == "npy":
+            import numpy
+            numpy.save(path, entry.value, allow_pickle=False)
+        elif entry.format == "parquet":
+            entry.value.to_parquet(path)
+        else:
+            with open(path, "wb") as f:
+                pickle.dump(entry.value, f, pickle.HIGHEST_PROTOCOL)
+
+    def _new_path(self, format: str) -> str:
+        directory = self._spill_dir
+        if directory is None:
+            if self._owned_dir is None:
+                self._owned_dir = tempfile.mkdtemp(prefix="pyflowgraph-spill-")
+                weakref.finalize(self, _remove_directory, self._owned_dir)
+            directory = self._owned_dir
+        else:
+            os.makedirs(directory, exist_ok=True)
+        self._file_count += 1
+        return os.path.join(directory, f"{os.getpid()}-{id(self):x}-{self._file_count}.{format}")
+
+    @staticmethod
+    def _delete_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            # Already gone, or still mapped on Windows; removed with the directory
+            pass
+
+
+class SpillingSlots(list):
+    """A plan's slot value array whose large values count against a PinSpillStore."""
+
+    __slots__ = ("_store",)
+
+    def __init__(self, count: int, store: PinSpillStore):
+        super().__init__([None] * count)
+        self._store = store
+
+    def __getitem__(self, index):
+        value = list.__getitem__(self, index)
+        if type(value) is SpilledValue:
+            return self._store.fault_in(value)
+        if value is not None:
+            self._store.touch(value)
+        return value
+
+    def __setitem__(self, index, value):
+        old = list.__getitem__(self, index)
+        list.__setitem__(self, index, value)
+        self._store.replaced(self, index, old, value)
+
+
+class SpillingPinValues(dict):
+    """A live-mode ``{pin: value}`` dict whose large values count against a PinSpillStore."""
+
+    def __init__(self, store: PinSpillStore):
+        super().__init__()
+        self._store = store
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is SpilledValue:
+            return self._store.fault_in(value)
+        self._store.touch(value)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        old = dict.get(self, key)
+        dict.__setitem__(self, key, value)
+        self._store.replaced(self, key, old, value)
+
+    def __delitem__(self, key):
+        old = dict.__getitem__(self, key)
+        dict.__delitem__(self, key)
+        self._store.replaced(self, key, old, None)
+
+    def pop(self, key, *default):
+        if key not in self:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = self[key]
+        del self[key]
+        return value
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
@@ -0,0 +1,231 @@
+# process_pool_executor.py
+# Runs opted-in nodes on a pool of warm worker processes so CPU-bound
+# pure-Python nodes are not serialized behind the GIL.
+#
+# Nodes opt in with ``@node_entry(process=True)``. Their inputs and results are
+# pickled between the main process and the workers, with large buffers in
+# shared memory (shm_transport), and their code runs
+# without the shared namespace of SingleProcessExecutor, so it must import
+# everything it uses.
+
+import io
+import os
+import sys
+import time
+import inspect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from . import shm_transport
+from .code_cache import code_hash
+from .node_profiler import NodeProfiler, object_size
+from .execution_trace import ExecutionTracer, node_span_args
+from .node_watchdog import wait_interruptibly
+
+
+def node_entry(func=None, *, process: bool = False, isolate: bool = False, remote: bool = False,
+               persist: bool = False, vectorize: bool = False, retain: bool = False,
+               live_rate: Optional[float] = None, live_on_change: bool = False):
+    """Decorator marking a node's entry function.
+
+    Used both bare (``@node_entry``) and with options:
+    ``process=True`` runs the node in a worker process, ``isolate=True`` in
+    a worker started from the graph's venv interpreter, ``remote=True`` on
+    a remote worker daemon (when the executor has any), ``persist=True``
+    keeps its results in the on-disk result store, ``vectorize=True``
+    lets batch runs pass whole columns of inputs at once and ``retain=True``
+    keeps its outputs alive for the whole run instead of releasing them
+    after their last consumer. ``live_rate`` (Hz) and ``live_on_change``
+    only concern live mode, which reads them from the source code.
+    """
+    def mark(function):
+        function.run_in_process = process
+        function.run_isolated = isolate
+        function.run_remote = remote
+        function.persist_result = persist
+        function.vectorized = vectorize
+        function.retain_outputs = retain
+        return function
+    return mark(func) if func is not None else mark
+
+
+def find_site_packages(venv_path: Optional[str]) -> Optional[str]:
+    """Return the site-packages directory of a virtual environment, if it exists."""
+    if not venv_path or not os.path.exists(venv_path):
+        return None
+
+    if os.name == 'nt':  # Windows
+        site_packages_path = os.path.join(venv_path, "Lib", "site-packages")
+    else:  # Unix/Linux/macOS
+        lib_dir = os.path.join(venv_path, "lib")
+        if not os.path.exists(lib_dir):
+            return None
+        python_dirs = [d for d in os.listdir(lib_dir) if d.startswith('python')]
+        if not python_dirs:
+            return None
+        site_packages_path = os.path.join(lib_dir, python_dirs[0], "site-packages")
+
+    return site_packages_path if os.path.exists(site_packages_path) else None
+
+
+# --- Worker process side ---
+
+# Compiled node globals by code hash, private to each worker process
+_worker_namespaces: Dict[str, Dict[str, Any]] = {}
+
+
+def _initialize_worker(site_packages: Optional[str], codes: Tuple[str, ...]):
+    """Pool initializer: expose the venv packages and precompile known node code."""
+    if site_packages and site_packages not in sys.path:
+        sys.path.insert(0, site_packages)
+    for code in codes:
+        try:
+            _worker_namespace(code)
+        except Exception:
+            # Reported properly when the node actually runs
+            pass
+
+
+def _worker_namespace(code: str) -> Dict[str, Any]:
+    key = code_hash(code)
+    namespace = _worker_namespaces.get(key)
+    if namespace is None:
+        namespace = {'__name__': '__node__', 'node_entry': node_entry}
+        exec(compile(code, "<node>", "exec"), namespace)
+        _worker_namespaces[key] = namespace
+    return namespace
+
+
+def _run_in_worker(code: str, function_name: str, inputs) -> Tuple[Any, str, str, float]:
+    """Worker body: run one node function and return (result, stdout, stderr, cpu_time).
+
+    Inputs and result are shm_transport messages.
+    """
+    inputs = shm_transport.loads(inputs)
+    stdout_capture = io.StringIO()
+    stderr_capture = io.StringIO()
+    with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+        function = _worker_namespace(code).get(function_name)
+        if not callable(function):
+            raise RuntimeError(f"Function '{function_name}' not found after code execution")
+        cpu_start = time.process_time()
+        result = function(**inputs)
+        if inspect.isawaitable(result):
+            import asyncio
+            result = asyncio.run(result)
+        cpu_time = time.process_time() - cpu_start
+    result, _ = shm_transport.dumps(result, hand_over=True)
+    return result, stdout_capture.getvalue(), stderr_capture.getvalue(), cpu_time
+
+
+def _warm_up():
+    return os.getpid()
+
+
+# --- Main process side ---
+
+class ProcessPoolNodeExecutor:
+    """Executes opted-in nodes on a pool of warm worker processes.
+
+    Has the same ``execute_node`` contract as SingleProcessExecutor, so the
+    graph executor (and the parallel scheduler's worker threads) can hand a
+    node to either backend. The pool is started lazily and kept alive across
+    runs; workers compile each distinct node source once.
+    """
+
+    def __init__(self, venv_path=None, max_workers: Optional[int] = None,
+                 profiler: Optional[NodeProfiler] = None, tracer: Optional[ExecutionTracer] = None):
+        """Initialize the process pool executor.
+
+        Args:
+            venv_path: Path to virtual environment whose packages workers can import
+            max_workers: Number of worker processes (None uses the CPU count)
+            profiler: Per-node profile store, shared with other executors (created if None)
+            tracer: Execution timeline, shared with other executors (created disabled if None)
+        """
+        self.venv_path = venv_path
+        self.max_workers = max_workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._preload: Tuple[str, ...] = ()
+
+        # Performance tracking: wall time measured in the main process (includes
+        # pickling), CPU time reported by the worker
+        self.execution_times: Dict[str, float] = {}
+        self.profiler = profiler if profiler is not None else NodeProfiler()
+        self.tracer = tracer if tracer is not None else ExecutionTracer()
+
+    @property
+    def is_running(self) -> bool:
+        return self._pool is not None
+
+    def start(self, codes: Iterable[str] = ()):
+        """Start the worker processes, precompiling ``codes`` in each of them."""
+        if self._pool is not None:
+            return
+        self._preload = tuple(dict.fromkeys(code for code in codes if code))
+        # Spawned workers never inherit Qt or executor threads from the GUI process
+        self._pool = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(find_site_packages(self.venv_path), self._preload),
+        )
+
+    def warm_up(self, codes: Iterable[str] = ()):
+        """Start the pool and block until every worker process is up."""
+        self.start(codes)
+        workers = self.max_workers or os.cpu_count() or 1
+        list(self._pool.map(_warm_up, range(workers)))
+
+    def execute_node(self, node, inputs: Dict[str, Any]) -> Tuple[Any, str]:
+        """Execute a single node in a worker process.
+
+        Args:
+            node: The node to execute
+            inputs: Dictionary of picklable input values for the node
+
+        Returns:
+            Tuple of (result, captured_output)
+        """
+        if not node.function_name:
+            return None, f"SKIP: Node '{node.title}' has no valid function defined."
+
+        self.start()
+        start_time = time.perf_counter()
+        try:
+            with self.tracer.span(node.title, "node") as span:
+                if span is not None:
+                    span.args.update(node_span_args(node, inputs), worker="process pool")
+                message, pins = shm_transport.dumps(inputs)
+                try:
+                    future = self._pool.submit(_run_in_worker, node.code, node.function_name, message)
+                    result, captured_output, captured_errors, cpu_time = wait_interruptibly(future)
+                    result = shm_transport.loads(result)
+                finally:
+                    shm_transport.release(pins)
+                if span is not None:
+                    span.args.update(output_size=object_size(result), cpu_time=cpu_time)
+        except Exception as e:
+            wall_time = time.perf_counter() - start_time
+            self.execution_times[node.title] = wall_time
+            self.profiler.record(node, wall_time, failed=True)
+            raise RuntimeError(f"ERROR in node '{node.title}' (worker process): {e}") from e
+
+        wall_time = time.perf_counter() - start_time
+        self.execution_times[node.title] = wall_time
+        self.profiler.record(node, wall_time, cpu_time, output_size=object_size(result))
+
+        output_message = ""
+        if captured_output:
+            output_message += captured_output.strip()
+        if captured_errors:
+            output_message += f"\nSTDERR: {captured_errors.strip()}"
+        return result, output_message
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes. The pool restarts on the next execution."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
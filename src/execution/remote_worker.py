@@ -0,0 +1,353 @@
+# remote_worker.py
+# Worker daemon for RemoteWorkerPool, started on a compute box with
+#
+#     PYFLOWGRAPH_WORKER_TOKEN=<secret> python src/cli.py worker --listen 0.0.0.0:7300 [--workers N] [--venv-dir DIR]
+#
+# Node calls run arbitrary code, so the daemon refuses to start without a
+# shared-secret token (``--token`` or PYFLOWGRAPH_WORKER_TOKEN), even on
+# loopback where any local user could connect, and clients must prove they
+# hold it before anything they send is unpickled.
+#
+# Clients connect over TCP and send node calls; each call runs on one of the
+# daemon's warm VenvWorkerPool processes, so node code gets the same
+# semantics as an isolated node in the editor (captured stdout and stderr,
+# async entry functions, crashes that only cost the worker). With
+# ``--venv-dir`` every distinct set of graph requirements gets its own venv
+# there, created and pip-installed on first use; without it all nodes run on
+# the daemon's own interpreter.
+#
+# Protocol: the venv_worker frames over the socket. The daemon announces
+# itself with HELLO, including a random challenge; the client answers with a
+# raw (unpickled) HELLO carrying its pickle protocol and the HMAC-SHA256 of
+# the challenge under the token; any other first frame, or one of another
+# length, drops the connection before its payload is read. The daemon accepts with an empty HELLO or
+# refuses with ERROR and hangs up. The client then sends CALLs without
+# waiting for earlier ones to finish. Every CALL carries a request id and is
+# answered by one RESULT or ERROR with that id, in completion order. Inputs
+# and results cross the daemon as pickles it never opens, so it needs none
+# of the packages the nodes use.
+
+import hashlib
+import hmac
+import os
+import pickle
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import traceback
+import venv
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from .venv_worker import CALL, ERROR, HEADER, HELLO, RESULT, read_frame, write_frame
+from .venv_worker_pool import DEFAULT_WORKERS, VenvWorkerPool, venv_python_executable
+
+# Port used when an address names only the host
+DEFAULT_PORT = 7300
+
+# Seconds pip may take to install one venv's requirements
+INSTALL_TIMEOUT = 900
+
+# Marker written into a requirements venv once pip has installed everything
+READY_MARKER = ".pyflowgraph-ready"
+
+# Environment variable holding the shared secret of daemons and their clients
+TOKEN_ENV_VAR = "PYFLOWGRAPH_WORKER_TOKEN"
+
+# Bytes of random challenge in the daemon's HELLO
+CHALLENGE_SIZE = 32
+
+# Client HELLO: pickle protocol, HMAC-SHA256 of the challenge
+CLIENT_HELLO = struct.Struct("!B32s")
+
+# Seconds a client may take to answer the challenge before it is dropped
+HANDSHAKE_TIMEOUT = 10.0
+
+Address = Tuple[str, int]
+
+
+def parse_address(text: str, default_host: str = "127.0.0.1") -> Address:
+    """Split ``host:port`` (``[::1]:port`` for IPv6, ``host`` or ``:port`` alone) into a tuple."""
+    host, colon, port = text.strip().rpartition(":")
+    if not colon or "]" in port:
+        host, port = text.strip(), ""
+    host = host.strip("[]") or default_host
+    try:
+        return host, int(port) if port else DEFAULT_PORT
+    except ValueError:
+        raise ValueError(f"expected HOST:PORT, got '{text}'") from None
+
+
+def format_address(address: Address) -> str:
+    host, port = address[:2]
+    return f"[{host}]:{port}" if ":" in host else f"{host}:{port}"
+
+
+def requirements_key(requirements) -> str:
+    """Directory name of the venv holding ``requirements``, the same for any order."""
+    return hashlib.sha256("\n".join(sorted(requirements)).encode("utf-8")).hexdigest()[:16]
+
+
+def worker_token(token: Optional[str] = None) -> Optional[bytes]:
+    """The shared secret: ``token`` if given, else $PYFLOWGRAPH_WORKER_TOKEN; None if neither is set."""
+    if token is None:
+        token = os.environ.get(TOKEN_ENV_VAR)
+    return token.encode("utf-8") if token else None
+
+
+def hello_digest(token: Optional[bytes], challenge: bytes) -> bytes:
+    """A client's answer to a daemon's challenge (keyed with an empty secret when the client has no token)."""
+    return hmac.new(token or b"", challenge, hashlib.sha256).digest()
+
+
+class _ClientConnection:
+    """One client socket; responses are written by whichever call finishes."""
+
+    def __init__(self, sock: socket.socket):
+        self.socket = sock
+        self.reader = sock.makefile("rb")
+        self.writer = sock.makefile("wb")
+        self.protocol = pickle.HIGHEST_PROTOCOL
+        self.closed = False
+        self._write_lock = threading.Lock()
+
+    def respond(self, kind: int, response: tuple):
+        payload = pickle.dumps(response, self.protocol)
+        with self._write_lock:
+            if self.closed:
+                return
+            try:
+                write_frame(self.writer, kind, payload)
+            except OSError:
+                # The client went away; its reader notices and closes
+                self.closed = True
+
+    def close(self):
+        with self._write_lock:
+            self.closed = True
+        try:
+            # Wakes the thread blocked reading this socket
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        for stream in (self.reader, self.writer):
+            try:
+                stream.close()
+            except OSError:
+                pass
+        try:
+            self.socket.close()
+        except OSError:
+            pass
+
+
+class RemoteWorkerServer:
+    """Serves node calls from RemoteWorkerPool clients.
+
+    Calls from every connection share the daemon's worker processes: up to
+    ``max_workers`` nodes run at once per venv, and further pipelined calls
+    wait for a free worker. A call's result is sent as soon as it is ready,
+    so a slow node never holds up the ones behind it.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, max_workers: Optional[int] = None,
+                 venv_dir: Optional[str] = None, python_executable: Optional[str] = None,
+                 token: Optional[str] = None):
+        """Initialize the daemon.
+
+        Args:
+            host: Interface to listen on ("0.0.0.0" for all)
+            port: TCP port (0 picks a free one, see ``address``)
+            max_workers: Worker processes per venv (None uses DEFAULT_WORKERS)
+            venv_dir: Directory for per-requirements venvs (None runs every node on ``python_executable``)
+            python_executable: Interpreter for nodes without a requirements venv (default: this one)
+            token: Shared secret clients must prove they hold (default: $PYFLOWGRAPH_WORKER_TOKEN)
+
+        Raises:
+            ValueError: If no token is configured
+        """
+        self._token = worker_token(token)
+        if self._token is None:
+            raise ValueError(f"refusing to listen on {host or 'all interfaces'} without a worker token "
+                             f"(pass --token or set {TOKEN_ENV_VAR})")
+        self.max_workers = max_workers or DEFAULT_WORKERS
+        self.venv_dir = venv_dir
+        self.python_executable = python_executable or sys.executable
+        self._listener = socket.create_server((host, port), family=socket.getaddrinfo(host, port)[0][0])
+        self.address: Address = self._listener.getsockname()[:2]
+        # Node sources by code key, shared by every connection
+        self._codes: Dict[str, str] = {}
+        # Worker pools by requirements key ("" for the daemon's own interpreter)
+        self._pools: Dict[str, VenvWorkerPool] = {}
+        self._pool_lock = threading.Lock()
+        self._venv_locks: Dict[str, threading.Lock] = {}
+        self._connections = set()
+        # Calls wait here for a worker; sized so every worker can stay busy
+        self._calls = ThreadPoolExecutor(max_workers=max(32, self.max_workers * 8),
+                                         thread_name_prefix="remote-call")
+        self._closed = threading.Event()
+        self._accept_thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Accept connections on a background thread."""
+        if self._accept_thread is None:
+            self._accept_thread = threading.Thread(target=self._accept, name="remote-accept", daemon=True)
+            self._accept_thread.start()
+
+    def serve_forever(self):
+        self.start()
+        self._closed.wait()
+
+    def close(self):
+        """Stop listening, drop every client and stop the worker processes."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        try:
+            self._listener.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            self._listener.close()
+        except OSError:
+            pass
+        for connection in list(self._connections):
+            connection.close()
+        self._calls.shutdown(wait=False)
+        with self._pool_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown()
+
+    def _accept(self):
+        while not self._closed.is_set():
+            try:
+                sock, _ = self._listener.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._serve, args=(_ClientConnection(sock),),
+                             name="remote-connection", daemon=True).start()
+
+    def _serve(self, connection: _ClientConnection):
+        self._connections.add(connection)
+        try:
+            if not self._handshake(connection):
+                return
+            while True:
+                frame = read_frame(connection.reader)
+                if frame is None:
+                    return
+                kind, payload = frame
+                if kind != CALL:
+                    # Not a client of this protocol
+                    return
+                try:
+                    request_id, key, code, function_name, inputs, requirements = pickle.loads(payload)
+                    requirements = tuple(requirements)
+                except (TypeError, ValueError):
+                    connection.respond(ERROR, (None, "protocol error: malformed CALL message", ""))
+                    continue
+                if code is not None:
+                    # Stored before later calls on this connection are read, so they may omit it
+                    self._codes[key] = code
+                self._calls.submit(self._run_call, connection, request_id, key, function_name,
+                                   inputs, requirements)
+        except (OSError, EOFError, pickle.UnpicklingError, ValueError, RuntimeError):
+            # Broken or closed connection, or the daemon is shutting down
+            return
+        finally:
+            self._connections.discard(connection)
+            connection.close()
+
+    def _handshake(self, connection: _ClientConnection) -> bool:
+        """Challenge the client; nothing it sends is unpickled unless it answers with the token.
+
+        A client that does not answer within HANDSHAKE_TIMEOUT is dropped, so
+        idle connections cannot hold the daemon's threads.
+        """
+        connection.socket.settimeout(HANDSHAKE_TIMEOUT)
+        challenge = os.urandom(CHALLENGE_SIZE)
+        hello = (os.getpid(), pickle.HIGHEST_PROTOCOL, socket.gethostname(), self.max_workers, challenge)
+        write_frame(connection.writer, HELLO, pickle.dumps(hello, 2))
+        # The header is checked before any payload is read, so an unauthenticated
+        # peer cannot make the daemon allocate or wait for a frame of its choosing
+        header = connection.reader.read(HEADER.size)
+        if len(header) != HEADER.size:
+            return False
+        length, kind = HEADER.unpack(header)
+        if kind != HELLO or length != CLIENT_HELLO.size:
+            # Not a client of this protocol
+            return False
+        payload = connection.reader.read(length)
+        if len(payload) != length:
+            return False
+        protocol, digest = CLIENT_HELLO.unpack(payload)
+        if not hmac.compare_digest(digest, hello_digest(self._token, challenge)):
+            refusal = (None, "authentication failed: wrong or missing worker token", "")
+            write_frame(connection.writer, ERROR, pickle.dumps(refusal, 2))
+            return False
+        connection.protocol = min(protocol, pickle.HIGHEST_PROTOCOL)
+        # Authenticated clients may stay idle between calls
+        connection.socket.settimeout(None)
+        write_frame(connection.writer, HELLO, b"")
+        return True
+
+    def _run_call(self, connection: _ClientConnection, request_id: int, key: str, function_name: str,
+                  inputs: bytes, requirements: Tuple[str, ...]):
+        if connection.closed:
+            return
+        try:
+            code = self._codes.get(key)
+            if code is None:
+                raise RuntimeError("node code was never sent to this worker")
+            pool = self._pool_for(requirements)
+            result, captured_output, captured_errors, cpu_time = pool.call_message(
+                key, code, function_name, (inputs, []), inline=True)
+            connection.respond(RESULT, (request_id, result[0], captured_output, captured_errors, cpu_time))
+        except Exception as e:
+            connection.respond(ERROR, (request_id, str(e) or type(e).__name__, traceback.format_exc()))
+
+    def _pool_for(self, requirements: Tuple[str, ...]) -> VenvWorkerPool:
+        key = requirements_key(requirements) if requirements and self.venv_dir else ""
+        with self._pool_lock:
+            pool = self._pools.get(key)
+            if pool is not None:
+                return pool
+            venv_lock = self._venv_locks.setdefault(key, threading.Lock())
+        # Creating a venv takes minutes; calls for other venvs carry on meanwhile
+        with venv_lock:
+            with self._pool_lock:
+                pool = self._pools.get(key)
+            if pool is not None:
+                return pool
+            python = self.python_executable if not key else self._ensure_venv(key, requirements)
+            pool = VenvWorkerPool(python, self.max_workers)
+            with self._pool_lock:
+                if self._closed.is_set():
+                    pool.shutdown()
+                    raise RuntimeError("worker daemon is shutting down")
+                self._pools[key] = pool
+            return pool
+
+    def _ensure_venv(self, key: str, requirements: Tuple[str, ...]) -> str:
+        """Create the venv for ``requirements`` unless an earlier run finished it."""
+        path = os.path.join(self.venv_dir, key)
+        python = venv_python_executable(path)
+        if os.path.exists(os.path.join(path, READY_MARKER)):
+            return python
+        print(f"[WORKER] Creating venv {path} for {', '.join(requirements)}", file=sys.stderr, flush=True)
+        try:
+            venv.EnvBuilder(with_pip=True, clear=True).create(path)
+            subprocess.run([python, "-m", "pip", "install", "--disable-pip-version-check", *requirements],
+                           check=True, capture_output=True, text=True, timeout=INSTALL_TIMEOUT)
+        except subprocess.CalledProcessError as e:
+            last_line = ((e.stderr or e.stdout or "").strip().splitlines() or [f"pip exited with code {e.returncode}"])[-1]
+            raise RuntimeError(f"could not install {', '.join(requirements)}: {last_line}") from e
+        except (OSError, subprocess.SubprocessError) as e:
+            raise RuntimeError(f"could not create a venv for {', '.join(requirements)}: {e}") from e
+        with open(os.path.join(path, READY_MARKER), "w", encoding="utf-8") as f:
+            f.write("\n".join(requirements) + "\n")
+        return python
@@ -0,0 +1,318 @@
+# remote_worker_pool.py
+# Runs nodes on worker daemons on other machines (remote_worker.py), so heavy
+# nodes use idle compute boxes while the editor stays on a laptop.
+#
+# Nodes opt in with ``@node_entry(remote=True)`` (or every node, with
+# ``GraphExecutor.set_remote_workers(..., all_nodes=True)``). The pool keeps
+# a few persistent TCP connections per daemon and pipelines calls over them:
+# a call is written as soon as it is made, without waiting for the ones ahead
+# of it, and results come back tagged with their request id in whatever
+# order they finish. Each distinct node source is sent once per connection.
+# Inputs and results are pickled, so like isolated nodes, remote nodes must
+# import everything they use. Daemons require the shared token (``token`` or
+# PYFLOWGRAPH_WORKER_TOKEN) they were started with.
+
+import itertools
+import pickle
+import socket
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .code_cache import code_hash
+from .node_profiler import NodeProfiler, object_size
+from .execution_trace import ExecutionTracer, node_span_args
+from .node_watchdog import WAIT_POLL_INTERVAL, wait_interruptibly
+from .remote_worker import CLIENT_HELLO, Address, format_address, hello_digest, parse_address, worker_token
+from .venv_worker import CALL, ERROR, HELLO, RESULT, read_frame, write_frame
+
+# Connections opened to each daemon at most
+DEFAULT_CONNECTIONS = 2
+
+# Calls written to one connection before it counts as busy
+DEFAULT_MAX_IN_FLIGHT = 8
+
+# Seconds to wait for a daemon to accept a connection and announce itself
+CONNECT_TIMEOUT = 10.0
+
+# Seconds before a daemon that refused a connection is tried again
+RETRY_DELAY = 5.0
+
+
+class RemoteWorkerError(RuntimeError):
+    """No daemon could be reached, or the connection broke during a call."""
+
+
+class _RemoteConnection:
+    """One socket to a daemon and the calls waiting for its answers."""
+
+    def __init__(self, address: Address, on_response, token: Optional[bytes] = None):
+        self.address = address
+        self.label = format_address(address)
+        self.socket = socket.create_connection(address, timeout=CONNECT_TIMEOUT)
+        try:
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._reader = self.socket.makefile("rb")
+            self._writer = self.socket.makefile("wb")
+            frame = read_frame(self._reader)
+            if frame is None or frame[0] != HELLO:
+                raise RemoteWorkerError(f"{self.label} is not a pyflowgraph worker")
+            self.pid, protocol, self.hostname, self.workers, challenge = pickle.loads(frame[1])
+            self.protocol = min(protocol, pickle.HIGHEST_PROTOCOL)
+            write_frame(self._writer, HELLO, CLIENT_HELLO.pack(self.protocol, hello_digest(token, challenge)))
+            frame = read_frame(self._reader)
+            if frame is not None and frame[0] == ERROR:
+                raise RemoteWorkerError(f"{self.label} refused the connection: {pickle.loads(frame[1])[1]}")
+            if frame is None or frame[0] != HELLO:
+                raise RemoteWorkerError(f"{self.label} closed the connection during the handshake")
+        except BaseException:
+            self.socket.close()
+            raise
+        self.socket.settimeout(None)
+        self.known_codes = set()
+        self.closed = False
+        self._pending: Dict[int, Future] = {}
+        # Calls handed this connection by the pool but not written yet
+        self._reserved = 0
+        self._request_ids = itertools.count()
+        self._lock = threading.Lock()
+        self._on_response = on_response
+        threading.Thread(target=self._read_responses, name=f"remote-{self.label}", daemon=True).start()
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending) + self._reserved
+
+    def reserve(self):
+        """Count a call that is about to be submitted, so the pool does not pick this connection as idle."""
+        with self._lock:
+            self._reserved += 1
+
+    def submit(self, key: str, code: str, function_name: str, inputs: Dict[str, Any],
+               requirements: Tuple[str, ...]) -> Future:
+        """Write one reserved call; the future resolves to (result, stdout, stderr, CPU time)."""
+        future = Future()
+        # Running from the start: a caller giving up cannot cancel a call already sent
+        future.set_running_or_notify_cancel()
+        with self._lock:
+            self._reserved -= 1
+            if self.closed:
+                raise RemoteWorkerError(f"connection to {self.label} is closed")
+            request_id = next(self._request_ids)
+            payload = pickle.dumps((request_id, key, None if key in self.known_codes else code, function_name,
+                                    pickle.dumps(inputs, self.protocol), requirements), self.protocol)
+            self._pending[request_id] = future
+            try:
+                write_frame(self._writer, CALL, payload)
+            except OSError as e:
+                del self._pending[request_id]
+                self._close_locked()
+                raise RemoteWorkerError(f"connection to {self.label} lost: {e}") from e
+            # Frames arrive in order, so later calls on this connection may omit the code
+            self.known_codes.add(key)
+        return future
+
+    def _read_responses(self):
+        reason = "closed by the worker"
+        try:
+            while True:
+                frame = read_frame(self._reader)
+                if frame is None:
+                    break
+                kind, payload = frame
+                request_id, *response = pickle.loads(payload)
+                with self._lock:
+                    future = self._pending.pop(request_id, None)
+                if future is not None:
+                    if kind == RESULT:
+                        future.set_result(response)
+                    else:
+                        future.set_exception(RuntimeError(response[0]))
+                self._on_response()
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError) as e:
+            reason = str(e) or type(e).__name__
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            self._close_locked()
+        for future in pending:
+            future.set_exception(RemoteWorkerError(f"connection to {self.label} lost: {reason}"))
+        self._on_response()
+
+    def _close_locked(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            self.socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.socket.close()
+
+    def close(self):
+        with self._lock:
+            self._close_locked()
+
+
+class RemoteWorkerPool:
+    """Executes nodes on remote worker daemons.
+
+    Has the same ``execute_node`` contract as SingleProcessExecutor. Each
+    call goes to the least busy open connection; a new one is opened (up to
+    ``connections_per_worker`` per daemon, least connected daemon first)
+    whenever every open one already has a call in flight. Calls made from
+    several threads at once (parallel mode) are pipelined. A daemon that
+    cannot be reached is skipped for ``RETRY_DELAY`` seconds.
+    """
+
+    def __init__(self, addresses: Iterable[Union[str, Address]], requirements: Sequence[str] = (),
+                 connections_per_worker: int = DEFAULT_CONNECTIONS, max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 profiler: Optional[NodeProfiler] = None, tracer: Optional[ExecutionTracer] = None,
+                 token: Optional[str] = None):
+        """Initialize the pool; connections open on first use (or ``start``).
+
+        Args:
+            addresses: Daemons as ``"host:port"`` strings or ``(host, port)`` tuples
+            requirements: The graph's pip requirements, installed into a venv on each daemon
+            connections_per_worker: Most connections opened to one daemon
+            max_in_flight: Most unanswered calls on one connection
+            profiler: Per-node profile store, shared with other executors (created if None)
+            tracer: Execution timeline, shared with other executors (created disabled if None)
+            token: Shared secret the daemons were started with (default: $PYFLOWGRAPH_WORKER_TOKEN)
+        """
+        self.addresses: List[Address] = [parse_address(address) if isinstance(address, str) else tuple(address)
+                                         for address in addresses]
+        if not self.addresses:
+            raise ValueError("no remote worker addresses given")
+        self.requirements = tuple(requirements)
+        self.connections_per_worker = max(1, connections_per_worker)
+        self.max_in_flight = max(1, max_in_flight)
+        self._token = worker_token(token)
+        self._connections: List[_RemoteConnection] = []
+        self._retry_at: Dict[Address, float] = {}
+        self._condition = threading.Condition()
+
+        self.execution_times: Dict[str, float] = {}
+        self.profiler = profiler if profiler is not None else NodeProfiler()
+        self.tracer = tracer if tracer is not None else ExecutionTracer()
+        # Connections that broke and were dropped
+        self.reconnects = 0
+
+    @property
+    def connections(self) -> List[_RemoteConnection]:
+        with self._condition:
+            return [connection for connection in self._connections if not connection.closed]
+
+    def start(self):
+        """Open one connection to every daemon, raising RemoteWorkerError if none answers."""
+        with self._condition:
+            connected = {connection.address for connection in self._connections if not connection.closed}
+            results = [self._connect(address) for address in self.addresses if address not in connected]
+        errors = [result for result in results if isinstance(result, str)]
+        if not connected and len(errors) == len(results):
+            raise RemoteWorkerError(f"no remote worker reachable: {'; '.join(errors)}")
+
+    def execute_node(self, node, inputs: Dict[str, Any]) -> Tuple[Any, str]:
+        """Execute a single node on a remote worker.
+
+        Args:
+            node: The node to execute
+            inputs: Dictionary of picklable input values for the node
+
+        Returns:
+            Tuple of (result, captured_output)
+        """
+        if not node.function_name:
+            return None, f"SKIP: Node '{node.title}' has no valid function defined."
+
+        start_time = time.perf_counter()
+        label = "remote worker"
+        try:
+            with self.tracer.span(node.title, "node") as span:
+                connection = self._acquire()
+                label = f"remote worker {connection.label}"
+                future = connection.submit(code_hash(node.code), node.code, node.function_name, inputs,
+                                           self.requirements)
+                if span is not None:
+                    span.args.update(node_span_args(node, inputs), worker=label)
+                result, captured_output, captured_errors, cpu_time = wait_interruptibly(future)
+                result = pickle.loads(result)
+                if span is not None:
+                    span.args.update(output_size=object_size(result), cpu_time=cpu_time)
+        except Exception as e:
+            wall_time = time.perf_counter() - start_time
+            self.execution_times[node.title] = wall_time
+            self.profiler.record(node, wall_time, failed=True)
+            raise RuntimeError(f"ERROR in node '{node.title}' ({label}): {e}") from e
+
+        wall_time = time.perf_counter() - start_time
+        self.execution_times[node.title] = wall_time
+        self.profiler.record(node, wall_time, cpu_time, output_size=object_size(result))
+
+        output_message = ""
+        if captured_output:
+            output_message += captured_output.strip()
+        if captured_errors:
+            output_message += f"\nSTDERR: {captured_errors.strip()}"
+        return result, output_message
+
+    def _acquire(self) -> _RemoteConnection:
+        """The connection for the next call, opening or waiting for one as needed."""
+        with self._condition:
+            while True:
+                open_connections = [connection for connection in self._connections if not connection.closed]
+                self.reconnects += len(self._connections) - len(open_connections)
+                self._connections = open_connections
+                available = [connection for connection in open_connections
+                             if connection.in_flight < self.max_in_flight]
+                best = min(available, key=lambda connection: connection.in_flight, default=None)
+                if best is not None and best.in_flight == 0:
+                    best.reserve()
+                    return best
+                errors = []
+                for address in self._addresses_with_room():
+                    connection = self._connect(address)
+                    if not isinstance(connection, str):
+                        connection.reserve()
+                        return connection
+                    errors.append(connection)
+                if best is not None:
+                    best.reserve()
+                    return best
+                if not open_connections:
+                    raise RemoteWorkerError("no remote worker reachable"
+                                            + (f": {'; '.join(errors)}" if errors else ""))
+                # Every connection has max_in_flight calls waiting: wait for an answer
+                self._condition.wait(WAIT_POLL_INTERVAL)
+
+    def _addresses_with_room(self) -> List[Address]:
+        counts = {address: 0 for address in self.addresses}
+        for connection in self._connections:
+            counts[connection.address] = counts.get(connection.address, 0) + 1
+        now = time.monotonic()
+        return sorted((address for address, count in counts.items()
+                       if count < self.connections_per_worker and self._retry_at.get(address, 0) <= now),
+                      key=counts.get)
+
+    def _connect(self, address: Address) -> Union[_RemoteConnection, str]:
+        """Open a connection, or describe why it failed. Called with the condition held."""
+        try:
+            connection = _RemoteConnection(address, self._notify, self._token)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError, RemoteWorkerError) as e:
+            self._retry_at[address] = time.monotonic() + RETRY_DELAY
+            return f"{format_address(address)} ({e})"
+        self._retry_at.pop(address, None)
+        self._connections.append(connection)
+        return connection
+
+    def _notify(self):
+        with self._condition:
+            self._condition.notify_all()
+
+    def shutdown(self):
+        """Close every connection; calls still waiting fail. The pool reconnects on next use."""
+        with self._condition:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            connection.close()
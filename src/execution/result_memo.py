@@ -0,0 +1,134 @@
+# result_memo.py
+# Memoizes node results between runs for incremental re-execution.
+# A node is skipped when its code, GUI values and upstream outputs are all
+# unchanged since it last ran; anything downstream of a change re-runs.
+
+import hashlib
+import pickle
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from .code_cache import code_hash
+
+
+def value_fingerprint(value: Any) -> Optional[str]:
+    """Return a content fingerprint for a value that is not produced by a node.
+
+    Values that cannot be pickled have no fingerprint (None). Their identity
+    is no substitute: an id can be reused by a new object once the old one
+    is freed, which would hand the consuming node a stale result.
+    """
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        return None
+    return hashlib.sha1(data).hexdigest()
+
+
+class MemoEntry:
+    """A node's memoized result and the output it printed when it produced it.
+
+    The result is handed out by reference, like every pin value, so nodes
+    downstream of a memoized node must not mutate their inputs in place.
+    """
+
+    __slots__ = ("result", "output_message")
+
+    def __init__(self, result: Any, output_message: str):
+        self.result = result
+        self.output_message = output_message
+
+
+class ResultMemo:
+    """Stores node results keyed by a fingerprint of everything that produced them.
+
+    The fingerprint of a node combines the hash of its code, the content of
+    the inputs it read from its GUI and the fingerprints of the upstream
+    outputs wired into it. Every output slot written during a run is tagged
+    with a token derived from its producer's fingerprint, so a change
+    anywhere upstream changes every downstream fingerprint too.
+
+    Entries not used by the latest run are dropped at the end of it, keeping
+    at most one result per node occurrence in the graph.
+    """
+
+    def __init__(self):
+        self._entries: Dict[Tuple[Any, str], MemoEntry] = {}
+        self._used: Set[Tuple[Any, str]] = set()
+        self._slot_tokens: List[Optional[str]] = []
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def begin_run(self, plan):
+        """Reset per-run state for a run of ``plan``."""
+        self._slot_tokens = [None] * plan.slot_count
+        self._used = set()
+        self.hits = 0
+        self.misses = 0
+
+    def end_run(self):
+        """Forget results that the run just finished did not touch."""
+        for key in [key for key in self._entries if key not in self._used]:
+            del self._entries[key]
+
+    def fingerprint(self, step, inputs: Dict[str, Any], slot_values: List[Any]) -> Optional[str]:
+        """Fingerprint a step from its node's code and the inputs it is about to receive.
+
+        Returns None when an input cannot be fingerprinted; the step then
+        always runs and its result is not memoized.
+        """
+        node = step.node
+        parts = [code_hash(node.code or ""), node.function_name or ""]
+        slots = dict(step.inputs)
+        for name in sorted(inputs):
+            slot = slots.get(name)
+            value = inputs[name]
+            # Wired inputs are identified by their producer; GUI values by content
+            if slot is not None and value is slot_values[slot] and self._slot_tokens[slot] is not None:
+                parts.append(f"{name}=@{self._slot_tokens[slot]}")
+            else:
+                value_hash = value_fingerprint(value)
+                if value_hash is None:
+                    return None
+                parts.append(f"{name}={value_hash}")
+        return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def lookup(self, step, fingerprint: Optional[str]) -> Optional[MemoEntry]:
+        """Return the memoized entry for a step, or None if it has to run."""
+        if fingerprint is None:
+            self.misses += 1
+            return None
+        key = (self._node_key(step.node), fingerprint)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used.add(key)
+        return entry
+
+    def store(self, step, fingerprint: str, result: Any, output_message: str):
+        """Remember a step's result for later runs."""
+        key = (self._node_key(step.node), fingerprint)
+        self._entries[key] = MemoEntry(result, output_message)
+        self._used.add(key)
+
+    def tag_outputs(self, step, fingerprint: str):
+        """Tag the slots a step just wrote with tokens derived from its fingerprint."""
+        for name, slot in step.outputs:
+            self._slot_tokens[slot] = f"{fingerprint}:{name}"
+
+    def invalidate(self, node=None):
+        """Drop the memoized results of ``node``, or of every node if None."""
+        if node is None:
+            self._entries.clear()
+            return
+        node_key = self._node_key(node)
+        for key in [key for key in self._entries if key[0] == node_key]:
+            del self._entries[key]
+
+    @staticmethod
+    def _node_key(node):
+        return getattr(node, "uuid", None) or id(node)
@@ -0,0 +1,184 @@
+# result_store.py
+# Content-addressed, on-disk store for node results so expensive nodes do not
+# re-run after the editor restarts. Values are written as pickle protocol 5,
+# or as memory-mapped .npy files for plain NumPy arrays, and the least
+# recently used files are evicted once the store exceeds its byte budget.
+
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+PICKLE_SUFFIX = ".pkl"
+NUMPY_SUFFIX = ".npy"
+
+# Default byte budget for the store (1 GiB)
+DEFAULT_MAX_BYTES = 1024 ** 3
+
+
+def _is_plain_ndarray(value: Any) -> bool:
+    """True for NumPy arrays that .npy can hold without pickling objects."""
+    if type(value).__module__ != "numpy" or type(value).__name__ != "ndarray":
+        return False
+    return not value.dtype.hasobject
+
+
+class ResultStore:
+    """Persistent node results keyed by fingerprint (code hash plus inputs).
+
+    Files live under ``<root>/<first two hex digits>/<fingerprint><suffix>``.
+    Recency is tracked in memory and seeded from file modification times, so
+    eviction order survives restarts.
+    """
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # fingerprint -> (path, size), least recently used first
+        self._index: "OrderedDict[str, Tuple[str, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(self.root, exist_ok=True)
+        self._load_index()
+
+    def __len__(self):
+        return len(self._index)
+
+    def __contains__(self, fingerprint: str):
+        return fingerprint in self._index
+
+    def _load_index(self):
+        entries = []
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                fingerprint, suffix = os.path.splitext(name)
+                if suffix not in (PICKLE_SUFFIX, NUMPY_SUFFIX):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, fingerprint, path, stat.st_size))
+
+        for _, fingerprint, path, size in sorted(entries):
+            self._index[fingerprint] = (path, size)
+            self.total_bytes += size
+
+    def get(self, fingerprint: str) -> Tuple[bool, Any]:
+        """Load a stored result.
+
+        Returns:
+            Tuple of (found, value); NumPy arrays come back read-only memory-mapped
+        """
+        with self._lock:
+            entry = self._index.get(fingerprint)
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self._index.move_to_end(fingerprint)
+
+        path, _ = entry
+        try:
+            if path.endswith(NUMPY_SUFFIX):
+                import numpy
+                value = numpy.load(path, mmap_mode="r", allow_pickle=False)
+            else:
+                with open(path, "rb") as file:
+                    value = pickle.load(file)
+            os.utime(path)
+        except Exception:
+            # Corrupt or deleted behind our back: treat as a miss
+            self._discard(fingerprint)
+            with self._lock:
+                self.misses += 1
+            return False, None
+
+        with self._lock:
+            self.hits += 1
+        return True, value
+
+    def put(self, fingerprint: str, value: Any) -> Optional[int]:
+        """Store a result, evicting least recently used files beyond the budget.
+
+        Returns:
+            Bytes written, or None if the value cannot be stored
+        """
+        suffix = NUMPY_SUFFIX if _is_plain_ndarray(value) else PICKLE_SUFFIX
+        directory = os.path.join(self.root, fingerprint[:2])
+        path = os.path.join(directory, fingerprint + suffix)
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(temp_path, "wb") as file:
+                if suffix == NUMPY_SUFFIX:
+                    import numpy
+                    numpy.save(file, value, allow_pickle=False)
+                else:
+                    pickle.dump(value, file, protocol=5)
+            size = os.path.getsize(temp_path)
+            if size > self.max_bytes:
+                os.remove(temp_path)
+                return None
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return None
+
+        with self._lock:
+            previous = self._index.pop(fingerprint, None)
+            if previous is not None:
+                self.total_bytes -= previous[1]
+                if previous[0] != path and os.path.exists(previous[0]):
+                    os.remove(previous[0])
+            self._index[fingerprint] = (path, size)
+            self.total_bytes += size
+            self._evict()
+        return size
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and self._index:
+            _, (path, size) = self._index.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _discard(self, fingerprint: str):
+        with self._lock:
+            entry = self._index.pop(fingerprint, None)
+            if entry is None:
+                return
+            self.total_bytes -= entry[1]
+        try:
+            os.remove(entry[0])
+        except OSError:
+            pass
+
+    def set_max_bytes(self, max_bytes: int):
+        """Change the byte budget, evicting immediately if the store is over it."""
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def clear(self):
+        """Delete every stored result."""
+        for fingerprint in list(self._index):
+            self._discard(fingerprint)
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._index),
+            'total_bytes': self.total_bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+        }
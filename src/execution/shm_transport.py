@@ -0,0 +1,223 @@
+# shm_transport.py
+# Moves large buffers (NumPy arrays, Arrow buffers, pandas blocks) between
+# processes through shared memory instead of through a pipe. Values are
+# pickled with protocol 5; out-of-band buffers of at least SHARED_THRESHOLD
+# bytes are placed in multiprocessing.shared_memory segments, and the
+# receiver maps them instead of copying. A value that arrived this way and is
+# sent on to another process travels as the segment name alone.
+#
+# A segment lives as long as the values mapped over it: when the last one is
+# garbage collected (e.g. PinLiveness clears its slot) the segment is closed,
+# and unlinked by the process that owns it. Standard library only: venv
+# workers import it too.
+
+import atexit
+import ctypes
+import os
+import pickle
+import sys
+import threading
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+# Out-of-band buffers at least this large go to shared memory; smaller ones
+# are cheaper to copy with the pickle
+SHARED_THRESHOLD = 64 * 1024
+
+# Room for a Py_buffer struct on every platform
+_PY_BUFFER_SIZE = 256
+
+_get_buffer = ctypes.pythonapi.PyObject_GetBuffer
+_get_buffer.argtypes = [ctypes.py_object, ctypes.c_void_p, ctypes.c_int]
+_get_buffer.restype = ctypes.c_int
+_release_buffer = ctypes.pythonapi.PyBuffer_Release
+_release_buffer.argtypes = [ctypes.c_void_p]
+_release_buffer.restype = None
+
+# (segment name, offset, length, receiver takes ownership)
+Descriptor = Tuple[str, int, int, bool]
+
+
+def _address(view) -> int:
+    """Start address of a buffer, read-only ones included."""
+    buffer = ctypes.create_string_buffer(_PY_BUFFER_SIZE)
+    _get_buffer(view, ctypes.addressof(buffer), 0)
+    try:
+        return ctypes.c_void_p.from_buffer(buffer).value or 0
+    finally:
+        _release_buffer(ctypes.addressof(buffer))
+
+
+class _Segment:
+    """A segment mapped in this process, with its live views and pins."""
+
+    def __init__(self, shm: shared_memory.SharedMemory, owned: bool):
+        self.shm = shm
+        self.name = shm.name
+        self.owned = owned
+        self.refs = 0
+        self.address = _address(shm.buf)
+        self.size = shm.size
+
+
+_segments: Dict[str, _Segment] = {}
+_lock = threading.RLock()
+_tracking = True
+
+
+def disable_tracking():
+    """Keep this process's resource tracker away from segments.
+
+    For processes with a tracker of their own (venv workers): the segments
+    they create are handed over to the pool's process, and the ones they map
+    belong to it, so their tracker must not unlink either at exit.
+    """
+    global _tracking
+    _tracking = False
+
+
+def _open(name: Optional[str] = None, size: int = 0) -> shared_memory.SharedMemory:
+    create = name is None
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name, create, size, track=_tracking)
+    shm = shared_memory.SharedMemory(name, create, size)
+    if not _tracking and os.name != "nt":
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _unlink(shm: shared_memory.SharedMemory):
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _find(view) -> Optional[Tuple[_Segment, int]]:
+    """The mapped segment holding ``view`` and its offset there, if any."""
+    if not _segments:
+        return None
+    start = _address(view)
+    end = start + view.nbytes
+    for segment in _segments.values():
+        if segment.address <= start and end <= segment.address + segment.size:
+            return segment, start - segment.address
+    return None
+
+
+def _attach(name: str, owned: bool) -> _Segment:
+    segment = _segments.get(name)
+    if segment is None:
+        segment = _segments[name] = _Segment(_open(name), owned)
+    elif owned:
+        segment.owned = True
+    return segment
+
+
+def _unref(name: str):
+    with _lock:
+        segment = _segments.get(name)
+        if segment is None:
+            return
+        segment.refs -= 1
+        if segment.refs > 0:
+            return
+        del _segments[name]
+    segment.shm.close()
+    if segment.owned:
+        _unlink(segment.shm)
+
+
+def dumps(obj: Any, hand_over: bool = False) -> Tuple[Tuple[bytes, List[Descriptor]], List[str]]:
+    """Pickle ``obj`` with its large buffers in shared memory.
+
+    Args:
+        obj: The value to send
+        hand_over: The receiver takes ownership of new segments (results sent
+            back to the pool); otherwise this process owns them
+
+    Returns:
+        Tuple of (message, pins): the picklable message for ``loads``, and the
+        segments held for the receiver, to pass to ``release`` once it is done
+    """
+    descriptors: List[Descriptor] = []
+    pins: List[str] = []
+    handed_over: List[str] = []
+
+    def place(buffer: pickle.PickleBuffer) -> bool:
+        try:
+            view = buffer.raw()
+        except BufferError:
+            # Not contiguous: copy it with the pickle
+            return True
+        length = view.nbytes
+        if length < SHARED_THRESHOLD:
+            return True
+        with _lock:
+            found = _find(view)
+            if found is None:
+                if hand_over and os.name == "nt":
+                    # Windows frees a segment with its last handle, so it cannot outlive this call
+                    return True
+                shm = _open(size=length)
+                shm.buf[:length] = view
+                if hand_over:
+                    handed_over.append(shm.name)
+                    descriptors.append((shm.name, 0, length, True))
+                    shm.close()
+                    return False
+                segment = _segments[shm.name] = _Segment(shm, owned=True)
+                found = segment, 0
+            segment, offset = found
+            segment.refs += 1
+            pins.append(segment.name)
+        descriptors.append((segment.name, offset, length, False))
+        return False
+
+    try:
+        payload = pickle.dumps(obj, 5, buffer_callback=place)
+    except BaseException:
+        release(pins)
+        for name in handed_over:
+            shm = _open(name)
+            shm.close()
+            _unlink(shm)
+        raise
+    return (payload, descriptors), pins
+
+
+def loads(message: Tuple[bytes, List[Descriptor]]) -> Any:
+    """Rebuild a value from ``dumps``, mapping its shared buffers in place."""
+    payload, descriptors = message
+    buffers = []
+    with _lock:
+        for name, offset, length, owned in descriptors:
+            segment = _attach(name, owned)
+            view = segment.shm.buf[offset:offset + length]
+            segment.refs += 1
+            weakref.finalize(view, _unref, name).atexit = False
+            # The PickleBuffer keeps ``view`` alive for as long as anything built on it
+            buffers.append(pickle.PickleBuffer(view))
+    return pickle.loads(payload, buffers=buffers)
+
+
+def release(pins: List[str]):
+    """Drop the pins ``dumps`` returned; segments nothing else maps are freed."""
+    for name in pins:
+        _unref(name)
+
+
+def live_segments() -> Dict[str, int]:
+    """Sizes of the segments mapped in this process, by name."""
+    with _lock:
+        return {name: segment.size for name, segment in _segments.items()}
+
+
+@atexit.register
+def _unlink_owned():
+    with _lock:
+        owned = [segment.shm for segment in _segments.values() if segment.owned]
+    for shm in owned:
+        _unlink(shm)
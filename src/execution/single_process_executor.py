@@ -6,29 +6,78 @@ import os
 import sys
 import io
 import gc
+import ast
 import time
+import importlib
+import inspect
+import threading
 import weakref
-from contextlib import redirect_stdout, redirect_stderr
-from typing import Dict, Any, Optional, Callable, List, Tuple
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Dict, Any, Optional, Callable, List, Set, Tuple
 
 # Add project root to path for cross-package imports
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from core.node import Node
-from core.reroute_node import RerouteNode
+from .code_cache import CodeCache, CompiledNode
+from .output_capture import capture_output
+from .node_stream import NodeStream, DEFAULT_BUFFER_SIZE
+from .process_pool_executor import node_entry, find_site_packages
+from .node_profiler import NodeProfiler, object_size
+from .execution_trace import ExecutionTracer, node_span_args
+
+if TYPE_CHECKING:
+    # Only for annotations: importing Node at runtime would load Qt in headless runs
+    from core.node import Node
+    from .async_runner import AsyncNodeRunner
+
+# Optional libraries nodes may use without importing them, by the global name
+# they are used under. Importing torch or tensorflow takes seconds and
+# gigabytes, so each is only imported once a node's code refers to it.
+OPTIONAL_MODULES = {
+    'numpy': 'numpy', 'np': 'numpy',
+    'pandas': 'pandas', 'pd': 'pandas',
+    'torch': 'torch',
+    'tensorflow': 'tensorflow', 'tf': 'tensorflow',
+}
+
+
+def optional_module_references(code: str) -> Set[str]:
+    """Names from OPTIONAL_MODULES that ``code`` reads but never binds itself."""
+    loaded, bound = set(), set()
+    for node in ast.walk(ast.parse(code)):
+        if isinstance(node, ast.Name):
+            (loaded if isinstance(node.ctx, ast.Load) else bound).add(node.id)
+        elif isinstance(node, ast.alias):
+            bound.add(node.asname or node.name.split('.')[0])
+        elif isinstance(node, ast.arg):
+            bound.add(node.arg)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            bound.add(node.name)
+    return (loaded - bound) & OPTIONAL_MODULES.keys()
+
+
+def format_import_times(import_times: Dict[str, float]) -> str:
+    """One-line import-time report, e.g. ``numpy 0.21s, torch 2.84s``."""
+    return ", ".join(f"{module_name} {seconds:.2f}s" for module_name, seconds in import_times.items())
 
 
 class SingleProcessExecutor:
     """Executes nodes directly in a single persistent Python interpreter."""
     
-    def __init__(self, log_widget=None, venv_path=None):
+    def __init__(self, log_widget=None, venv_path=None, code_cache_size=256,
+                 stream_buffer_size=DEFAULT_BUFFER_SIZE, profiler: Optional[NodeProfiler] = None,
+                 tracer: Optional[ExecutionTracer] = None):
         """Initialize the single process executor.
         
         Args:
             log_widget: Optional logging widget for output messages
             venv_path: Path to virtual environment for package loading
+            code_cache_size: Maximum number of distinct node sources kept compiled
+            stream_buffer_size: Items a streaming node may produce ahead of its consumer
+            profiler: Per-node profile store, shared with other executors (created if None)
+            tracer: Execution timeline, shared with other executors (created disabled if None)
         """
         self.log = log_widget if log_widget is not None else []
         self.venv_path = venv_path
@@ -40,8 +89,26 @@ class SingleProcessExecutor:
         # Direct object storage for pin values (no serialization)
         self.object_store: Dict[Any, Any] = {}
         
-        # Performance tracking
+        # Compiled code objects and entry functions keyed by code hash
+        self.code_cache = CodeCache(code_cache_size)
+        # Bumped whenever node definitions are merged into the persistent namespace
+        self._namespace_version = 0
+        # Serializes cache lookups and module-level code when nodes run on worker threads
+        self._compile_lock = threading.RLock()
+        
+        # Bounded buffer size for streaming outputs
+        self.stream_buffer_size = stream_buffer_size
+        
+        # Event loop for async def node functions, created on first use (see async_runner)
+        self._async_runner: Optional['AsyncNodeRunner'] = None
+        
+        # Seconds spent importing each optional library on first use
+        self.import_times: Dict[str, float] = {}
+        
+        # Performance tracking: last time per title, and per-UUID profiles across runs
         self.execution_times: Dict[str, float] = {}
+        self.profiler = profiler if profiler is not None else NodeProfiler()
+        self.tracer = tracer if tracer is not None else ExecutionTracer()
         
         # Reference counting for memory management
         self.object_refs: Dict[Any, int] = weakref.WeakValueDictionary()
@@ -53,9 +120,13 @@ class SingleProcessExecutor:
         self._initialize_namespace()
     
     def _initialize_namespace(self):
-        """Initialize persistent namespace with common imports and utilities."""
+        """Initialize persistent namespace with common imports and utilities.
+
+        Heavy optional libraries are not imported here; ``_import_referenced_modules``
+        imports each one the first time a node's code uses it.
+        """
         # Add the node_entry decorator that nodes expect
-        self.namespace['node_entry'] = lambda func: func
+        self.namespace['node_entry'] = node_entry
         
         # Add common imports that nodes might use
         essential_modules = {
@@ -68,16 +139,39 @@ class SingleProcessExecutor:
         }
         
         self.namespace.update(essential_modules)
-        
-        # Try to import common data science libraries (optional)
-        optional_modules = ['numpy', 'pandas', 'torch', 'tensorflow']
-        for module_name in optional_modules:
+    
+    def _import_referenced_modules(self, code: str):
+        """Import the optional libraries ``code`` uses without importing them itself."""
+        for name in sorted(optional_module_references(code)):
+            if name in self.namespace:
+                continue
+            module_name = OPTIONAL_MODULES[name]
+            start_time = time.perf_counter()
             try:
-                module = __import__(module_name)
-                self.namespace[module_name] = module
+                module = importlib.import_module(module_name)
             except ImportError:
-                # Module not available, skip
-                pass
+                # Module not available; the node fails with a NameError as before
+                continue
+            if module_name not in self.import_times:
+                self.import_times[module_name] = time.perf_counter() - start_time
+            self.namespace[name] = module
+    
+    @property
+    def async_runner(self) -> 'AsyncNodeRunner':
+        """Event loop for async def node functions.
+
+        asyncio is only imported once a graph awaits a node, which keeps it
+        off the startup path of graphs without async nodes.
+        """
+        with self._compile_lock:
+            if self._async_runner is None:
+                from .async_runner import AsyncNodeRunner
+                self._async_runner = AsyncNodeRunner()
+            return self._async_runner
+    
+    def get_import_report(self) -> Dict[str, float]:
+        """Seconds spent importing each optional library, in the order nodes first needed them."""
+        return dict(self.import_times)
     
     def _setup_venv_packages(self):
         """Set up virtual environment packages by adding site-packages to sys.path."""
@@ -87,29 +181,16 @@ class SingleProcessExecutor:
         # Store original sys.path for cleanup
         self.original_sys_path = sys.path.copy()
         
-        # Find site-packages directory in the virtual environment
-        if os.name == 'nt':  # Windows
-            site_packages_path = os.path.join(self.venv_path, "Lib", "site-packages")
-        else:  # Unix/Linux/macOS
-            # Find the Python version directory
-            lib_dir = os.path.join(self.venv_path, "lib")
-            if os.path.exists(lib_dir):
-                python_dirs = [d for d in os.listdir(lib_dir) if d.startswith('python')]
-                if python_dirs:
-                    site_packages_path = os.path.join(lib_dir, python_dirs[0], "site-packages")
-                else:
-                    return
-            else:
-                return
-        
         # Add site-packages to sys.path if it exists
-        if os.path.exists(site_packages_path):
+        site_packages_path = find_site_packages(self.venv_path)
+        # Executors rebuilt for the same venv must not stack duplicate entries
+        if site_packages_path and site_packages_path not in sys.path:
             # Insert at the beginning to give priority to venv packages
             sys.path.insert(0, site_packages_path)
             if self.log and hasattr(self.log, 'append'):
                 self.log.append(f"Added venv packages from: {site_packages_path}")
     
-    def execute_node(self, node: Node, inputs: Dict[str, Any]) -> Tuple[Any, str]:
+    def execute_node(self, node: 'Node', inputs: Dict[str, Any]) -> Tuple[Any, str]:
         """Execute a single node directly in the current interpreter.
         
         Args:
@@ -121,6 +202,8 @@ class SingleProcessExecutor:
         """
         if not node.function_name:
             return None, f"SKIP: Node '{node.title}' has no valid function defined."
+        if getattr(node, "is_fused", False) is True:
+            return self._execute_fused(node, inputs)
         
         start_time = time.perf_counter()
         
@@ -129,69 +212,185 @@ class SingleProcessExecutor:
         stderr_capture = io.StringIO()
         
         try:
-            # Execute the node's code directly in the persistent namespace
-            # This ensures all definitions (functions, variables, imports) persist
-            temp_namespace = {**self.namespace, **inputs}
-            
-            with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                # Execute code directly in persistent namespace to ensure persistence
-                exec(node.code, temp_namespace)
-                
-                # Update persistent namespace with all new definitions
-                self.namespace.update(temp_namespace)
-                
-                # Call the node's function with inputs
-                if node.function_name in temp_namespace:
-                    function = temp_namespace[node.function_name]
-                    result = function(**inputs)
-                else:
-                    raise RuntimeError(f"Function '{node.function_name}' not found after code execution")
+            with capture_output(stdout_capture, stderr_capture):
+                function = self._get_node_function(node)
+                is_coroutine = inspect.iscoroutinefunction(function)
+                # A coroutine burns CPU on the loop thread, not on this one
+                with self.tracer.span(node.title, "node") as span, \
+                        self.profiler.measure(node, cpu=not is_coroutine) as sample:
+                    if span is not None:
+                        span.args.update(node_span_args(node, inputs))
+                    if is_coroutine:
+                        # Await on the node event loop; the coroutine captures its own output
+                        result = self.async_runner.run(
+                            self._await_function(function, inputs, stdout_capture, stderr_capture))
+                    else:
+                        result = function(**inputs)
+                    sample.set_result(result)
+                    if span is not None:
+                        span.args["output_size"] = object_size(result)
             
             # Record performance
             execution_time = time.perf_counter() - start_time
             self.execution_times[node.title] = execution_time
             
-            # Get captured output
-            captured_output = stdout_capture.getvalue()
-            captured_errors = stderr_capture.getvalue()
-            
-            output_message = ""
-            if captured_output:
-                output_message += captured_output.strip()
-            if captured_errors:
-                output_message += f"\nSTDERR: {captured_errors.strip()}"
-            
-            return result, output_message
+            return self._wrap_stream(node, result), self._format_output(stdout_capture, stderr_capture, inputs)
             
         except Exception as e:
             execution_time = time.perf_counter() - start_time
             self.execution_times[node.title] = execution_time
+            raise self._node_error(node, e, stderr_capture) from e
+    
+    def _execute_fused(self, node, inputs: Dict[str, Any]) -> Tuple[Any, str]:
+        """Execute a fused chain (see ``node_fusion``), profiling and blaming its members.
+
+        The chain's output is captured once for all members. Each member gets
+        its own profile sample and execution time, and a failure is reported
+        as the failing member's own error.
+        """
+        stdout_capture = io.StringIO()
+        stderr_capture = io.StringIO()
+        try:
+            with capture_output(stdout_capture, stderr_capture):
+                function = self._get_node_function(node)
+                with self.tracer.span(node.title, "node") as span:
+                    if span is not None:
+                        span.args.update(node_span_args(node, inputs), fused=len(node.members))
+                    result, timings = function(**inputs)
+        except Exception as e:
+            member_index = getattr(e, "member_index", None)
+            if member_index is None:
+                raise self._node_error(node, e, stderr_capture) from e
+            self._record_member_timings(node, e.timings, failed=member_index)
+            error = e.__cause__ if e.__cause__ is not None else e
+            raise self._node_error(node.members[member_index], error, stderr_capture) from error
+        
+        self._record_member_timings(node, timings)
+        return result, self._format_output(stdout_capture, stderr_capture, inputs)
+    
+    def _record_member_timings(self, node, timings, failed: Optional[int] = None):
+        for index, wall_time, cpu_time in timings:
+            member = node.members[index]
+            self.execution_times[member.title] = wall_time
+            self.profiler.record(member, wall_time, cpu_time, failed=index == failed)
+    
+    async def execute_node_async(self, node: 'Node', inputs: Dict[str, Any]) -> Tuple[Any, str]:
+        """Execute a node on the node event loop (see ``async_runner``).
+        
+        Coroutine functions are awaited, so several async nodes scheduled on
+        the loop run concurrently. Regular functions are simply called.
+        
+        Returns:
+            Tuple of (result, captured_output)
+        """
+        if not node.function_name:
+            return None, f"SKIP: Node '{node.title}' has no valid function defined."
+        
+        start_time = time.perf_counter()
+        stdout_capture = io.StringIO()
+        stderr_capture = io.StringIO()
+        
+        try:
+            with capture_output(stdout_capture, stderr_capture):
+                function = self._get_node_function(node)
+                # Other tasks interleave on the loop thread, so its CPU time is not this node's
+                with self.tracer.span(node.title, "node") as span, self.profiler.measure(node, cpu=False) as sample:
+                    if span is not None:
+                        span.args.update(node_span_args(node, inputs), awaited=True)
+                    result = function(**inputs)
+                    if inspect.isawaitable(result):
+                        result = await result
+                    sample.set_result(result)
+                    if span is not None:
+                        span.args["output_size"] = object_size(result)
             
-            error_message = f"ERROR in node '{node.title}': {e}"
+            self.execution_times[node.title] = time.perf_counter() - start_time
+            return self._wrap_stream(node, result), self._format_output(stdout_capture, stderr_capture, inputs)
             
-            # Include any captured stderr
-            captured_errors = stderr_capture.getvalue()
-            if captured_errors:
-                error_message += f"\nSTDERR: {captured_errors.strip()}"
-                
-            raise RuntimeError(error_message) from e
+        except Exception as e:
+            self.execution_times[node.title] = time.perf_counter() - start_time
+            raise self._node_error(node, e, stderr_capture) from e
     
-    def _update_persistent_namespace(self, exec_globals: Dict[str, Any]):
-        """Update persistent namespace with new imports and variables.
+    async def _await_function(self, function: Callable, inputs: Dict[str, Any], stdout_capture, stderr_capture):
+        with capture_output(stdout_capture, stderr_capture):
+            return await function(**inputs)
+    
+    def _wrap_stream(self, node: 'Node', result: Any) -> Any:
+        """Turn the iterator returned by a streaming node into a bounded NodeStream."""
+        if isinstance(result, NodeStream):
+            return result
+        if inspect.isgenerator(result) or (getattr(node, "is_streaming", False) is True
+                                           and isinstance(result, Iterator)):
+            return NodeStream(result, node.title, self.stream_buffer_size)
+        return result
+    
+    def _format_output(self, stdout_capture, stderr_capture, inputs=None) -> str:
+        """Combine captured stdout and stderr, plus output printed by streams the node read."""
+        captured_output = stdout_capture.getvalue()
+        captured_errors = stderr_capture.getvalue()
         
-        Args:
-            exec_globals: The globals dict after node execution
+        output_message = ""
+        if captured_output:
+            output_message += captured_output.strip()
+        if captured_errors:
+            output_message += f"\nSTDERR: {captured_errors.strip()}"
+        for value in (inputs or {}).values():
+            if isinstance(value, NodeStream):
+                streamed = value.take_output()
+                if streamed:
+                    output_message += f"\nSTREAM '{value.title}': {streamed}"
+        return output_message.strip()
+    
+    def _node_error(self, node: 'Node', error: Exception, stderr_capture) -> RuntimeError:
+        """Wrap a node failure, including any captured stderr."""
+        error_message = f"ERROR in node '{node.title}': {error}"
+        
+        # Include any captured stderr
+        captured_errors = stderr_capture.getvalue()
+        if captured_errors:
+            error_message += f"\nSTDERR: {captured_errors.strip()}"
+        return RuntimeError(error_message)
+    
+    def _get_node_function(self, node: 'Node') -> Callable:
+        """Return the node's entry function, compiling its code only on a cache miss.
+        
+        Module-level code runs once per distinct source, in its own copy of
+        the persistent namespace. Its definitions are merged into the
+        persistent namespace so later nodes can use them, while its own
+        functions keep resolving the names it defined itself. Names it did
+        not define are refreshed from the persistent namespace whenever that
+        has changed since, so a cached node sees what other nodes define later.
         """
-        # Update with new imports and module-level definitions
-        for key, value in exec_globals.items():
-            if key.startswith('__') and key.endswith('__'):
-                continue  # Skip built-in attributes
+        with self._compile_lock:
+            entry = self.code_cache.get(node.code)
+            if entry is None:
+                code_object = compile(node.code, f"<node {node.title}>", "exec")
+                # Function groups and fused chains carry their members' sources as strings
+                codes = node.member_codes if getattr(node, "is_group", False) is True else (node.code,)
+                for code in codes:
+                    self._import_referenced_modules(code)
+                node_namespace = dict(self.namespace)
+                exec(code_object, node_namespace)
+                bound_names = [name for name, value in node_namespace.items()
+                               if name not in self.namespace or self.namespace[name] is not value]
+                
+                # Update persistent namespace with all new definitions
+                self.namespace.update(node_namespace)
+                self._namespace_version += 1
                 
-            # Add new modules and functions to persistent namespace
-            if (hasattr(value, '__module__') or 
-                callable(value) or 
-                key in ['np', 'pd', 'torch', 'tf', 'plt']):  # Common aliases
-                self.namespace[key] = value
+                entry = CompiledNode(code_object, node_namespace, bound_names, self._namespace_version)
+                self.code_cache.put(node.code, entry)
+            elif entry.namespace_version != self._namespace_version:
+                entry.refresh(self.namespace, self._namespace_version)
+            
+            function = entry.get_function(node.function_name)
+        if function is None:
+            raise RuntimeError(f"Function '{node.function_name}' not found after code execution")
+        return function
+    
+    def invalidate_code(self, code: str):
+        """Forget the compiled form of ``code`` so it is re-executed on next use."""
+        self.code_cache.invalidate(code)
     
     def store_object(self, key: Any, value: Any):
         """Store an object directly without serialization.
@@ -262,8 +461,14 @@ class SingleProcessExecutor:
         self.namespace.clear()
         self.object_store.clear()
         self.execution_times.clear()
+        self.code_cache.clear()
         self._initialize_namespace()
     
+    def shutdown(self):
+        """Stop the node event loop if it was started."""
+        if self._async_runner is not None:
+            self._async_runner.shutdown()
+    
     def cleanup_venv_packages(self):
         """Restore original sys.path by removing venv packages."""
         if self.original_sys_path is not None:
@@ -0,0 +1,146 @@
+# venv_worker.py
+# Worker process for VenvWorkerPool. Started with a virtual environment's own
+# interpreter, so nodes import that venv's packages and nothing from the
+# editor. Standard library only: it runs in environments without PySide6.
+#
+# Protocol: frames on stdin/stdout, each a 5-byte header (big-endian payload
+# length, message kind) followed by a pickled payload. The worker announces
+# itself with HELLO, then answers every CALL or LOAD with one RESULT or ERROR.
+# Inputs and results are shm_transport messages, so large buffers stay in
+# shared memory; a CALL marked inline gets its result back as a plain pickle
+# instead, for remote workers that forward it over a socket.
+
+import inspect
+import io
+import os
+import pickle
+import struct
+import sys
+import time
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+
+try:
+    from . import shm_transport
+except ImportError:
+    # Run as a script by VenvWorkerPool
+    import shm_transport
+
+HEADER = struct.Struct("!IB")
+
+# Message kinds
+HELLO = 1      # worker -> pool: (pid, highest pickle protocol, sys.prefix)
+CALL = 2       # pool -> worker: (code key, code or None if already sent, function name, inputs message, inline)
+LOAD = 3       # pool -> worker: (code key, code), compile only
+RESULT = 4     # worker -> pool: (result message, stdout, stderr, cpu time)
+ERROR = 5      # worker -> pool: (message, formatted traceback)
+
+
+def read_frame(stream):
+    """Read one frame from a binary stream; None at end of stream."""
+    header = _read_exact(stream, HEADER.size)
+    if header is None:
+        return None
+    length, kind = HEADER.unpack(header)
+    payload = _read_exact(stream, length)
+    if payload is None:
+        return None
+    return kind, payload
+
+
+def write_frame(stream, kind, payload):
+    stream.write(HEADER.pack(len(payload), kind) + payload)
+    stream.flush()
+
+
+def _read_exact(stream, size):
+    chunks = []
+    while size:
+        chunk = stream.read(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def node_entry(func=None, **options):
+    """Stand-in for the editor's decorator; options only matter to the editor."""
+    def mark(function):
+        return function
+    return mark(func) if func is not None else mark
+
+
+class Worker:
+    """Serves node calls until the pool closes stdin."""
+
+    def __init__(self, requests, responses):
+        self.requests = requests
+        self.responses = responses
+        # Compiled node globals by code key
+        self.namespaces = {}
+
+    def namespace(self, key, code):
+        namespace = self.namespaces.get(key)
+        if namespace is None:
+            if code is None:
+                raise RuntimeError("node code was never sent to this worker")
+            namespace = {'__name__': '__node__', 'node_entry': node_entry}
+            exec(compile(code, "<node>", "exec"), namespace)
+            self.namespaces[key] = namespace
+        return namespace
+
+    def call(self, key, code, function_name, inputs, inline=False):
+        inputs = shm_transport.loads(inputs)
+        stdout_capture = io.StringIO()
+        stderr_capture = io.StringIO()
+        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+            function = self.namespace(key, code).get(function_name)
+            if not callable(function):
+                raise RuntimeError(f"Function '{function_name}' not found after code execution")
+            cpu_start = time.process_time()
+            result = function(**inputs)
+            if inspect.isawaitable(result):
+                import asyncio
+                result = asyncio.run(result)
+            cpu_time = time.process_time() - cpu_start
+        if inline:
+            result = (pickle.dumps(result, 5), [])
+        else:
+            # The pool adopts the new segments; input segments remain the pool's
+            result, _ = shm_transport.dumps(result, hand_over=True)
+        return result, stdout_capture.getvalue(), stderr_capture.getvalue(), cpu_time
+
+    def serve(self):
+        protocol = pickle.HIGHEST_PROTOCOL
+        write_frame(self.responses, HELLO, pickle.dumps((os.getpid(), protocol, sys.prefix), 2))
+        while True:
+            frame = read_frame(self.requests)
+            if frame is None:
+                return
+            kind, payload = frame
+            try:
+                if kind == CALL:
+                    response = self.call(*pickle.loads(payload))
+                elif kind == LOAD:
+                    self.namespace(*pickle.loads(payload))
+                    response = None
+                else:
+                    raise RuntimeError(f"unknown message kind {kind}")
+                write_frame(self.responses, RESULT, pickle.dumps(response, protocol))
+            except Exception as e:
+                message = f"{type(e).__name__}: {e}"
+                write_frame(self.responses, ERROR, pickle.dumps((message, traceback.format_exc()), protocol))
+
+
+def main():
+    # Frames own the real stdout; anything else writing to fd 1 (C extensions,
+    # subprocesses) lands on stderr instead of corrupting them
+    responses = os.fdopen(os.dup(1), "wb")
+    os.dup2(2, 1)
+    shm_transport.disable_tracking()
+    Worker(sys.stdin.buffer, responses).serve()
+
+
+if __name__ == "__main__":
+    main()
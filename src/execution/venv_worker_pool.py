@@ -0,0 +1,308 @@
+# venv_worker_pool.py
+# Runs isolated nodes in warm interpreter processes started from the graph's
+# virtual environment. Each worker is that venv's own python running
+# venv_worker.py, so node imports never mix with the editor's packages, and a
+# node that crashes its interpreter only costs the worker, which is replaced.
+#
+# Nodes opt in with ``@node_entry(isolate=True)`` (or every node, with
+# ``GraphExecutor.set_isolated_mode``). Inputs and results are pickled over
+# the worker's pipes, with large buffers in shared memory (shm_transport); a
+# call costs one round trip of small binary frames, and each distinct node
+# source is sent to a worker only once.
+
+import os
+import pickle
+import select
+import subprocess
+import sys
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from .code_cache import code_hash
+from .node_profiler import NodeProfiler, object_size
+from .execution_trace import ExecutionTracer, node_span_args
+from .node_watchdog import WAIT_POLL_INTERVAL
+from . import shm_transport, venv_worker
+from .venv_worker import CALL, ERROR, HELLO, LOAD, RESULT, read_frame, write_frame
+
+# Worker processes per venv unless configured otherwise
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+
+# Seconds a new worker may take to import and announce itself
+STARTUP_TIMEOUT = 30.0
+
+WORKER_SCRIPT = os.path.abspath(venv_worker.__file__)
+
+
+def venv_python_executable(venv_path: Optional[str]) -> str:
+    """The interpreter of a virtual environment, or this interpreter without one."""
+    if venv_path and os.path.exists(venv_path):
+        if sys.platform == "win32":
+            return os.path.join(venv_path, "Scripts", "python.exe")
+        return os.path.join(venv_path, "bin", "python")
+    return sys.executable
+
+
+class WorkerCrashed(RuntimeError):
+    """The worker process exited or broke the protocol during a call."""
+
+
+class _VenvWorker:
+    """One interpreter process and the node sources it has compiled."""
+
+    def __init__(self, python_executable: str, generation: int):
+        self.generation = generation
+        self.process = subprocess.Popen(
+            [python_executable, WORKER_SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, bufsize=0,
+        )
+        self.known_codes: Set[str] = set()
+        self.pid = None
+        self.prefix = None
+        self.protocol = pickle.HIGHEST_PROTOCOL
+        self._hello = False
+
+    def wait_ready(self):
+        if self._hello:
+            return
+        kind, payload = self.receive(deadline=time.monotonic() + STARTUP_TIMEOUT)
+        if kind != HELLO:
+            raise WorkerCrashed("worker process did not announce itself")
+        self.pid, protocol, self.prefix = pickle.loads(payload)
+        self.protocol = min(protocol, pickle.HIGHEST_PROTOCOL)
+        self._hello = True
+
+    def send(self, kind: int, message: Any):
+        self.send_payload(kind, pickle.dumps(message, self.protocol))
+
+    def send_payload(self, kind: int, payload: bytes):
+        try:
+            write_frame(self.process.stdin, kind, payload)
+        except OSError as e:
+            raise WorkerCrashed(self._exit_message()) from e
+
+    def receive(self, deadline: Optional[float] = None) -> Tuple[int, bytes]:
+        """Read the next frame, waiting in short slices so a NodeTimeout can reach this thread."""
+        if os.name != "nt":
+            stdout = self.process.stdout
+            while not select.select([stdout], [], [], WAIT_POLL_INTERVAL)[0]:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise WorkerCrashed("worker process did not start in time")
+        frame = read_frame(self.process.stdout)
+        if frame is None:
+            raise WorkerCrashed(self._exit_message())
+        return frame
+
+    def _exit_message(self) -> str:
+        try:
+            code = self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            return "worker process stopped responding"
+        return f"worker process exited with code {code}"
+
+    def close(self):
+        """Let the worker exit on end of input, killing it if it does not."""
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        self.process.stdout.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.wait()
+        for pipe in (self.process.stdin, self.process.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
+class VenvWorkerPool:
+    """Executes isolated nodes on warm worker processes of one venv's interpreter.
+
+    Has the same ``execute_node`` contract as SingleProcessExecutor. Workers
+    start on first use (or ``start``) and live until ``shutdown``; up to
+    ``max_workers`` nodes run at once, one per worker. A worker whose node
+    crashed it or ran past its time limit is killed and replaced, so unlike
+    the in-process backends a timeout really stops the node.
+    """
+
+    def __init__(self, python_executable: Optional[str] = None, max_workers: Optional[int] = None,
+                 profiler: Optional[NodeProfiler] = None, tracer: Optional[ExecutionTracer] = None):
+        """Initialize the pool.
+
+        Args:
+            python_executable: Interpreter to start workers with (default: this one)
+            max_workers: Number of worker processes (None uses DEFAULT_WORKERS)
+            profiler: Per-node profile store, shared with other executors (created if None)
+            tracer: Execution timeline, shared with other executors (created disabled if None)
+        """
+        self.python_executable = python_executable or sys.executable
+        self.max_workers = max_workers or DEFAULT_WORKERS
+        self._idle: List[_VenvWorker] = []
+        self._worker_count = 0
+        self._condition = threading.Condition()
+        self._preload: Tuple[str, ...] = ()
+        # Bumped by shutdown, so workers busy at the time are closed when they come back
+        self._generation = 0
+
+        self.execution_times: Dict[str, float] = {}
+        self.profiler = profiler if profiler is not None else NodeProfiler()
+        self.tracer = tracer if tracer is not None else ExecutionTracer()
+        # Workers replaced after a crash or timeout
+        self.restarts = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker_count > 0
+
+    def start(self, codes: Iterable[str] = ()):
+        """Start every worker; ``codes`` are compiled in each as it becomes ready."""
+        self._preload = tuple(dict.fromkeys(self._preload + tuple(code for code in codes if code)))
+        with self._condition:
+            while self._worker_count < self.max_workers:
+                self._idle.append(_VenvWorker(self.python_executable, self._generation))
+                self._worker_count += 1
+
+    def warm_up(self, codes: Iterable[str] = ()):
+        """Start the pool and block until every worker is up with ``codes`` compiled."""
+        self.start(codes)
+        workers = [self._acquire() for _ in range(self.max_workers)]
+        for worker in workers:
+            self._release(worker)
+
+    def worker_pids(self) -> List[int]:
+        with self._condition:
+            return [worker.pid for worker in self._idle if worker.pid is not None]
+
+    def execute_node(self, node, inputs: Dict[str, Any]) -> Tuple[Any, str]:
+        """Execute a single node in a worker process.
+
+        Args:
+            node: The node to execute
+            inputs: Dictionary of picklable input values for the node
+
+        Returns:
+            Tuple of (result, captured_output)
+        """
+        if not node.function_name:
+            return None, f"SKIP: Node '{node.title}' has no valid function defined."
+
+        start_time = time.perf_counter()
+        try:
+            with self.tracer.span(node.title, "node") as span:
+                if span is not None:
+                    span.args.update(node_span_args(node, inputs), worker="venv worker")
+                result, captured_output, captured_errors, cpu_time = self._call(node, inputs)
+                if span is not None:
+                    span.args.update(output_size=object_size(result), cpu_time=cpu_time)
+        except Exception as e:
+            wall_time = time.perf_counter() - start_time
+            self.execution_times[node.title] = wall_time
+            self.profiler.record(node, wall_time, failed=True)
+            raise RuntimeError(f"ERROR in node '{node.title}' (venv worker): {e}") from e
+
+        wall_time = time.perf_counter() - start_time
+        self.execution_times[node.title] = wall_time
+        self.profiler.record(node, wall_time, cpu_time, output_size=object_size(result))
+
+        output_message = ""
+        if captured_output:
+            output_message += captured_output.strip()
+        if captured_errors:
+            output_message += f"\nSTDERR: {captured_errors.strip()}"
+        return result, output_message
+
+    def _call(self, node, inputs: Dict[str, Any]):
+        message, pins = shm_transport.dumps(inputs)
+        try:
+            result, captured_output, captured_errors, cpu_time = self.call_message(
+                code_hash(node.code), node.code, node.function_name, message)
+            return shm_transport.loads(result), captured_output, captured_errors, cpu_time
+        finally:
+            # A result that passes an input through keeps its segment mapped
+            shm_transport.release(pins)
+
+    def call_message(self, key: str, code: str, function_name: str, message, inline: bool = False):
+        """Run one call on an idle worker, with inputs and result as shm_transport messages.
+
+        With ``inline`` the result message is a plain pickle without shared
+        memory, which remote workers forward to another machine unopened.
+
+        Returns:
+            Tuple of (result message, stdout, stderr, CPU time)
+        """
+        worker = self._acquire()
+        try:
+            request = pickle.dumps((key, None if key in worker.known_codes else code, function_name,
+                                    message, inline), worker.protocol)
+        except BaseException:
+            # Unpicklable inputs: nothing reached the worker
+            self._release(worker)
+            raise
+        try:
+            worker.send_payload(CALL, request)
+            kind, payload = worker.receive()
+        except BaseException:
+            # Crashed, or interrupted mid-call (e.g. a NodeTimeout): its state is unknown
+            self._discard(worker)
+            raise
+        self._release(worker)
+        if kind == ERROR:
+            error, _ = pickle.loads(payload)
+            raise RuntimeError(error)
+        worker.known_codes.add(key)
+        return pickle.loads(payload)
+
+    def _acquire(self) -> _VenvWorker:
+        with self._condition:
+            while not self._idle and self._worker_count >= self.max_workers:
+                self._condition.wait()
+            if self._idle:
+                worker = self._idle.pop()
+            else:
+                worker = _VenvWorker(self.python_executable, self._generation)
+                self._worker_count += 1
+        try:
+            if not worker._hello:
+                worker.wait_ready()
+                for code in self._preload:
+                    key = code_hash(code)
+                    worker.send(LOAD, (key, code))
+                    # Compile errors are reported when the node actually runs
+                    if worker.receive()[0] == RESULT:
+                        worker.known_codes.add(key)
+        except BaseException:
+            self._discard(worker)
+            raise
+        return worker
+
+    def _release(self, worker: _VenvWorker):
+        with self._condition:
+            if worker.generation == self._generation:
+                self._idle.append(worker)
+                self._condition.notify()
+                return
+        worker.close()
+
+    def _discard(self, worker: _VenvWorker):
+        worker.kill()
+        with self._condition:
+            if worker.generation == self._generation:
+                self._worker_count -= 1
+                self.restarts += 1
+                self._condition.notify()
+
+    def shutdown(self):
+        """Stop the workers; ones busy with a node stop when it returns. The pool restarts on next use."""
+        with self._condition:
+            workers, self._idle = self._idle, []
+            self._worker_count = 0
+            self._generation += 1
+            self._condition.notify_all()
+        for worker in workers:
+            worker.close()
@@ -231,6 +231,11 @@ class GroupPropertiesDialog(QDialog):
                                        if hasattr(self.group, 'member_node_uuids') else "0")
         basic_layout.addRow("Member Nodes:", self.member_count_label)
         
+        self.function_checkbox = QCheckBox("Execute as one function")
+        self.function_checkbox.setToolTip("Compile the members into a single call whose results are "
+                                          "memoized on the group's inputs")
+        basic_layout.addRow("Execution:", self.function_checkbox)
+        
         left_layout.addWidget(basic_group)
         
         # Color properties with alpha sliders
@@ -371,6 +376,7 @@ class GroupPropertiesDialog(QDialog):
         """Load current group properties into the dialog."""
         self.name_edit.setText(self.group.name)
         self.description_edit.setPlainText(getattr(self.group, 'description', ''))
+        self.function_checkbox.setChecked(getattr(self.group, 'is_function', False))
         
         # Load size properties
         self.width_spinbox.setValue(int(self.group.width))
@@ -512,6 +518,7 @@ class GroupPropertiesDialog(QDialog):
         return {
             'name': self.group.name,
             'description': getattr(self.group, 'description', ''),
+            'is_function': getattr(self.group, 'is_function', False),
             'width': self.group.width,
             'height': self.group.height,
             'padding': getattr(self.group, 'padding', 20),
@@ -527,6 +534,7 @@ class GroupPropertiesDialog(QDialog):
         return {
             'name': self.name_edit.text().strip(),
             'description': self.description_edit.toPlainText().strip(),
+            'is_function': self.function_checkbox.isChecked(),
             'width': float(self.width_spinbox.value()),
             'height': float(self.height_spinbox.value()),
             'padding': float(self.padding_spinbox.value()),
@@ -3,7 +3,8 @@
 # path for virtual environments.
 
 import os
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QFileDialog, QDialogButtonBox, QCheckBox
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QFileDialog,
+                               QDialogButtonBox, QCheckBox, QDoubleSpinBox)
 from PySide6.QtCore import QSettings
 
 
@@ -49,6 +50,19 @@ class SettingsDialog(QDialog):
         self.show_pin_types_checkbox.setChecked(self.settings.value("show_pin_types", True, type=bool))
         layout.addWidget(self.show_pin_types_checkbox)
 
+        # --- Per-Node Timeout Setting ---
+        timeout_layout = QHBoxLayout()
+        timeout_layout.addWidget(QLabel("Abort nodes running longer than:"))
+        self.node_timeout_spin = QDoubleSpinBox()
+        self.node_timeout_spin.setRange(0, 86400)
+        self.node_timeout_spin.setDecimals(1)
+        self.node_timeout_spin.setSuffix(" s")
+        self.node_timeout_spin.setSpecialValueText("No limit")
+        self.node_timeout_spin.setValue(self.settings.value("node_timeout", 0, type=float))
+        timeout_layout.addWidget(self.node_timeout_spin)
+        timeout_layout.addStretch()
+        layout.addLayout(timeout_layout)
+
         # --- OK and Cancel Buttons ---
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept)
@@ -64,4 +78,5 @@ class SettingsDialog(QDialog):
         """Saves the settings when the user clicks OK."""
         self.settings.setValue("venv_parent_dir", self.path_edit.text())
         self.settings.setValue("show_pin_types", self.show_pin_types_checkbox.isChecked())
+        self.settings.setValue("node_timeout", self.node_timeout_spin.value())
         super().accept()
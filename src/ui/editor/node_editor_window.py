@@ -3,7 +3,7 @@
 
 import os
 import sys
-from PySide6.QtWidgets import (QMainWindow, QTextEdit, QDockWidget, QInputDialog, 
+from PySide6.QtWidgets import (QMainWindow, QDockWidget, QInputDialog, 
                               QToolBar, QWidget, QHBoxLayout, QSizePolicy)
 from PySide6.QtGui import QAction
 from PySide6.QtCore import Qt, QPointF, QSettings
@@ -23,6 +23,7 @@ from ui.dialogs.undo_history_dialog import UndoHistoryDialog
 
 # Import our new modular components
 from ui.utils.ui_utils import create_fa_icon, create_execution_control_widget, ButtonStyleManager
+from ui.utils.log_sink import LogSink, LogView
 from data.file_operations import FileOperationsManager
 from execution.execution_controller import ExecutionController
 from .view_state_manager import ViewStateManager
@@ -70,11 +71,11 @@ class NodeEditorWindow(QMainWindow):
         self.view = NodeEditorView(self.graph, self)
         self.setCentralWidget(self.view)
 
-        # Output log
-        self.output_log = QTextEdit()
-        self.output_log.setReadOnly(True)
+        # Output log: executors append to the buffered sink, the list view shows it
+        self.output_log = LogSink(parent=self)
+        self.log_view = LogView(self.output_log)
         dock = QDockWidget("Output Log")
-        dock.setWidget(self.output_log)
+        dock.setWidget(self.log_view)
         self.addDockWidget(Qt.BottomDockWidgetArea, dock)
         
         # Ensure default virtual environment exists
@@ -102,8 +103,10 @@ class NodeEditorWindow(QMainWindow):
             self.exec_widget.main_exec_button,
             self.exec_widget.status_label,
             ButtonStyleManager.get_button_style,
-            self.file_ops
+            self.file_ops,
+            self.exec_widget.stop_button
         )
+        self.execution_ctrl.set_node_timeout(self.settings.value("node_timeout", 0, type=float))
         
         # Set execution controller reference in file operations
         self.file_ops.set_execution_controller(self.execution_ctrl)
@@ -212,7 +215,8 @@ class NodeEditorWindow(QMainWindow):
         # Create execution control widget (right-aligned)
         self.exec_widget = create_execution_control_widget(
             self._on_mode_changed,
-            self._on_main_button_clicked
+            self._on_main_button_clicked,
+            self._on_stop_button_clicked
         )
         toolbar.addWidget(self.exec_widget)
 
@@ -224,6 +228,10 @@ class NodeEditorWindow(QMainWindow):
         """Handle main execution button clicks."""
         self.execution_ctrl.on_main_button_clicked()
 
+    def _on_stop_button_clicked(self):
+        """Handle stop button clicks."""
+        self.execution_ctrl.stop_execution()
+
     # File operation handlers
     def on_new_scene(self):
         """Create a new scene."""
@@ -261,6 +269,7 @@ class NodeEditorWindow(QMainWindow):
         if dialog.exec():
             self.venv_parent_dir = self.settings.value("venv_parent_dir")
             self.output_log.append(f"Default venv directory updated to: {self.venv_parent_dir}")
+            self.execution_ctrl.set_node_timeout(self.settings.value("node_timeout", 0, type=float))
             
             # Refresh all pin labels to reflect type visibility setting changes
             self.refresh_pin_labels()
@@ -404,4 +413,5 @@ class NodeEditorWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle application close event."""
         self.view_state.save_view_state()
+        self.execution_ctrl.shutdown()
         event.accept()
\ No newline at end of file
@@ -0,0 +1,226 @@
+# log_sink.py
+# Buffered, rate-limited output log. Executors append lines as fast as they
+# like; the sink keeps them in a fixed-size ring buffer and hands them to the
+# screen at most ``max_fps`` times a second, in one batch per frame. LogView
+# shows the buffer through a list model, so only visible rows are ever laid
+# out and a million-line log scrolls as fast as an empty one.
+
+import threading
+from typing import List, Optional
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QFontDatabase, QKeySequence
+from PySide6.QtWidgets import QAbstractItemView, QApplication, QListView
+
+# Lines kept before the oldest ones are dropped
+DEFAULT_MAX_LINES = 1_000_000
+
+# Screen updates per second while lines are arriving
+DEFAULT_MAX_FPS = 30
+
+
+class LogRingBuffer:
+    """Fixed-capacity list of lines with O(1) append and indexing; the oldest lines fall out."""
+
+    def __init__(self, capacity: int = DEFAULT_MAX_LINES):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self._lines: List[Optional[str]] = [None] * capacity
+        self._start = 0
+        self._size = 0
+        # Lines that fell out of the buffer since it was last cleared
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("log line index out of range")
+        return self._lines[(self._start + index) % self.capacity]
+
+    def __iter__(self):
+        for index in range(self._size):
+            yield self._lines[(self._start + index) % self.capacity]
+
+    def extend(self, lines: List[str]):
+        if len(lines) > self.capacity:
+            self.dropped += len(lines) - self.capacity
+            lines = lines[-self.capacity:]
+        for line in lines:
+            end = (self._start + self._size) % self.capacity
+            self._lines[end] = line
+            if self._size < self.capacity:
+                self._size += 1
+            else:
+                self._start = (self._start + 1) % self.capacity
+                self.dropped += 1
+
+    def drop_oldest(self, count: int):
+        count = min(count, self._size)
+        for index in range(count):
+            self._lines[(self._start + index) % self.capacity] = None
+        self._start = (self._start + count) % self.capacity
+        self._size -= count
+        self.dropped += count
+
+    def clear(self):
+        self._lines = [None] * self.capacity
+        self._start = 0
+        self._size = 0
+        self.dropped = 0
+
+
+class LogListModel(QAbstractListModel):
+    """Read-only list model over a LogRingBuffer, one row per line."""
+
+    def __init__(self, lines: LogRingBuffer, parent=None):
+        super().__init__(parent)
+        self.lines = lines
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.lines)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self.lines[index.row()]
+        return None
+
+    def append_lines(self, lines: List[str]):
+        """Add lines to the buffer, announcing the rows that fall out and the rows added."""
+        if not lines:
+            return
+        if len(lines) > self.lines.capacity:
+            self.lines.dropped += len(lines) - self.lines.capacity
+            lines = lines[-self.lines.capacity:]
+        overflow = len(self.lines) + len(lines) - self.lines.capacity
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            self.lines.drop_oldest(overflow)
+            self.endRemoveRows()
+        first = len(self.lines)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self.lines.extend(lines)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.lines.clear()
+        self.endResetModel()
+
+
+class LogSink(QObject):
+    """Output log that executors, the live executor and the execution controller append to.
+
+    ``append`` may be called from any thread and only queues the text; the
+    queued lines reach the screen on a timer, at most ``max_fps`` times a
+    second. Lines beyond ``max_lines`` are dropped oldest first. An optional
+    text widget (QTextEdit or QPlainTextEdit) is updated with one append per
+    frame; for very long logs show the sink in a LogView instead.
+    """
+
+    _flush_requested = Signal()
+
+    def __init__(self, widget=None, max_lines: int = DEFAULT_MAX_LINES, max_fps: int = DEFAULT_MAX_FPS,
+                 parent=None):
+        super().__init__(parent)
+        self.widget = widget
+        self.lines = LogRingBuffer(max_lines)
+        self.model = LogListModel(self.lines, self)
+        self._pending: List[str] = []
+        self._lock = threading.Lock()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(max(1, round(1000 / max_fps)))
+        self._timer.timeout.connect(self.flush)
+        # Queued across threads, so the timer is only ever started on the sink's own thread
+        self._flush_requested.connect(self._schedule_flush)
+        if widget is not None and hasattr(widget, "document"):
+            widget.document().setMaximumBlockCount(max_lines)
+
+    @property
+    def max_lines(self) -> int:
+        return self.lines.capacity
+
+    def append(self, text: str):
+        """Queue ``text``; multi-line text (e.g. captured node output) becomes one entry per line."""
+        with self._lock:
+            first = not self._pending
+            self._pending.extend(str(text).split("\n"))
+            if len(self._pending) > self.lines.capacity:
+                overflow = len(self._pending) - self.lines.capacity
+                del self._pending[:overflow]
+                self.lines.dropped += overflow
+        if first:
+            self._flush_requested.emit()
+
+    def _schedule_flush(self):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        """Move queued lines to the buffer and the screen now."""
+        self._timer.stop()
+        with self._lock:
+            lines, self._pending = self._pending, []
+        if not lines:
+            return
+        self.model.append_lines(lines)
+        if self.widget is not None:
+            self.widget.append("\n".join(lines))
+
+    def clear(self):
+        """Drop every queued and shown line."""
+        self._timer.stop()
+        with self._lock:
+            self._pending = []
+        self.model.clear()
+        if self.widget is not None:
+            self.widget.clear()
+
+    def toPlainText(self) -> str:
+        """The whole retained log, queued lines included."""
+        self.flush()
+        return "\n".join(self.lines)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+
+class LogView(QListView):
+    """Virtualized view of a LogSink: only the visible rows are laid out.
+
+    Follows new lines while scrolled to the bottom and copies the selected
+    lines with the standard copy shortcut.
+    """
+
+    def __init__(self, sink: LogSink, parent=None):
+        super().__init__(parent)
+        self.sink = sink
+        self.setModel(sink.model)
+        self.setUniformItemSizes(True)
+        self.setLayoutMode(QListView.Batched)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self._follow = True
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        sink.model.rowsInserted.connect(self._on_rows_inserted)
+
+    def _on_scrolled(self, value):
+        self._follow = value >= self.verticalScrollBar().maximum()
+
+    def _on_rows_inserted(self, parent, first, last):
+        if self._follow:
+            self.scrollToBottom()
+
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.Copy):
+            rows = sorted(index.row() for index in self.selectedIndexes())
+            QApplication.clipboard().setText("\n".join(self.sink.lines[row] for row in rows))
+            return
+        super().keyPressEvent(event)
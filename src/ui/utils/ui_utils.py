@@ -123,7 +123,7 @@ class ButtonStyleManager:
                 """
 
 
-def create_execution_control_widget(mode_changed_callback, button_clicked_callback):
+def create_execution_control_widget(mode_changed_callback, button_clicked_callback, stop_clicked_callback=None):
     """Create the execution mode and control widget."""
     # Container widget
     exec_widget = QWidget()
@@ -208,6 +208,32 @@ def create_execution_control_widget(mode_changed_callback, button_clicked_callba
     main_exec_button.setShortcut("F5")
     layout.addWidget(main_exec_button)
 
+    # Stop button - only shown while a batch run is in progress
+    stop_button = QPushButton("Stop")
+    stop_button.setMinimumSize(70, 35)
+    stop_button.setToolTip("Stop the run before its next node")
+    stop_button.setStyleSheet("""
+        QPushButton {
+            background-color: #F44336;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            font-weight: bold;
+            font-size: 12px;
+        }
+        QPushButton:hover {
+            background-color: #E53935;
+        }
+        QPushButton:disabled {
+            background-color: #888;
+            color: #ccc;
+        }
+    """)
+    stop_button.setVisible(False)
+    if stop_clicked_callback:
+        stop_button.clicked.connect(stop_clicked_callback)
+    layout.addWidget(stop_button)
+
     # Status indicator
     status_label = QLabel("Ready")
     status_label.setStyleSheet("color: #4CAF50; font-weight: bold; font-size: 12px;")
@@ -218,6 +244,7 @@ def create_execution_control_widget(mode_changed_callback, button_clicked_callba
     exec_widget.batch_radio = batch_radio
     exec_widget.live_radio = live_radio
     exec_widget.main_exec_button = main_exec_button
+    exec_widget.stop_button = stop_button
     exec_widget.status_label = status_label
 
     return exec_widget
\ No newline at end of file
@@ -0,0 +1,97 @@
+"""
+Shared fixtures for execution tests: GraphTestCase builds graphs in the
+editor's NodeGraph and runs them with a GraphExecutor; chain_data builds the
+graph data of a headless HeadlessGraph, and StubNode stands in for a node
+passed straight to a worker backend.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import Mock
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
+
+from PySide6.QtWidgets import QApplication, QTextEdit
+
+from execution.graph_executor import GraphExecutor
+from core.node_graph import NodeGraph
+from core.node_signature import parse_node_signature
+
+
+class StubNode:
+    """The attributes worker backends read from a node, for calling them without a graph."""
+
+    def __init__(self, code, title="Node"):
+        self.title = title
+        self.uuid = title
+        self.code = code
+        self.function_name = parse_node_signature(code).function_name
+
+
+def chain_data(codes, data=None, flow=None, gui=None, titles="Node {}", input_name="value"):
+    """Graph data of nodes n0..nN from ``codes``, by default each feeding the next.
+
+    Args:
+        codes: Source code of each node, in order
+        data: (start, output pin, end, input pin) data connections by node index;
+            default: every node's output_1 into the next node's ``input_name``
+        flow: (start, end) execution connections by node index; default: n0 -> n1 -> ... -> nN
+        gui: GUI state by node index
+        titles: Title format filled with the node index, or a list of titles
+        input_name: Input pin fed by the default data connections
+    """
+    nodes = [{"uuid": f"n{index}", "title": titles.format(index) if isinstance(titles, str) else titles[index], "code": code,
+              "gui_state": (gui or {}).get(index, {})} for index, code in enumerate(codes)]
+    pairs = [(index, index + 1) for index in range(len(codes) - 1)]
+    flow = pairs if flow is None else flow
+    data = [(start, "output_1", end, input_name) for start, end in pairs] if data is None else data
+    connections = [{"start_node_uuid": f"n{start}", "start_pin_name": "exec_out",
+                    "end_node_uuid": f"n{end}", "end_pin_name": "exec_in"} for start, end in flow]
+    connections += [{"start_node_uuid": f"n{start}", "start_pin_name": output,
+                     "end_node_uuid": f"n{end}", "end_pin_name": name} for start, output, end, name in data]
+    return {"nodes": nodes, "connections": connections}
+
+
+def exec_pin(node, direction):
+    pins = node.input_pins if direction == "input" else node.output_pins
+    return next(p for p in pins if p.pin_category == "execution")
+
+
+def data_pin(node, direction):
+    pins = node.input_pins if direction == "input" else node.output_pins
+    return next(p for p in pins if p.pin_category == "data")
+
+
+class GraphTestCase(unittest.TestCase):
+    """A fresh NodeGraph, log widget and GraphExecutor for every test."""
+
+    @classmethod
+    def setUpClass(cls):
+        if QApplication.instance() is None:
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.graph = NodeGraph()
+        self.log_widget = QTextEdit()
+        self.executor = GraphExecutor(self.graph, self.log_widget, Mock(return_value=None))
+
+    def tearDown(self):
+        self.executor.shutdown()
+        self.graph.clear()
+        self.log_widget.clear()
+
+    def _make_node(self, title, code):
+        node = self.graph.create_node(title, pos=(0, 0), use_command=False)
+        node.set_code(code)
+        return node
+
+    def _connect(self, start, end):
+        """Connect ``start`` to ``end`` by execution flow and by their first data pins."""
+        self.graph.create_connection(exec_pin(start, "output"), exec_pin(end, "input"), use_command=False)
+        self.graph.create_connection(data_pin(start, "output"), data_pin(end, "input"), use_command=False)
@@ -0,0 +1,122 @@
+"""
+Tests for async def node functions, which run on a dedicated event loop and
+are awaited concurrently when they do not depend on each other.
+"""
+
+import unittest
+import sys
+import os
+import asyncio
+from unittest.mock import Mock, patch
+
+from tests.graph_fixtures import GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.single_process_executor import SingleProcessExecutor
+from execution.output_capture import capture_output
+
+
+FETCH_CODE = '''
+import asyncio
+
+@node_entry
+async def {name}(value: int) -> int:
+    await asyncio.sleep(0.3)
+    print("{name} fetched")
+    return value + {offset}
+'''
+
+
+class TestAsyncNodeExecutor(unittest.TestCase):
+    """Test async node functions in SingleProcessExecutor."""
+
+    def setUp(self):
+        self.executor = SingleProcessExecutor([])
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_coroutine_is_awaited(self):
+        node = Mock()
+        node.title = "Fetch"
+        node.function_name = "fetch"
+        node.code = FETCH_CODE.format(name="fetch", offset=1)
+
+        result, output = self.executor.execute_node(node, {'value': 1})
+        self.assertEqual(result, 2)
+        self.assertEqual(output, "fetch fetched")
+
+    def test_concurrent_tasks_capture_separately(self):
+        async def talk(name):
+            with capture_output() as (stdout_capture, _):
+                for _ in range(20):
+                    print(name)
+                    await asyncio.sleep(0)
+            return stdout_capture.getvalue().split()
+
+        async def both():
+            return await asyncio.gather(talk("a"), talk("b"))
+
+        a_lines, b_lines = self.executor.async_runner.run(both())
+        self.assertEqual(a_lines, ["a"] * 20)
+        self.assertEqual(b_lines, ["b"] * 20)
+
+
+class TestAsyncNodesInGraph(GraphTestCase):
+    """Test that independent async nodes overlap in a graph run."""
+
+    def test_async_def_detected_when_parsing_pins(self):
+        node = self._make_node("Fetch", FETCH_CODE.format(name="fetch", offset=1))
+        self.assertTrue(node.is_async)
+        self.assertEqual(node.function_name, "fetch")
+        self.assertEqual([p.name for p in node.input_pins if p.pin_category == "data"], ["value"])
+
+    def test_fan_out_awaits_concurrently(self):
+        source = self._make_node("Source", '''
+@node_entry
+def source() -> int:
+    return 1
+''')
+        fetchers = [self._make_node(f"Fetch {i}", FETCH_CODE.format(name=f"fetch_{i}", offset=i))
+                    for i in range(5)]
+        for fetcher in fetchers:
+            self._connect(source, fetcher)
+
+        self.executor.execute()
+
+        stats = self.executor.last_run_stats
+        log_lines = self.log_widget.toPlainText().splitlines()
+        self.assertLess(stats['wall_time'], 1.0)
+        self.assertGreaterEqual(stats['serial_node_time'], 1.5)
+        # Log stays in plan order
+        fetched = [line for line in log_lines if line.endswith("fetched")]
+        self.assertEqual(fetched, [f"fetch_{i} fetched" for i in range(5)])
+        self.assertTrue(any(line.startswith("[ASYNC] 5 async nodes") for line in log_lines))
+
+    def test_async_results_flow_downstream(self):
+        fetch = self._make_node("Fetch", FETCH_CODE.replace("value: int", "").replace(
+            "value + {offset}", "{offset}").format(name="fetch", offset=41))
+        sink = self._make_node("Sink", '''
+@node_entry
+def sink(value: int):
+    print(f"got {value + 1}")
+''')
+        self._connect(fetch, sink)
+        self.executor.execute()
+        self.assertIn("got 42", self.log_widget.toPlainText())
+
+    def test_inline_run_starts_no_thread_pool(self):
+        for i in range(2):
+            self._make_node(f"Fetch {i}", FETCH_CODE.replace("value: int", "").replace(
+                "value + {offset}", "{offset}").format(name=f"fetch_{i}", offset=i))
+        with patch("execution.parallel_scheduler.ThreadPoolExecutor") as pool_class:
+            self.executor.execute()
+        pool_class.assert_not_called()
+        self.assertIn("[ASYNC] 2 async nodes", self.log_widget.toPlainText())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,270 @@
+"""
+Tests for batch execution off the GUI thread: stopping between nodes,
+per-node time limits and delivery of GUI values back to the GUI thread.
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+from tests.graph_fixtures import chain_data
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from PySide6.QtWidgets import QApplication, QLabel, QPushButton
+
+from core.headless_graph import HeadlessGraph
+from execution.execution_controller import BatchExecutionThread, ExecutionController
+from execution.graph_executor import GraphExecutor
+from execution.node_watchdog import NodeTimeout, NodeWatchdog
+
+SLOW_CODE = '''
+import time
+
+@node_entry
+def {name}(value: int) -> int:
+    time.sleep(0.3)
+    return value + 1
+'''
+
+SOURCE_CODE = '''
+@node_entry
+def source(value: int) -> int:
+    return value
+'''
+
+SPIN_CODE = '''
+@node_entry
+def spin(value: int) -> int:
+    while True:
+        try:
+            value += 1
+        except Exception:
+            pass
+'''
+
+ASYNC_WAIT_CODE = '''
+import asyncio
+
+@node_entry
+async def wait(value: int) -> int:
+    await asyncio.sleep(60)
+    return value
+'''
+
+
+def _chain_data(*codes):
+    """One node per code, each feeding ``value`` and execution into the next."""
+    return chain_data(codes, titles="Step {}", gui={0: {"value": 1}})
+
+
+def _executed(log):
+    return [line for line in log if line.startswith("--- Executing Node:")]
+
+
+class TestCancellation(unittest.TestCase):
+    """Test stopping a run between nodes."""
+
+    def _run_and_cancel(self, parallel):
+        log = []
+        codes = [SLOW_CODE.format(name=f"slow{index}") for index in range(4)]
+        executor = GraphExecutor(HeadlessGraph(_chain_data(*codes)), log, None)
+        executor.set_parallel_mode(parallel, max_workers=2)
+        worker = threading.Thread(target=executor.execute)
+        try:
+            worker.start()
+            time.sleep(0.1)
+            executor.cancel()
+            worker.join(timeout=5)
+        finally:
+            executor.shutdown()
+        self.assertFalse(worker.is_alive())
+        return log
+
+    def test_serial_run_stops_after_current_node(self):
+        log = self._run_and_cancel(parallel=False)
+        self.assertEqual(_executed(log), ["--- Executing Node: Step 0 ---"])
+        self.assertIn("[STOPPED] Execution stopped after 1 of 4 steps.", log)
+
+    def test_parallel_run_starts_no_new_nodes(self):
+        log = self._run_and_cancel(parallel=True)
+        self.assertEqual(len(_executed(log)), 1)
+        self.assertTrue(any(line.startswith("[STOPPED]") for line in log))
+
+    def test_next_run_clears_the_stop_request(self):
+        log = []
+        executor = GraphExecutor(HeadlessGraph(_chain_data(SOURCE_CODE, SOURCE_CODE)), log, None)
+        executor.cancel()
+        executor.execute()
+        self.assertEqual(len(_executed(log)), 2)
+        self.assertFalse(any(line.startswith("[STOPPED]") for line in log))
+
+
+class TestNodeTimeout(unittest.TestCase):
+    """Test aborting nodes that run past the per-node time limit."""
+
+    def test_watchdog_interrupts_loop_that_catches_exceptions(self):
+        with self.assertRaises(RuntimeError) as context:
+            with NodeWatchdog("Spin", 0.1):
+                while True:
+                    try:
+                        pass
+                    except Exception:
+                        pass
+        self.assertIn("TIMEOUT: Node 'Spin'", str(context.exception))
+        self.assertIsInstance(context.exception.__cause__, NodeTimeout)
+
+    def test_watchdog_is_silent_when_block_finishes_in_time(self):
+        with NodeWatchdog("Quick", 1.0) as watchdog:
+            pass
+        time.sleep(0.05)
+        self.assertFalse(watchdog.fired)
+
+    def test_timeout_delivered_after_block_becomes_runtime_error(self):
+        class LateDeliveryLock:
+            """Raises NodeTimeout on first use, as if it arrived just after the block returned."""
+
+            def __init__(self):
+                self.lock = threading.Lock()
+                self.delivered = False
+
+            def __enter__(self):
+                if not self.delivered:
+                    self.delivered = True
+                    raise NodeTimeout()
+                return self.lock.__enter__()
+
+            def __exit__(self, *exc_info):
+                return self.lock.__exit__(*exc_info)
+
+        with self.assertRaises(RuntimeError) as context:
+            with NodeWatchdog("Late", 10.0) as watchdog:
+                watchdog.fired = True
+                watchdog._lock = LateDeliveryLock()
+        self.assertIn("TIMEOUT: Node 'Late'", str(context.exception))
+        self.assertIsInstance(context.exception.__cause__, NodeTimeout)
+        self.assertFalse(watchdog._running)
+
+    def _run(self, *codes, parallel=False):
+        log = []
+        executor = GraphExecutor(HeadlessGraph(_chain_data(*codes)), log, None)
+        executor.set_parallel_mode(parallel, max_workers=2)
+        executor.set_node_timeout(0.2)
+        start_time = time.perf_counter()
+        try:
+            executor.execute()
+        finally:
+            executor.shutdown()
+        return log, time.perf_counter() - start_time
+
+    def test_runaway_node_is_reported_and_downstream_skipped(self):
+        log, elapsed = self._run(SOURCE_CODE, SPIN_CODE, SOURCE_CODE)
+        self.assertLess(elapsed, 5)
+        errors = [line for line in log if "TIMEOUT" in line]
+        self.assertEqual(len(errors), 1)
+        self.assertIn("Step 1", errors[0])
+        self.assertNotIn("--- Executing Node: Step 2 ---", log)
+
+    def test_runaway_node_in_parallel_run(self):
+        log, elapsed = self._run(SOURCE_CODE, SPIN_CODE, parallel=True)
+        self.assertLess(elapsed, 5)
+        self.assertTrue(any("TIMEOUT: Node 'Step 1'" in line for line in log))
+
+    def test_async_node_timeout(self):
+        log, elapsed = self._run(SOURCE_CODE, ASYNC_WAIT_CODE)
+        self.assertLess(elapsed, 5)
+        self.assertTrue(any("TIMEOUT: Node 'Step 1'" in line for line in log))
+
+
+class TestBackgroundRun(unittest.TestCase):
+    """Test running on a worker thread with GUI values snapshotted and dispatched."""
+
+    @classmethod
+    def setUpClass(cls):
+        if QApplication.instance() is None:
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def _graph(self):
+        graph = HeadlessGraph(_chain_data(SOURCE_CODE, SOURCE_CODE))
+        self.applied = []
+        for node in graph.nodes:
+            node.set_gui_values = lambda values, node=node: self.applied.append(
+                (node.title, values, threading.current_thread() is threading.main_thread()))
+        return graph
+
+    def test_gui_values_are_read_before_the_run(self):
+        graph = self._graph()
+        dispatched = []
+        executor = GraphExecutor(graph, [], None)
+        executor.begin_background_run(lambda node, values: dispatched.append((node.title, values)))
+        graph.nodes[0].gui_state["value"] = 5
+        worker = threading.Thread(target=executor.execute)
+        worker.start()
+        worker.join(timeout=5)
+        executor.end_background_run()
+
+        self.assertEqual(dispatched, [("Step 0", {"output_1": 1}), ("Step 1", {"output_1": 1})])
+        self.assertEqual(self.applied, [])
+
+    def test_thread_applies_values_on_gui_thread(self):
+        executor = GraphExecutor(self._graph(), [], None)
+        finished = []
+        thread = BatchExecutionThread(executor, finished.append)
+        executor.begin_background_run(thread.dispatch_gui_values)
+        thread.start()
+        deadline = time.perf_counter() + 5
+        while not finished and time.perf_counter() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+        executor.end_background_run()
+
+        self.assertEqual(finished, [thread])
+        self.assertIsNone(thread.error)
+        self.assertEqual(self.applied, [("Step 0", {"output_1": 1}, True), ("Step 1", {"output_1": 1}, True)])
+
+    def test_thread_finishes_when_run_raises_node_timeout(self):
+        executor = Mock()
+        executor.execute.side_effect = NodeTimeout
+        finished = []
+        thread = BatchExecutionThread(executor, finished.append)
+        thread.start()
+        deadline = time.perf_counter() + 5
+        while not finished and time.perf_counter() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+
+        self.assertEqual(finished, [thread])
+        self.assertIsInstance(thread.error, NodeTimeout)
+
+    def test_controller_stop_button(self):
+        log = []
+        codes = [SLOW_CODE.format(name=f"slow{index}") for index in range(4)]
+        graph = HeadlessGraph(_chain_data(*codes))
+        log_sink = type("Log", (list,), {"clear": list.clear})()
+        button, stop_button, status = QPushButton(), QPushButton(), QLabel()
+        controller = ExecutionController(graph, log_sink, lambda: None, button, status,
+                                         stop_button=stop_button)
+        try:
+            controller.on_main_button_clicked()
+            self.assertTrue(controller.is_batch_running)
+            self.assertFalse(stop_button.isHidden())
+            controller.stop_execution(wait=True)
+        finally:
+            controller.shutdown()
+
+        self.assertFalse(controller.is_batch_running)
+        self.assertTrue(stop_button.isHidden())
+        self.assertEqual(button.text(), "Execute Graph")
+        self.assertIn("[STOP] === BATCH EXECUTION STOPPED ===", log_sink)
+        self.assertLess(len(_executed(log_sink)), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
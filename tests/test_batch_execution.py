@@ -0,0 +1,99 @@
+"""
+Tests for batch-over-records execution: one compiled plan run across many
+input records, with vectorized nodes called once per chunk.
+"""
+
+import unittest
+import sys
+import os
+
+from tests.graph_fixtures import GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.batch_runner import to_batch_column
+
+
+class TestBatchExecution(GraphTestCase):
+    """Test GraphExecutor.run_batch over small graphs."""
+
+    def _make_chain(self, double_code=None):
+        source = self._make_node("Source", '''
+@node_entry
+def source(value: int) -> int:
+    return value
+''')
+        double = self._make_node("Double", double_code or '''
+@node_entry
+def double(value: int) -> int:
+    return value * 2
+''')
+        self._connect(source, double)
+        return source, double
+
+    def test_records_override_entry_inputs(self):
+        self._make_chain()
+        results = self.executor.run_batch([{"Source": {"value": i}} for i in range(5)])
+
+        self.assertEqual([r["Double"]["output_1"] for r in results], [0, 2, 4, 6, 8])
+        # Connected outputs are not collected unless asked for
+        self.assertNotIn("Source", results[0])
+        self.assertIn("[BATCH] 5 records", self.log_widget.toPlainText())
+
+    def test_requested_outputs(self):
+        self._make_chain()
+        results = self.executor.run_batch([{"Source": {"value": 3}}], outputs=["Source"])
+        self.assertEqual(results, [{"Source": {"output_1": 3}}])
+
+    def test_vectorized_node_called_once_per_chunk(self):
+        self._make_chain('''
+@node_entry(vectorize=True)
+def double(value: int) -> int:
+    print(f"chunk of {len(value)}")
+    return [v * 2 for v in value]
+''')
+        double = next(n for n in self.graph.nodes if getattr(n, "title", "") == "Double")
+        self.assertTrue(double.vectorized)
+
+        calls = []
+        node_executor = self.executor.get_node_executor(double)
+        execute_node = node_executor.execute_node
+
+        def counting_execute(node, inputs):
+            if node is double:
+                calls.append(len(inputs["value"]))
+            return execute_node(node, inputs)
+
+        node_executor.execute_node = counting_execute
+        results = self.executor.run_batch(({"Source": {"value": i}} for i in range(10)), batch_size=4)
+
+        self.assertEqual([r["Double"]["output_1"] for r in results], [i * 2 for i in range(10)])
+        self.assertEqual(calls, [4, 4, 2])
+
+    def test_failing_record_is_isolated(self):
+        self._make_chain('''
+@node_entry
+def double(value: int) -> int:
+    if value == 2:
+        raise ValueError("bad record")
+    return value * 2
+''')
+        results = self.executor.run_batch([{"Source": {"value": i}} for i in range(4)])
+
+        self.assertEqual(results[1], {"Double": {"output_1": 2}})
+        self.assertEqual(results[2], {})
+        self.assertEqual(results[3], {"Double": {"output_1": 6}})
+        self.assertEqual(self.executor.last_run_stats['failed_records'], 1)
+        log_text = self.log_widget.toPlainText()
+        self.assertIn("1 failed", log_text)
+        self.assertIn("Record 2:", log_text)
+
+    def test_batch_column_falls_back_to_list(self):
+        self.assertEqual(to_batch_column(["a", "b"]), ["a", "b"])
+        self.assertEqual(list(to_batch_column([1, 2, 3])), [1, 2, 3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -484,14 +484,14 @@ button.show()
             
             # Clear the log to see only the execution result
             output_log = self.window.output_log
-            initial_log_count = output_log.document().blockCount()
+            initial_log_count = len(output_log.lines)
             
             # Trigger node execution (simulates clicking "Generate Password" button)
             live_executor.trigger_node_execution(node)
             QApplication.processEvents()
             
             # Check the log output
-            final_log_count = output_log.document().blockCount()
+            final_log_count = len(output_log.lines)
             log_text = output_log.toPlainText()
             
             # CRITICAL TEST: Should NOT contain the error message
@@ -0,0 +1,121 @@
+"""
+Unit tests for ExecutionPlan - the compiled, cached step list that
+GraphExecutor runs instead of traversing the graph on every execution.
+"""
+
+import unittest
+import sys
+import os
+
+from tests.graph_fixtures import exec_pin, data_pin, GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.execution_plan import ExecutionPlan
+
+
+class TestExecutionPlan(GraphTestCase):
+    """Test plan compilation, caching and execution."""
+
+    def _make_chain(self):
+        source = self._make_node("Source", '''
+@node_entry
+def source() -> int:
+    return 20
+''')
+        double = self._make_node("Double", '''
+@node_entry
+def double(value: int) -> int:
+    return value * 2
+''')
+        sink = self._make_node("Sink", '''
+@node_entry
+def sink(value: int):
+    print(f"result={value}")
+''')
+        self.graph.create_connection(exec_pin(source, "output"), exec_pin(double, "input"), use_command=False)
+        self.graph.create_connection(exec_pin(double, "output"), exec_pin(sink, "input"), use_command=False)
+        self.graph.create_connection(data_pin(source, "output"), data_pin(double, "input"), use_command=False)
+        self.graph.create_connection(data_pin(double, "output"), data_pin(sink, "input"), use_command=False)
+        return source, double, sink
+
+    def test_plan_follows_depth_first_order(self):
+        """Steps are laid out in the order the recursive executor visited nodes."""
+        source, double, sink = self._make_chain()
+        plan = ExecutionPlan(self.graph)
+
+        self.assertEqual([step.node for step in plan.steps], [source, double, sink])
+        self.assertEqual(plan.entry_nodes, [source])
+        # Each node's inputs read the slot its upstream node writes
+        self.assertEqual(plan.steps[1].inputs[0][1], plan.steps[0].outputs[0][1])
+        self.assertEqual(plan.steps[2].inputs[0][1], plan.steps[1].outputs[0][1])
+
+    def test_plan_is_reused_until_structure_changes(self):
+        """The executor only rebuilds the plan after pins, connections or code change."""
+        source, double, sink = self._make_chain()
+
+        first = self.executor.get_execution_plan()
+        self.assertIs(self.executor.get_execution_plan(), first)
+
+        double.set_code('''
+@node_entry
+def triple(value: int) -> int:
+    return value * 3
+''')
+        second = self.executor.get_execution_plan()
+        self.assertIsNot(second, first)
+
+        connection = data_pin(double, "output").connections[0]
+        self.graph.remove_connection(connection, use_command=False)
+        self.assertIsNot(self.executor.get_execution_plan(), second)
+
+    def test_execute_passes_values_through_plan(self):
+        """Executing the compiled plan produces the same results as direct traversal."""
+        self._make_chain()
+        self.executor.execute()
+        self.executor.execute()
+
+        log_text = self.log_widget.toPlainText()
+        self.assertEqual(log_text.count("result=40"), 2)
+
+    def test_reroute_on_data_connection_resolves_to_source(self):
+        """Inputs fed through a reroute node read the producing node's slot."""
+        source, double, sink = self._make_chain()
+        connection = data_pin(source, "output").connections[0]
+        reroute = self.graph.create_reroute_node_on_connection(connection, connection.path().pointAtPercent(0.5),
+                                                               use_command=False)
+        self.assertIsNotNone(reroute)
+
+        plan = ExecutionPlan(self.graph)
+        self.assertEqual(plan.pin_slots[reroute.output_pin], plan.pin_slots[data_pin(source, "output")])
+
+        self.executor.execute()
+        self.assertIn("result=40", self.log_widget.toPlainText())
+
+    def test_failed_node_skips_downstream_flow(self):
+        """A failing node prevents its downstream execution flow, like before."""
+        source, double, sink = self._make_chain()
+        double.set_code('''
+@node_entry
+def double(value: int) -> int:
+    raise ValueError("boom")
+''')
+        self.executor.execute()
+
+        log_text = self.log_widget.toPlainText()
+        self.assertIn("boom", log_text)
+        self.assertNotIn("--- Executing Node: Sink ---", log_text)
+
+    def test_execution_limit_truncates_plan(self):
+        """Plans stop growing once the execution limit is reached."""
+        self._make_chain()
+        plan = ExecutionPlan(self.graph, execution_limit=2)
+
+        self.assertEqual(len(plan.steps), 2)
+        self.assertTrue(plan.limit_reached)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for Chrome trace export of graph executions.
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+from tests.graph_fixtures import exec_pin, data_pin, GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.execution_trace import ExecutionTracer
+
+
+class TestExecutionTracer(unittest.TestCase):
+    """Test the tracer on its own."""
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = ExecutionTracer()
+        with tracer.span("node", "node") as span:
+            self.assertIsNone(span)
+        tracer.instant("hit", "cache")
+        self.assertEqual(tracer.event_count, 0)
+
+    def test_spans_and_event_cap(self):
+        tracer = ExecutionTracer(max_events=2)
+        tracer.enabled = True
+        with tracer.span("first", "node", {"uuid": "a"}) as span:
+            span.args["output_size"] = 10
+        with self.assertRaises(ValueError):
+            with tracer.span("second", "node"):
+                raise ValueError("boom")
+        tracer.instant("dropped", "cache")
+
+        trace = tracer.to_dict()
+        events = [e for e in trace["traceEvents"] if e["ph"] != "M"]
+        self.assertEqual([e["name"] for e in events], ["first", "second"])
+        self.assertEqual(events[0]["args"], {"uuid": "a", "output_size": 10})
+        self.assertIn("boom", events[1]["args"]["error"])
+        self.assertGreaterEqual(events[0]["dur"], 0)
+        self.assertEqual(trace["otherData"]["dropped_events"], 1)
+        self.assertTrue(any(e["name"] == "thread_name" for e in trace["traceEvents"]))
+
+
+class TestGraphTracing(GraphTestCase):
+    """Test traces recorded by GraphExecutor runs."""
+
+    def setUp(self):
+        super().setUp()
+        self.source = self._make_node("Source", '''
+@node_entry
+def source() -> list:
+    return list(range(100))
+''')
+        self.total = self._make_node("Total", '''
+@node_entry
+def total(values: list) -> int:
+    return sum(values)
+''')
+        self.graph.create_connection(exec_pin(self.source, "output"), exec_pin(self.total, "input"), use_command=False)
+        self.graph.create_connection(data_pin(self.source, "output"), data_pin(self.total, "input"), use_command=False)
+
+    def _exported_events(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            self.executor.export_trace(path)
+            with open(path, encoding="utf-8") as f:
+                return [e for e in json.load(f)["traceEvents"] if e["ph"] != "M"]
+
+    def test_off_by_default(self):
+        self.executor.execute()
+        self.assertEqual(self.executor.tracer.event_count, 0)
+
+    def test_batch_run_trace(self):
+        self.executor.set_tracing(True)
+        self.executor.execute()
+        events = self._exported_events()
+
+        node_spans = {e["name"]: e for e in events if e["cat"] == "node"}
+        self.assertEqual(set(node_spans), {"Source", "Total"})
+        self.assertEqual(node_spans["Source"]["args"]["uuid"], self.source.uuid)
+        self.assertGreater(node_spans["Total"]["args"]["input_size"], 0)
+        self.assertIn("output_size", node_spans["Source"]["args"])
+        self.assertEqual(len([e for e in events if e["cat"] == "gui"]), 2)
+        run = next(e for e in events if e["cat"] == "run")
+        self.assertEqual(run["args"]["mode"], "serial")
+        # Node spans sit inside the run span
+        for span in node_spans.values():
+            self.assertGreaterEqual(span["ts"], run["ts"])
+            self.assertLessEqual(span["ts"] + span["dur"], run["ts"] + run["dur"] + 1)
+
+    def test_cache_hits_and_live_mode(self):
+        self.executor.set_tracing(True)
+        self.executor.set_incremental_mode(True)
+        self.executor.execute()
+        self.executor.execute()
+        self.executor._execute_node_flow(self.source, {}, 0, 100)
+        events = self._exported_events()
+
+        cache_hits = [e["name"] for e in events if e["cat"] == "cache"]
+        self.assertEqual(cache_hits, ["Source", "Total"])
+        self.assertTrue(any(e["name"] == "live flow" for e in events))
+        self.assertEqual(len([e for e in events if e["cat"] == "node"]), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
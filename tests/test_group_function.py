@@ -0,0 +1,204 @@
+"""
+Tests for function groups: groups compiled into one callable step, with
+their interface inputs as parameters and member outputs as results.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import Mock
+
+from tests.graph_fixtures import chain_data
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from PySide6.QtWidgets import QApplication
+
+from core.group import Group
+from core.headless_graph import HeadlessGraph
+from data.flow_format import FlowFormatHandler
+from execution.graph_executor import GraphExecutor
+from execution.group_function import GroupFunction, compile_function_groups, function_group_signature
+
+EXAMPLE_PATH = os.path.join(os.path.dirname(src_path), "examples", "password_generator_tool_group.md")
+
+SOURCE_CODE = '''
+@node_entry
+def source(value: int) -> int:
+    return value
+'''
+
+DOUBLE_CODE = '''
+@node_entry
+def double(value: int) -> int:
+    print(f"doubling {value}")
+    return value * 2
+'''
+
+SPLIT_CODE = '''
+from typing import Tuple
+
+@node_entry
+def split(value: int) -> Tuple[int, int]:
+    return value // 10, value % 10
+'''
+
+ADD_CODE = '''
+@node_entry
+def add(a: int, b: int) -> int:
+    return a + b
+'''
+
+FAIL_CODE = '''
+@node_entry
+def fail(value: int) -> int:
+    raise ValueError("bad value")
+'''
+
+PID_CODE = '''
+import os
+
+@node_entry(isolate={isolate})
+def pid(value: int) -> int:
+    return os.getpid()
+'''
+
+
+def _graph_data(codes, members, flow=None, data=(), gui=None, is_function=True):
+    """Nodes n0..nN from ``codes``, exec chained in order unless ``flow`` is given, grouped by ``members``."""
+    graph_data = chain_data(codes, data=list(data), flow=flow, gui=gui)
+    graph_data["groups"] = [{"uuid": "group", "name": "Function",
+                             "member_node_uuids": [f"n{index}" for index in members], "is_function": is_function}]
+    return graph_data
+
+
+def _chain_data(is_function=True):
+    # n0 -> [n1 double, n2 split] -> n3 add(split outputs)
+    return _graph_data(
+        [SOURCE_CODE, DOUBLE_CODE, SPLIT_CODE, ADD_CODE], members=[1, 2],
+        data=[(0, "output_1", 1, "value"), (1, "output_1", 2, "value"),
+              (2, "output_1", 3, "a"), (2, "output_2", 3, "b")],
+        gui={0: {"value": 21}}, is_function=is_function)
+
+
+class TestGroupCompilation(unittest.TestCase):
+    """Test compiling groups into single plan steps."""
+
+    def _run(self, data, records=({},), outputs=None, incremental=False):
+        log = []
+        executor = GraphExecutor(HeadlessGraph(data), log, None)
+        executor.set_incremental_mode(incremental)
+        try:
+            results = executor.run_batch(list(records), outputs=outputs)
+        finally:
+            executor.shutdown()
+        return results, log, executor
+
+    def test_group_is_one_step_with_interface_parameters(self):
+        executor = GraphExecutor(HeadlessGraph(_chain_data()), [], None)
+        plan = executor.get_execution_plan()
+        self.assertEqual([step.node.title for step in plan.steps], ["Node 0", "Function", "Node 3"])
+        group = plan.steps[1].node
+        self.assertIsInstance(group, GroupFunction)
+        self.assertFalse(group.is_entry)
+        self.assertEqual([name for name, _ in plan.steps[1].inputs], ["_in0"])
+        self.assertEqual([name for name, _ in plan.steps[1].outputs], ["0:output_1", "1:output_1", "1:output_2"])
+        self.assertEqual([node.title for node in group.downstream], ["Node 3"])
+
+    def test_results_match_node_by_node(self):
+        outputs = ["Node 1", "Node 2", "Node 3"]
+        compiled, _, executor = self._run(_chain_data(True), outputs=outputs)
+        plain, _, _ = self._run(_chain_data(False), outputs=outputs)
+        self.assertEqual(compiled, plain)
+        self.assertEqual(compiled[0]["Node 3"], {"output_1": 4 + 2})
+        # One backend call for the whole group
+        self.assertIsNotNone(executor.profiler.get_profile("group"))
+        self.assertIsNone(executor.profiler.get_profile("n1"))
+
+    def test_record_overrides_reach_members(self):
+        results, _, _ = self._run(_chain_data(), records=[{"Node 1": {"value": 5}}], outputs=["Node 1"])
+        self.assertEqual(results[0]["Node 1"], {"output_1": 10})
+
+    def test_incremental_mode_memoizes_the_group(self):
+        log = []
+        executor = GraphExecutor(HeadlessGraph(_chain_data()), log, None)
+        executor.set_incremental_mode(True)
+        executor.execute()
+        log.clear()
+        executor.execute()
+        self.assertIn("CACHED: Node 'Function' is unchanged, reusing its previous result.", log)
+        self.assertNotIn("doubling 21", log)
+
+        executor.graph.nodes[0].gui_state["value"] = 3
+        log.clear()
+        executor.execute()
+        self.assertIn("doubling 3", log)
+
+    def test_member_error_names_member(self):
+        data = _graph_data([SOURCE_CODE, FAIL_CODE, DOUBLE_CODE], members=[1, 2],
+                           data=[(0, "output_1", 1, "value")], gui={0: {"value": 1}})
+        log = []
+        executor = GraphExecutor(HeadlessGraph(data), log, None)
+        executor.execute()
+        self.assertTrue(any("'Node 1' failed: ValueError: bad value" in line for line in log))
+        self.assertFalse(any(line.startswith("doubling") for line in log))
+
+    def test_flow_entering_midway_runs_node_by_node(self):
+        # n0 triggers n2, which is not the group's first node
+        data = _graph_data([SOURCE_CODE, DOUBLE_CODE, DOUBLE_CODE], members=[1, 2],
+                           flow=[(0, 1), (1, 2), (0, 2)], data=[(0, "output_1", 1, "value")],
+                           gui={0: {"value": 1}})
+        results, log, _ = self._run(data, outputs=["Node 1"])
+        self.assertEqual(results[0]["Node 1"], {"output_1": 2})
+        self.assertIn("[GROUP] 'Function' runs node by node: execution enters the group at 'Node 2', "
+                      "which is not one of its first nodes", log)
+
+    def test_graph_without_group_list_has_no_function_groups(self):
+        # Graph stand-ins (a Mock, say) may have no real list of groups
+        graph = Mock(nodes=[], structure_revision=0)
+        self.assertEqual(function_group_signature(graph), ())
+        self.assertEqual(compile_function_groups(graph), ([], []))
+
+    def test_group_runs_in_one_worker(self):
+        data = _graph_data([SOURCE_CODE, PID_CODE.format(isolate=True), PID_CODE.format(isolate=False)],
+                           members=[1, 2], data=[(0, "output_1", 1, "value"), (0, "output_1", 2, "value")],
+                           gui={0: {"value": 1}})
+        results, _, _ = self._run(data, outputs=["Node 1", "Node 2"])
+        pids = {results[0]["Node 1"]["output_1"], results[0]["Node 2"]["output_1"]}
+        self.assertEqual(len(pids), 1)
+        self.assertNotIn(os.getpid(), pids)
+
+    def test_password_generator_group(self):
+        with open(EXAMPLE_PATH, encoding="utf-8") as f:
+            data = FlowFormatHandler().markdown_to_data(f.read())
+        data["groups"][0]["is_function"] = True
+        results, log, executor = self._run(
+            data, records=[{"Password Configuration": {"length": 30}}],
+            outputs=["Password Generator Engine", "Password Output & Copy"])
+        self.assertEqual(len(executor.get_execution_plan().steps), 3)
+        self.assertEqual(len(results[0]["Password Generator Engine"]["password"]), 30)
+        self.assertIn("Password Output & Copy", results[0])
+
+
+class TestFunctionGroupItem(unittest.TestCase):
+    """Test the editor's Group item keeping its function flag."""
+
+    @classmethod
+    def setUpClass(cls):
+        if QApplication.instance() is None:
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_flag_survives_serialization(self):
+        group = Group("Tools", ["a", "b"])
+        self.assertFalse(group.is_function)
+        group.is_function = True
+        self.assertTrue(Group.deserialize(group.serialize()).is_function)
+        self.assertFalse(Group.deserialize({"name": "Old"}).is_function)
+
+
+if __name__ == '__main__':
+    unittest.main()
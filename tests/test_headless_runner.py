@@ -0,0 +1,124 @@
+"""
+Tests for the Qt-free headless runner and its command line (src/cli.py).
+"""
+
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from core.headless_graph import HeadlessGraph
+from core.node_signature import parse_node_signature
+from data.flow_format import FlowFormatHandler
+from execution.headless_runner import HeadlessRunner
+
+CLI_PATH = os.path.join(src_path, 'cli.py')
+EXAMPLE_PATH = os.path.join(os.path.dirname(src_path), 'examples', 'password_generator_tool_group.md')
+
+GRAPH_DATA = {
+    "graph_title": "Headless Test",
+    "nodes": [
+        {
+            "uuid": "source", "title": "Source", "pos": [0, 0], "size": [200, 150],
+            "code": "@node_entry\ndef source(count: int) -> int:\n    print(f'count is {count}')\n    return count",
+            "gui_state": {"count": 3},
+        },
+        {"uuid": "reroute", "title": "", "pos": [0, 0], "is_reroute": True},
+        {
+            "uuid": "scale", "title": "Scale", "pos": [0, 0], "size": [200, 150],
+            "code": ("from typing import Tuple\n\n@node_entry\ndef scale(value: int, factor: int) -> Tuple[int, str]:\n"
+                     "    '''@outputs: scaled, label'''\n"
+                     "    return value * factor, f'x{factor}'"),
+            "gui_state": {"factor": 2},
+        },
+    ],
+    "connections": [
+        {"start_node_uuid": "source", "start_pin_name": "exec_out", "end_node_uuid": "scale", "end_pin_name": "exec_in"},
+        {"start_node_uuid": "source", "start_pin_name": "output_1", "end_node_uuid": "reroute", "end_pin_name": "input"},
+        {"start_node_uuid": "reroute", "start_pin_name": "output", "end_node_uuid": "scale", "end_pin_name": "value"},
+    ],
+}
+
+
+class TestHeadlessRunner(unittest.TestCase):
+    """Test running graph data without Qt."""
+
+    def test_signature_matches_pin_parsing(self):
+        signature = parse_node_signature(GRAPH_DATA["nodes"][2]["code"])
+        self.assertEqual(signature.function_name, "scale")
+        self.assertEqual(signature.inputs, {"value": "int", "factor": "int"})
+        self.assertEqual(signature.outputs, {"scaled": "int", "label": "str"})
+        self.assertIsNone(parse_node_signature("def helper():\n    pass"))
+
+    def test_runs_with_gui_state_and_overrides(self):
+        outputs = []
+        runner = HeadlessRunner(HeadlessGraph(GRAPH_DATA), on_output=lambda node, text: outputs.append(text))
+        try:
+            self.assertEqual(runner.run(), {"Scale": {"scaled": 6, "label": "x2"}})
+            self.assertEqual(runner.run({"Source": {"count": 5}, "scale": {"factor": 10}}),
+                             {"Scale": {"scaled": 50, "label": "x10"}})
+        finally:
+            runner.shutdown()
+        self.assertEqual(outputs, ["count is 3", "count is 5"])
+        self.assertEqual(runner.errors, [])
+
+    def test_node_error_is_reported(self):
+        runner = HeadlessRunner(HeadlessGraph(GRAPH_DATA))
+        try:
+            self.assertEqual(runner.run({"Scale": {"factor": None}}, outputs=["Source"]),
+                             {"Source": {"output_1": 3}})
+        finally:
+            runner.shutdown()
+        self.assertEqual(len(runner.errors), 1)
+        self.assertIn("Scale", runner.errors[0])
+
+
+class TestCommandLine(unittest.TestCase):
+    """Test the command line in a fresh interpreter."""
+
+    def setUp(self):
+        handle, self.graph_path = tempfile.mkstemp(suffix=".md")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write(FlowFormatHandler().data_to_markdown(GRAPH_DATA, "Headless Test"))
+
+    def tearDown(self):
+        os.remove(self.graph_path)
+
+    def _run_cli(self, *args):
+        return subprocess.run([sys.executable, CLI_PATH, "run", self.graph_path, *args],
+                              capture_output=True, text=True, timeout=60)
+
+    def test_run_prints_json_outputs(self):
+        completed = self._run_cli("--set", "Source.count=4", "--set", "Scale.factor=3", "--timings")
+        self.assertEqual(completed.returncode, 0, completed.stderr)
+        self.assertEqual(json.loads(completed.stdout), {"Scale": {"scaled": 12, "label": "x3"}})
+        self.assertIn("[Source] count is 4", completed.stderr)
+        self.assertIn("[TIMINGS] startup", completed.stderr)
+
+    def test_failed_node_sets_exit_status(self):
+        completed = self._run_cli("--set", "Scale.factor=null", "--quiet")
+        self.assertEqual(completed.returncode, 1)
+        self.assertIn("EXECUTION ERROR", completed.stderr)
+
+    def test_startup_is_qt_free_and_within_budget(self):
+        # The interval `run --timings` reports as startup: importing cli and loading the graph
+        script = ("import sys, time; start = time.perf_counter(); import cli; "
+                  "runner = cli.HeadlessRunner.from_file(sys.argv[1]); startup_time = time.perf_counter() - start; "
+                  "runner.shutdown(); "
+                  "print(startup_time, cli.STARTUP_BUDGET, 'PySide6' in sys.modules, 'asyncio' in sys.modules)")
+        completed = subprocess.run([sys.executable, "-c", script, EXAMPLE_PATH], cwd=src_path,
+                                   capture_output=True, text=True, timeout=60)
+        startup_time, budget, qt_loaded, asyncio_loaded = completed.stdout.split()
+        self.assertEqual(qt_loaded, "False")
+        self.assertEqual(asyncio_loaded, "False")
+        self.assertLess(float(startup_time), float(budget))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+"""
+Tests for incremental re-execution, where GraphExecutor reuses the results of
+nodes whose code, GUI values and upstream results have not changed.
+"""
+
+import unittest
+import sys
+import os
+import threading
+from unittest.mock import Mock
+
+from tests.graph_fixtures import GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.result_memo import ResultMemo, value_fingerprint
+
+STAGE_CODE = '''
+@node_entry
+def {name}(value: int) -> int:
+    print("ran {name}")
+    return value + {offset}
+'''
+
+
+class TestIncrementalExecution(GraphTestCase):
+    """Test memoized node outputs and dirty propagation."""
+
+    def setUp(self):
+        super().setUp()
+        self.executor.set_incremental_mode(True)
+
+    def _make_chain(self):
+        source = self._make_node("Source", '''
+@node_entry
+def source() -> int:
+    print("ran source")
+    return 1
+''')
+        middle = self._make_node("Middle", STAGE_CODE.format(name="middle", offset=10))
+        tail = self._make_node("Tail", STAGE_CODE.format(name="tail", offset=100))
+        self._connect(source, middle)
+        self._connect(middle, tail)
+        return source, middle, tail
+
+    def _run(self):
+        self.log_widget.clear()
+        self.executor.execute()
+        return self.log_widget.toPlainText()
+
+    def test_unchanged_graph_reuses_every_result(self):
+        self._make_chain()
+        first = self._run()
+        self.assertIn("ran tail", first)
+
+        second = self._run()
+        self.assertNotIn("ran ", second)
+        self.assertEqual(self.executor.result_memo.hits, 3)
+        self.assertIn("[INCREMENTAL] 0 of 3 nodes re-executed", second)
+
+    def test_edit_reruns_node_and_downstream_only(self):
+        source, middle, tail = self._make_chain()
+        self._run()
+
+        middle.set_code(STAGE_CODE.format(name="middle", offset=20))
+        log_text = self._run()
+
+        self.assertNotIn("ran source", log_text)
+        self.assertIn("ran middle", log_text)
+        self.assertIn("ran tail", log_text)
+        self.assertEqual(self.executor.result_memo.hits, 1)
+
+    def test_tail_edit_keeps_upstream_cached(self):
+        source, middle, tail = self._make_chain()
+        self._run()
+
+        tail.set_code(STAGE_CODE.format(name="tail", offset=1000))
+        log_text = self._run()
+
+        self.assertNotIn("ran source", log_text)
+        self.assertNotIn("ran middle", log_text)
+        self.assertIn("ran tail", log_text)
+
+    def test_cached_results_still_reach_downstream(self):
+        source, middle, tail = self._make_chain()
+        sink = self._make_node("Sink", '''
+@node_entry
+def sink(value: int):
+    print(f"sink got {value}")
+''')
+        self._connect(tail, sink)
+        self._run()
+
+        sink.set_code(sink.code.replace("sink got", "sink received"))
+        log_text = self._run()
+        self.assertIn("sink received 111", log_text)
+
+    def test_invalidate_results_forces_rerun(self):
+        source, middle, tail = self._make_chain()
+        self._run()
+
+        self.executor.invalidate_results(source)
+        log_text = self._run()
+        self.assertIn("ran source", log_text)
+        # Same code and inputs give the same fingerprint, so downstream stays cached
+        self.assertNotIn("ran middle", log_text)
+
+    def test_failed_nodes_are_not_memoized(self):
+        source = self._make_node("Source", '''
+@node_entry
+def source() -> int:
+    raise ValueError("boom")
+''')
+        self._run()
+        log_text = self._run()
+        self.assertIn("boom", log_text)
+        self.assertEqual(len(self.executor.result_memo), 0)
+
+    def test_parallel_mode_uses_memo(self):
+        self._make_chain()
+        self.executor.set_parallel_mode(True)
+        self._run()
+        log_text = self._run()
+        self.assertNotIn("ran ", log_text)
+        self.assertEqual(self.executor.result_memo.hits, 3)
+
+    def test_disabling_clears_memo(self):
+        self._make_chain()
+        self._run()
+        self.executor.set_incremental_mode(False)
+        self.assertEqual(len(self.executor.result_memo), 0)
+        self.assertIn("ran source", self._run())
+
+
+class TestResultMemo(unittest.TestCase):
+    """Test fingerprinting in the memo on its own."""
+
+    def test_unpicklable_input_is_always_a_miss(self):
+        memo = ResultMemo()
+        memo.begin_run(Mock(slot_count=0))
+        step = Mock(inputs=[], outputs=[])
+        step.node = Mock(code="def f(lock): pass", function_name="f", uuid="node")
+        self.assertIsNotNone(value_fingerprint([1, 2]))
+        self.assertIsNone(value_fingerprint(threading.Lock()))
+
+        fingerprint = memo.fingerprint(step, {"lock": threading.Lock()}, [])
+        self.assertIsNone(fingerprint)
+        self.assertIsNone(memo.lookup(step, fingerprint))
+        self.assertEqual(memo.misses, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
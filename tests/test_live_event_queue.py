@@ -0,0 +1,196 @@
+"""
+Tests for the live-mode event queue: coalescing, priorities, debounce and
+throttle windows, timer sources and their wiring into LiveGraphExecutor.
+"""
+
+import unittest
+import sys
+import os
+import time
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from PySide6.QtWidgets import QApplication, QSlider
+
+from core.event_system import EventType, GraphEvent, LiveEventQueue, LiveGraphExecutor, TimerSource
+from core.headless_graph import HeadlessGraph
+from core.node_signature import parse_node_signature
+
+TICKER_CODE = '''
+@node_entry(live_rate=50)
+def tick() -> int:
+    return 1
+'''
+
+SLIDER_CODE = '''
+@node_entry(live_on_change=True)
+def level() -> int:
+    return 1
+'''
+
+
+class _Source:
+    def __init__(self, uuid):
+        self.uuid = uuid
+        self.title = uuid
+
+
+def _pump(condition, timeout=2.0):
+    """Process Qt events until ``condition()`` holds or ``timeout`` passes."""
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.001)
+
+
+class TestLiveEventQueue(unittest.TestCase):
+    """Test coalescing, ordering and rate windows of LiveEventQueue."""
+
+    @classmethod
+    def setUpClass(cls):
+        if QApplication.instance() is None:
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def setUp(self):
+        self.handled = []
+        self.queue = LiveEventQueue(self.handled.append)
+
+    def test_dispatch_happens_outside_the_posting_call(self):
+        self.queue.post(GraphEvent(EventType.BUTTON_CLICK, _Source("a")))
+        self.assertEqual(self.handled, [])
+        _pump(lambda: self.handled)
+        self.assertEqual(len(self.handled), 1)
+
+    def test_latest_value_wins(self):
+        slider = _Source("slider")
+        for value in range(100):
+            self.queue.post(GraphEvent(EventType.VALUE_CHANGED, slider, {"value": value}))
+        _pump(lambda: not self.queue.pending_count)
+
+        self.assertEqual([event.data["value"] for event in self.handled], [99])
+        self.assertEqual(self.handled[0].merged, 99)
+        self.assertEqual(self.queue.stats(), {'posted': 100, 'dispatched': 1, 'merged': 99,
+                                              'dropped': 0, 'pending': 0})
+
+    def test_priority_order(self):
+        self.queue.post(GraphEvent(EventType.TIMER_TICK, _Source("timer")))
+        self.queue.post(GraphEvent(EventType.VALUE_CHANGED, _Source("slider")))
+        self.queue.post(GraphEvent(EventType.BUTTON_CLICK, _Source("button")))
+        _pump(lambda: len(self.handled) == 3)
+        self.assertEqual([event.event_type for event in self.handled],
+                         [EventType.BUTTON_CLICK, EventType.VALUE_CHANGED, EventType.TIMER_TICK])
+
+    def test_debounce_waits_for_quiet_source(self):
+        self.queue.set_debounce(EventType.USER_INPUT, 0.1)
+        field = _Source("field")
+        for value in range(5):
+            self.queue.post(GraphEvent(EventType.USER_INPUT, field, {"value": value}))
+            _pump(lambda: False, timeout=0.02)
+        self.assertEqual(self.handled, [])
+
+        _pump(lambda: self.handled)
+        self.assertEqual([event.data["value"] for event in self.handled], [4])
+
+    def test_throttle_spaces_dispatches_and_keeps_last_value(self):
+        self.queue.set_throttle(EventType.VALUE_CHANGED, 0.1, node_uuid="slider")
+        slider = _Source("slider")
+        start_time = time.perf_counter()
+        value = 0
+        while time.perf_counter() - start_time < 0.35:
+            self.queue.post(GraphEvent(EventType.VALUE_CHANGED, slider, {"value": value}))
+            value += 1
+            _pump(lambda: False, timeout=0.005)
+        _pump(lambda: not self.queue.pending_count)
+
+        self.assertGreaterEqual(len(self.handled), 3)
+        self.assertLessEqual(len(self.handled), 5)
+        self.assertEqual(self.handled[-1].data["value"], value - 1)
+        for earlier, later in zip(self.handled, self.handled[1:]):
+            self.assertGreaterEqual(later.timestamp - earlier.timestamp, 0.0)
+
+    def test_lowest_priority_dropped_beyond_bound(self):
+        queue = LiveEventQueue(self.handled.append, max_pending=2)
+        queue.post(GraphEvent(EventType.TIMER_TICK, _Source("old tick")))
+        queue.post(GraphEvent(EventType.TIMER_TICK, _Source("new tick")))
+        queue.post(GraphEvent(EventType.BUTTON_CLICK, _Source("button")))
+        _pump(lambda: not queue.pending_count)
+
+        self.assertEqual([event.source_node.uuid for event in self.handled], ["button", "new tick"])
+        self.assertEqual(queue.dropped, 1)
+
+    def test_timer_source_reports_missed_ticks(self):
+        def slow_handler(event):
+            self.handled.append(event)
+            time.sleep(0.1)
+
+        queue = LiveEventQueue(slow_handler)
+        source = TimerSource(_Source("dashboard"), 50, queue)
+        source.start()
+        _pump(lambda: len(self.handled) >= 3)
+        source.stop()
+
+        self.assertGreater(source.missed, 0)
+        self.assertGreaterEqual(queue.dropped, source.missed)
+
+
+class TestLiveSources(unittest.TestCase):
+    """Test live-mode sources declared with @node_entry options."""
+
+    @classmethod
+    def setUpClass(cls):
+        if QApplication.instance() is None:
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_options_are_parsed(self):
+        self.assertEqual(parse_node_signature(TICKER_CODE).live_rate, 50.0)
+        self.assertTrue(parse_node_signature(SLIDER_CODE).live_on_change)
+        self.assertIsNone(parse_node_signature(SLIDER_CODE).live_rate)
+
+    def _live_executor(self, code):
+        graph = HeadlessGraph({"nodes": [{"uuid": "n0", "title": "Source", "code": code}], "connections": []})
+        log = []
+        live_executor = LiveGraphExecutor(graph, log, None)
+        flows = []
+        live_executor._execute_node_flow_live = flows.append
+        return graph.nodes[0], live_executor, flows, log
+
+    def test_timer_source_runs_flow_while_live(self):
+        node, live_executor, flows, log = self._live_executor(TICKER_CODE)
+        live_executor.set_live_mode(True)
+        try:
+            _pump(lambda: len(flows) >= 3)
+        finally:
+            live_executor.set_live_mode(False)
+            live_executor.shutdown()
+
+        self.assertGreaterEqual(len(flows), 3)
+        self.assertTrue(all(flow is node for flow in flows))
+        self.assertIn("Timer source on 'Source' at 50 Hz", log)
+        self.assertTrue(any(line.startswith("[EVENTS]") for line in log))
+
+    def test_slider_drag_coalesces_into_few_runs(self):
+        node, live_executor, flows, _ = self._live_executor(SLIDER_CODE)
+        slider = QSlider()
+        slider.setRange(0, 100)
+        node.gui_widgets = {"level": slider}
+        live_executor.set_live_mode(True)
+        try:
+            for value in range(1, 51):
+                slider.setValue(value)
+            _pump(lambda: not live_executor.event_queue.pending_count)
+        finally:
+            live_executor.set_live_mode(False)
+            live_executor.shutdown()
+
+        self.assertEqual(len(flows), 1)
+        self.assertEqual(live_executor.event_queue.merged, 49)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests for the buffered output log: ring buffer, rate-limited flushing and the
+virtualized list view.
+"""
+
+import unittest
+import sys
+import os
+import threading
+import time
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from PySide6.QtWidgets import QApplication, QTextEdit
+
+from ui.utils.log_sink import LogRingBuffer, LogSink, LogView
+
+
+class TestLogRingBuffer(unittest.TestCase):
+    """Test the fixed-capacity line buffer."""
+
+    def test_oldest_lines_fall_out(self):
+        lines = LogRingBuffer(3)
+        lines.extend(["a", "b"])
+        lines.extend(["c", "d"])
+        self.assertEqual(list(lines), ["b", "c", "d"])
+        self.assertEqual(lines[0], "b")
+        self.assertEqual(lines[-1], "d")
+        self.assertEqual(lines.dropped, 1)
+
+    def test_drop_oldest_and_clear(self):
+        lines = LogRingBuffer(4)
+        lines.extend(["a", "b", "c"])
+        lines.drop_oldest(2)
+        self.assertEqual(list(lines), ["c"])
+        lines.clear()
+        self.assertEqual(len(lines), 0)
+        with self.assertRaises(IndexError):
+            lines[0]
+
+
+class TestLogSink(unittest.TestCase):
+    """Test buffering and flushing to the model and a text widget."""
+
+    @classmethod
+    def setUpClass(cls):
+        if QApplication.instance() is None:
+            cls.app = QApplication(sys.argv)
+        else:
+            cls.app = QApplication.instance()
+
+    def test_appends_are_batched_until_flush(self):
+        widget = QTextEdit()
+        sink = LogSink(widget)
+        sink.append("--- Executing Node: A ---")
+        sink.append("line 1\nline 2")
+
+        self.assertEqual(sink.pending_count, 3)
+        self.assertEqual(sink.model.rowCount(), 0)
+        self.assertEqual(widget.toPlainText(), "")
+
+        sink.flush()
+        self.assertEqual(sink.model.rowCount(), 3)
+        self.assertEqual(widget.toPlainText(), "--- Executing Node: A ---\nline 1\nline 2")
+
+    def test_timer_flushes_at_frame_rate(self):
+        sink = LogSink(max_fps=100)
+        sink.append("hello")
+        deadline = time.perf_counter() + 2
+        while sink.pending_count and time.perf_counter() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.005)
+        self.assertEqual(sink.pending_count, 0)
+        self.assertEqual(sink.toPlainText(), "hello")
+
+    def test_cap_keeps_newest_lines(self):
+        sink = LogSink(max_lines=5)
+        for i in range(4):
+            sink.append(f"early {i}")
+        sink.flush()
+        for i in range(8):
+            sink.append(f"late {i}")
+
+        self.assertEqual(sink.toPlainText().splitlines(), [f"late {i}" for i in range(3, 8)])
+        self.assertEqual(sink.model.rowCount(), 5)
+        self.assertEqual(sink.lines.dropped, 7)
+
+    def test_append_from_worker_threads(self):
+        sink = LogSink()
+        workers = [threading.Thread(target=lambda: [sink.append("x") for _ in range(1000)]) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        QApplication.processEvents()
+        self.assertEqual(len(sink.toPlainText().splitlines()), 4000)
+
+    def test_clear(self):
+        widget = QTextEdit()
+        sink = LogSink(widget)
+        sink.append("shown")
+        sink.flush()
+        sink.append("queued")
+        sink.clear()
+        self.assertEqual(sink.toPlainText(), "")
+        self.assertEqual(widget.toPlainText(), "")
+
+    def test_view_handles_a_million_lines(self):
+        sink = LogSink()
+        view = LogView(sink)
+        view.resize(400, 300)
+
+        start_time = time.perf_counter()
+        for chunk in range(10):
+            sink.append("\n".join(f"line {chunk * 100000 + i}" for i in range(100000)))
+            sink.flush()
+            QApplication.processEvents()
+        elapsed = time.perf_counter() - start_time
+
+        self.assertEqual(view.model().rowCount(), 1_000_000)
+        self.assertEqual(view.model().index(999_999, 0).data(), "line 999999")
+        self.assertLess(elapsed, 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
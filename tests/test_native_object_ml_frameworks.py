@@ -389,60 +389,62 @@ class TestFrameworkAutoImport(unittest.TestCase):
         self.executor.reset_namespace()
         gc.collect()
     
-    def test_numpy_auto_import_availability(self):
-        """Test numpy automatically available in namespace."""
+    def _use_in_node(self, name):
+        """Run a node that refers to ``name`` without importing it."""
+        node = Mock()
+        node.title = f"Uses {name}"
+        node.function_name = "use"
+        node.code = f"@node_entry\ndef use() -> str:\n    return {name}.__name__\n"
+        result, _ = self.executor.execute_node(node, {})
+        return result
+    
+    def test_numpy_imported_on_first_use(self):
+        """Test numpy imported into the namespace once a node uses it."""
         try:
             import numpy
         except ImportError:
             self.skipTest("NumPy not available on system")
         
-        # Check if numpy is in namespace after initialization
-        self.assertIn('numpy', self.executor.namespace)
-        self.assertIn('np', self.executor.namespace)
-        
-        # Verify it's the actual numpy module
+        # Nothing heavy is imported up front
+        self.assertNotIn('numpy', self.executor.namespace)
+        self.assertEqual(self._use_in_node('np'), 'numpy')
+        self.assertIs(self.executor.namespace['np'], numpy)
+        self.assertEqual(self._use_in_node('numpy'), 'numpy')
         self.assertIs(self.executor.namespace['numpy'], numpy)
+        self.assertIn('numpy', self.executor.get_import_report())
     
-    def test_pandas_auto_import_availability(self):
-        """Test pandas automatically available in namespace."""
+    def test_pandas_imported_on_first_use(self):
+        """Test pandas imported into the namespace once a node uses it."""
         try:
             import pandas
         except ImportError:
             self.skipTest("Pandas not available on system")
         
-        # Check if pandas is in namespace after initialization  
-        self.assertIn('pandas', self.executor.namespace)
-        self.assertIn('pd', self.executor.namespace)
-        
-        # Verify it's the actual pandas module
-        self.assertIs(self.executor.namespace['pandas'], pandas)
+        self.assertNotIn('pandas', self.executor.namespace)
+        self.assertEqual(self._use_in_node('pd'), 'pandas')
+        self.assertIs(self.executor.namespace['pd'], pandas)
     
-    def test_torch_auto_import_availability(self):
-        """Test torch automatically available in namespace."""
+    def test_torch_imported_on_first_use(self):
+        """Test torch imported into the namespace once a node uses it."""
         try:
             import torch
         except ImportError:
             self.skipTest("PyTorch not available on system")
         
-        # Check if torch is in namespace after initialization
-        self.assertIn('torch', self.executor.namespace)
-        
-        # Verify it's the actual torch module  
+        self.assertNotIn('torch', self.executor.namespace)
+        self.assertEqual(self._use_in_node('torch'), 'torch')
         self.assertIs(self.executor.namespace['torch'], torch)
     
-    def test_tensorflow_auto_import_availability(self):
-        """Test tensorflow automatically available in namespace."""
+    def test_tensorflow_imported_on_first_use(self):
+        """Test tensorflow imported into the namespace once a node uses it."""
         try:
             import tensorflow
         except ImportError:
             self.skipTest("TensorFlow not available on system")
         
-        # Check if tensorflow is in namespace after initialization
-        self.assertIn('tensorflow', self.executor.namespace)
-        self.assertIn('tf', self.executor.namespace)
-        
-        # Verify it's the actual tensorflow module
-        self.assertIs(self.executor.namespace['tensorflow'], tensorflow)
+        self.assertNotIn('tensorflow', self.executor.namespace)
+        self.assertEqual(self._use_in_node('tf'), 'tensorflow')
+        self.assertIs(self.executor.namespace['tf'], tensorflow)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+"""
+Tests for node fusion: linear chains of small nodes inlined into one
+compiled step, with per-node profiles and errors preserved.
+"""
+
+import unittest
+import sys
+import os
+import time
+
+from tests.graph_fixtures import chain_data
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from core.headless_graph import HeadlessGraph
+from execution.graph_executor import GraphExecutor
+from execution.headless_runner import HeadlessRunner
+from execution.node_fusion import FusedChain, fuse_chains, is_fusable
+
+SOURCE_CODE = '''
+@node_entry
+def source(value: int) -> int:
+    return value
+'''
+
+INCREMENT_CODE = '''
+@node_entry
+def increment(value: int) -> int:
+    return value + 1
+'''
+
+FORMAT_CODE = '''
+@node_entry
+def format_value(value: int, prefix: str) -> str:
+    print(f"formatting {value}")
+    return f"{prefix}{value}"
+'''
+
+FAIL_CODE = '''
+@node_entry
+def fail(value: int) -> int:
+    raise ValueError(f"bad value {value}")
+'''
+
+PROCESS_CODE = '''
+@node_entry(process=True)
+def work(value: int) -> int:
+    return value
+'''
+
+
+def _executor(data, fuse=True):
+    executor = GraphExecutor(HeadlessGraph(data), [], None)
+    executor.set_fusion_mode(fuse)
+    return executor
+
+
+class TestChainDetection(unittest.TestCase):
+    """Test finding maximal fusable chains."""
+
+    def _titles(self, data):
+        return [[member.title for member in chain.members] for chain in fuse_chains(HeadlessGraph(data))]
+
+    def test_linear_chain_is_one_step(self):
+        data = chain_data([SOURCE_CODE] + [INCREMENT_CODE] * 3, gui={0: {"value": 1}})
+        self.assertEqual(self._titles(data), [["Node 0", "Node 1", "Node 2", "Node 3"]])
+        plan = _executor(data).get_execution_plan()
+        self.assertEqual(len(plan.steps), 1)
+        self.assertIsInstance(plan.steps[0].node, FusedChain)
+        self.assertEqual(plan.steps[0].node.title, "Node 0 > Node 1 > Node 2 > Node 3")
+
+    def test_branching_flow_ends_chains(self):
+        # n1 triggers both n2 and n3
+        data = chain_data([SOURCE_CODE] + [INCREMENT_CODE] * 3, flow=[(0, 1), (1, 2), (1, 3)],
+                           data=[(0, "output_1", 1, "value"), (1, "output_1", 2, "value"),
+                                 (1, "output_1", 3, "value")])
+        self.assertEqual(self._titles(data), [["Node 0", "Node 1"]])
+
+    def test_output_read_elsewhere_ends_chain(self):
+        # n0's value is also read by n2, so n0 -> n1 cannot be fused
+        data = chain_data([SOURCE_CODE, INCREMENT_CODE, FORMAT_CODE],
+                           data=[(0, "output_1", 1, "value"), (1, "output_1", 2, "value"),
+                                 (0, "output_1", 2, "prefix")])
+        self.assertEqual(self._titles(data), [["Node 1", "Node 2"]])
+
+    def test_worker_and_gui_nodes_are_not_fused(self):
+        data = chain_data([SOURCE_CODE, PROCESS_CODE, INCREMENT_CODE, INCREMENT_CODE])
+        self.assertEqual(self._titles(data), [["Node 2", "Node 3"]])
+
+        node = HeadlessGraph(data).nodes[2]
+        self.assertTrue(is_fusable(node))
+        node.gui_get_values_code = "def set_values(widgets, outputs): pass"
+        node.gui_widgets = {"result": object()}
+        self.assertFalse(is_fusable(node))
+
+    def test_function_group_members_are_not_fused(self):
+        data = chain_data([SOURCE_CODE] + [INCREMENT_CODE] * 3)
+        data["groups"] = [{"uuid": "group", "name": "Group", "member_node_uuids": ["n2", "n3"],
+                           "is_function": True}]
+        plan = _executor(data).get_execution_plan()
+        self.assertEqual([step.node.title for step in plan.steps], ["Node 0 > Node 1", "Group"])
+
+    def test_isolated_mode_turns_fusion_off(self):
+        executor = _executor(chain_data([SOURCE_CODE, INCREMENT_CODE]))
+        self.assertEqual(len(executor.get_execution_plan().steps), 1)
+        executor.set_isolated_mode(True)
+        self.assertEqual(len(executor.get_execution_plan().steps), 2)
+
+
+class TestFusedExecution(unittest.TestCase):
+    """Test running fused chains against running their nodes one by one."""
+
+    def _data(self):
+        # n0 -> n1 -> n2 -> n3 fused, then a branch from n3 ends the chain
+        return chain_data(
+            [SOURCE_CODE, INCREMENT_CODE, INCREMENT_CODE, INCREMENT_CODE, FORMAT_CODE, INCREMENT_CODE],
+            flow=[(0, 1), (1, 2), (2, 3), (3, 4), (3, 5)],
+            data=[(0, "output_1", 1, "value"), (1, "output_1", 2, "value"), (2, "output_1", 3, "value"),
+                  (3, "output_1", 4, "value"), (3, "output_1", 5, "value")],
+            gui={0: {"value": 1}, 4: {"prefix": "#"}})
+
+    def test_results_match_node_by_node(self):
+        records = [{"Node 0": {"value": value}} for value in range(5)]
+        fused = _executor(self._data()).run_batch(records)
+        plain = _executor(self._data(), fuse=False).run_batch(records)
+        self.assertEqual(fused, plain)
+        self.assertEqual(fused[2], {"Node 4": {"output_1": "#5"}, "Node 5": {"output_1": 6}})
+
+    def test_member_profiles_are_kept(self):
+        executor = _executor(self._data())
+        executor.execute()
+        executor.execute()
+        stats = executor.profiler.get_stats()
+        self.assertEqual(sorted(stats), [f"n{index}" for index in range(6)])
+        self.assertEqual(stats["n2"]["calls"], 2)
+        self.assertEqual(stats["n2"]["wall_time"]["count"], 2)
+        self.assertIn("Node 2", executor.single_process_executor.execution_times)
+        self.assertIn("formatting 4", executor.log)
+
+    def test_error_names_the_member(self):
+        codes = [SOURCE_CODE, INCREMENT_CODE, FAIL_CODE, INCREMENT_CODE]
+        fused = _executor(chain_data(codes, gui={0: {"value": 1}}))
+        plain = _executor(chain_data(codes, gui={0: {"value": 1}}), fuse=False)
+        fused.execute()
+        plain.execute()
+        self.assertIn("ERROR in node 'Node 2': bad value 2", fused.log)
+        self.assertIn("ERROR in node 'Node 2': bad value 2", plain.log)
+        stats = fused.profiler.get_stats()
+        self.assertEqual((stats["n1"]["errors"], stats["n2"]["errors"]), (0, 1))
+        self.assertNotIn("n3", stats)
+
+    def test_incremental_mode_reuses_the_chain(self):
+        executor = _executor(self._data())
+        executor.set_incremental_mode(True)
+        executor.execute()
+        executor.log.clear()
+        executor.execute()
+        self.assertIn("CACHED: Node 'Node 0 > Node 1 > Node 2 > Node 3' is unchanged, "
+                      "reusing its previous result.", executor.log)
+
+    def test_parallel_mode(self):
+        executor = _executor(self._data())
+        executor.set_parallel_mode(True, max_workers=2)
+        executor.execute()
+        self.assertIn("formatting 4", executor.log)
+
+    def test_headless_runner(self):
+        runner = HeadlessRunner(HeadlessGraph(self._data()), fuse=True)
+        try:
+            results = runner.run({"Node 0": {"value": 10}})
+        finally:
+            runner.shutdown()
+        self.assertEqual(results, {"Node 4": {"output_1": "#13"}, "Node 5": {"output_1": 14}})
+        self.assertEqual(len(runner._plan.fused_chains), 1)
+
+    def test_long_chain_of_tiny_nodes(self):
+        data = chain_data([SOURCE_CODE] + [INCREMENT_CODE] * 199, gui={0: {"value": 0}})
+        durations = {}
+        for fuse in (False, True):
+            executor = _executor(data, fuse)
+            executor.execute()
+            start_time = time.perf_counter()
+            for _ in range(5):
+                executor.execute()
+            durations[fuse] = (time.perf_counter() - start_time) / 5
+            self.assertEqual(executor.run_batch([{}], outputs=["Node 199"]), [{"Node 199": {"output_1": 199}}])
+        print(f"\n200 tiny nodes: {durations[False] * 1e3:.2f}ms node by node, {durations[True] * 1e3:.2f}ms fused")
+
+
+if __name__ == '__main__':
+    unittest.main()
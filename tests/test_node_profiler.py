@@ -0,0 +1,120 @@
+"""
+Tests for per-node profiling: wall and CPU time, allocations, output size and
+call counts recorded per node UUID across runs.
+"""
+
+import unittest
+import sys
+import os
+import json
+import tempfile
+from unittest.mock import Mock
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.node_profiler import NodeProfiler, RollingHistogram, object_size
+from execution.single_process_executor import SingleProcessExecutor
+
+
+def _make_node(uuid, title, code, function_name):
+    node = Mock()
+    node.uuid = uuid
+    node.title = title
+    node.code = code
+    node.function_name = function_name
+    node.is_streaming = False
+    return node
+
+
+BUSY_CODE = '''
+@node_entry
+def busy(size: int) -> list:
+    total = 0
+    for i in range(200000):
+        total += i
+    return list(range(size))
+'''
+
+
+class TestRollingHistogram(unittest.TestCase):
+    """Test percentile bookkeeping on its own."""
+
+    def test_percentiles(self):
+        histogram = RollingHistogram()
+        for value in range(1, 101):
+            histogram.add(value)
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual((summary['p50'], summary['p95'], summary['p99']), (50, 95, 99))
+        self.assertEqual((summary['min'], summary['max']), (1, 100))
+
+    def test_window_rolls(self):
+        histogram = RollingHistogram(window=10)
+        for value in range(100):
+            histogram.add(value)
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.percentile(0), 90)
+
+    def test_object_size_uses_buffers(self):
+        self.assertEqual(object_size(b"x" * 1000), sys.getsizeof(b"x" * 1000))
+        self.assertGreater(object_size(list(range(1000))), sys.getsizeof(list(range(1000))))
+
+
+class TestNodeProfiler(unittest.TestCase):
+    """Test profiles recorded by SingleProcessExecutor."""
+
+    def setUp(self):
+        self.profiler = NodeProfiler()
+        self.executor = SingleProcessExecutor([], profiler=self.profiler)
+
+    def tearDown(self):
+        self.profiler.set_track_allocations(False)
+        self.executor.shutdown()
+
+    def test_duplicate_titles_kept_apart(self):
+        first = _make_node("uuid-1", "Busy", BUSY_CODE, "busy")
+        second = _make_node("uuid-2", "Busy", BUSY_CODE, "busy")
+        for _ in range(3):
+            self.executor.execute_node(first, {'size': 10})
+        self.executor.execute_node(second, {'size': 1000})
+
+        stats = self.profiler.get_stats()
+        self.assertEqual(stats["uuid-1"]['calls'], 3)
+        self.assertEqual(stats["uuid-2"]['calls'], 1)
+        self.assertGreater(stats["uuid-1"]['wall_time']['p50'], 0)
+        self.assertGreater(stats["uuid-1"]['cpu_time']['p99'], 0)
+        self.assertGreater(stats["uuid-2"]['output_size']['max'], stats["uuid-1"]['output_size']['max'])
+        # Allocation tracking is opt-in
+        self.assertEqual(stats["uuid-1"]['peak_alloc'], {'count': 0})
+
+    def test_allocations_and_errors(self):
+        self.profiler.set_track_allocations(True)
+        node = _make_node("uuid-1", "Busy", BUSY_CODE, "busy")
+        self.executor.execute_node(node, {'size': 100000})
+        with self.assertRaises(RuntimeError):
+            self.executor.execute_node(node, {'size': "not a number"})
+
+        profile = self.profiler.get_profile("uuid-1")
+        self.assertEqual((profile['calls'], profile['errors']), (2, 1))
+        self.assertGreater(profile['peak_alloc']['max'], 100000 * 8)
+
+    def test_slowest_and_json_export(self):
+        fast = _make_node("fast", "Fast", "@node_entry\ndef fast() -> int:\n    return 1", "fast")
+        slow = _make_node("slow", "Slow", BUSY_CODE, "busy")
+        self.executor.execute_node(fast, {})
+        self.executor.execute_node(slow, {'size': 1})
+
+        self.assertEqual([stats['uuid'] for stats in self.profiler.slowest(1)], ["slow"])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "profile.json")
+            self.profiler.export_json(path)
+            with open(path, encoding="utf-8") as f:
+                exported = json.load(f)
+        self.assertEqual(set(exported['nodes']), {"fast", "slow"})
+        self.assertEqual(exported['nodes']["fast"]['title'], "Fast")
+
+
+if __name__ == '__main__':
+    unittest.main()
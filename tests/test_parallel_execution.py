@@ -0,0 +1,134 @@
+"""
+Tests for the opt-in parallel batch mode of GraphExecutor, which runs
+independent execution branches on a thread pool.
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+from tests.graph_fixtures import GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.execution_plan import ExecutionPlan
+from execution.parallel_scheduler import build_step_dependencies
+from execution.output_capture import capture_output
+
+
+BRANCH_CODE = '''
+import time
+
+@node_entry
+def {name}(value: int) -> int:
+    time.sleep(0.3)
+    print("{name} done")
+    return value + {offset}
+'''
+
+
+class TestParallelExecution(GraphTestCase):
+    """Test parallel scheduling of independent branches."""
+
+    def _make_fan_out(self):
+        source = self._make_node("Source", '''
+@node_entry
+def source() -> int:
+    return 1
+''')
+        left = self._make_node("Left", BRANCH_CODE.format(name="left", offset=10))
+        right = self._make_node("Right", BRANCH_CODE.format(name="right", offset=20))
+        self._connect(source, left)
+        self._connect(source, right)
+        return source, left, right
+
+    def test_independent_branches_overlap(self):
+        """Two sleeping branches finish in about the time of one."""
+        self._make_fan_out()
+        self.executor.set_parallel_mode(True, max_workers=4)
+        self.executor.execute()
+
+        stats = self.executor.last_run_stats
+        self.assertLess(stats['wall_time'], 0.55)
+        self.assertGreaterEqual(stats['serial_node_time'], 0.6)
+        self.assertGreaterEqual(stats['critical_path_time'], 0.3)
+        self.assertLess(stats['critical_path_time'], stats['serial_node_time'])
+        self.assertIn("[PARALLEL]", self.log_widget.toPlainText())
+
+    def test_log_order_matches_serial_run(self):
+        """Log lines appear in plan order no matter which branch finishes first."""
+        self._make_fan_out()
+        self.executor.execute()
+        serial_log = self.log_widget.toPlainText()
+
+        self.log_widget.clear()
+        self.executor.set_parallel_mode(True)
+        self.executor.execute()
+        parallel_lines = self.log_widget.toPlainText().splitlines()
+
+        self.assertEqual(serial_log.splitlines(), parallel_lines[:-1])
+        self.assertLess(parallel_lines.index("left done"), parallel_lines.index("right done"))
+
+    def test_dependencies_follow_exec_and_data(self):
+        """Branches depend only on their source, not on each other."""
+        self._make_fan_out()
+        plan = ExecutionPlan(self.graph)
+        dependencies = build_step_dependencies(plan)
+
+        self.assertEqual(dependencies[0], set())
+        self.assertEqual(dependencies[1], {0})
+        self.assertEqual(dependencies[2], {0})
+
+    def test_failed_branch_skips_only_its_flow(self):
+        """A failing branch cancels its downstream steps but not its siblings."""
+        source, left, right = self._make_fan_out()
+        left.set_code('''
+@node_entry
+def left(value: int) -> int:
+    raise ValueError("left failed")
+''')
+        after_left = self._make_node("After Left", '''
+@node_entry
+def after_left(value: int):
+    print("should not run")
+''')
+        self._connect(left, after_left)
+
+        self.executor.set_parallel_mode(True)
+        self.executor.execute()
+
+        log_text = self.log_widget.toPlainText()
+        self.assertIn("left failed", log_text)
+        self.assertIn("right done", log_text)
+        self.assertNotIn("should not run", log_text)
+
+
+class TestOutputCapture(unittest.TestCase):
+    """Test per-thread stdout capture."""
+
+    def test_threads_capture_separately(self):
+        results = {}
+        barrier = threading.Barrier(2)
+
+        def worker(name):
+            with capture_output() as (stdout_capture, _):
+                barrier.wait()
+                for _ in range(50):
+                    print(name)
+            results[name] = stdout_capture.getvalue().split()
+
+        threads = [threading.Thread(target=worker, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results["a"], ["a"] * 50)
+        self.assertEqual(results["b"], ["b"] * 50)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,12 +9,33 @@ import sys
 import os
 from unittest.mock import Mock
 
-# Add project root to path
-project_root = os.path.dirname(os.path.dirname(__file__))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+from tests.graph_fixtures import chain_data, data_pin
 
-from src.execution.single_process_executor import SingleProcessExecutor
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.single_process_executor import SingleProcessExecutor
+from execution.graph_executor import GraphExecutor
+from core.event_system import LiveGraphExecutor
+from core.headless_graph import HeadlessGraph
+
+
+CHAIN_LENGTH = 10000
+
+# Nodes in the flow behind one live-mode button
+LIVE_FLOW_LENGTH = 20
+LIVE_CLICKS = 50
+
+CHAIN_CODE = '''
+@node_entry
+def step(value: int = 0) -> int:
+    return value + 1
+'''
+
+
+def _build_chain(length):
+    return HeadlessGraph(chain_data([CHAIN_CODE] * length, titles="Step {}"))
 
 
 class TestPerformanceBenchmarks(unittest.TestCase):
@@ -197,5 +218,111 @@ def use_vars():
                        f"Using persistent variables took {avg_time*1000:.2f}ms, should be under 1ms")
 
 
+class TestLongChainBenchmarks(unittest.TestCase):
+    """Benchmarks over chains far deeper than Python's recursion limit."""
+
+    def setUp(self):
+        self.log = []
+        self.graph = _build_chain(CHAIN_LENGTH)
+        self.executor = GraphExecutor(self.graph, self.log, None)
+
+    def test_live_flow_on_long_chain(self):
+        """Live-mode flow following runs a 10k-node chain without recursion."""
+        self.assertGreater(CHAIN_LENGTH, sys.getrecursionlimit())
+        pin_values = {}
+
+        start_time = time.perf_counter()
+        execution_count = self.executor._execute_node_flow(self.graph.nodes[0], pin_values, 0, CHAIN_LENGTH * 10)
+        total_time = time.perf_counter() - start_time
+
+        # The last output has no consumer, so live mode does not keep it
+        last_wired_output = data_pin(self.graph.nodes[-2], "output")
+        self.assertEqual(execution_count, CHAIN_LENGTH)
+        self.assertEqual(pin_values[last_wired_output], CHAIN_LENGTH - 1)
+        self.assertNotIn(data_pin(self.graph.nodes[-1], "output"), pin_values)
+
+        print(f"\nLive flow over {CHAIN_LENGTH} nodes: {total_time:.3f}s "
+              f"({total_time / CHAIN_LENGTH * 1e6:.1f}us per node)")
+
+    def test_live_flow_respects_execution_limit(self):
+        """The execution limit stops a long chain early instead of a RecursionError."""
+        execution_count = self.executor._execute_node_flow(self.graph.nodes[0], {}, 0, 100)
+        self.assertEqual(execution_count, 100)
+
+    def test_batch_execution_on_long_chain(self):
+        """Plan compilation and batch execution of a 10k-node chain."""
+        start_time = time.perf_counter()
+        plan = self.executor.get_execution_plan()
+        build_time = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        self.executor.execute()
+        run_time = time.perf_counter() - start_time
+
+        self.assertEqual(len(plan.steps), CHAIN_LENGTH)
+        self.assertNotIn("EXECUTION ERROR: Execution limit reached. Check for infinite loops in execution flow.", self.log)
+
+        print(f"\nBatch execution over {CHAIN_LENGTH} nodes: plan build {build_time:.3f}s, "
+              f"run {run_time:.3f}s ({run_time / CHAIN_LENGTH * 1e6:.1f}us per node)")
+
+
+class TestLiveLatencyBenchmarks(unittest.TestCase):
+    """Latency from a live-mode button press to the completed flow."""
+
+    def setUp(self):
+        self.log = []
+        self.graph = _build_chain(LIVE_FLOW_LENGTH)
+        self.live_executor = LiveGraphExecutor(self.graph, self.log, None)
+        self.live_executor.set_live_mode(True)
+
+    def tearDown(self):
+        self.live_executor.shutdown()
+
+    def _click_latencies(self, trigger):
+        latencies = []
+        for _ in range(LIVE_CLICKS):
+            start_time = time.perf_counter()
+            trigger()
+            latencies.append(time.perf_counter() - start_time)
+        return sorted(latencies)
+
+    def test_button_press_latency(self):
+        """A warm executor is reused across presses instead of being rebuilt per press."""
+        source = self.graph.nodes[0]
+        warm = self._click_latencies(lambda: self.live_executor.trigger_node_execution(source))
+        executor = self.live_executor.executor
+
+        def cold_click():
+            # What every press used to cost: a fresh executor with empty caches
+            GraphExecutor(self.graph, [], None)._execute_node_flow(source, {}, 0, 100)
+
+        cold = self._click_latencies(cold_click)
+
+        self.assertIs(self.live_executor.executor, executor)
+        self.assertIn(f"Live execution completed ({LIVE_FLOW_LENGTH} nodes)", self.log)
+        warm_median, cold_median = warm[LIVE_CLICKS // 2], cold[LIVE_CLICKS // 2]
+        self.assertLess(warm_median, cold_median)
+
+        print(f"\nLive button press over {LIVE_FLOW_LENGTH} nodes: warm median {warm_median * 1000:.2f}ms, "
+              f"p95 {warm[int(LIVE_CLICKS * 0.95)] * 1000:.2f}ms; fresh executor per press "
+              f"{cold_median * 1000:.2f}ms")
+
+    def test_environment_change_refreshes_executor(self):
+        """The warm executor keeps its namespace until the venv changes."""
+        venv_path = [None]
+        live_executor = LiveGraphExecutor(self.graph, self.log, lambda: venv_path[0])
+        try:
+            executor = live_executor.get_executor()
+            namespace = executor.single_process_executor
+            self.assertIs(live_executor.get_executor().single_process_executor, namespace)
+
+            venv_path[0] = "/nonexistent/venv"
+            self.assertIs(live_executor.get_executor(), executor)
+            self.assertIsNot(executor.single_process_executor, namespace)
+            self.assertEqual(executor.single_process_executor.venv_path, "/nonexistent/venv")
+        finally:
+            live_executor.shutdown()
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,151 @@
+"""
+Tests for liveness-based release of pin values: outputs are dropped once
+their last consumer has run, unless their node is declared with retain=True.
+"""
+
+import unittest
+import sys
+import os
+
+from tests.graph_fixtures import chain_data
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from core.headless_graph import HeadlessGraph
+from core.node_signature import parse_node_signature
+from execution.execution_plan import ExecutionPlan
+from execution.graph_executor import GraphExecutor
+from execution.headless_runner import HeadlessRunner
+from execution.pin_liveness import PinLiveness, format_bytes
+
+PAYLOAD_SIZE = 1024 * 1024
+CHAIN_LENGTH = 5
+
+SOURCE_CODE = f'''
+@node_entry
+def source() -> bytearray:
+    return bytearray({PAYLOAD_SIZE})
+'''
+
+COPY_CODE = '''
+@node_entry
+def copy(data: bytearray) -> bytearray:
+    return bytearray(data)
+'''
+
+RETAINED_COPY_CODE = '''
+@node_entry(retain=True)
+def copy(data: bytearray) -> bytearray:
+    return bytearray(data)
+'''
+
+
+def _chain_data(retain_index=None):
+    """Source followed by CHAIN_LENGTH - 1 copies, each feeding the next."""
+    codes = [SOURCE_CODE if index == 0 else RETAINED_COPY_CODE if index == retain_index else COPY_CODE
+             for index in range(CHAIN_LENGTH)]
+    return chain_data(codes, titles="Step {}", input_name="data")
+
+
+class TestPinLiveness(unittest.TestCase):
+    """Test slot release against compiled plans of headless graphs."""
+
+    def test_plan_counts_readers_and_retained_slots(self):
+        plan = ExecutionPlan(HeadlessGraph(_chain_data(retain_index=2)))
+        self.assertEqual(plan.slot_reads, [1, 1, 1, 1, 0])
+        self.assertEqual(plan.retained_slots, {plan.steps[2].outputs[0][1]})
+
+    def test_retain_option_is_parsed(self):
+        self.assertTrue(parse_node_signature(RETAINED_COPY_CODE).retain_outputs)
+        self.assertFalse(parse_node_signature(COPY_CODE).retain_outputs)
+
+    def test_values_released_after_last_reader(self):
+        plan = ExecutionPlan(HeadlessGraph(_chain_data()))
+        slot_values = plan.new_slot_values()
+        liveness = PinLiveness(plan, [slot_values])
+
+        slot_values[0] = "first"
+        liveness.step_done(0)
+        self.assertEqual(slot_values[0], "first")
+
+        slot_values[1] = "second"
+        liveness.step_done(1)
+        self.assertIsNone(slot_values[0])
+        self.assertEqual(slot_values[1], "second")
+        self.assertEqual(liveness.released, 1)
+
+    def test_shared_objects_counted_once(self):
+        plan = ExecutionPlan(HeadlessGraph(_chain_data()))
+        slot_values = plan.new_slot_values()
+        liveness = PinLiveness(plan, [slot_values])
+        payload = bytearray(PAYLOAD_SIZE)
+
+        slot_values[0] = payload
+        liveness.step_done(0)
+        slot_values[1] = payload
+        liveness.step_done(1)
+        self.assertLess(liveness.peak_bytes, 2 * PAYLOAD_SIZE)
+
+    def test_format_bytes(self):
+        self.assertEqual(format_bytes(512), "512 B")
+        self.assertEqual(format_bytes(1536), "1.5 KB")
+        self.assertEqual(format_bytes(3 * 1024 ** 3), "3.0 GB")
+
+
+class TestPinLivenessExecution(unittest.TestCase):
+    """Test peak retained bytes reported by real runs of a copy chain."""
+
+    def setUp(self):
+        self.log = []
+
+    def _run(self, retain_index=None, parallel=False, timings=False):
+        executor = GraphExecutor(HeadlessGraph(_chain_data(retain_index)), self.log, None)
+        executor.set_parallel_mode(parallel, max_workers=2)
+        executor.set_timings(timings)
+        try:
+            executor.execute()
+        finally:
+            executor.shutdown()
+        return executor.last_run_stats
+
+    def test_serial_run_keeps_two_payloads(self):
+        stats = self._run(timings=True)
+        self.assertGreaterEqual(stats['peak_retained_bytes'], 2 * PAYLOAD_SIZE)
+        self.assertLess(stats['peak_retained_bytes'], 3 * PAYLOAD_SIZE)
+        self.assertEqual(stats['released_values'], CHAIN_LENGTH)
+        self.assertTrue(any(line.startswith("[MEMORY] Peak retained pin values 2.0 MB") for line in self.log))
+
+    def test_parallel_run_keeps_two_payloads(self):
+        stats = self._run(parallel=True)
+        self.assertLess(stats['peak_retained_bytes'], 3 * PAYLOAD_SIZE)
+        self.assertIn('speedup', stats)
+        # Without timings the statistics are kept but not logged
+        self.assertFalse(any(line.startswith("[MEMORY]") for line in self.log))
+
+    def test_retained_outputs_stay_alive(self):
+        stats = self._run(retain_index=1)
+        self.assertGreaterEqual(stats['peak_retained_bytes'], 3 * PAYLOAD_SIZE)
+        self.assertEqual(stats['released_values'], CHAIN_LENGTH - 1)
+
+    def test_batch_and_headless_runs_report_peak(self):
+        executor = GraphExecutor(HeadlessGraph(_chain_data()), self.log, None)
+        try:
+            results = executor.run_batch([{}, {}], outputs=["Step 4"])
+        finally:
+            executor.shutdown()
+        self.assertEqual(len(results[0]["Step 4"]["output_1"]), PAYLOAD_SIZE)
+        self.assertLess(executor.last_run_stats['peak_retained_bytes'], 5 * PAYLOAD_SIZE)
+
+        runner = HeadlessRunner(HeadlessGraph(_chain_data()))
+        try:
+            outputs = runner.run()
+        finally:
+            runner.shutdown()
+        self.assertEqual(len(outputs["Step 4"]["output_1"]), PAYLOAD_SIZE)
+        self.assertLess(runner.peak_retained_bytes, 3 * PAYLOAD_SIZE)
+
+
+if __name__ == '__main__':
+    unittest.main()
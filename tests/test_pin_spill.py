@@ -0,0 +1,251 @@
+"""
+Tests for the memory-budgeted pin value store: spilling least recently used
+large values to disk and faulting them back in on read.
+"""
+
+import unittest
+import sys
+import os
+import gc
+import shutil
+import tempfile
+
+from tests.graph_fixtures import chain_data
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from core.headless_graph import HeadlessGraph
+from execution.graph_executor import GraphExecutor
+from execution.headless_runner import HeadlessRunner
+from execution.pin_liveness import PinLiveness
+from execution.pin_spill import PinSpillStore, SpilledValue
+from execution.node_profiler import object_size
+
+MB = 1024 * 1024
+
+MAKE_CODE = '''
+@node_entry
+def make(fill: int) -> bytes:
+    return bytes([fill]) * (2 * 1024 * 1024)
+'''
+
+COMBINE_CODE = '''
+@node_entry
+def combine(a: bytes, b: bytes, c: bytes) -> str:
+    summary = f"{len(a) + len(b) + len(c)}:{a[0]}{b[0]}{c[0]}"
+    print(summary)
+    return summary
+'''
+
+
+class _Unpicklable(bytearray):
+    def __reduce_ex__(self, protocol):
+        raise TypeError("cannot pickle")
+
+
+def _raw(slots, index):
+    return list.__getitem__(slots, index)
+
+
+class TestSpillStore(unittest.TestCase):
+    """Test the budget, LRU order and fault-in of slot values."""
+
+    def setUp(self):
+        self.spill_dir = tempfile.mkdtemp()
+        self.store = PinSpillStore(5 * MB, self.spill_dir)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def test_least_recently_used_value_spills(self):
+        slots = self.store.new_slot_values(3)
+        for index in range(3):
+            slots[index] = bytes([index]) * (2 * MB)
+        self.assertIsInstance(_raw(slots, 0), SpilledValue)
+        self.assertNotIsInstance(_raw(slots, 2), SpilledValue)
+        self.assertEqual(self.store.stats()['spills'], 1)
+        self.assertEqual(len(os.listdir(self.spill_dir)), 1)
+
+        # Reading faults it back in, which pushes out the next oldest value
+        self.assertEqual(slots[0], bytes([0]) * (2 * MB))
+        self.assertIsInstance(_raw(slots, 1), SpilledValue)
+        stats = self.store.stats()
+        self.assertEqual((stats['spills'], stats['faults']), (2, 1))
+        self.assertLessEqual(stats['resident_bytes'], 5 * MB)
+
+    def test_reads_refresh_recency(self):
+        slots = self.store.new_slot_values(3)
+        slots[0] = b"a" * (2 * MB)
+        slots[1] = b"b" * (2 * MB)
+        slots[0]
+        slots[2] = b"c" * (2 * MB)
+        self.assertIsInstance(_raw(slots, 1), SpilledValue)
+        self.assertNotIsInstance(_raw(slots, 0), SpilledValue)
+
+    def test_shared_value_is_counted_and_restored_once(self):
+        slots = self.store.new_slot_values(4)
+        value = b"x" * (2 * MB)
+        slots[0] = slots[1] = value
+        self.assertEqual(self.store.resident_bytes, object_size(value))
+        slots[2] = b"y" * (2 * MB)
+        slots[3] = b"z" * (2 * MB)
+        self.assertIs(_raw(slots, 0), _raw(slots, 1))
+        restored = slots[1]
+        self.assertIs(_raw(slots, 0), restored)
+        self.assertEqual(self.store.faults, 1)
+
+    def test_cleared_slots_delete_files_and_free_budget(self):
+        slots = self.store.new_slot_values(3)
+        for index in range(3):
+            slots[index] = bytes([index]) * (2 * MB)
+        for index in range(3):
+            slots[index] = None
+        self.assertEqual(os.listdir(self.spill_dir), [])
+        self.assertEqual(self.store.resident_bytes, 0)
+
+    def test_small_and_unknown_values_are_untracked(self):
+        slots = self.store.new_slot_values(3)
+        slots[0] = b"small"
+        slots[1] = ["a list"] * MB
+        slots[2] = 42
+        self.assertEqual(self.store.resident_bytes, 0)
+
+    def test_unpicklable_value_stays_in_memory(self):
+        slots = self.store.new_slot_values(3)
+        slots[0] = _Unpicklable(3 * MB)
+        slots[1] = b"b" * (3 * MB)
+        self.assertIsInstance(_raw(slots, 0), _Unpicklable)
+        self.assertEqual(self.store.failed_spills, 1)
+        self.assertEqual(os.listdir(self.spill_dir), [])
+
+    def test_liveness_releases_without_faulting(self):
+        class Plan:
+            slot_reads = [1, 1, 1]
+            slot_count = 3
+            retained_slots = frozenset()
+            steps = []
+        slots = self.store.new_slot_values(3)
+        for index in range(3):
+            slots[index] = bytes([index]) * (2 * MB)
+        liveness = PinLiveness(Plan(), [slots])
+        liveness._release(0)
+        self.assertEqual(self.store.faults, 0)
+        self.assertIsNone(_raw(slots, 0))
+        self.assertEqual(os.listdir(self.spill_dir), [])
+
+    def test_pin_value_dict(self):
+        pin_values = self.store.new_pin_values({"a": b"a" * (2 * MB)})
+        pin_values["b"] = b"b" * (2 * MB)
+        pin_values["c"] = b"c" * (2 * MB)
+        self.assertIsInstance(dict.__getitem__(pin_values, "a"), SpilledValue)
+        self.assertEqual(pin_values.get("a"), b"a" * (2 * MB))
+        self.assertIsNone(pin_values.get("missing"))
+        self.assertEqual(pin_values.pop("b"), b"b" * (2 * MB))
+        pin_values.clear()
+        self.assertEqual(self.store.resident_bytes, 0)
+        self.assertEqual(os.listdir(self.spill_dir), [])
+
+    def test_numpy_arrays_are_memory_mapped(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("NumPy not available")
+        slots = self.store.new_slot_values(2)
+        slots[0] = np.arange(MB // 2, dtype=np.float64)
+        slots[1] = np.ones(MB // 2, dtype=np.float64)
+        self.assertEqual(_raw(slots, 0).format, "npy")
+        restored = slots[0]
+        self.assertIsInstance(restored, np.memmap)
+        self.assertEqual(float(restored[-1]), MB // 2 - 1)
+        restored[0] = 5
+        self.assertEqual(restored[0], 5)
+
+    def test_dataframes(self):
+        try:
+            import pandas as pd
+        except ImportError:
+            self.skipTest("pandas not available")
+        slots = self.store.new_slot_values(2)
+        slots[0] = pd.DataFrame({"x": range(200000), "y": range(200000)})
+        slots[1] = pd.DataFrame({"x": range(300000), "y": range(300000)})
+        self.assertIsInstance(_raw(slots, 0), SpilledValue)
+        self.assertEqual(int(slots[0]["y"].sum()), sum(range(200000)))
+
+    def test_close_removes_owned_directory(self):
+        store = PinSpillStore(MB)
+        slots = store.new_slot_values(2)
+        slots[0] = b"a" * (2 * MB)
+        slots[1] = b"b" * (2 * MB)
+        directory = os.path.dirname(_raw(slots, 0).path)
+        self.assertTrue(os.path.isdir(directory))
+        store.close()
+        self.assertFalse(os.path.exists(directory))
+
+
+def _graph_data():
+    # Three large values all held until the last node reads them
+    return chain_data([MAKE_CODE] * 3 + [COMBINE_CODE], titles=["Make 0", "Make 1", "Make 2", "Combine"],
+                      data=[(fill, "output_1", 3, name) for fill, name in enumerate("abc")],
+                      gui={fill: {"fill": fill} for fill in range(3)})
+
+
+class TestSpillingExecution(unittest.TestCase):
+    """Test graph runs under a memory budget."""
+
+    def test_execute_spills_and_reports(self):
+        log = []
+        executor = GraphExecutor(HeadlessGraph(_graph_data()), log, None)
+        executor.set_memory_budget(5 * MB)
+        try:
+            executor.execute()
+            stats = executor.last_run_stats
+        finally:
+            executor.shutdown()
+        self.assertIn("6291456:012", log)
+        self.assertGreaterEqual(stats['spills'], 1)
+        self.assertGreaterEqual(stats['faults'], 1)
+        self.assertLessEqual(stats['peak_resident_bytes'], 5 * MB)
+        self.assertTrue(any(line.startswith("[SPILL]") for line in log))
+
+    def test_batch_results_match_unbudgeted(self):
+        records = [{"Make 0": {"fill": fill}} for fill in range(3, 6)]
+        plain = GraphExecutor(HeadlessGraph(_graph_data()), [], None)
+        budgeted = GraphExecutor(HeadlessGraph(_graph_data()), [], None)
+        budgeted.set_memory_budget(5 * MB)
+        try:
+            expected = plain.run_batch(records, outputs=["Combine"])
+            self.assertEqual(budgeted.run_batch(records, outputs=["Combine"]), expected)
+            self.assertGreaterEqual(budgeted.last_run_stats['spills'], 1)
+        finally:
+            plain.shutdown()
+            budgeted.shutdown()
+        gc.collect()
+
+    def test_headless_runner(self):
+        runner = HeadlessRunner(HeadlessGraph(_graph_data()), memory_budget=5 * MB)
+        try:
+            results = runner.run()
+            self.assertEqual(results, {"Combine": {"output_1": "6291456:012"}})
+            self.assertGreaterEqual(runner.spill_store.stats()['spills'], 1)
+        finally:
+            runner.shutdown()
+
+    def test_object_store_follows_budget(self):
+        executor = GraphExecutor(HeadlessGraph(_graph_data()), [], None)
+        store = executor.single_process_executor
+        store.store_object("a", b"a" * (3 * MB))
+        executor.set_memory_budget(5 * MB)
+        store.store_object("b", b"b" * (3 * MB))
+        self.assertEqual(executor.spill_store.spills, 1)
+        self.assertEqual(store.get_object("a"), b"a" * (3 * MB))
+        executor.set_memory_budget(None)
+        self.assertIs(type(store.object_store), dict)
+        self.assertEqual(store.get_object("b"), b"b" * (3 * MB))
+        executor.shutdown()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Tests for the process-pool backend that runs nodes declared with
+@node_entry(process=True) in warm worker processes.
+"""
+
+import unittest
+import sys
+import os
+from unittest.mock import Mock
+
+from tests.graph_fixtures import exec_pin, data_pin, GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.process_pool_executor import ProcessPoolNodeExecutor
+from execution.single_process_executor import SingleProcessExecutor
+
+
+PROCESS_CODE = '''
+import os
+
+@node_entry(process=True)
+def worker_pid(value: int) -> int:
+    print("running in worker")
+    return os.getpid()
+'''
+
+
+class TestProcessPoolNodeExecutor(unittest.TestCase):
+    """Test the worker-process backend on its own."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = ProcessPoolNodeExecutor(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def _node(self, code, function_name, title="Process Node"):
+        node = Mock()
+        node.title = title
+        node.code = code
+        node.function_name = function_name
+        return node
+
+    def test_runs_in_another_process(self):
+        node = self._node(PROCESS_CODE, "worker_pid")
+        result, output = self.executor.execute_node(node, {'value': 1})
+
+        self.assertNotEqual(result, os.getpid())
+        self.assertEqual(output, "running in worker")
+
+    def test_errors_are_reported_with_node_title(self):
+        node = self._node('''
+@node_entry(process=True)
+def fail():
+    raise ValueError("bad input")
+''', "fail", title="Failing Node")
+
+        with self.assertRaises(RuntimeError) as context:
+            self.executor.execute_node(node, {})
+        self.assertIn("Failing Node", str(context.exception))
+        self.assertIn("bad input", str(context.exception))
+
+    def test_unpicklable_inputs_raise(self):
+        node = self._node(PROCESS_CODE, "worker_pid")
+        with self.assertRaises(RuntimeError):
+            self.executor.execute_node(node, {'value': lambda: None})
+
+
+class TestProcessNodesInGraph(GraphTestCase):
+    """Test that GraphExecutor routes opted-in nodes to the process pool."""
+
+    def setUp(self):
+        super().setUp()
+        self.executor.set_process_workers(1)
+
+    def test_decorator_argument_marks_node(self):
+        node = self._make_node("Worker", PROCESS_CODE)
+        self.assertTrue(node.run_in_process)
+        self.assertEqual(node.function_name, "worker_pid")
+        self.assertEqual([p.name for p in node.input_pins if p.pin_category == "data"], ["value"])
+
+        node.set_code(PROCESS_CODE.replace("@node_entry(process=True)", "@node_entry"))
+        self.assertFalse(node.run_in_process)
+
+    def test_process_node_result_flows_downstream(self):
+        source = self._make_node("Source", '''
+@node_entry
+def source() -> int:
+    return 1
+''')
+        worker = self._make_node("Worker", PROCESS_CODE)
+        sink = self._make_node("Sink", '''
+@node_entry
+def sink(pid: int):
+    print(f"pid={pid}")
+''')
+        for start, end in ((source, worker), (worker, sink)):
+            self.graph.create_connection(exec_pin(start, "output"), exec_pin(end, "input"), use_command=False)
+            self.graph.create_connection(data_pin(start, "output"), data_pin(end, "input"), use_command=False)
+
+        self.executor.execute()
+
+        log_text = self.log_widget.toPlainText()
+        self.assertIn("running in worker", log_text)
+        self.assertIn("pid=", log_text)
+        self.assertNotIn(f"pid={os.getpid()}", log_text)
+        self.assertTrue(self.executor.process_executor.is_running)
+
+    def test_resized_pool_keeps_profiling_and_tracing(self):
+        # setUp already resized the pool; resize it again before running
+        self.executor.set_process_workers(2)
+        self.executor.set_tracing(True)
+        source = self._make_node("Source", '''
+@node_entry
+def source() -> int:
+    return 1
+''')
+        worker = self._make_node("Worker", PROCESS_CODE)
+        self._connect(source, worker)
+
+        self.executor.execute()
+
+        self.assertIs(self.executor.process_executor.profiler, self.executor.profiler)
+        self.assertIn("running in worker", self.log_widget.toPlainText())
+        self.assertEqual(self.executor.profiler.get_profile(worker.uuid)["calls"], 1)
+        self.assertIs(self.executor.process_executor.tracer, self.executor.tracer)
+        spans = [event for event in self.executor.tracer.to_dict()["traceEvents"]
+                 if event.get("cat") == "node" and event["name"] == "Worker"]
+        self.assertEqual(len(spans), 1)
+        self.assertEqual(spans[0]["args"]["worker"], "process pool")
+
+    def test_in_process_executor_accepts_decorator_argument(self):
+        node = Mock()
+        node.title = "Worker"
+        node.code = PROCESS_CODE
+        node.function_name = "worker_pid"
+
+        result, _ = SingleProcessExecutor([]).execute_node(node, {'value': 1})
+        self.assertEqual(result, os.getpid())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,366 @@
+"""
+Tests for remote workers: the worker daemon on 127.0.0.1 and the pool that
+sends nodes to it over pooled, pipelined connections.
+"""
+
+import unittest
+import sys
+import os
+import pickle
+import socket
+import subprocess
+import threading
+import time
+from unittest.mock import patch
+
+from tests.graph_fixtures import StubNode, chain_data
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from core.headless_graph import HeadlessGraph
+from execution.graph_executor import GraphExecutor
+from execution.headless_runner import HeadlessRunner
+from execution.remote_worker import (CLIENT_HELLO, TOKEN_ENV_VAR, RemoteWorkerServer, hello_digest, parse_address,
+                                     requirements_key)
+from execution.remote_worker_pool import RemoteWorkerPool
+from execution.venv_worker import CALL, ERROR, HEADER, HELLO, read_frame, write_frame
+
+CLI_PATH = os.path.join(src_path, "cli.py")
+
+SOURCE_CODE = '''
+@node_entry
+def source(value: int) -> int:
+    return value
+'''
+
+REMOTE_CODE = '''
+import os
+
+@node_entry(remote=True)
+def square(value: int) -> int:
+    print(f"squaring {value} in {os.getpid()}")
+    return value * value
+'''
+
+SLEEP_CODE = '''
+import time
+
+@node_entry(remote=True)
+def nap(value: float) -> float:
+    time.sleep(value)
+    return value
+'''
+
+FAIL_CODE = '''
+@node_entry(remote=True)
+def fail(value: int) -> int:
+    raise ValueError(f"bad value {value}")
+'''
+
+CRASH_CODE = '''
+import os
+
+@node_entry(remote=True)
+def crash(value: int) -> int:
+    os._exit(3)
+'''
+
+
+def _graph_data(code):
+    # Source -> remote node, with the remote node's result collected
+    return chain_data([SOURCE_CODE, code], titles=["Source", "Remote"], gui={0: {"value": 7}})
+
+
+# Set if the daemon ever unpickles a payload from an unauthenticated client
+_unpickled = []
+
+
+def _record_unpickling():
+    _unpickled.append(True)
+
+
+class _Payload:
+    def __reduce__(self):
+        return _record_unpickling, ()
+
+
+def _unused_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestRemoteWorker(unittest.TestCase):
+    """Test node calls against a daemon on 127.0.0.1."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Daemons and their clients both pick the token up from the environment
+        cls.token_env = patch.dict(os.environ, {TOKEN_ENV_VAR: "s3cret"})
+        cls.token_env.start()
+        cls.server = RemoteWorkerServer("127.0.0.1", 0, max_workers=4)
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+        cls.token_env.stop()
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address("box:7400"), ("box", 7400))
+        self.assertEqual(parse_address("box"), ("box", 7300))
+        self.assertEqual(parse_address(":7400"), ("127.0.0.1", 7400))
+        self.assertEqual(parse_address("[::1]:7400"), ("::1", 7400))
+        self.assertEqual(requirements_key(["b", "a"]), requirements_key(["a", "b"]))
+        with self.assertRaises(ValueError):
+            parse_address("box:http")
+
+    def test_remote_node_matches_local(self):
+        log = []
+        executor = GraphExecutor(HeadlessGraph(_graph_data(REMOTE_CODE)), log, None)
+        local = executor.run_batch([{"Source": {"value": 9}}], outputs=["Remote"])
+        executor.set_remote_workers([self.server.address])
+        try:
+            self.assertIs(executor.get_node_executor(executor.graph.nodes[1]), executor.remote_pool)
+            self.assertIs(executor.get_node_executor(executor.graph.nodes[0]), executor.single_process_executor)
+            remote = executor.run_batch([{"Source": {"value": 9}}], outputs=["Remote"])
+            executor.execute()
+        finally:
+            executor.shutdown()
+        self.assertEqual(remote, local)
+        self.assertEqual(remote, [{"Remote": {"output_1": 81}}])
+        printed = [line for line in log if line.startswith("squaring 7 in ")]
+        self.assertEqual(len(printed), 1)
+        self.assertNotEqual(int(printed[0].rsplit(" ", 1)[1]), os.getpid())
+        self.assertIsNotNone(executor.profiler.get_profile("n1"))
+
+    def test_error_names_node_and_worker(self):
+        log = []
+        executor = GraphExecutor(HeadlessGraph(_graph_data(FAIL_CODE)), log, None)
+        executor.set_remote_workers([f"127.0.0.1:{self.server.address[1]}"])
+        try:
+            executor.execute()
+        finally:
+            executor.shutdown()
+        self.assertTrue(any(f"ERROR in node 'Remote' (remote worker 127.0.0.1:{self.server.address[1]}): "
+                            "ValueError: bad value 7" in line for line in log), log)
+
+    def test_crashed_worker_is_replaced(self):
+        pool = RemoteWorkerPool([self.server.address])
+        try:
+            with self.assertRaisesRegex(RuntimeError, "exited with code 3"):
+                pool.execute_node(StubNode(CRASH_CODE), {"value": 1})
+            result, _ = pool.execute_node(StubNode(REMOTE_CODE), {"value": 4})
+        finally:
+            pool.shutdown()
+        self.assertEqual(result, 16)
+
+    def test_calls_are_pipelined_on_one_connection(self):
+        pool = RemoteWorkerPool([self.server.address], connections_per_worker=1)
+        node = StubNode(SLEEP_CODE)
+        results = []
+        try:
+            pool.execute_node(node, {"value": 0.0})
+            start_time = time.perf_counter()
+            threads = [threading.Thread(target=lambda: results.append(pool.execute_node(node, {"value": 0.3})))
+                       for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            elapsed = time.perf_counter() - start_time
+            connections = pool.connections
+        finally:
+            pool.shutdown()
+        self.assertEqual(len(results), 4)
+        self.assertEqual(len(connections), 1)
+        # Four 0.3s naps answered together, not one after another
+        self.assertLess(elapsed, 0.9)
+
+    def test_connections_are_pooled_across_daemons(self):
+        second = RemoteWorkerServer("127.0.0.1", 0, max_workers=2)
+        second.start()
+        pool = RemoteWorkerPool([self.server.address, second.address], connections_per_worker=1)
+        node = StubNode(SLEEP_CODE)
+        try:
+            threads = [threading.Thread(target=pool.execute_node, args=(node, {"value": 0.2})) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            addresses = sorted(connection.address for connection in pool.connections)
+            # The code went over each connection once; later calls reuse both
+            pool.execute_node(node, {"value": 0.0})
+            self.assertEqual(len(pool.connections), 2)
+            self.assertTrue(all(connection.known_codes for connection in pool.connections))
+        finally:
+            pool.shutdown()
+            second.close()
+        self.assertEqual(addresses, sorted([self.server.address, second.address]))
+
+    def test_unreachable_worker(self):
+        pool = RemoteWorkerPool([("127.0.0.1", _unused_port())])
+        with self.assertRaisesRegex(RuntimeError, "no remote worker reachable"):
+            pool.execute_node(StubNode(REMOTE_CODE), {"value": 1})
+
+    def test_all_nodes_mode(self):
+        # Neither node is declared remote, and fused chains would run locally
+        executor = GraphExecutor(HeadlessGraph(_graph_data(REMOTE_CODE.replace("(remote=True)", ""))), [], None)
+        executor.set_fusion_mode(True)
+        executor.set_remote_workers([self.server.address], all_nodes=True)
+        try:
+            self.assertEqual(len(executor.get_execution_plan().steps), 2)
+            self.assertIs(executor.get_node_executor(executor.graph.nodes[0]), executor.remote_pool)
+            executor.set_parallel_mode(True, max_workers=4)
+            results = executor.run_batch([{"Source": {"value": value}} for value in range(6)], outputs=["Remote"])
+        finally:
+            executor.shutdown()
+        self.assertEqual([result["Remote"]["output_1"] for result in results], [value * value for value in range(6)])
+        executor.set_remote_workers(None)
+        self.assertIsNone(executor.remote_pool)
+        self.assertEqual(len(executor.get_execution_plan().steps), 1)
+
+    def test_headless_runner(self):
+        runner = HeadlessRunner(HeadlessGraph(_graph_data(REMOTE_CODE)), remote_workers=[self.server.address])
+        try:
+            results = runner.run({"Source": {"value": 5}})
+        finally:
+            runner.shutdown()
+        self.assertEqual(results, {"Remote": {"output_1": 25}})
+        self.assertEqual(runner.errors, [])
+
+
+class TestWorkerAuthentication(unittest.TestCase):
+    """Test the shared-token handshake of a daemon started with a token."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = RemoteWorkerServer("127.0.0.1", 0, max_workers=1, token="s3cret")
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
+    def _square(self, **pool_options):
+        pool = RemoteWorkerPool([self.server.address], **pool_options)
+        try:
+            return pool.execute_node(StubNode(REMOTE_CODE), {"value": 4})[0]
+        finally:
+            pool.shutdown()
+
+    def test_client_with_token_runs_nodes(self):
+        self.assertEqual(self._square(token="s3cret"), 16)
+        with patch.dict(os.environ, {TOKEN_ENV_VAR: "s3cret"}):
+            self.assertEqual(self._square(), 16)
+
+    def test_wrong_or_missing_token_is_refused(self):
+        with self.assertRaisesRegex(RuntimeError, "authentication failed"):
+            self._square(token="guess")
+        with patch.dict(os.environ, {TOKEN_ENV_VAR: ""}):
+            with self.assertRaisesRegex(RuntimeError, "authentication failed"):
+                self._square()
+
+    def test_unauthenticated_payload_is_never_unpickled(self):
+        _unpickled.clear()
+        with socket.create_connection(self.server.address, timeout=10) as sock:
+            reader, writer = sock.makefile("rb"), sock.makefile("wb")
+            self.assertEqual(read_frame(reader)[0], HELLO)
+            write_frame(writer, HELLO, CLIENT_HELLO.pack(pickle.HIGHEST_PROTOCOL, bytes(32)))
+            try:
+                write_frame(writer, CALL, pickle.dumps(_Payload()))
+            except OSError:
+                pass
+            self.assertEqual(read_frame(reader)[0], ERROR)
+            self.assertIsNone(read_frame(reader))
+            reader.close()
+            writer.close()
+        # A pickled HELLO is not even a valid answer
+        with socket.create_connection(self.server.address, timeout=10) as sock:
+            reader, writer = sock.makefile("rb"), sock.makefile("wb")
+            read_frame(reader)
+            write_frame(writer, HELLO, pickle.dumps(_Payload()))
+            self.assertIsNone(read_frame(reader))
+            reader.close()
+            writer.close()
+        self.assertEqual(_unpickled, [])
+
+    def test_oversized_hello_is_dropped_unread(self):
+        with socket.create_connection(self.server.address, timeout=10) as sock:
+            reader, writer = sock.makefile("rb"), sock.makefile("wb")
+            read_frame(reader)
+            # Announces a 4 GiB HELLO but never sends it; the daemon must not wait for it
+            writer.write(HEADER.pack(2 ** 32 - 1, HELLO))
+            writer.flush()
+            self.assertIsNone(read_frame(reader))
+            reader.close()
+            writer.close()
+
+    def test_silent_client_is_dropped(self):
+        with patch("execution.remote_worker.HANDSHAKE_TIMEOUT", 0.2):
+            with socket.create_connection(self.server.address, timeout=10) as sock:
+                reader = sock.makefile("rb")
+                read_frame(reader)
+                # Never answers the challenge
+                start_time = time.perf_counter()
+                self.assertIsNone(read_frame(reader))
+                self.assertLess(time.perf_counter() - start_time, 5)
+                reader.close()
+
+    def test_malformed_call_gets_protocol_error(self):
+        with socket.create_connection(self.server.address, timeout=10) as sock:
+            reader, writer = sock.makefile("rb"), sock.makefile("wb")
+            challenge = pickle.loads(read_frame(reader)[1])[-1]
+            write_frame(writer, HELLO, CLIENT_HELLO.pack(pickle.HIGHEST_PROTOCOL, hello_digest(b"s3cret", challenge)))
+            self.assertEqual(read_frame(reader), (HELLO, b""))
+            for message in ((1, "key"), 42):
+                write_frame(writer, CALL, pickle.dumps(message))
+                kind, payload = read_frame(reader)
+                self.assertEqual(kind, ERROR)
+                self.assertIn("malformed CALL", pickle.loads(payload)[1])
+            reader.close()
+            writer.close()
+
+    def test_daemon_needs_token(self):
+        with patch.dict(os.environ, {TOKEN_ENV_VAR: ""}):
+            for host in ("127.0.0.1", "0.0.0.0"):
+                with self.assertRaisesRegex(ValueError, "without a worker token"):
+                    RemoteWorkerServer(host, 0)
+        RemoteWorkerServer("0.0.0.0", 0, token="s3cret").close()
+
+
+class TestWorkerCommand(unittest.TestCase):
+    """Test the ``worker`` command (src/cli.py) as its own process."""
+
+    def test_worker_serves_runner(self):
+        env = dict(os.environ, **{TOKEN_ENV_VAR: "s3cret"})
+        process = subprocess.Popen([sys.executable, CLI_PATH, "worker", "--listen", "127.0.0.1:0", "--workers", "1"],
+                                   stdout=subprocess.PIPE, text=True, env=env)
+        try:
+            line = process.stdout.readline()
+            self.assertTrue(line.startswith("Listening on 127.0.0.1:"), line)
+            address = line.split()[-1]
+            runner = HeadlessRunner(HeadlessGraph(_graph_data(REMOTE_CODE)), remote_workers=[address],
+                                    remote_token="s3cret")
+            try:
+                results = runner.run({"Source": {"value": 3}})
+            finally:
+                runner.shutdown()
+            self.assertEqual(results, {"Remote": {"output_1": 9}})
+        finally:
+            process.terminate()
+            process.wait(timeout=10)
+            process.stdout.close()
+
+    def test_worker_refuses_to_start_without_token(self):
+        env = {key: value for key, value in os.environ.items() if key != TOKEN_ENV_VAR}
+        result = subprocess.run([sys.executable, CLI_PATH, "worker", "--listen", "127.0.0.1:0"],
+                                capture_output=True, text=True, env=env, timeout=30)
+        self.assertEqual(result.returncode, 2)
+        self.assertIn("without a worker token", result.stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests for the persistent on-disk result store used by nodes declared with
+@node_entry(persist=True).
+"""
+
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+from unittest.mock import Mock
+
+from tests.graph_fixtures import GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.graph_executor import GraphExecutor
+from execution.result_store import ResultStore
+
+
+class TestResultStore(unittest.TestCase):
+    """Test storage, persistence and eviction of the result store."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_round_trip_and_persistence(self):
+        store = ResultStore(self.cache_dir)
+        store.put("ab" * 20, {"features": [1, 2, 3]})
+        store.put("cd" * 20, None)
+
+        reopened = ResultStore(self.cache_dir)
+        self.assertEqual(reopened.get("ab" * 20), (True, {"features": [1, 2, 3]}))
+        self.assertEqual(reopened.get("cd" * 20), (True, None))
+        self.assertEqual(reopened.get("ef" * 20), (False, None))
+        self.assertEqual((reopened.hits, reopened.misses), (2, 1))
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        store = ResultStore(self.cache_dir)
+        size = store.put("00" * 20, b"x" * 1000)
+        store.set_max_bytes(size * 2 + size // 2)
+        store.put("11" * 20, b"y" * 1000)
+        store.get("00" * 20)
+        store.put("22" * 20, b"z" * 1000)
+
+        self.assertIn("00" * 20, store)
+        self.assertNotIn("11" * 20, store)
+        self.assertIn("22" * 20, store)
+        self.assertLessEqual(store.total_bytes, store.max_bytes)
+
+    def test_unpicklable_values_are_skipped(self):
+        store = ResultStore(self.cache_dir)
+        self.assertIsNone(store.put("33" * 20, lambda: None))
+        self.assertEqual(len(store), 0)
+        self.assertEqual(os.listdir(os.path.join(self.cache_dir, "33")), [])
+
+    def test_numpy_arrays_are_memory_mapped(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("NumPy not available")
+
+        store = ResultStore(self.cache_dir)
+        store.put("44" * 20, np.arange(10))
+        found, value = ResultStore(self.cache_dir).get("44" * 20)
+
+        self.assertTrue(found)
+        self.assertIsInstance(value, np.memmap)
+        self.assertEqual(value.sum(), 45)
+
+
+class TestPersistentNodes(GraphTestCase):
+    """Test that persist nodes reuse stored results across executors."""
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        super().tearDown()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def _run_new_executor(self):
+        executor = GraphExecutor(self.graph, self.log_widget, Mock(return_value=None))
+        executor.enable_result_store(True, cache_dir=self.cache_dir)
+        self.log_widget.clear()
+        executor.execute()
+        return self.log_widget.toPlainText()
+
+    def test_result_survives_new_executor(self):
+        node = self._make_node("Features", '''
+@node_entry(persist=True)
+def features() -> int:
+    print("extracting")
+    return 42
+''')
+        self.assertTrue(node.persist_result)
+
+        first = self._run_new_executor()
+        self.assertIn("CACHE MISS", first)
+        self.assertIn("extracting", first)
+
+        second = self._run_new_executor()
+        self.assertIn("CACHE HIT", second)
+        self.assertNotIn("extracting", second)
+        self.assertIn("[RESULT CACHE] 1 hits, 0 misses", second)
+
+    def test_nodes_without_persist_always_run(self):
+        self._make_node("Plain", '''
+@node_entry
+def plain() -> int:
+    print("plain ran")
+    return 1
+''')
+        self._run_new_executor()
+        log_text = self._run_new_executor()
+        self.assertIn("plain ran", log_text)
+        self.assertNotIn("CACHE", log_text)
+
+    def test_code_change_misses(self):
+        code = '''
+@node_entry(persist=True)
+def features() -> int:
+    print("extracting")
+    return {value}
+'''
+        node = self._make_node("Features", code.format(value=1))
+        self._run_new_executor()
+
+        node.set_code(code.format(value=2))
+        log_text = self._run_new_executor()
+        self.assertIn("CACHE MISS", log_text)
+        self.assertIn("extracting", log_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
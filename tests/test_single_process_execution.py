@@ -8,13 +8,14 @@ import sys
 import os
 import time
 import gc
-from unittest.mock import Mock, MagicMock
+import json
+from unittest.mock import Mock, MagicMock, patch
 
 # Add src directory to path
 src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
 sys.path.insert(0, src_path)
 
-from execution.single_process_executor import SingleProcessExecutor
+from execution.single_process_executor import SingleProcessExecutor, OPTIONAL_MODULES, optional_module_references
 from core.node import Node
 from core.pin import Pin
 
@@ -278,6 +279,32 @@ def timed_func():
         # Verify essentials are back
         self.assertIn('node_entry', self.executor.namespace)
 
+    def test_optional_modules_detected_statically(self):
+        """Test that only unbound references to optional libraries are detected."""
+        code = (
+            "import pandas as pd\n"
+            "@node_entry\n"
+            "def f(tf: int) -> int:\n"
+            "    return np.sum(torch.ones(tf)) + len(pd.DataFrame())\n"
+        )
+        self.assertEqual(optional_module_references(code), {'np', 'torch'})
+        self.assertEqual(optional_module_references("def f(x):\n    return x.numpy()"), set())
+
+    def test_optional_modules_imported_on_first_use(self):
+        """Test that an optional library is imported only when a node refers to it."""
+        node = Mock()
+        node.title = "Uses Library"
+        node.function_name = "use"
+        node.code = "@node_entry\ndef use() -> str:\n    return jsonlib.dumps([1])\n"
+
+        with patch.dict(OPTIONAL_MODULES, {'jsonlib': 'json'}):
+            self.assertNotIn('jsonlib', self.executor.namespace)
+            result, _ = self.executor.execute_node(node, {})
+
+        self.assertEqual(result, "[1]")
+        self.assertIs(self.executor.namespace['jsonlib'], json)
+        self.assertEqual(list(self.executor.get_import_report()), ['json'])
+
 
 class TestComplexObjectPassing(unittest.TestCase):
     """Test complex object passing scenarios."""
@@ -346,5 +373,125 @@ def pandas_func(df):
         self.assertEqual(result, 6)
 
 
+class TestCodeCache(unittest.TestCase):
+    """Test the compiled code cache used by SingleProcessExecutor."""
+    
+    def setUp(self):
+        self.log = []
+        self.executor = SingleProcessExecutor(self.log)
+    
+    def tearDown(self):
+        self.executor.reset_namespace()
+    
+    def _make_node(self, title, function_name, code):
+        node = Mock(spec=Node)
+        node.title = title
+        node.function_name = function_name
+        node.code = code
+        return node
+    
+    def test_module_code_runs_once(self):
+        """Repeat executions only call the cached function."""
+        node = self._make_node("Counter", "count", '''
+import builtins
+builtins._pfg_module_runs = getattr(builtins, "_pfg_module_runs", 0) + 1
+
+def count(x):
+    return x + 1
+''')
+        import builtins
+        builtins._pfg_module_runs = 0
+        try:
+            for i in range(5):
+                result, _ = self.executor.execute_node(node, {'x': i})
+                self.assertEqual(result, i + 1)
+            self.assertEqual(builtins._pfg_module_runs, 1)
+        finally:
+            del builtins._pfg_module_runs
+        
+        stats = self.executor.code_cache.get_stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hits'], 4)
+    
+    def test_identical_code_shares_entry(self):
+        """Nodes with the same source share one compiled entry."""
+        code = '''
+def square(x):
+    return x * x
+'''
+        node_a = self._make_node("A", "square", code)
+        node_b = self._make_node("B", "square", code)
+        
+        self.executor.execute_node(node_a, {'x': 2})
+        result, _ = self.executor.execute_node(node_b, {'x': 3})
+        
+        self.assertEqual(result, 9)
+        self.assertEqual(len(self.executor.code_cache), 1)
+    
+    def test_lru_bound(self):
+        """The cache never holds more than its configured number of entries."""
+        executor = SingleProcessExecutor([], code_cache_size=2)
+        for i in range(4):
+            node = self._make_node(f"N{i}", "f", f"def f():\n    return {i}\n")
+            result, _ = executor.execute_node(node, {})
+            self.assertEqual(result, i)
+        self.assertEqual(len(executor.code_cache), 2)
+    
+    def test_invalidation_recompiles(self):
+        """Invalidated code is re-executed on next use."""
+        node = self._make_node("Node", "f", "def f():\n    return 1\n")
+        self.executor.execute_node(node, {})
+        self.executor.invalidate_code(node.code)
+        self.assertEqual(len(self.executor.code_cache), 0)
+        
+        result, _ = self.executor.execute_node(node, {})
+        self.assertEqual(result, 1)
+        self.assertEqual(self.executor.code_cache.get_stats()['misses'], 2)
+    
+    def test_cached_function_sees_later_globals(self):
+        """A cached function looks up globals that later nodes define."""
+        consumer = self._make_node("Consumer", "scaled", "def scaled(x):\n    return x * factor\n")
+        with self.assertRaises(RuntimeError):
+            self.executor.execute_node(consumer, {'x': 2})
+
+        provider = self._make_node("Provider", "provide", "factor = 10\n\ndef provide():\n    return factor\n")
+        self.executor.execute_node(provider, {})
+        result, _ = self.executor.execute_node(consumer, {'x': 2})
+        self.assertEqual(result, 20)
+        self.assertEqual(self.executor.code_cache.get_stats()['misses'], 2)
+
+    def test_entry_function_survives_redefinition(self):
+        """A later node defining the same function name does not replace a cached entry."""
+        first = self._make_node("First", "f", "def f():\n    return 1\n")
+        second = self._make_node("Second", "f", "def f():\n    return 2\n")
+        self.executor.execute_node(first, {})
+        self.executor.execute_node(second, {})
+        self.assertEqual(self.executor.execute_node(first, {})[0], 1)
+        self.assertEqual(self.executor.execute_node(second, {})[0], 2)
+
+    def test_module_helpers_stay_per_node(self):
+        """Nodes defining the same helper each keep calling their own."""
+        node_a = self._make_node("A", "run_a", "def _h():\n    return 'A'\n\ndef run_a():\n    return _h()\n")
+        node_b = self._make_node("B", "run_b", "def _h():\n    return 'B'\n\ndef run_b():\n    return _h()\n")
+        results = [self.executor.execute_node(node, {})[0] for node in (node_a, node_b, node_a)]
+        self.assertEqual(results, ['A', 'B', 'A'])
+
+    def test_set_code_invalidates_old_code(self):
+        """Node.set_code evicts the previous source from live caches."""
+        from PySide6.QtWidgets import QApplication
+        app = QApplication.instance() or QApplication(sys.argv)
+        
+        node = Node("Editable")
+        node.set_code("@node_entry\ndef f() -> int:\n    return 1\n")
+        result, _ = self.executor.execute_node(node, {})
+        self.assertEqual(result, 1)
+        self.assertEqual(len(self.executor.code_cache), 1)
+        
+        node.set_code("@node_entry\ndef f() -> int:\n    return 2\n")
+        self.assertEqual(len(self.executor.code_cache), 0)
+        result, _ = self.executor.execute_node(node, {})
+        self.assertEqual(result, 2)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,144 @@
+"""
+Tests for streaming pins: generator nodes feed downstream nodes item by item
+through a bounded buffer instead of materializing their whole output.
+"""
+
+import unittest
+import sys
+import os
+import threading
+
+from tests.graph_fixtures import exec_pin, data_pin, GraphTestCase
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from execution.node_stream import NodeStream
+
+
+class TestNodeStream(unittest.TestCase):
+    """Test the bounded producer/consumer stream on its own."""
+
+    def test_producer_stays_within_buffer(self):
+        produced = []
+
+        def numbers():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        stream = NodeStream(numbers(), "Numbers", buffer_size=4)
+        iterator = iter(stream)
+        self.assertEqual(next(iterator), 0)
+        threading.Event().wait(0.2)
+        # One item handed over, at most buffer_size queued, one blocked in put
+        self.assertLessEqual(len(produced), 1 + 4 + 1)
+        self.assertEqual(list(iterator), list(range(1, 100)))
+        self.assertTrue(stream.finished)
+
+    def test_producer_error_reaches_consumer(self):
+        def failing():
+            yield 1
+            raise ValueError("bad row")
+
+        stream = NodeStream(failing(), "Reader")
+        with self.assertRaises(RuntimeError) as context:
+            list(stream)
+        self.assertIn("Reader", str(context.exception))
+        self.assertIn("bad row", str(context.exception))
+
+    def test_single_consumer(self):
+        stream = NodeStream(iter(range(3)), "Numbers")
+        self.assertEqual(list(stream), [0, 1, 2])
+        with self.assertRaises(RuntimeError):
+            list(stream)
+
+    def test_early_stop_releases_producer(self):
+        closed = threading.Event()
+
+        def endless():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        stream = NodeStream(endless(), "Endless", buffer_size=2)
+        for item in stream:
+            if item == 3:
+                break
+        self.assertTrue(closed.wait(2))
+
+
+class TestStreamingNodesInGraph(GraphTestCase):
+    """Test streaming outputs flowing between graph nodes."""
+
+    def _make_reader(self):
+        return self._make_node("Reader", '''
+from typing import Iterator
+
+@node_entry
+def read_rows() -> Iterator[int]:
+    for i in range(1000):
+        yield i
+    print("reader finished")
+''')
+
+    def _make_summer(self):
+        return self._make_node("Summer", '''
+@node_entry
+def sum_rows(rows: 'iterator[int]'):
+    print(f"total={sum(rows)}")
+''')
+
+    def test_streaming_detected_from_yield_and_annotation(self):
+        reader = self._make_reader()
+        self.assertTrue(reader.is_streaming)
+        self.assertEqual(data_pin(reader, "output").pin_type, "iterator[int]")
+
+        plain_generator = self._make_node("Plain", '''
+@node_entry
+def numbers():
+    yield 1
+''')
+        self.assertTrue(plain_generator.is_streaming)
+        self.assertEqual(data_pin(plain_generator, "output").pin_type, "iterator")
+
+        regular = self._make_node("Regular", '''
+@node_entry
+def value() -> int:
+    def helper():
+        yield 1
+    return 1
+''')
+        self.assertFalse(regular.is_streaming)
+
+    def test_stream_flows_to_consumer(self):
+        reader = self._make_reader()
+        summer = self._make_summer()
+        self.graph.create_connection(exec_pin(reader, "output"), exec_pin(summer, "input"), use_command=False)
+        self.graph.create_connection(data_pin(reader, "output"), data_pin(summer, "input"), use_command=False)
+
+        self.executor.execute()
+
+        log_text = self.log_widget.toPlainText()
+        self.assertIn(f"total={sum(range(1000))}", log_text)
+        self.assertIn("STREAM 'Reader': reader finished", log_text)
+
+    def test_stream_passes_through_reroute(self):
+        reader = self._make_reader()
+        summer = self._make_summer()
+        self.graph.create_connection(exec_pin(reader, "output"), exec_pin(summer, "input"), use_command=False)
+        reroute = self.graph.create_node("", pos=(0, 0), is_reroute=True, use_command=False)
+        self.graph.create_connection(data_pin(reader, "output"), reroute.input_pin, use_command=False)
+        self.graph.create_connection(reroute.output_pin, data_pin(summer, "input"), use_command=False)
+
+        self.executor.execute()
+        self.assertIn(f"total={sum(range(1000))}", self.log_widget.toPlainText())
+
+
+if __name__ == '__main__':
+    unittest.main()
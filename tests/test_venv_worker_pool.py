@@ -0,0 +1,208 @@
+"""
+Tests for isolated nodes running in warm worker processes started from the
+graph's virtual environment interpreter.
+"""
+
+import unittest
+import sys
+import os
+import statistics
+import tempfile
+import time
+import venv
+
+from tests.graph_fixtures import StubNode, chain_data
+
+# Add src directory to path
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, src_path)
+
+from core.headless_graph import HeadlessGraph
+from execution.graph_executor import GraphExecutor
+from execution.headless_runner import HeadlessRunner
+from execution.venv_worker_pool import VenvWorkerPool, venv_python_executable
+
+ADD_CODE = '''
+@node_entry(isolate=True)
+def add(a: int, b: int) -> int:
+    print(f"adding {a} and {b}")
+    return a + b
+'''
+
+PID_CODE = '''
+import os
+
+@node_entry(isolate=True)
+def pid() -> int:
+    return os.getpid()
+'''
+
+PREFIX_CODE = '''
+import sys
+
+@node_entry(isolate=True)
+def prefix() -> str:
+    return sys.prefix
+'''
+
+CRASH_CODE = '''
+import os
+
+@node_entry(isolate=True)
+def crash() -> int:
+    os._exit(3)
+'''
+
+FAIL_CODE = '''
+@node_entry(isolate=True)
+def fail() -> int:
+    raise ValueError("bad input")
+'''
+
+SPIN_CODE = '''
+@node_entry(isolate=True)
+def spin() -> int:
+    while True:
+        pass
+'''
+
+PLAIN_CODE = '''
+@node_entry
+def plain(value: int) -> int:
+    return value * 2
+'''
+
+
+class TestVenvWorkerPool(unittest.TestCase):
+    """Test calls, failures and per-call overhead of the worker pool."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = VenvWorkerPool(max_workers=2)
+        cls.pool.warm_up()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_node_runs_in_another_process(self):
+        result, output = self.pool.execute_node(StubNode(ADD_CODE), {'a': 2, 'b': 3})
+        self.assertEqual((result, output), (5, "adding 2 and 3"))
+        pid, _ = self.pool.execute_node(StubNode(PID_CODE), {})
+        self.assertNotEqual(pid, os.getpid())
+
+    def test_code_is_sent_once_per_worker(self):
+        node = StubNode(ADD_CODE)
+        for _ in range(10):
+            self.pool.execute_node(node, {'a': 1, 'b': 1})
+        workers = list(self.pool._idle)
+        self.assertTrue(all(len(worker.known_codes) <= 3 for worker in workers))
+
+    def test_node_error_keeps_worker(self):
+        pids_before = sorted(self.pool.worker_pids())
+        with self.assertRaises(RuntimeError) as context:
+            self.pool.execute_node(StubNode(FAIL_CODE, "Fail"), {})
+        self.assertIn("ValueError: bad input", str(context.exception))
+        self.assertIn("'Fail'", str(context.exception))
+        self.assertEqual(sorted(self.pool.worker_pids()), pids_before)
+
+    def test_crash_costs_only_the_worker(self):
+        pool = VenvWorkerPool(max_workers=1)
+        try:
+            with self.assertRaises(RuntimeError) as context:
+                pool.execute_node(StubNode(CRASH_CODE), {})
+            self.assertIn("exited with code 3", str(context.exception))
+            self.assertEqual(pool.execute_node(StubNode(ADD_CODE), {'a': 1, 'b': 2})[0], 3)
+            self.assertEqual(pool.restarts, 1)
+        finally:
+            pool.shutdown()
+
+    def test_unpicklable_inputs_keep_worker(self):
+        import threading
+        pool = VenvWorkerPool(max_workers=1)
+        try:
+            with self.assertRaises(RuntimeError):
+                pool.execute_node(StubNode(ADD_CODE), {'a': threading.Lock(), 'b': 1})
+            self.assertEqual(pool.restarts, 0)
+            self.assertEqual(pool.execute_node(StubNode(ADD_CODE), {'a': 1, 'b': 2})[0], 3)
+        finally:
+            pool.shutdown()
+
+    def test_per_call_overhead_is_sub_millisecond(self):
+        node = StubNode(ADD_CODE)
+        self.pool.execute_node(node, {'a': 0, 'b': 0})
+        durations = []
+        for index in range(300):
+            start_time = time.perf_counter()
+            self.pool.execute_node(node, {'a': index, 'b': 1})
+            durations.append(time.perf_counter() - start_time)
+        median = statistics.median(durations)
+        self.assertLess(median, 0.001)
+        print(f"\nVenv worker round trip: median {median * 1e6:.0f}us, "
+              f"p95 {sorted(durations)[int(len(durations) * 0.95)] * 1e6:.0f}us")
+
+
+class TestIsolatedNodesInGraph(unittest.TestCase):
+    """Test routing isolated nodes through the graph executor and headless runner."""
+
+    def _graph(self, *codes, gui_state=None):
+        # Execution flow only, no data connections
+        return HeadlessGraph(chain_data(codes, data=[], titles="Step {}", gui={0: gui_state or {}}))
+
+    def test_workers_use_the_venv_interpreter(self):
+        with tempfile.TemporaryDirectory() as venv_dir:
+            venv.create(venv_dir, with_pip=False, symlinks=os.name != "nt")
+            log = []
+            executor = GraphExecutor(self._graph(PREFIX_CODE), log, lambda: venv_dir)
+            try:
+                self.assertEqual(executor.venv_worker_pool.python_executable, executor.get_python_executable())
+                self.assertEqual(executor.get_python_executable(), venv_python_executable(venv_dir))
+                runner_result = executor.run_batch([{}], outputs=["Step 0"])
+            finally:
+                executor.shutdown()
+        self.assertEqual(os.path.realpath(runner_result[0]["Step 0"]["output_1"]), os.path.realpath(venv_dir))
+
+    def test_crashing_node_fails_and_skips_downstream(self):
+        log = []
+        executor = GraphExecutor(self._graph(CRASH_CODE, PLAIN_CODE), log, None)
+        try:
+            executor.execute()
+        finally:
+            executor.shutdown()
+        self.assertTrue(any("exited with code 3" in line for line in log))
+        self.assertNotIn("--- Executing Node: Step 1 ---", log)
+
+    def test_timeout_kills_the_worker(self):
+        log = []
+        executor = GraphExecutor(self._graph(SPIN_CODE), log, None)
+        executor.set_node_timeout(0.2)
+        try:
+            executor.execute()
+            self.assertEqual(executor.venv_worker_pool.restarts, 1)
+        finally:
+            executor.shutdown()
+        self.assertTrue(any("TIMEOUT: Node 'Step 0'" in line for line in log))
+
+    def test_isolated_mode_routes_every_node(self):
+        executor = GraphExecutor(self._graph(PLAIN_CODE), [], None)
+        node = executor.graph.nodes[0]
+        try:
+            self.assertIs(executor.get_node_executor(node), executor.single_process_executor)
+            executor.set_isolated_mode(True)
+            self.assertIs(executor.get_node_executor(node), executor.venv_worker_pool)
+            results = executor.run_batch([{"Step 0": {"value": 21}}], outputs=["Step 0"])
+        finally:
+            executor.shutdown()
+        self.assertEqual(results[0]["Step 0"]["output_1"], 42)
+
+    def test_headless_runner(self):
+        runner = HeadlessRunner(self._graph(ADD_CODE, gui_state={"a": 2, "b": 3}))
+        try:
+            outputs = runner.run()
+        finally:
+            runner.shutdown()
+        self.assertEqual(outputs["Step 0"]["output_1"], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()